@@ -12,6 +12,8 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
 
 from app.core.config import settings
+from app.core.response_cache import response_cache, COMPANIES, NEWS, COLLECTIONS
+from app.db.supabase_client import InvalidCursorError
 from app.schemas.investment_tracker import (
     CompanyResponse,
     CompanyListResponse,
@@ -47,8 +49,9 @@ def get_supabase():
 # ============================================================
 
 @router.get("/dashboard/stats", response_model=DashboardStats)
+@response_cache.cached("dashboard_stats", ttl=30, stale_ttl=300, tags=(COMPANIES, NEWS, COLLECTIONS))
 async def get_dashboard_stats():
-    """대시보드 통계 조회"""
+    """대시보드 통계 조회 (30초 캐시, 이후 5분간 stale 응답 + 백그라운드 갱신)"""
     client = get_supabase()
 
     if not client:
@@ -78,12 +81,14 @@ async def get_dashboard_stats():
 # ============================================================
 
 @router.get("/companies", response_model=CompanyListResponse)
+@response_cache.cached("companies", ttl=120, tags=(COMPANIES,))
 async def list_companies(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     industry: Optional[str] = None,
     stage: Optional[InvestmentStage] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)")
 ):
     """기업 목록 조회"""
     client = get_supabase()
@@ -103,7 +108,8 @@ async def list_companies(
             page_size=page_size,
             industry=industry,
             stage=stage.value if stage else None,
-            search=search
+            search=search,
+            cursor=cursor
         )
 
         return CompanyListResponse(
@@ -111,8 +117,11 @@ async def list_companies(
             total=result["total"],
             page=result["page"],
             page_size=result["page_size"],
-            total_pages=result["total_pages"]
+            total_pages=result["total_pages"],
+            next_cursor=result["next_cursor"]
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"List companies error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -164,6 +173,7 @@ async def create_company(company_data: CompanyCreate):
             raise HTTPException(status_code=400, detail="Company already exists")
 
         company = await client.create_company(company_data.model_dump())
+        await response_cache.invalidate(COMPANIES)
         return CompanyResponse(**company)
     except HTTPException:
         raise
@@ -188,6 +198,7 @@ async def update_company(company_id: int, update_data: CompanyUpdate):
         if not company:
             raise HTTPException(status_code=404, detail="Company not found")
 
+        await response_cache.invalidate(COMPANIES)
         return CompanyResponse(**company)
     except HTTPException:
         raise
@@ -298,12 +309,14 @@ async def regenerate_email_template(
 # ============================================================
 
 @router.get("/news", response_model=NewsListResponse)
+@response_cache.cached("news", ttl=120, tags=(NEWS,))
 async def list_news(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     source: Optional[str] = None,
     company_id: Optional[int] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)")
 ):
     """뉴스 목록 조회"""
     client = get_supabase()
@@ -322,7 +335,8 @@ async def list_news(
             page=page,
             page_size=page_size,
             source=source,
-            company_id=company_id
+            company_id=company_id,
+            cursor=cursor
         )
 
         return NewsListResponse(
@@ -330,8 +344,11 @@ async def list_news(
             total=result["total"],
             page=result["page"],
             page_size=result["page_size"],
-            total_pages=result["total_pages"]
+            total_pages=result["total_pages"],
+            next_cursor=result["next_cursor"]
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"List news error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -365,7 +382,8 @@ async def get_news_detail(news_id: int):
 @router.get("/collections", response_model=CollectionListResponse)
 async def list_collections(
     page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1, le=50)
+    page_size: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)")
 ):
     """수집 작업 이력 조회"""
     client = get_supabase()
@@ -380,15 +398,18 @@ async def list_collections(
         )
 
     try:
-        result = await client.get_collections(page=page, page_size=page_size)
+        result = await client.get_collections(page=page, page_size=page_size, cursor=cursor)
 
         return CollectionListResponse(
             items=[CollectionResponse(**c) for c in result["items"]],
             total=result["total"],
             page=result["page"],
             page_size=result["page_size"],
-            total_pages=result["total_pages"]
+            total_pages=result["total_pages"],
+            next_cursor=result["next_cursor"]
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"List collections error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -416,6 +437,7 @@ async def trigger_collection(
             "year": iso_calendar.year,
             "status": "pending"
         })
+        await response_cache.invalidate(COLLECTIONS)
 
         # 백그라운드 작업 (추후 구현)
         # background_tasks.add_task(run_weekly_collection, ...)
@@ -456,6 +478,7 @@ async def get_collection_detail(collection_id: int):
 # ============================================================
 
 @router.get("/industries")
+@response_cache.cached("industries", ttl=600, tags=(COMPANIES,), cache_if=lambda r: bool(r["industries"]))
 async def list_industries():
     """업종 목록 조회"""
     client = get_supabase()
@@ -473,6 +496,7 @@ async def list_industries():
 
 
 @router.get("/stages")
+@response_cache.cached("stages", ttl=3600)
 async def list_stages():
     """투자 단계 목록 조회"""
     return {
@@ -11,6 +11,10 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""
 
+    # Response Cache (REDIS_URL 설정 시 워커 간 공유, 없으면 프로세스 내)
+    REDIS_URL: str = ""
+    RESPONSE_CACHE_ENABLED: bool = True
+
     # Application
     DEBUG: bool = True
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
@@ -0,0 +1,395 @@
+"""
+Response Cache
+투자 트래커 조회 API 응답 캐시
+
+@task Investment Tracker
+@description 라우트별 TTL + 쓰기 시 무효화 응답 캐시
+
+- 키: 라우트 이름 + 쿼리 파라미터 + 의존 태그(테이블) 세대 번호
+- 무효화: invalidate("startup_companies") → 태그 세대 증가 → 그 태그에 의존하는 키가 모두 미적중
+  (키를 찾아 지우지 않으므로 공유 백엔드에서도 O(태그 수))
+- 백엔드: 프로세스 내 LRU (기본) / Redis (REDIS_URL 설정 시, 워커 간 공유)
+- stale-while-revalidate: TTL이 지나도 stale 구간 안이면 이전 응답을 바로 주고 백그라운드에서 갱신
+- 같은 키의 동시 미적중은 한 번만 계산 (프로세스 내 single-flight)
+- 라우트별 적중 / stale / 합류 / 미적중 / 갱신 / 무효화 카운터 (stats())
+"""
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+# 트래커 데이터 태그 (Supabase 테이블 이름)
+COMPANIES = "startup_companies"
+NEWS = "investment_news"
+COLLECTIONS = "weekly_collections"
+
+
+# ============================================================
+# Backends
+# ============================================================
+
+class MemoryCacheBackend:
+    """프로세스 내 LRU 백엔드 (기본)"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    async def set(self, key: str, entry: Dict[str, Any], ttl: float):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    async def generations(self, tags: Iterable[str]) -> List[int]:
+        with self._lock:
+            return [self._generations.get(tag, 0) for tag in tags]
+
+    async def bump(self, tags: Iterable[str]):
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+
+    async def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    async def close(self):
+        pass
+
+
+class RedisCacheBackend:
+    """Redis 공유 백엔드 (워커 / 인스턴스 간 응답과 무효화 공유)"""
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "tracker-cache"):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package not installed")
+        self.url = url
+        self.prefix = prefix
+        self._redis = aioredis.from_url(url)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:entry:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}:gen:{tag}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.get(self._key(key))
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, entry: Dict[str, Any], ttl: float):
+        await self._redis.set(self._key(key), json.dumps(entry, ensure_ascii=False), px=max(int(ttl * 1000), 1))
+
+    async def generations(self, tags: Iterable[str]) -> List[int]:
+        tags = list(tags)
+        if not tags:
+            return []
+        values = await self._redis.mget([self._tag(tag) for tag in tags])
+        return [int(v) if v is not None else 0 for v in values]
+
+    async def bump(self, tags: Iterable[str]):
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(self._tag(tag))
+            await pipe.execute()
+
+    async def clear(self):
+        async for key in self._redis.scan_iter(match=f"{self.prefix}:*"):
+            await self._redis.delete(key)
+
+    def size(self) -> Optional[int]:
+        return None
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+# ============================================================
+# Response Cache
+# ============================================================
+
+class ResponseCache:
+    """
+    라우트 응답 캐시
+
+    사용법:
+        @router.get("/companies")
+        @response_cache.cached("companies", ttl=120, tags=(COMPANIES,))
+        async def list_companies(page: int = 1, ...): ...
+
+        await response_cache.invalidate(COMPANIES)  # 기업 쓰기 후
+    """
+
+    def __init__(self, backend=None, enabled: bool = True):
+        self.backend = backend or MemoryCacheBackend()
+        self.enabled = enabled
+        self.routes: Dict[str, Dict[str, Any]] = {}
+        self.invalidations: Dict[str, int] = {}
+        self.backend_errors = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    def use_backend(self, backend):
+        """백엔드 교체 (lifespan에서 Redis 연결 시)"""
+        self.backend = backend
+
+    async def close(self):
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        await self.backend.close()
+
+    # ==================== 키 ====================
+
+    @staticmethod
+    def _params_digest(params: Dict[str, Any]) -> str:
+        canonical = json.dumps(jsonable_encoder(params), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+    async def _key(self, route: str, tags: Tuple[str, ...], params: Dict[str, Any]) -> str:
+        generations = await self.backend.generations(tags)
+        version = ".".join(str(g) for g in generations)
+        return f"{route}:{version}:{self._params_digest(params)}"
+
+    # ==================== 조회 / 저장 ====================
+
+    def _counters(self, route: str) -> Dict[str, Any]:
+        if route not in self.routes:
+            self.routes[route] = {"hits": 0, "stale_hits": 0, "coalesced": 0, "misses": 0,
+                                  "refreshes": 0, "bypassed": 0, "ttl": None, "stale_ttl": 0}
+        return self.routes[route]
+
+    async def _store(self, key: str, value: Any, ttl: float, stale_ttl: float):
+        entry = {"value": value, "fresh_until": time.time() + ttl}
+        await self.backend.set(key, entry, ttl + stale_ttl)
+
+    async def _compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float,
+        cache_if: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """계산 후 저장 (같은 키 동시 계산은 한 번만)"""
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = jsonable_encoder(await compute())
+            if cache_if is None or cache_if(value):
+                try:
+                    await self._store(key, value, ttl, stale_ttl)
+                except Exception as e:
+                    self.backend_errors += 1
+                    logger.warning(f"Response cache store failed: {e}")
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 'never retrieved' 경고 방지
+            raise
+        finally:
+            del self._inflight[key]
+
+    def _refresh_in_background(self, route, key, compute, ttl, stale_ttl, cache_if):
+        if key in self._refreshing or key in self._inflight:
+            return
+
+        async def refresh():
+            try:
+                await self._compute(key, compute, ttl, stale_ttl, cache_if)
+                self._counters(route)["refreshes"] += 1
+            except Exception as e:
+                logger.warning(f"Background refresh of {route} failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    async def get_or_compute(
+        self,
+        route: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        tags: Tuple[str, ...] = (),
+        stale_ttl: float = 0,
+        cache_if: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        캐시 조회, 없으면 compute() 실행 후 저장
+
+        Args:
+            route: 라우트 이름 (키 / 카운터 구분)
+            params: 쿼리 파라미터 (키에 포함)
+            compute: 응답 생성 코루틴 함수
+            ttl: 신선 기간 (초)
+            tags: 의존 데이터 태그 (invalidate 시 미적중)
+            stale_ttl: TTL 이후 stale 응답을 주며 백그라운드 갱신하는 기간 (초, 0이면 사용 안 함)
+            cache_if: 응답 저장 여부 판단 (예: 오류 대체 응답 제외)
+
+        Returns:
+            JSON 호환 응답 (dict / list)
+        """
+        counters = self._counters(route)
+        counters["ttl"], counters["stale_ttl"] = ttl, stale_ttl
+
+        if not self.enabled:
+            counters["bypassed"] += 1
+            return await compute()
+
+        try:
+            key = await self._key(route, tags, params)
+            entry = await self.backend.get(key)
+        except Exception as e:
+            # 캐시 백엔드 장애는 응답 실패로 이어지지 않게 우회
+            self.backend_errors += 1
+            counters["bypassed"] += 1
+            logger.warning(f"Response cache unavailable, bypassing: {e}")
+            return await compute()
+
+        if entry is not None:
+            if entry["fresh_until"] > time.time():
+                counters["hits"] += 1
+                return entry["value"]
+            if stale_ttl:
+                counters["stale_hits"] += 1
+                self._refresh_in_background(route, key, compute, ttl, stale_ttl, cache_if)
+                return entry["value"]
+
+        counters["coalesced" if key in self._inflight else "misses"] += 1
+        return await self._compute(key, compute, ttl, stale_ttl, cache_if)
+
+    def cached(
+        self,
+        route: str,
+        ttl: float,
+        tags: Tuple[str, ...] = (),
+        stale_ttl: float = 0,
+        cache_if: Optional[Callable[[Any], bool]] = None
+    ):
+        """라우트 핸들러 데코레이터 (핸들러 인자 = 쿼리 파라미터가 키에 포함)"""
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await self.get_or_compute(
+                    route, kwargs, lambda: func(*args, **kwargs),
+                    ttl=ttl, tags=tags, stale_ttl=stale_ttl, cache_if=cache_if
+                )
+            return wrapper
+        return decorator
+
+    # ==================== 무효화 ====================
+
+    async def invalidate(self, *tags: str):
+        """태그(테이블)에 의존하는 캐시 응답 무효화 (쓰기 후 호출, 실패해도 예외 없음)"""
+        try:
+            await self.backend.bump(tags)
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning(f"Response cache invalidation failed for {tags}: {e}")
+            return
+        for tag in tags:
+            self.invalidations[tag] = self.invalidations.get(tag, 0) + 1
+
+    async def clear(self):
+        await self.backend.clear()
+
+    # ==================== 계측 ====================
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        라우트별 적중률
+
+        Returns:
+            {'backend': str, 'enabled': bool, 'entries': int | None, 'backend_errors': int,
+             'hit_ratio': float, 'invalidations': {태그: 횟수},
+             'routes': {라우트: {'hits', 'stale_hits', 'coalesced', 'misses', 'refreshes',
+                                 'bypassed', 'ttl', 'stale_ttl', 'hit_ratio'}}}
+            coalesced: 같은 키의 진행 중 계산에 합류한 요청 (백엔드 호출 없음, 적중으로 집계)
+        """
+        routes = {}
+        total_served = total_requests = 0
+        for route, c in self.routes.items():
+            served = c["hits"] + c["stale_hits"] + c["coalesced"]
+            requests = served + c["misses"] + c["bypassed"]
+            total_served += served
+            total_requests += requests
+            routes[route] = {**c, "hit_ratio": round(served / requests, 4) if requests else 0.0}
+
+        return {
+            "backend": self.backend.name,
+            "enabled": self.enabled,
+            "entries": self.backend.size(),
+            "backend_errors": self.backend_errors,
+            "hit_ratio": round(total_served / total_requests, 4) if total_requests else 0.0,
+            "invalidations": dict(self.invalidations),
+            "routes": routes
+        }
+
+    def reset_stats(self):
+        self.routes.clear()
+        self.invalidations.clear()
+        self.backend_errors = 0
+
+
+def create_backend():
+    """설정에 따른 백엔드 (REDIS_URL이 있고 redis 패키지가 있으면 Redis, 아니면 메모리)"""
+    if settings.REDIS_URL:
+        if REDIS_AVAILABLE:
+            return RedisCacheBackend(settings.REDIS_URL)
+        logger.warning("REDIS_URL set but redis package not installed - response cache stays in-process")
+    return MemoryCacheBackend()
+
+
+# 전역 인스턴스
+response_cache = ResponseCache(enabled=settings.RESPONSE_CACHE_ENABLED)
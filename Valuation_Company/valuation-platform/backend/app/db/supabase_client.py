@@ -5,23 +5,158 @@ Supabase REST API 클라이언트
 @task Investment Tracker
 @description Supabase DB와 통신하는 클라이언트
 """
-import httpx
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import asyncio
+import base64
+import binascii
+import hashlib
 import json
+import logging
+import random
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timedelta
+
+import httpx
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# 대시보드 요약 통계 뷰 (migrations/005_add_dashboard_stats_summary.sql)
+DASHBOARD_STATS_VIEW = "dashboard_stats_view"
+DASHBOARD_STATS_COLUMNS = (
+    "total_companies,total_news,total_funding_krw,this_week_new_companies,this_week_new_news,"
+    "industry_distribution,stage_distribution,last_collection_date,last_collection_status"
+)
+
+
+def dashboard_week_start() -> str:
+    """
+    대시보드 '이번 주' 시작 시각 (UTC 오늘 포함 최근 7개 달력일의 첫날 0시)
+
+    요약 뷰의 day > current_date - 7 (created_at 일자 기준)과 같은 구간
+    """
+    return (datetime.utcnow().date() - timedelta(days=6)).isoformat()
+
+
+# ============================================================
+# 목록 커서 (keyset 페이지네이션)
+# ============================================================
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없거나 다른 목록/필터에서 발급된 커서"""
+
+
+def _filters_digest(filters: Dict[str, Any]) -> str:
+    """목록 필터 지문 (커서가 같은 필터 조건에서만 쓰이도록)"""
+    canonical = json.dumps(sorted((k, str(v)) for k, v in filters.items()), ensure_ascii=False)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(
+    table: str,
+    filters: Dict[str, Any],
+    value: Any,
+    row_id: int,
+    position: int,
+    total: int
+) -> str:
+    """
+    불투명 커서 생성
+
+    Args:
+        table: 목록 테이블 (다른 목록의 커서 재사용 방지)
+        filters: 목록 필터 (PostgREST 파라미터)
+        value: 마지막 행의 정렬 컬럼 값
+        row_id: 마지막 행의 id
+        position: 지금까지 반환한 행 수 (페이지 번호 계산용)
+        total: 첫 페이지에서 센 필터 반영 총건수
+    """
+    payload = {"t": table, "f": _filters_digest(filters), "v": value, "id": row_id, "n": position, "c": total}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, table: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    커서 해석
+
+    Returns:
+        {'v': 정렬 컬럼 값, 'id': int, 'n': int, 'c': int}
+
+    Raises:
+        InvalidCursorError: 형식 오류 / 다른 테이블·필터의 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        row_id, position, total = int(payload["id"]), int(payload["n"]), int(payload["c"])
+        value = payload["v"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+
+    if payload.get("t") != table or payload.get("f") != _filters_digest(filters):
+        raise InvalidCursorError("Cursor does not belong to this listing")
+    if position < 0 or total < 0 or (value is not None and not isinstance(value, (str, int, float))):
+        raise InvalidCursorError("Malformed cursor")
+    return {"v": value, "id": row_id, "n": position, "c": total}
+
+
+def _quote(value: Any) -> str:
+    """PostgREST 논리 필터(or) 안의 값 인용"""
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _content_range_total(response: httpx.Response) -> int:
+    """Prefer: count=exact 응답의 Content-Range 총건수 (예: 0-19/137 → 137)"""
+    total = response.headers.get("content-range", "0-0/0").split("/")[-1]
+    return int(total) if total.isdigit() else 0
+
 
 class SupabaseClient:
     """
     Supabase REST API 클라이언트
     PostgREST API를 사용하여 데이터베이스와 통신
+
+    - 장수명 httpx.AsyncClient 하나를 공유 (커넥션 풀 / keep-alive / HTTP/2)
+      FastAPI lifespan에서 start() / close(), 그 밖(스크립트 등)에서는 첫 호출 시 생성
+    - 5xx / 429 / 연결 오류는 지터 포함 지수 백오프로 재시도
+    - 풀 사용률 / 테이블별 지연시간 계측 (stats())
     """
 
-    def __init__(self):
-        self.url = settings.SUPABASE_URL
-        self.key = settings.SUPABASE_KEY
+    # 재시도 대상 상태 코드
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    # 5xx 재시도가 안전한 메서드 (POST는 429 / 전송 전 연결 오류만 재시도 → 중복 INSERT 방지)
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "PATCH", "DELETE"}
+    # 테이블별 지연시간 샘플 보관 개수 (최근 N건으로 백분위 계산)
+    LATENCY_SAMPLES = 512
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        key: Optional[str] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0,
+        connect_timeout: float = 3.0,
+        pool_timeout: float = 5.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 5.0,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.url = settings.SUPABASE_URL if url is None else url
+        self.key = settings.SUPABASE_KEY if key is None else key
         self.headers = {
             "apikey": self.key,
             "Authorization": f"Bearer {self.key}",
@@ -29,30 +164,230 @@ class SupabaseClient:
             "Prefer": "return=representation"
         }
 
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout, pool=pool_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("h2 package not installed - Supabase client falls back to HTTP/1.1")
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._tables: Dict[str, Dict[str, Any]] = {}
+        self._dashboard_fallback_warned = False
+
+    # ============================================================
+    # Lifecycle
+    # ============================================================
+
+    async def start(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 생성 (이미 있으면 그대로 반환)"""
+        loop = asyncio.get_running_loop()
+        # 다른 이벤트 루프(asyncio.run을 여러 번 쓰는 스크립트)에서는 커넥션을 재사용할 수 없으므로 새로 생성
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._loop = loop
+            self._client = httpx.AsyncClient(
+                base_url=f"{self.url}/rest/v1",
+                headers=self.headers,
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                transport=self._transport
+            )
+        return self._client
+
+    async def close(self):
+        """공유 HTTP 클라이언트 종료 (풀의 커넥션 반납)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    # ============================================================
+    # Transport
+    # ============================================================
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """재시도 대기 시간 (full jitter, 429의 Retry-After 우선)"""
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after and retry_after.replace(".", "", 1).isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _should_retry(self, method: str, status_code: Optional[int], error: Optional[Exception]) -> bool:
+        if error is not None:
+            # 요청이 전송되지 않은 오류는 항상 안전, 그 외 전송 오류는 멱등 메서드만
+            if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+                return True
+            return method in self.IDEMPOTENT_METHODS
+        if status_code == 429:
+            return True
+        return status_code in self.RETRY_STATUSES and method in self.IDEMPOTENT_METHODS
+
+    async def _send(
+        self,
+        method: str,
+        table: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        filters: Optional[str] = "",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> httpx.Response:
+        """재시도 / 계측을 포함한 요청 전송 (응답 상태 검사는 호출 측)"""
+        client = await self.start()
+        request_timeout = httpx.Timeout(timeout, connect=self.timeout.connect, pool=self.timeout.pool) \
+            if timeout is not None else httpx.USE_CLIENT_DEFAULT
+
+        attempt = 0
+        while True:
+            response = None
+            error = None
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            start = time.perf_counter()
+            try:
+                response = await client.request(
+                    method=method,
+                    url=f"/{table}{filters or ''}",
+                    headers=headers,
+                    params=params,
+                    json=data,
+                    timeout=request_timeout
+                )
+            except httpx.TransportError as e:
+                error = e
+            finally:
+                self._in_flight -= 1
+                self._record(table, time.perf_counter() - start, response, error)
+
+            status_code = response.status_code if response is not None else None
+            if attempt >= self.max_retries or not self._should_retry(method, status_code, error):
+                if error is not None:
+                    raise error
+                return response
+
+            delay = self._backoff(attempt, response)
+            logger.warning(
+                f"Supabase {method} {table} failed "
+                f"({status_code or type(error).__name__}), retry {attempt + 1}/{self.max_retries} in {delay:.2f}s"
+            )
+            self._tables[table]["retries"] += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
     async def _request(
         self,
         method: str,
         table: str,
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
-        filters: Optional[str] = ""
+        filters: Optional[str] = "",
+        timeout: Optional[float] = None
     ) -> Any:
         """HTTP 요청 실행"""
-        url = f"{self.url}/rest/v1/{table}{filters}"
+        response = await self._send(method, table, params=params, data=data, filters=filters, timeout=timeout)
+        response.raise_for_status()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                params=params,
-                json=data
-            )
-            response.raise_for_status()
+        if response.content:
+            return response.json()
+        return None
+
+    # ============================================================
+    # Instrumentation
+    # ============================================================
 
-            if response.content:
-                return response.json()
-            return None
+    def _record(
+        self,
+        table: str,
+        elapsed: float,
+        response: Optional[httpx.Response],
+        error: Optional[Exception]
+    ):
+        entry = self._tables.get(table)
+        if entry is None:
+            entry = self._tables[table] = {
+                "requests": 0, "errors": 0, "retries": 0, "total_ms": 0.0,
+                "samples": deque(maxlen=self.LATENCY_SAMPLES)
+            }
+        elapsed_ms = elapsed * 1000
+        entry["requests"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["samples"].append(elapsed_ms)
+        if error is not None or (response is not None and response.status_code >= 400):
+            entry["errors"] += 1
+
+    def _open_connections(self) -> Dict[str, int]:
+        """httpcore 풀의 커넥션 상태 (내부 속성 - 버전에 따라 비어 있을 수 있음)"""
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return {}
+        idle = sum(1 for c in connections if c.is_idle())
+        return {"open": len(connections), "idle": idle, "active": len(connections) - idle}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        클라이언트 계측 통계
+
+        Returns:
+            {
+                'http2': bool, 'started': bool,
+                'pool': {
+                    'max_connections': int, 'max_keepalive_connections': int,
+                    'in_flight': int, 'peak_in_flight': int,
+                    'utilisation': float,        # in_flight / max_connections
+                    'peak_utilisation': float,
+                    'connections': {'open': int, 'idle': int, 'active': int}
+                },
+                'tables': {
+                    table: {'requests': int, 'errors': int, 'retries': int,
+                            'mean_ms': float, 'p50_ms': float, 'p95_ms': float, 'max_ms': float}
+                }
+            }
+        """
+        max_connections = self.limits.max_connections or 0
+        tables = {}
+        for table, entry in sorted(self._tables.items()):
+            samples = sorted(entry["samples"])
+            tables[table] = {
+                "requests": entry["requests"],
+                "errors": entry["errors"],
+                "retries": entry["retries"],
+                "mean_ms": round(entry["total_ms"] / entry["requests"], 2) if entry["requests"] else 0.0,
+                "p50_ms": round(samples[len(samples) // 2], 2) if samples else 0.0,
+                "p95_ms": round(samples[int(0.95 * (len(samples) - 1))], 2) if samples else 0.0,
+                "max_ms": round(samples[-1], 2) if samples else 0.0
+            }
+
+        return {
+            "http2": self.http2,
+            "started": self._client is not None and not self._client.is_closed,
+            "pool": {
+                "max_connections": max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "utilisation": round(self._in_flight / max_connections, 4) if max_connections else 0.0,
+                "peak_utilisation": round(self._peak_in_flight / max_connections, 4) if max_connections else 0.0,
+                "connections": self._open_connections()
+            },
+            "tables": tables
+        }
+
+    def reset_stats(self):
+        self._peak_in_flight = self._in_flight
+        self._tables.clear()
 
     # ============================================================
     # Generic CRUD Operations
@@ -105,9 +440,14 @@ class SupabaseClient:
         filter_str = "?" + "&".join([f"{k}=eq.{v}" for k, v in filters.items()])
         await self._request("DELETE", table, filters=filter_str)
 
-    async def count(self, table: str, filters: Optional[Dict[str, Any]] = None) -> int:
+    async def count(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> int:
         """COUNT 쿼리"""
-        headers = {**self.headers, "Prefer": "count=exact"}
+        headers = {"Prefer": "count=exact"}
         params = {"select": "*"}
 
         if filters:
@@ -115,13 +455,94 @@ class SupabaseClient:
                 if value is not None:
                     params[key] = f"eq.{value}"
 
-        url = f"{self.url}/rest/v1/{table}"
+        response = await self._send("HEAD", table, params=params, headers=headers, timeout=timeout)
+        return _content_range_total(response)
+
+    async def rpc(self, function: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """RPC 호출 (POST /rpc/{function})"""
+        return await self._request("POST", f"rpc/{function}", data=params or {})
+
+    async def paginate(
+        self,
+        table: str,
+        sort_column: str,
+        filters: Optional[Dict[str, str]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """
+        목록 조회 (sort_column DESC NULLS LAST, id DESC)
+
+        - cursor 없음: page 기준 offset 조회, 총건수는 같은 GET의 Prefer: count=exact (필터 반영)
+        - cursor 있음: 마지막 행 (값, id) 이후를 keyset 조건으로 조회 → 깊은 페이지도
+          (sort_column, id) 인덱스 범위 스캔 (migrations/006). 총건수는 첫 페이지 값을 커서로 전달
+          (이어지는 페이지마다 남은 행 전체를 다시 세지 않도록)
+        - 정렬 값이 NULL인 행은 맨 뒤 구간이므로, 값 있는 구간이 끝나는 페이지에서만 한 번 더 조회
+
+        Args:
+            filters: PostgREST 필터 파라미터 (예: {'industry': 'eq.AI'}, sort_column / id 제외)
+            cursor: 이전 응답의 next_cursor
+
+        Returns:
+            {'items': [...], 'total': int, 'page': int, 'page_size': int,
+             'total_pages': int, 'next_cursor': str | None}
+
+        Raises:
+            InvalidCursorError: 커서 형식 오류 / 다른 목록·필터의 커서
+        """
+        filters = filters or {}
+        params = {
+            **filters,
+            "select": "*",
+            "order": f"{sort_column}.desc.nullslast,id.desc",
+            "limit": page_size + 1
+        }
+
+        if cursor:
+            state = decode_cursor(cursor, table, filters)
+            position, total = state["n"], state["c"]
+            if state["v"] is None:
+                params[sort_column] = "is.null"
+                params["id"] = f"lt.{state['id']}"
+                rows = await self._request("GET", table, params=params)
+            else:
+                params[sort_column] = f"lte.{state['v']}"
+                params["or"] = f"({sort_column}.lt.{_quote(state['v'])},id.lt.{state['id']})"
+                rows = await self._request("GET", table, params=params)
+                if len(rows) <= page_size:
+                    rows += await self._request("GET", table, params={
+                        **filters,
+                        "select": "*",
+                        "order": "id.desc",
+                        sort_column: "is.null",
+                        "limit": page_size + 1 - len(rows)
+                    })
+        else:
+            position = (page - 1) * page_size
+            if position:
+                params["offset"] = position
+            response = await self._send("GET", table, params=params, headers={"Prefer": "count=exact"})
+            response.raise_for_status()
+            rows = response.json()
+            total = _content_range_total(response)
+
+        items = rows[:page_size]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                table, filters, last.get(sort_column), last["id"], position + len(items), total
+            )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.head(url, headers=headers, params=params)
-            content_range = response.headers.get("content-range", "0-0/0")
-            total = int(content_range.split("/")[-1])
-            return total
+        return {
+            "items": items,
+            "total": total,
+            "page": position // page_size + 1,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size,
+            "next_cursor": next_cursor
+        }
 
     # ============================================================
     # Investment Tracker Specific Methods
@@ -133,33 +554,22 @@ class SupabaseClient:
         page_size: int = 20,
         industry: Optional[str] = None,
         stage: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> Dict:
-        """기업 목록 조회"""
-        params = {
-            "select": "*",
-            "order": "latest_round_date.desc.nullslast",
-            "limit": page_size,
-            "offset": (page - 1) * page_size
-        }
-
+        """기업 목록 조회 (최근 투자일 순, 커서 페이지네이션)"""
+        filters = {}
         if industry:
-            params["industry"] = f"eq.{industry}"
+            filters["industry"] = f"eq.{industry}"
         if stage:
-            params["latest_stage"] = f"eq.{stage}"
+            filters["latest_stage"] = f"eq.{stage}"
         if search:
-            params["name_ko"] = f"ilike.%{search}%"
-
-        items = await self._request("GET", "startup_companies", params=params)
-        total = await self.count("startup_companies")
+            filters["name_ko"] = f"ilike.%{search}%"
 
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size
-        }
+        return await self.paginate(
+            "startup_companies", "latest_round_date", filters,
+            page=page, page_size=page_size, cursor=cursor
+        )
 
     async def get_company_by_id(self, company_id: int) -> Optional[Dict]:
         """기업 상세 조회"""
@@ -213,31 +623,20 @@ class SupabaseClient:
         page: int = 1,
         page_size: int = 20,
         source: Optional[str] = None,
-        company_id: Optional[int] = None
+        company_id: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Dict:
-        """뉴스 목록 조회"""
-        params = {
-            "select": "*",
-            "order": "published_date.desc.nullslast",
-            "limit": page_size,
-            "offset": (page - 1) * page_size
-        }
-
+        """뉴스 목록 조회 (발행일 순, 커서 페이지네이션)"""
+        filters = {}
         if source:
-            params["source"] = f"eq.{source}"
+            filters["source"] = f"eq.{source}"
         if company_id:
-            params["company_id"] = f"eq.{company_id}"
+            filters["company_id"] = f"eq.{company_id}"
 
-        items = await self._request("GET", "investment_news", params=params)
-        total = await self.count("investment_news")
-
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size
-        }
+        return await self.paginate(
+            "investment_news", "published_date", filters,
+            page=page, page_size=page_size, cursor=cursor
+        )
 
     async def get_news_by_url(self, source_url: str) -> Optional[Dict]:
         """URL로 뉴스 조회"""
@@ -271,24 +670,17 @@ class SupabaseClient:
         data["updated_at"] = datetime.utcnow().isoformat()
         return await self.insert("email_templates", data)
 
-    async def get_collections(self, page: int = 1, page_size: int = 10) -> Dict:
-        """수집 이력 조회"""
-        params = {
-            "select": "*",
-            "order": "collection_date.desc",
-            "limit": page_size,
-            "offset": (page - 1) * page_size
-        }
-        items = await self._request("GET", "weekly_collections", params=params)
-        total = await self.count("weekly_collections")
-
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size
-        }
+    async def get_collections(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """수집 이력 조회 (수집일 순, 커서 페이지네이션)"""
+        return await self.paginate(
+            "weekly_collections", "collection_date",
+            page=page, page_size=page_size, cursor=cursor
+        )
 
     async def create_collection(self, data: Dict) -> Dict:
         """수집 레코드 생성"""
@@ -307,35 +699,87 @@ class SupabaseClient:
         return result[0] if result else {}
 
     async def get_dashboard_stats(self) -> Dict:
-        """대시보드 통계"""
-        from datetime import timedelta
+        """
+        대시보드 통계 (요약 뷰 1행 조회)
+
+        dashboard_stats_view는 쓰기 트리거로 증분 갱신되는 요약 테이블을 읽는다
+        (migrations/005_add_dashboard_stats_summary.sql).
+        마이그레이션 전 DB(뷰 없음)에서는 전체 스캔 방식으로 계산한다.
+
+        Returns:
+            {'total_companies': int, 'total_news': int, 'total_funding_krw': float,
+             'this_week_new_companies': int, 'this_week_new_news': int,
+             'industry_distribution': {업종: 기업 수}, 'stage_distribution': {단계: 기업 수},
+             'last_collection_date': str | None, 'last_collection_status': str | None}
+        """
+        response = await self._send(
+            "GET", DASHBOARD_STATS_VIEW, params={"select": DASHBOARD_STATS_COLUMNS, "limit": 1}
+        )
+        if response.status_code == 404:
+            if not self._dashboard_fallback_warned:
+                logger.warning(
+                    f"{DASHBOARD_STATS_VIEW} not found (migration 005 not applied), "
+                    "falling back to full-scan dashboard stats"
+                )
+                self._dashboard_fallback_warned = True
+            return await self._compute_dashboard_stats()
+        response.raise_for_status()
+
+        rows = response.json()
+        if not rows:
+            return await self._compute_dashboard_stats()
+        row = rows[0]
 
-        week_ago = (datetime.utcnow() - timedelta(days=7)).isoformat()
+        return {
+            "total_companies": row.get("total_companies") or 0,
+            "total_news": row.get("total_news") or 0,
+            "total_funding_krw": float(row.get("total_funding_krw") or 0),
+            "this_week_new_companies": row.get("this_week_new_companies") or 0,
+            "this_week_new_news": row.get("this_week_new_news") or 0,
+            "industry_distribution": row.get("industry_distribution") or {},
+            "stage_distribution": row.get("stage_distribution") or {},
+            "last_collection_date": row.get("last_collection_date"),
+            "last_collection_status": row.get("last_collection_status")
+        }
 
-        # 기본 통계
-        total_companies = await self.count("startup_companies")
-        total_news = await self.count("investment_news")
+    async def refresh_dashboard_stats(self) -> None:
+        """대시보드 요약 통계 전체 재계산 (드리프트 보정용, 수집 완료 후 호출)"""
+        await self.rpc("refresh_dashboard_stats")
+
+    async def _compute_dashboard_stats(self) -> Dict:
+        """대시보드 통계 전체 스캔 계산 (요약 뷰가 없는 DB용)"""
+        week_start = dashboard_week_start()
+
+        total_companies, total_news, companies, new_news, collections = await asyncio.gather(
+            self.count("startup_companies"),
+            self.count("investment_news"),
+            self.select("startup_companies", columns="total_funding_krw,industry,latest_stage,created_at"),
+            self._send(
+                "HEAD", "investment_news",
+                params={"select": "*", "created_at": f"gte.{week_start}"},
+                headers={"Prefer": "count=exact"}
+            ),
+            self.select("weekly_collections", order_by="collection_date.desc.nullslast", limit=1)
+        )
 
-        # 총 투자금액 (별도 쿼리 필요 - RPC 사용 권장)
-        companies = await self.select("startup_companies", columns="total_funding_krw")
-        total_funding = sum(c.get("total_funding_krw", 0) or 0 for c in companies)
+        industry_distribution: Dict[str, int] = {}
+        stage_distribution: Dict[str, int] = {}
+        for c in companies:
+            if c.get("industry"):
+                industry_distribution[c["industry"]] = industry_distribution.get(c["industry"], 0) + 1
+            if c.get("latest_stage"):
+                stage_distribution[c["latest_stage"]] = stage_distribution.get(c["latest_stage"], 0) + 1
 
-        # 최근 수집
-        collections = await self.select(
-            "weekly_collections",
-            order_by="collection_date.desc",
-            limit=1
-        )
         last_collection = collections[0] if collections else None
 
         return {
             "total_companies": total_companies,
             "total_news": total_news,
-            "total_funding_krw": total_funding,
-            "this_week_new_companies": 0,  # 별도 쿼리 필요
-            "this_week_new_news": 0,       # 별도 쿼리 필요
-            "industry_distribution": {},    # 별도 쿼리 필요
-            "stage_distribution": {},       # 별도 쿼리 필요
+            "total_funding_krw": float(sum(c.get("total_funding_krw", 0) or 0 for c in companies)),
+            "this_week_new_companies": sum(1 for c in companies if (c.get("created_at") or "") >= week_start),
+            "this_week_new_news": _content_range_total(new_news),
+            "industry_distribution": industry_distribution,
+            "stage_distribution": stage_distribution,
             "last_collection_date": last_collection.get("collection_date") if last_collection else None,
             "last_collection_status": last_collection.get("status") if last_collection else None
         }
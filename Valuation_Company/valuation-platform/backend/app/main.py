@@ -6,7 +6,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import router
 from app.core.config import settings
+from app.core.response_cache import response_cache, create_backend
 from app.core.scheduler import start_scheduler, shutdown_scheduler, get_job_status
+from app.db.supabase_client import supabase_client
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,6 +25,15 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Valuation Platform API")
     logger.info(f"Supabase URL configured: {bool(settings.SUPABASE_URL)}")
 
+    # Supabase 공유 HTTP 클라이언트 (커넥션 풀 / keep-alive)
+    if settings.SUPABASE_URL:
+        await supabase_client.start()
+        logger.info(f"Supabase client started (http2={supabase_client.http2})")
+
+    # 조회 응답 캐시 (REDIS_URL 설정 시 워커 간 공유 백엔드)
+    response_cache.use_backend(create_backend())
+    logger.info(f"Response cache backend: {response_cache.backend.name} (enabled={response_cache.enabled})")
+
     # 스케줄러 시작
     if not settings.DEBUG:  # 프로덕션에서만 스케줄러 자동 시작
         start_scheduler()
@@ -35,6 +46,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Valuation Platform API")
     shutdown_scheduler()
+    await supabase_client.close()
+    await response_cache.close()
 
 
 app = FastAPI(
@@ -98,3 +111,23 @@ async def stop_scheduler_endpoint():
     """스케줄러 수동 중지"""
     shutdown_scheduler()
     return {"status": "stopped"}
+
+
+# ============================================================
+# Supabase Client Endpoints
+# ============================================================
+
+@app.get("/supabase/stats")
+async def supabase_stats():
+    """Supabase 클라이언트 풀 사용률 / 테이블별 지연시간"""
+    return supabase_client.stats()
+
+
+# ============================================================
+# Response Cache Endpoints
+# ============================================================
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """조회 응답 캐시 라우트별 적중률 / 무효화 횟수"""
+    return response_cache.stats()
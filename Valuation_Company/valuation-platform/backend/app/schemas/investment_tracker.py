@@ -89,12 +89,13 @@ class CompanyResponse(CompanyBase):
 
 
 class CompanyListResponse(BaseModel):
-    """기업 목록 응답 (페이지네이션)"""
+    """기업 목록 응답 (페이지네이션, 커서)"""
     items: List[CompanyResponse]
     total: int
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
 
 
 class InvestmentRoundResponse(BaseModel):
@@ -192,12 +193,13 @@ class NewsDetailResponse(BaseModel):
 
 
 class NewsListResponse(BaseModel):
-    """뉴스 목록 응답 (페이지네이션)"""
+    """뉴스 목록 응답 (페이지네이션, 커서)"""
     items: List[NewsDetailResponse]
     total: int
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
 
 
 # ============================================================
@@ -265,12 +267,13 @@ class CollectionResponse(CollectionBase):
 
 
 class CollectionListResponse(BaseModel):
-    """수집 작업 목록 응답"""
+    """수집 작업 목록 응답 (페이지네이션, 커서)"""
     items: List[CollectionResponse]
     total: int
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
 
 
 # ============================================================
@@ -0,0 +1,389 @@
+"""
+배치 자산가치평가 엔진 (Batch NAV Engine)
+
+펀드 포트폴리오의 분기말 NAV처럼 많은 재무상태표를 한 번에 평가
+- 입력은 컬럼형: 계정별 (N,) 배열 (AssetValuationEngine의 balance_sheet 키와 동일)
+- 공정가치 조정 규칙은 AssetValuationEngine._value_* 와 같은 규칙을 배열 연산으로 적용
+- 감정평가액 등 선택 입력은 NaN = 미제공 (스칼라 엔진의 '키 없음'과 동일하게 기본 규칙 적용)
+- 회사별 NAV만 반환하고, 계정별 상세는 detail=True 또는 item_details(i) 요청 시에만 생성
+- chunk_size 단위로 나눠 계산해 임시 배열 메모리를 청크 크기로 제한
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import sys
+sys.path.append('..')
+
+from typing import Dict, Iterable, Optional
+import numpy as np
+
+
+class BatchAssetValuationEngine:
+    """N개 재무상태표를 한 번에 평가하는 NAV 배치 엔진"""
+
+    # 스칼라 엔진 기본 가정 (AssetValuationEngine과 동일)
+    DEFAULTS = {
+        'bad_debt_rate': 0.02,
+        'inventory_markdown': 0.05,
+        'machinery_depreciation': 0.20,
+        'goodwill_impairment': 0.0,
+        'contingent_liabilities': 0.0,
+        'debt_interest_rate': 0.05,
+        'shares_outstanding': 1_000_000
+    }
+
+    # 계정 순서 = 스칼라 엔진 상세 순서 (자산 11개 + 부채 3개)
+    ASSET_ITEMS = (
+        ('cash', '현금 및 현금성자산'),
+        ('short_term_investments', '단기금융상품'),
+        ('accounts_receivable', '매출채권'),
+        ('inventory', '재고자산'),
+        ('land', '토지'),
+        ('building', '건물'),
+        ('machinery', '기계장치'),
+        ('goodwill', '영업권'),
+        ('patents', '특허권/상표권'),
+        ('listed_stocks', '상장주식'),
+        ('unlisted_stocks', '비상장주식')
+    )
+    LIABILITY_ITEMS = (
+        ('current_liabilities', '유동부채'),
+        ('long_term_debt', '장기차입금'),
+        ('contingent_liabilities', '우발부채')
+    )
+
+    def __init__(self, chunk_size: int = 4096):
+        self.chunk_size = chunk_size
+
+    # ==================== 입력 정리 ====================
+
+    @staticmethod
+    def _column(source: Dict, key: str, n: int, default: float = 0.0) -> np.ndarray:
+        """스칼라 / (N,) 배열 / 없음 → (N,) float 배열"""
+        if key not in source or source[key] is None:
+            return np.full(n, default, dtype=float)
+        return np.broadcast_to(np.asarray(source[key], dtype=float), (n,))
+
+    @staticmethod
+    def batch_size(balance_sheets: Dict) -> int:
+        """계정 배열 길이로 회사 수(N) 결정"""
+        sizes = {np.asarray(v).shape[0] for v in balance_sheets.values() if np.ndim(v) == 1}
+        if len(sizes) > 1:
+            raise ValueError(f"재무상태표 배열의 길이가 일치하지 않습니다: {sorted(sizes)}")
+        return sizes.pop() if sizes else 1
+
+    @staticmethod
+    def stack_balance_sheets(records: Iterable[Dict]) -> Dict[str, np.ndarray]:
+        """
+        스칼라 재무상태표 / 공정가치 Dict 리스트를 컬럼형으로 변환
+
+        숫자가 아닌 값(회사명, 분기 라벨 등)은 object 배열, 빠진 숫자 키는 NaN
+
+        Args:
+            records: [{'cash': 5000, 'land': 10000, ...}, ...]
+
+        Returns:
+            Dict: 키별 (N,) 배열
+        """
+        records = list(records)
+        keys = dict.fromkeys(k for r in records for k in r)
+        stacked = {}
+        for key in keys:
+            values = [r.get(key) for r in records]
+            if all(v is None or isinstance(v, (int, float)) for v in values):
+                stacked[key] = np.array([np.nan if v is None else v for v in values], dtype=float)
+            else:
+                stacked[key] = np.array(values, dtype=object)
+        return stacked
+
+    # ==================== 계정별 공정가치 ====================
+
+    def _fair_values(self, bs: Dict, fv: Dict, rows: slice, n: int) -> Dict[str, np.ndarray]:
+        """
+        청크 1개의 계정별 (장부가, 공정가치) 배열
+
+        Returns:
+            {'book': (n, K), 'fair': (n, K), 'fallback': (n, K) bool}
+            K = 자산 11개 + 부채 3개, fallback은 감정평가액 등 미제공으로 기본 규칙이 적용된 위치
+        """
+        def col(source, key, default=0.0):
+            """NaN / 없음 = 기본값"""
+            value = source.get(key)
+            if value is None:
+                return np.full(n, default)
+            if np.ndim(value) == 1:
+                value = np.asarray(value, dtype=float)[rows]
+            return np.nan_to_num(np.broadcast_to(np.asarray(value, dtype=float), (n,)), nan=default)
+
+        def optional(source, key):
+            """NaN = 미제공"""
+            value = source.get(key)
+            if value is None:
+                return np.full(n, np.nan)
+            if np.ndim(value) == 1:
+                value = np.asarray(value, dtype=float)[rows]
+            return np.broadcast_to(np.asarray(value, dtype=float), (n,))
+
+        k = len(self.ASSET_ITEMS) + len(self.LIABILITY_ITEMS)
+        book = np.empty((n, k))
+        fair = np.empty((n, k))
+        fallback = np.zeros((n, k), dtype=bool)
+
+        for j, (key, _) in enumerate(self.ASSET_ITEMS + self.LIABILITY_ITEMS[:2]):
+            book[:, j] = col(bs, key)
+
+        # 유동자산: 현금·단기금융상품은 장부가, 매출채권 대손, 재고 평가손
+        fair[:, 0] = book[:, 0]
+        fair[:, 1] = book[:, 1]
+        fair[:, 2] = book[:, 2] * (1 - col(fv, 'bad_debt_rate', self.DEFAULTS['bad_debt_rate']))
+        fair[:, 3] = book[:, 3] * (1 - col(fv, 'inventory_markdown', self.DEFAULTS['inventory_markdown']))
+
+        # 유형자산: 감정평가액 우선, 없으면 토지 × 1.5 / 건물 × 0.9, 기계장치 추가 감가
+        for j, key, factor in ((4, 'land_appraisal', 1.5), (5, 'building_appraisal', 0.9)):
+            appraisal = optional(fv, key)
+            fallback[:, j] = np.isnan(appraisal)
+            fair[:, j] = np.where(fallback[:, j], book[:, j] * factor, appraisal)
+        fair[:, 6] = book[:, 6] * (1 - col(fv, 'machinery_depreciation', self.DEFAULTS['machinery_depreciation']))
+
+        # 무형자산: 영업권 손상, 특허권 별도 평가액 또는 80%
+        fair[:, 7] = book[:, 7] - col(fv, 'goodwill_impairment')
+        patents = optional(fv, 'patents_valuation')
+        fallback[:, 8] = np.isnan(patents)
+        fair[:, 8] = np.where(fallback[:, 8], book[:, 8] * 0.8, patents)
+
+        # 투자자산: 상장주식 시가 또는 장부가, 비상장주식 별도 평가액 또는 50%
+        for j, key, factor in ((9, 'listed_stocks_market_value', 1.0), (10, 'unlisted_stocks_valuation', 0.5)):
+            value = optional(fv, key)
+            fallback[:, j] = np.isnan(value)
+            fair[:, j] = np.where(fallback[:, j], book[:, j] * factor, value)
+
+        # 부채: 유동부채 장부가, 장기차입금은 시장이자율 > 약정이자율일 때만 할인, 우발부채 추가 인식
+        lt = len(self.ASSET_ITEMS)
+        fair[:, lt] = book[:, lt]
+        market_rate = optional(fv, 'market_interest_rate')
+        book_rate = col(bs, 'debt_interest_rate', self.DEFAULTS['debt_interest_rate'])
+        rate_up = ~np.isnan(market_rate) & (market_rate > book_rate)
+        fallback[:, lt + 1] = np.isnan(market_rate)
+        fair[:, lt + 1] = book[:, lt + 1] * (1 + np.where(rate_up, (book_rate - market_rate) * 0.5, 0.0))
+        contingent = np.maximum(col(fv, 'contingent_liabilities'), 0.0)
+        book[:, lt + 2] = 0.0
+        fair[:, lt + 2] = contingent
+
+        return {'book': book, 'fair': fair, 'fallback': fallback}
+
+    # ==================== 실행 ====================
+
+    def run_valuation(self,
+                      balance_sheets: Dict,
+                      fair_value_data: Optional[Dict] = None,
+                      detail: bool = False) -> Dict:
+        """
+        배치 NAV 평가
+
+        Args:
+            balance_sheets: 계정별 (N,) 배열 (AssetValuationEngine balance_sheet 키)
+                + 선택: 'company_id' (N,), 'period' (N,) 분기말 라벨, 'ownership' (N,) 보유 지분율
+            fair_value_data: 공정가치 조정 키별 스칼라 또는 (N,) 배열 (NaN = 미제공)
+            detail: True면 계정별 (N, K) 장부가/공정가치 행렬 포함
+
+        Returns:
+            Dict: 컬럼형 결과
+                {
+                    'n_companies': N,
+                    'total_assets_book', 'total_assets_fv', 'total_liabilities_book',
+                    'total_liabilities_fv', 'nav', 'nav_per_share', 'total_adjustments': (N,),
+                    'holding_value': (N,)  # ownership이 있을 때 NAV × 지분율
+                    'portfolio': {'periods': [...], 'nav': [...], 'holding_value': [...]}  # period가 있을 때
+                    'items': [...], 'book': (N, K), 'fair_value': (N, K)  # detail=True일 때
+                }
+        """
+        fair_value_data = fair_value_data or {}
+        n = self.batch_size(balance_sheets)
+        n_assets = len(self.ASSET_ITEMS)
+
+        totals = {key: np.empty(n) for key in ('assets_fv', 'liabilities_fv', 'adjustments')}
+        if detail:
+            k = n_assets + len(self.LIABILITY_ITEMS)
+            book_all, fair_all = np.empty((n, k)), np.empty((n, k))
+
+        for start in range(0, n, self.chunk_size):
+            rows = slice(start, min(start + self.chunk_size, n))
+            values = self._fair_values(balance_sheets, fair_value_data, rows, rows.stop - rows.start)
+            book, fair = values['book'], values['fair']
+
+            assets_fv = fair[:, :n_assets].sum(axis=1)
+            liabilities_fv = fair[:, n_assets:].sum(axis=1)
+            adjustment = fair - book
+            totals['assets_fv'][rows] = assets_fv
+            totals['liabilities_fv'][rows] = liabilities_fv
+            totals['adjustments'][rows] = adjustment[:, :n_assets].sum(axis=1) - adjustment[:, n_assets:].sum(axis=1)
+            if detail:
+                book_all[rows], fair_all[rows] = book, fair
+
+        shares = self._column(balance_sheets, 'shares_outstanding', n, self.DEFAULTS['shares_outstanding'])
+        nav = totals['assets_fv'] - totals['liabilities_fv']
+        result = {
+            'n_companies': n,
+            'total_assets_book': self._column(balance_sheets, 'total_assets', n),
+            'total_assets_fv': totals['assets_fv'],
+            'total_liabilities_book': self._column(balance_sheets, 'total_liabilities', n),
+            'total_liabilities_fv': totals['liabilities_fv'],
+            'nav': nav,
+            'nav_per_share': nav * 1_000_000 / shares,  # 원
+            'total_adjustments': totals['adjustments']
+        }
+        if 'company_id' in balance_sheets:
+            result['company_id'] = np.asarray(balance_sheets['company_id'])
+
+        if 'ownership' in balance_sheets:
+            result['holding_value'] = nav * self._column(balance_sheets, 'ownership', n)
+
+        if 'period' in balance_sheets:
+            # 분기말별 포트폴리오 합계 (bincount 1회)
+            periods, index = np.unique(np.asarray(balance_sheets['period']).astype(str), return_inverse=True)
+            result['portfolio'] = {
+                'periods': periods.tolist(),
+                'n_companies': np.bincount(index, minlength=periods.size).tolist(),
+                'nav': np.bincount(index, weights=nav, minlength=periods.size).tolist()
+            }
+            if 'holding_value' in result:
+                result['portfolio']['holding_value'] = np.bincount(
+                    index, weights=result['holding_value'], minlength=periods.size).tolist()
+
+        if detail:
+            result['items'] = [name for _, name in self.ASSET_ITEMS + self.LIABILITY_ITEMS]
+            result['book'] = book_all
+            result['fair_value'] = fair_all
+
+        return result
+
+    def item_details(self, balance_sheets: Dict, fair_value_data: Optional[Dict], index: int) -> Dict:
+        """
+        회사 1곳의 계정별 상세 (AssetValuationEngine의 asset_details / liability_details 형식)
+
+        배치 결과에는 상세를 담지 않으므로, 감사·검토 대상 회사만 이 함수로 생성
+        """
+        fair_value_data = fair_value_data or {}
+        values = self._fair_values(balance_sheets, fair_value_data, slice(index, index + 1), 1)
+        book, fair, fallback = values['book'][0], values['fair'][0], values['fallback'][0]
+
+        def rate(key):
+            value = fair_value_data[key] if key in fair_value_data else self.DEFAULTS[key]
+            return float(np.asarray(value)[index] if np.ndim(value) == 1 else value)
+
+        reasons = {
+            0: '현금은 공정가치 = 장부가',
+            1: '단기금융상품 시가 = 장부가',
+            2: f"대손율 {rate('bad_debt_rate'):.1%} 반영",
+            3: f"재고 평가손 {rate('inventory_markdown'):.1%} 반영",
+            4: '공시지가 기준 추정 (장부가 × 1.5)' if fallback[4] else '감정평가액 적용',
+            5: '경제적 감가상각 10% 반영' if fallback[5] else '감정평가액 적용',
+            6: f"경제적 감가상각 {rate('machinery_depreciation'):.0%} 추가",
+            7: '손상검사 결과 반영',
+            8: '잔여 유효기간 고려 (80%)' if fallback[8] else '별도 평가액 적용',
+            9: '장부가 = 시가 가정' if fallback[9] else '거래소 시가 적용',
+            10: '유동성 할인 50% 적용' if fallback[10] else 'DCF 등 별도 평가',
+            11: '단기부채는 장부가 = 공정가치',
+            12: '장부가 = 공정가치 가정' if fallback[12] else
+                ('장부가 = 공정가치' if fair[12] == book[12] else
+                 f"시장이자율 {rate('market_interest_rate'):.1%} 반영"),
+            13: '소송/보증 등 우발부채 추가 인식'
+        }
+
+        items = self.ASSET_ITEMS + self.LIABILITY_ITEMS
+        details = [
+            {
+                'asset_type': items[j][1],
+                'book_value': float(book[j]),
+                'fair_value': float(fair[j]),
+                'adjustment': float(fair[j] - book[j]),
+                'adjustment_reason': reasons[j]
+            }
+            for j in range(len(items))
+        ]
+        n_assets = len(self.ASSET_ITEMS)
+        liabilities = details[n_assets:]
+        if fair[-1] <= 0:
+            liabilities = liabilities[:-1]  # 우발부채는 있을 때만 표시 (스칼라 엔진과 동일)
+        return {'asset_details': details[:n_assets], 'liability_details': liabilities}
+
+
+# 정합성 검증 및 벤치마크
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from asset.asset_engine import AssetValuationEngine
+
+    print("=" * 80)
+    print("Batch NAV Engine - Consistency Check & Benchmark")
+    print("=" * 80)
+
+    rng = np.random.default_rng(3)
+    n = 10_000
+    accounts = [key for key, _ in BatchAssetValuationEngine.ASSET_ITEMS] + ['current_liabilities', 'long_term_debt']
+    balance_sheets = {key: rng.uniform(0, 20_000, n).round() for key in accounts}
+    balance_sheets['shares_outstanding'] = rng.integers(100_000, 5_000_000, n).astype(float)
+    balance_sheets['debt_interest_rate'] = rng.uniform(0.03, 0.07, n)
+    balance_sheets['company_id'] = np.array([f"C{i:05d}" for i in range(n)])
+    balance_sheets['period'] = np.array(['2025-03-31', '2025-06-30', '2025-09-30', '2025-12-31'])[np.arange(n) % 4]
+    balance_sheets['ownership'] = rng.uniform(0.05, 0.40, n)
+
+    def sometimes(values, p=0.5):
+        return np.where(rng.random(n) < p, values, np.nan)
+
+    fair_value_data = {
+        'bad_debt_rate': rng.uniform(0.01, 0.05, n),
+        'inventory_markdown': 0.08,
+        'land_appraisal': sometimes(balance_sheets['land'] * rng.uniform(1.0, 2.0, n)),
+        'building_appraisal': sometimes(balance_sheets['building'] * rng.uniform(0.7, 1.1, n)),
+        'patents_valuation': sometimes(balance_sheets['patents'] * 0.6, 0.2),
+        'unlisted_stocks_valuation': sometimes(balance_sheets['unlisted_stocks'] * 0.7),
+        'market_interest_rate': sometimes(rng.uniform(0.03, 0.08, n)),
+        'contingent_liabilities': np.where(rng.random(n) < 0.1, 500.0, 0.0)
+    }
+
+    engine = BatchAssetValuationEngine()
+    engine.run_valuation(balance_sheets, fair_value_data)  # 워밍업
+    start = time.perf_counter()
+    result = engine.run_valuation(balance_sheets, fair_value_data)
+    batch_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    engine.run_valuation(balance_sheets, fair_value_data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # 스칼라 엔진과 비교 (앞 500개 회사)
+    scalar = AssetValuationEngine()
+    sample = 500
+    start = time.perf_counter()
+    for i in range(sample):
+        bs = {key: float(balance_sheets[key][i]) for key in accounts + ['shares_outstanding', 'debt_interest_rate']}
+        fv = {key: float(np.asarray(v)[i]) if np.ndim(v) else v for key, v in fair_value_data.items()}
+        fv = {key: v for key, v in fv.items() if not (isinstance(v, float) and np.isnan(v))}
+        expected = scalar.run_valuation(bs, fv)
+        assert abs(expected['nav'] - result['nav'][i]) <= 0.5, (i, expected['nav'], result['nav'][i])
+        assert abs(expected['total_adjustments'] - result['total_adjustments'][i]) <= 0.5
+
+        if i < 20:
+            details = engine.item_details(balance_sheets, fair_value_data, i)
+            assert [d['adjustment_reason'] for d in details['asset_details']] == \
+                [d['adjustment_reason'] for d in expected['asset_details']]
+            assert [d['adjustment_reason'] for d in details['liability_details']] == \
+                [d['adjustment_reason'] for d in expected['liability_details']]
+            assert np.allclose([d['fair_value'] for d in details['asset_details'] + details['liability_details']],
+                               [d['fair_value'] for d in expected['asset_details'] + expected['liability_details']])
+    scalar_time = (time.perf_counter() - start) / sample * n
+
+    print(f"스칼라 엔진 {sample}건과 NAV·조정액 일치 (계정별 상세 20건 일치)")
+    print(f"\n{n:,}개 재무상태표")
+    print(f"  배치: {batch_time * 1000:8.1f} ms  (최대 임시 메모리 {peak / 1024 / 1024:.1f} MiB)")
+    print(f"  스칼라 반복 추정: {scalar_time * 1000:8.1f} ms  ({scalar_time / batch_time:.0f}배)")
+
+    print("\n[분기말 포트폴리오]")
+    portfolio = result['portfolio']
+    for period, count, nav, holding in zip(portfolio['periods'], portfolio['n_companies'],
+                                           portfolio['nav'], portfolio['holding_value']):
+        print(f"  {period}: {count:,}개사  NAV 합계 {nav:,.0f}백만원  보유지분 가치 {holding:,.0f}백만원")
+    print("=" * 80)
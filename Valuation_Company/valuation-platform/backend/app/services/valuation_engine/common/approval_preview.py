@@ -0,0 +1,416 @@
+"""
+Approval Impact Preview
+판단 포인트 시나리오별 가치 영향 미리보기
+
+- 승인 대기 중인 판단 포인트의 모든 시나리오에 대해 최종 가치를 미리 계산
+- 포인트 간 조합은 요청될 때만 계산하고 캐시 (미계산 조합만 BatchDCFEngine 한 번 호출로 평가)
+- 포인트가 승인되면 기준 조합만 바뀌고, 캐시된 조합은 그대로 재사용 (증분 갱신)
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import sys
+sys.path.append('..')
+
+import copy
+import itertools
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from common.human_approval import HumanApprovalManager, ApprovalPoint, ApprovalStatus
+from dcf.batch_dcf_engine import BatchDCFEngine
+
+
+class ApprovalImpactPreview:
+    """판단 포인트 시나리오 → 최종 가치 영향 미리보기"""
+
+    # 판단 포인트 → 값 적용 방식
+    #   ('assumptions', 키): DCF 가정 덮어쓰기 (엔진 재계산)
+    #   ('wacc_inputs', 'wacc'): 할인율 직접 지정 (엔진 재계산)
+    #   ('discount', None): 주주가치 × (1 - 할인율)
+    #   ('deduction', None): 주주가치 - 금액 (백만원)
+    # 시나리오가 없는 포인트(일회성 항목 등)나 DCF 가치에 연결되지 않는 포인트는 미리보기 대상이 아니다
+    POINT_DRIVERS = {
+        'DCF_GROWTH_RATE': ('assumptions', 'revenue_growth'),
+        'DCF_EBITDA_MARGIN': ('assumptions', 'target_operating_margin'),
+        'DCF_WACC': ('wacc_inputs', 'wacc'),
+        'REL_MARKETABILITY_DISCOUNT': ('discount', None),
+        'NAV_CONTINGENT_LIABILITIES': ('deduction', None),
+    }
+
+    ENGINE_TARGETS = ('assumptions', 'wacc_inputs')
+
+    def __init__(self,
+                 manager: HumanApprovalManager,
+                 base_inputs: Dict,
+                 engine: Optional[BatchDCFEngine] = None,
+                 max_combinations: int = 4096):
+        """
+        Args:
+            manager: 판단 포인트를 가진 승인 관리자
+            base_inputs: DCFEngine.run_valuation 입력 (금액 단위 백만원)
+            engine: 배치 엔진 (생략 시 생성)
+            max_combinations: 엔진 결과 캐시 크기 (LRU)
+        """
+        self.manager = manager
+        self.base_inputs = copy.deepcopy(base_inputs)
+        self.engine = engine or BatchDCFEngine()
+        self.max_combinations = max_combinations
+        self.periods = self.base_inputs.get('projection_period', 5)
+
+        # 기준 상태: 정규화 재무와 기준 WACC는 한 번만 계산
+        self.normalized = self.engine.engine.normalize_financials(self.base_inputs['historical_financials'])
+        wacc_inputs = self.engine.resolve_wacc_inputs(self.base_inputs)
+        self.base_wacc = float(self.engine.calculate_wacc(wacc_inputs, 1)['wacc'][0])
+
+        # 엔진 조합 키 → (주주가치, 유효 여부)
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.counters = {'hits': 0, 'computed': 0, 'batch_calls': 0, 'evictions': 0}
+
+    # ==================== 포인트 / 선택 ====================
+
+    def previewable_points(self) -> List[ApprovalPoint]:
+        """미리보기 가능한 포인트 (요청 순서)"""
+        return [
+            self.manager.approval_points[point_id]
+            for point_id in self.manager.approval_order
+            if point_id in self.POINT_DRIVERS and self._options(self.manager.approval_points[point_id])
+        ]
+
+    def _options(self, point: ApprovalPoint) -> List[int]:
+        """값으로 평가 가능한 시나리오 인덱스"""
+        return [i for i, scenario in enumerate(point.scenarios)
+                if self._coerce(point.id, scenario.value) is not None]
+
+    def _coerce(self, point_id: str, value: Any):
+        """시나리오 값 → 엔진/후처리에 넣을 값 (평가 불가하면 None)"""
+        target, key = self.POINT_DRIVERS[point_id]
+        if key == 'revenue_growth':
+            if isinstance(value, dict):
+                value = [value[year] for year in sorted(value)]
+            if not isinstance(value, (list, tuple)) or not value:
+                return None
+            path = [float(v) for v in value][:self.periods]
+            # 예측 기간보다 짧으면 마지막 성장률 유지
+            return path + [path[-1]] * (self.periods - len(path))
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        return float(value)
+
+    def _current_choice(self, point: ApprovalPoint):
+        """
+        포인트의 현재 선택
+
+        - 승인됨: 승인된 시나리오 인덱스 (직접 입력이면 ('custom', 값))
+        - 대기: 추천 시나리오 (없으면 None = 기준 입력 유지)
+        """
+        if point.status in (ApprovalStatus.APPROVED, ApprovalStatus.CUSTOM):
+            if point.status == ApprovalStatus.APPROVED:
+                for i, scenario in enumerate(point.scenarios):
+                    if scenario.value == point.approved_value:
+                        return i
+            return ('custom', point.approved_value)
+
+        for i in self._options(point):
+            if point.scenarios[i].is_recommended:
+                return i
+        return None
+
+    def _choice_value(self, point: ApprovalPoint, choice):
+        if choice is None:
+            return None
+        if isinstance(choice, tuple):
+            return self._coerce(point.id, choice[1])
+        return self._coerce(point.id, point.scenarios[choice].value)
+
+    def baseline_selection(self) -> Dict[str, Any]:
+        """현재 기준 조합 (승인값 + 대기 포인트는 추천 시나리오)"""
+        return {point.id: self._current_choice(point) for point in self.previewable_points()}
+
+    @staticmethod
+    def _freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, ApprovalImpactPreview._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(ApprovalImpactPreview._freeze(v) for v in value)
+        return value
+
+    def _engine_key(self, values: Dict[str, Any]) -> tuple:
+        """엔진 재계산이 필요한 포인트 값만으로 만든 캐시 키"""
+        return tuple(
+            (point_id, self._freeze(values[point_id]))
+            for point_id in sorted(values)
+            if self.POINT_DRIVERS[point_id][0] in self.ENGINE_TARGETS and values[point_id] is not None
+        )
+
+    # ==================== 평가 ====================
+
+    def evaluate(self, selections: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        조합별 최종 가치 계산 (캐시에 없는 조합만 배치 엔진 1회 호출)
+
+        Args:
+            selections: [{포인트 ID: 시나리오 인덱스 | ('custom', 값) | None}, ...]
+                지정하지 않은 포인트는 기준 조합 값을 사용
+
+        Returns:
+            [{'selection', 'equity_value', 'value_per_share', 'dcf_equity_value', 'valid'}, ...]
+        """
+        points = {point.id: point for point in self.previewable_points()}
+        baseline = self.baseline_selection()
+
+        resolved = []
+        for selection in selections:
+            choice = {**baseline, **{k: v for k, v in selection.items() if k in points}}
+            values = {point_id: self._choice_value(points[point_id], c) for point_id, c in choice.items()}
+            resolved.append((choice, values, self._engine_key(values)))
+
+        self._compute_missing({key: values for _, values, key in resolved})
+
+        shares = float(self.base_inputs['adjustments']['shares_outstanding'])
+        results = []
+        for choice, values, key in resolved:
+            dcf_equity, valid = self._cache[key]
+            equity = dcf_equity
+            for point_id, value in values.items():
+                target = self.POINT_DRIVERS[point_id][0]
+                if value is not None and target == 'deduction':
+                    equity -= value
+            for point_id, value in values.items():
+                target = self.POINT_DRIVERS[point_id][0]
+                if value is not None and target == 'discount':
+                    equity *= (1 - value)
+
+            results.append({
+                'selection': choice,
+                'equity_value': equity,
+                'value_per_share': equity * 1_000_000 / shares,  # 백만원 → 원
+                'dcf_equity_value': dcf_equity,
+                'valid': valid
+            })
+        return results
+
+    def _compute_missing(self, values_by_key: Dict[tuple, Dict[str, Any]]):
+        """캐시에 없는 엔진 조합을 한 번의 배치 호출로 계산"""
+        missing = []
+        for key in values_by_key:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.counters['hits'] += 1
+            else:
+                missing.append(key)
+
+        if not missing:
+            return
+
+        base_assumptions = {
+            **self.base_inputs['assumptions'],
+            'revenue_growth': self._coerce('DCF_GROWTH_RATE', self.base_inputs['assumptions']['revenue_growth'])
+        }
+        rows, waccs = [], []
+        for key in missing:
+            row = dict(base_assumptions)
+            wacc = self.base_wacc
+            for point_id, value in values_by_key[key].items():
+                target, driver = self.POINT_DRIVERS[point_id]
+                if value is None:
+                    continue
+                if target == 'assumptions':
+                    row[driver] = value
+                elif target == 'wacc_inputs':
+                    wacc = value
+            rows.append(row)
+            waccs.append(wacc)
+
+        batch = self.engine.run_valuation({
+            **self.base_inputs,
+            'assumptions': BatchDCFEngine.stack_assumptions(rows),
+            'wacc_inputs': {'wacc': np.asarray(waccs)}
+        }, normalized=self.normalized)
+        self.counters['batch_calls'] += 1
+        self.counters['computed'] += len(missing)
+
+        equity = np.broadcast_to(batch['equity_value'], (len(missing),))
+        valid = np.broadcast_to(batch['wacc'] > np.asarray([r['terminal_growth'] for r in rows]), (len(missing),))
+        for i, key in enumerate(missing):
+            self._cache[key] = (float(equity[i]), bool(valid[i]))
+
+        while len(self._cache) > self.max_combinations:
+            self._cache.popitem(last=False)
+            self.counters['evictions'] += 1
+
+    # ==================== 미리보기 ====================
+
+    def preview(self) -> Dict[str, Any]:
+        """
+        대기 중인 포인트별 시나리오 영향 (다른 포인트는 기준 조합 유지)
+
+        Returns:
+            {
+                'baseline': {'equity_value', 'value_per_share', 'selection'},
+                'points': {
+                    'DCF_WACC': [
+                        {'index': 0, 'label': '낙관적', 'description': ..., 'is_recommended': False,
+                         'equity_value': ..., 'value_per_share': ..., 'delta': ..., 'delta_pct': ..., 'valid': True},
+                        ...
+                    ],
+                    ...
+                }
+            }
+        """
+        pending = [point for point in self.previewable_points() if point.status == ApprovalStatus.PENDING]
+        selections = [{}] + [{point.id: i} for point in pending for i in self._options(point)]
+        results = self.evaluate(selections)
+
+        base = results[0]
+        points, cursor = {}, 1
+        for point in pending:
+            options = []
+            for i in self._options(point):
+                result = results[cursor]
+                cursor += 1
+                delta = result['equity_value'] - base['equity_value']
+                options.append({
+                    'index': i,
+                    'label': point.scenarios[i].label,
+                    'description': point.scenarios[i].description,
+                    'is_recommended': point.scenarios[i].is_recommended,
+                    'equity_value': result['equity_value'],
+                    'value_per_share': result['value_per_share'],
+                    'delta': delta,
+                    'delta_pct': delta / base['equity_value'] if base['equity_value'] else None,
+                    'valid': result['valid']
+                })
+            points[point.id] = options
+
+        return {
+            'baseline': {
+                'selection': base['selection'],
+                'equity_value': base['equity_value'],
+                'value_per_share': base['value_per_share']
+            },
+            'points': points
+        }
+
+    def grid(self, point_ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        지정 포인트들의 시나리오 전체 조합 (나머지는 기준 조합 유지)
+
+        Args:
+            point_ids: 조합할 포인트 ID 목록
+
+        Returns:
+            evaluate() 결과 리스트 (조합 수 = 포인트별 시나리오 수의 곱)
+        """
+        points = {point.id: point for point in self.previewable_points()}
+        axes = [[(point_id, i) for i in self._options(points[point_id])] for point_id in point_ids]
+        return self.evaluate([dict(combo) for combo in itertools.product(*axes)])
+
+    def approve(self, point_id: str, selected_scenario: int = None,
+                custom_value: Any = None, reason: str = "") -> Dict[str, Any]:
+        """
+        승인 처리 후 갱신된 미리보기 반환
+
+        승인으로 기준 조합이 바뀌어도 이미 계산된 엔진 조합은 캐시에서 재사용하고,
+        새로 필요한 조합만 계산한다.
+        """
+        if not self.manager.approve(point_id, selected_scenario, custom_value, reason):
+            raise ValueError(f"승인 처리 실패: {point_id}")
+        return self.preview()
+
+    def stats(self) -> Dict[str, Any]:
+        return {'cached_combinations': len(self._cache), **self.counters}
+
+
+# ==================== 사용 예시 ====================
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import time
+    from dcf.dcf_engine import DCFEngine
+
+    base_inputs = {
+        'company_id': 'TEST001',
+        'company_name': '테스트기업',
+        'valuation_date': '2025-01-01',
+        'historical_financials': [
+            {'year': 2022, 'revenue': 100_000, 'operating_income': 12_000, 'net_income': 8_000,
+             'depreciation': 3_000, 'capex': 4_000, 'working_capital_change': 1_000},
+            {'year': 2023, 'revenue': 115_000, 'operating_income': 15_000, 'net_income': 10_000,
+             'depreciation': 3_500, 'capex': 5_000, 'working_capital_change': 1_500},
+            {'year': 2024, 'revenue': 130_000, 'operating_income': 18_000, 'net_income': 12_000,
+             'depreciation': 4_000, 'capex': 6_000, 'working_capital_change': 1_500}
+        ],
+        'assumptions': {
+            'base_year': 2024,
+            'revenue_growth': [0.12, 0.10, 0.08, 0.06, 0.05],
+            'target_operating_margin': 0.15,
+            'tax_rate': 0.25,
+            'terminal_growth': 0.03
+        },
+        'wacc_inputs': {
+            'risk_free_rate': 0.035, 'beta': 1.2, 'market_premium': 0.07,
+            'cost_of_debt': 0.05, 'debt_ratio': 0.30, 'tax_rate': 0.25
+        },
+        'adjustments': {
+            'cash': 10_000, 'total_debt': 30_000,
+            'non_operating_assets': 5_000, 'shares_outstanding': 10_000_000
+        }
+    }
+
+    manager = HumanApprovalManager()
+    manager.request_growth_rate_approval({2025: 0.25, 2026: 0.20, 2027: 0.15, 2028: 0.12, 2029: 0.10},
+                                         {'avg_3yr': 0.14}, 0.08)
+    manager.request_wacc_approval(0.0886, beta=1.2, rf=0.035, mrp=0.07)
+    manager.request_ebitda_margin_approval([0.12, 0.13, 0.138], 0.16)
+    manager.request_marketability_discount_approval(is_ipo_preparing=False)
+    manager.request_contingent_liabilities_approval()
+
+    print("=" * 80)
+    print("판단 포인트 시나리오 영향 미리보기")
+    print("=" * 80)
+
+    preview = ApprovalImpactPreview(manager, base_inputs)
+
+    start = time.perf_counter()
+    result = preview.preview()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"\n기준 (추천 시나리오): 주주가치 {result['baseline']['equity_value']:,.0f}백만원, "
+          f"주당 {result['baseline']['value_per_share']:,.0f}원  ({elapsed:.2f} ms)")
+    for point_id, options in result['points'].items():
+        print(f"\n[{point_id}]")
+        for option in options:
+            star = " ⭐" if option['is_recommended'] else ""
+            print(f"  [{option['index']}] {option['label']:<10} 주당 {option['value_per_share']:>10,.0f}원 "
+                  f"({option['delta_pct']:+.1%}){star}")
+
+    # 미리보기 값이 스칼라 DCF 엔진 결과와 일치하는지 확인 (WACC 보수적 시나리오)
+    scalar_inputs = copy.deepcopy(base_inputs)
+    scalar_inputs['assumptions']['revenue_growth'] = [0.165, 0.14, 0.115, 0.10, 0.09]
+    scalar_inputs['assumptions']['target_operating_margin'] = 0.16
+    engine = DCFEngine()
+    override = {**engine.calculate_wacc_detailed(base_inputs['wacc_inputs']), 'wacc': 0.0886 + 0.03}
+    engine.calculate_wacc_detailed = lambda wacc_inputs: override
+    with contextlib.redirect_stdout(io.StringIO()):
+        scalar = engine.run_valuation(scalar_inputs)
+    expected = scalar['valuation_result']['equity_value'] * (1 - 0.20)
+    previewed = next(o for o in result['points']['DCF_WACC'] if o['index'] == 2)['equity_value']
+    assert abs(previewed - expected) < 1e-6 * abs(expected), (previewed, expected)
+    print("\n✅ 스칼라 DCF 엔진 결과와 일치")
+
+    # 승인 → 기준만 이동, 기존 조합 재사용
+    before = preview.stats()
+    preview.approve('DCF_WACC', selected_scenario=2, reason="신생기업 위험 반영")
+    after = preview.stats()
+    print(f"\nWACC 보수적 승인 후 재계산 조합: {after['computed'] - before['computed']}건 "
+          f"(캐시 적중 {after['hits'] - before['hits']}건)")
+
+    # 성장률 × 마진 전체 조합
+    grid = preview.grid(['DCF_GROWTH_RATE', 'DCF_EBITDA_MARGIN'])
+    print(f"성장률 × 마진 조합 {len(grid)}건: 주당 {min(r['value_per_share'] for r in grid):,.0f}원 ~ "
+          f"{max(r['value_per_share'] for r in grid):,.0f}원")
+    print(f"캐시 통계: {preview.stats()}")
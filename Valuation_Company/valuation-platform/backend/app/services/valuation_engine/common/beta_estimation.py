@@ -0,0 +1,364 @@
+"""
+베타 추정 (Rolling OLS Beta Estimation)
+
+비교기업 주가와 시장지수(KOSPI 등) 로컬 CSV로 rolling OLS 베타를 추정
+- 전 종목을 (T, N) 배열 1개로 처리: 누적합 차분으로 창별 공분산/분산 계산 (종목별 루프 없음)
+- 결측(거래정지·상장 전)은 종목별 마스크로 제외, 창 내 관측치가 min_periods 미만이면 NaN
+- Blume 조정: β_adj = 0.67 × β_raw + 0.33
+- Hamada 언레버/리레버: β_U = β_L / (1 + (1 - t) × D/E),  β_L = β_U × (1 + (1 - t) × D/E)
+- 결과는 MarketDataStore('beta' 시계열)와 WACC 승인 요청(request_wacc_approval)에 연결
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import csv
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BLUME_WEIGHT = 0.67
+
+
+# ==================== 가격 CSV ====================
+
+def load_prices(path: str, encoding: str = 'utf-8-sig') -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """
+    종가 CSV 로드
+
+    지원 형식:
+        - wide: date,005930,000660,...  (종목별 컬럼)
+        - long: date,ticker,close        (행 순서 무관)
+
+    Returns:
+        (dates (T,) datetime64[D] 오름차순, tickers [N], prices (T, N) — 빈 값은 NaN)
+    """
+    with open(path, encoding=encoding, newline='') as f:
+        reader = csv.reader(f)
+        header = [h.strip() for h in next(reader)]
+        rows = [row for row in reader if row]
+
+    lowered = [h.lower() for h in header]
+    if 'ticker' in lowered and 'close' in lowered:
+        d, t, c = lowered.index('date'), lowered.index('ticker'), lowered.index('close')
+        dates, date_idx = np.unique(np.array([r[d].strip() for r in rows], dtype='datetime64[D]'),
+                                    return_inverse=True)
+        tickers, ticker_idx = np.unique(np.array([r[t].strip() for r in rows]), return_inverse=True)
+        prices = np.full((dates.size, tickers.size), np.nan)
+        prices[date_idx, ticker_idx] = [float(r[c]) if r[c].strip() else np.nan for r in rows]
+        return dates, tickers.tolist(), prices
+
+    dates = np.array([r[0].strip() for r in rows], dtype='datetime64[D]')
+    prices = np.array([[float(v) if v.strip() else np.nan for v in r[1:len(header)]] for r in rows])
+    order = np.argsort(dates, kind='stable')
+    return dates[order], header[1:], prices[order].reshape(len(rows), len(header) - 1)
+
+
+def align(dates_a: np.ndarray, values_a: np.ndarray,
+          dates_b: np.ndarray, values_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """두 가격 시계열을 공통 거래일로 정렬"""
+    common, ia, ib = np.intersect1d(dates_a, dates_b, assume_unique=True, return_indices=True)
+    return common, values_a[ia], values_b[ib]
+
+
+def simple_returns(prices: np.ndarray) -> np.ndarray:
+    """단순 수익률 (첫 행 제외, 가격 결측 구간은 NaN)"""
+    prices = np.asarray(prices, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return prices[1:] / prices[:-1] - 1.0
+
+
+# ==================== 베타 조정 ====================
+
+def blume_adjust(beta):
+    """Blume 조정 베타 (장기적으로 1로 회귀)"""
+    return BLUME_WEIGHT * np.asarray(beta, dtype=float) + (1 - BLUME_WEIGHT)
+
+
+def unlever(beta, debt_to_equity, tax_rate):
+    """Hamada 언레버드 베타 (배열 브로드캐스트)"""
+    return np.asarray(beta, dtype=float) / (1 + (1 - np.asarray(tax_rate)) * np.asarray(debt_to_equity))
+
+
+def relever(beta_unlevered, debt_to_equity, tax_rate):
+    """Hamada 리레버드 베타 (배열 브로드캐스트)"""
+    return np.asarray(beta_unlevered, dtype=float) * (1 + (1 - np.asarray(tax_rate)) * np.asarray(debt_to_equity))
+
+
+# ==================== 추정 ====================
+
+class BetaEstimator:
+    """다종목 rolling OLS 베타 추정기"""
+
+    def __init__(self, window: int = 252, min_periods: Optional[int] = None):
+        """
+        Args:
+            window: 추정 창 (거래일, 기본 1년)
+            min_periods: 창 내 최소 관측치 (기본 window의 80%)
+        """
+        self.window = window
+        self.min_periods = min_periods or int(window * 0.8)
+
+    def _window_sum(self, x: np.ndarray) -> np.ndarray:
+        """열별 이동합 (누적합 차분, 길이 T)"""
+        c = np.cumsum(x, axis=0)
+        out = c.copy()
+        out[self.window:] -= c[:-self.window]
+        return out
+
+    def rolling(self, stock_returns: np.ndarray, market_returns: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Rolling OLS 베타 (전 종목 1회 벡터 연산)
+
+        β = Cov(r_i, r_m) / Var(r_m), 종목별로 r_i가 있는 날의 r_m만 사용
+
+        Args:
+            stock_returns: (T, N) 종목 수익률 (NaN 허용)
+            market_returns: (T,) 시장 수익률
+
+        Returns:
+            {
+                'beta': (T, N), 'r_squared': (T, N), 'n_obs': (T, N) int,
+                'alpha': (T, N)  # 일간 절편
+            }
+            창이 차지 않았거나 관측치가 부족한 위치는 NaN
+        """
+        y = np.asarray(stock_returns, dtype=float)
+        if y.ndim == 1:
+            y = y[:, np.newaxis]
+        x = np.asarray(market_returns, dtype=float).reshape(-1, 1)
+        if y.shape[0] != x.shape[0]:
+            raise ValueError(f"종목 수익률({y.shape[0]})과 시장 수익률({x.shape[0]})의 기간이 다릅니다")
+
+        valid = np.isfinite(y) & np.isfinite(x)
+        # 누적합 차분의 상쇄 오차를 줄이려고 전체 평균으로 먼저 중심화 (공분산·분산은 평행이동에 불변)
+        x_mean = np.nanmean(x)
+        y_mean = np.nanmean(np.where(valid, y, np.nan), axis=0)
+        x0 = np.where(valid, x - x_mean, 0.0)
+        y0 = np.where(valid, y - y_mean, 0.0)
+
+        n = self._window_sum(valid.astype(float))
+        sx = self._window_sum(x0)
+        sy = self._window_sum(y0)
+        sxx = self._window_sum(x0 * x0)
+        syy = self._window_sum(y0 * y0)
+        sxy = self._window_sum(x0 * y0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sxy - sx * sy / n
+            var_x = sxx - sx * sx / n
+            var_y = syy - sy * sy / n
+            beta = cov / var_x
+            r_squared = cov * cov / (var_x * var_y)
+            alpha = (sy / n + y_mean) - beta * (sx / n + x_mean)
+
+        enough = n >= self.min_periods
+        enough[:self.window - 1] = False  # 창이 다 차기 전 제외
+        enough &= var_x > 0
+        mask = ~enough
+        beta[mask] = r_squared[mask] = alpha[mask] = np.nan
+
+        return {'beta': beta, 'r_squared': r_squared, 'n_obs': n.astype(np.int64), 'alpha': alpha}
+
+    def estimate(self,
+                 dates: np.ndarray,
+                 tickers: Sequence[str],
+                 peer_prices: np.ndarray,
+                 market_prices: np.ndarray,
+                 debt_to_equity=None,
+                 tax_rate=0.22) -> Dict:
+        """
+        비교기업 베타 추정 (raw → Blume → 언레버)
+
+        Args:
+            dates: (T,) 거래일
+            tickers: 종목코드 N개
+            peer_prices: (T, N) 종가
+            market_prices: (T,) 시장지수
+            debt_to_equity: 종목별 D/E (스칼라 또는 (N,), 생략 시 언레버 생략)
+            tax_rate: 법인세율 (스칼라 또는 (N,))
+
+        Returns:
+            {
+                'dates': (T-1,), 'tickers': [N],
+                'raw': (T-1, N), 'adjusted': (T-1, N), 'unlevered': (T-1, N) | None,
+                'r_squared': (T-1, N), 'n_obs': (T-1, N)
+            }
+        """
+        result = self.rolling(simple_returns(peer_prices), simple_returns(market_prices))
+        adjusted = blume_adjust(result['beta'])
+        return {
+            'dates': np.asarray(dates, dtype='datetime64[D]')[1:],
+            'tickers': list(tickers),
+            'raw': result['beta'],
+            'adjusted': adjusted,
+            'unlevered': unlever(adjusted, debt_to_equity, tax_rate) if debt_to_equity is not None else None,
+            'r_squared': result['r_squared'],
+            'n_obs': result['n_obs']
+        }
+
+    @classmethod
+    def from_csv(cls, peers_csv: str, market_csv: str, window: int = 252, **kwargs) -> Dict:
+        """비교기업 종가 CSV + 시장지수 CSV로 추정 (공통 거래일 기준)"""
+        peer_dates, tickers, peer_prices = load_prices(peers_csv)
+        market_dates, _, market_prices = load_prices(market_csv)
+        dates, peer_prices, market_prices = align(peer_dates, peer_prices, market_dates, market_prices[:, 0])
+        return cls(window).estimate(dates, tickers, peer_prices, market_prices, **kwargs)
+
+
+# ==================== 연결 (시장 데이터 / 승인) ====================
+
+def peer_beta_summary(estimate: Dict, target_debt_to_equity: float, target_tax_rate: float,
+                      as_of: Optional[str] = None) -> Dict:
+    """
+    기준일의 비교기업 언레버드 베타 분포 → 대상회사 리레버드 베타
+
+    Args:
+        estimate: BetaEstimator.estimate 결과 (unlevered 필요)
+        target_debt_to_equity: 대상회사 D/E
+        target_tax_rate: 대상회사 법인세율
+        as_of: 기준일 (생략 시 마지막 거래일, 휴일이면 직전 거래일)
+
+    Returns:
+        {
+            'as_of': 'YYYY-MM-DD', 'n_peers': int,
+            'unlevered': {'q1', 'median', 'q3', 'mean'},
+            'relevered': {'q1', 'median', 'q3'},
+            'beta': float  # 리레버드 중위값 (WACC 입력용)
+        }
+    """
+    if estimate['unlevered'] is None:
+        raise ValueError("언레버드 베타가 없습니다 (estimate에 debt_to_equity 전달 필요)")
+
+    dates = estimate['dates']
+    row = dates.size - 1 if as_of is None else \
+        int(np.searchsorted(dates, np.datetime64(as_of, 'D'), side='right')) - 1
+    if row < 0:
+        raise LookupError(f"{as_of} 이전 추정값이 없습니다")
+
+    unlevered = estimate['unlevered'][row]
+    unlevered = unlevered[np.isfinite(unlevered)]
+    if unlevered.size == 0:
+        raise LookupError(f"{dates[row]}: 유효한 비교기업 베타가 없습니다")
+
+    q1, median, q3 = np.percentile(unlevered, [25, 50, 75])
+    relevered = relever(np.array([q1, median, q3]), target_debt_to_equity, target_tax_rate)
+    return {
+        'as_of': str(dates[row]),
+        'n_peers': int(unlevered.size),
+        'unlevered': {'q1': float(q1), 'median': float(median), 'q3': float(q3),
+                      'mean': float(unlevered.mean())},
+        'relevered': {'q1': float(relevered[0]), 'median': float(relevered[1]), 'q3': float(relevered[2])},
+        'beta': float(relevered[1])
+    }
+
+
+def store_betas(store, estimate: Dict, industry: Optional[str] = None,
+                sample: str = 'M', kind: str = 'adjusted'):
+    """
+    추정 베타를 MarketDataStore 'beta' 시계열로 적재
+
+    Args:
+        store: MarketDataStore
+        estimate: BetaEstimator.estimate 결과
+        industry: 지정 시 비교기업 베타 중위값을 업종 키로도 적재
+        sample: 'M'(월말 거래일) 또는 'D'(전 거래일)
+        kind: 종목별로 적재할 베타 ('adjusted' | 'raw')
+    """
+    dates = estimate['dates']
+    if sample == 'M':
+        months = dates.astype('datetime64[M]')
+        rows = np.flatnonzero(np.append(months[1:] != months[:-1], True))
+    else:
+        rows = np.arange(dates.size)
+
+    values = estimate[kind][rows]
+    for j, ticker in enumerate(estimate['tickers']):
+        ok = np.isfinite(values[:, j])
+        if ok.any():
+            store.add_series('beta', ticker, dates[rows][ok], values[ok, j])
+
+    if industry is None:
+        return
+    # 업종 키: 비교기업 중위값 (resolve_wacc_inputs의 industry 선택자), ':unlevered'는 언레버드 중위값
+    industry_series = [(industry, values)]
+    if estimate['unlevered'] is not None:
+        industry_series.append((f"{industry}:unlevered", estimate['unlevered'][rows]))
+    for key, matrix in industry_series:
+        has_peer = np.isfinite(matrix).any(axis=1)
+        if has_peer.any():
+            store.add_series('beta', key, dates[rows][has_peer], np.nanmedian(matrix[has_peer], axis=1))
+
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 80)
+    print("Beta Estimation - Rolling OLS (Vectorized)")
+    print("=" * 80)
+
+    rng = np.random.default_rng(11)
+    n_days, n_peers = 5 * 252 + 1, 500
+    dates = np.busday_offset('2021-01-04', np.arange(n_days), roll='forward')
+
+    true_beta = rng.uniform(0.5, 1.8, n_peers)
+    market_ret = rng.normal(0.0003, 0.011, n_days - 1)
+    peer_ret = market_ret[:, None] * true_beta + rng.normal(0, 0.012, (n_days - 1, n_peers))
+    market_prices = 2500 * np.concatenate([[1.0], np.cumprod(1 + market_ret)])
+    peer_prices = 10000 * np.vstack([np.ones(n_peers), np.cumprod(1 + peer_ret, axis=0)])
+    peer_prices[:300, :25] = np.nan  # 상장 전
+    peer_prices[800:820, 40] = np.nan  # 거래정지
+
+    tickers = [f"{i:06d}" for i in range(n_peers)]
+    debt_to_equity = rng.uniform(0.1, 1.0, n_peers)
+
+    estimator = BetaEstimator(window=252)
+    start = time.perf_counter()
+    estimate = estimator.estimate(dates, tickers, peer_prices, market_prices,
+                                  debt_to_equity=debt_to_equity, tax_rate=0.22)
+    vectorized = time.perf_counter() - start
+    print(f"{n_peers}개 종목 × {n_days}거래일, 창 252일: {vectorized * 1000:.1f} ms")
+
+    # 종목별 np.polyfit 루프와 비교 (표본 5개 종목 × 20개 시점)
+    returns = simple_returns(peer_prices)
+    start = time.perf_counter()
+    checks = 0
+    for j in (0, 40, 100, 250, 499):
+        for t in range(260, n_days - 1, 50):
+            y, x = returns[t - 251:t + 1, j], market_ret[t - 251:t + 1]
+            ok = np.isfinite(y)
+            if ok.sum() < estimator.min_periods:
+                assert np.isnan(estimate['raw'][t, j])
+                continue
+            slope = np.polyfit(x[ok], y[ok], 1)[0]
+            assert abs(slope - estimate['raw'][t, j]) < 1e-9, (j, t, slope, estimate['raw'][t, j])
+            checks += 1
+    per_fit = (time.perf_counter() - start) / checks
+    print(f"polyfit 대조 {checks}건 일치 (루프 추정: {per_fit * n_peers * (n_days - 252) / 60:,.1f}분)")
+
+    latest = estimate['raw'][-1]
+    print(f"최종일 raw 베타 오차(참값 대비) 평균: {np.nanmean(np.abs(latest - true_beta)):.3f}")
+
+    summary = peer_beta_summary(estimate, target_debt_to_equity=0.5, target_tax_rate=0.22)
+    print(f"\n비교기업 {summary['n_peers']}개 @ {summary['as_of']}")
+    print(f"  언레버드 중위값: {summary['unlevered']['median']:.3f}")
+    print(f"  리레버드 (D/E 0.5): Q1 {summary['relevered']['q1']:.3f} / "
+          f"중위 {summary['relevered']['median']:.3f} / Q3 {summary['relevered']['q3']:.3f}")
+
+    import sys
+    sys.path.append('..')
+    from common.market_data import MarketDataStore
+    from common.human_approval import HumanApprovalManager
+
+    store = MarketDataStore()
+    start = time.perf_counter()
+    store_betas(store, estimate, industry='소프트웨어')
+    print(f"\n시장 데이터 적재: {len(store.series('beta'))}개 시계열, {len(store):,}건 "
+          f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+    print(f"  000100 베타 @ 2024-06-30: {store.as_of('beta', '000100', '2024-06-30'):.3f}")
+
+    manager = HumanApprovalManager()
+    point = manager.request_wacc_approval(0.095, beta=summary['beta'], rf=0.03, mrp=0.07,
+                                          beta_estimation=summary)
+    print(f"  WACC 승인 요청: {point.context['calculation']}")
+    print("=" * 80)
@@ -10,9 +10,8 @@ Author: Valuation Engine Team
 Date: 2025-10-17
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
 import numpy as np
-from scipy.optimize import newton
 
 
 class FinancialCalculator:
@@ -198,7 +197,7 @@ class FinancialCalculator:
         """
         내부수익률 계산 (Internal Rate of Return)
 
-        Newton-Raphson 방법 사용
+        Newton-Raphson 방법 사용 (수렴 실패 시 구간 이분법으로 대체)
 
         Formula: NPV = -I0 + Σ [CFt / (1 + IRR)^t] = 0
 
@@ -212,35 +211,194 @@ class FinancialCalculator:
         Example:
             >>> cash_flows = [100, 110, 121, 133, 146]
             >>> FinancialCalculator.irr(cash_flows, 400)
-            0.1234  # 12.34%
+            0.1483  # 14.83%
         """
-        def npv(rate):
-            return -initial_investment + sum(
-                cf / (1 + rate) ** t
-                for t, cf in enumerate(cash_flows, start=1)
-            )
+        result = FinancialCalculator.irr_batch([[-initial_investment, *cash_flows]])
+
+        if not result['converged'][0]:
+            raise ValueError(f"IRR 계산 실패: {result['message'][0]}")
 
-        try:
-            return newton(npv, x0=0.10)  # 초기값 10%
-        except RuntimeError:
-            raise ValueError("IRR 계산 실패: 수렴하지 않음")
+        return float(result['rate'][0])
 
     @staticmethod
     def xirr(cash_flows: List[float], dates: List[str]) -> float:
         """
         불규칙 현금흐름의 IRR 계산 (Extended IRR)
 
+        Formula: Σ [CFi / (1 + XIRR)^((di - d0) / 365)] = 0
+
         Args:
-            cash_flows: 현금흐름 리스트
-            dates: 날짜 리스트 (YYYY-MM-DD 형식)
+            cash_flows: 현금흐름 리스트 (투자는 음수)
+            dates: 날짜 리스트 (YYYY-MM-DD 형식, 첫 날짜가 기준일)
 
         Returns:
             float: XIRR
 
-        Note:
-            추후 구현 (scipy.optimize 활용)
+        Example:
+            >>> FinancialCalculator.xirr([-1000, 300, 400, 500],
+            ...                          ['2024-01-01', '2024-07-01', '2025-03-15', '2026-01-01'])
+            0.1463  # 14.63%
+        """
+        if len(cash_flows) != len(dates):
+            raise ValueError("현금흐름과 날짜의 개수가 같아야 합니다")
+
+        result = FinancialCalculator.irr_batch([cash_flows], [dates])
+
+        if not result['converged'][0]:
+            raise ValueError(f"XIRR 계산 실패: {result['message'][0]}")
+
+        return float(result['rate'][0])
+
+    # IRR 탐색 범위 (log(1 + r) 기준: r ∈ [-99.99%, 10,000%])
+    IRR_LOG_BOUNDS = (np.log(1e-4), np.log(101.0))
+    IRR_BRACKET_GRID = 64
+
+    @staticmethod
+    def irr_batch(cash_flow_series: Sequence[Sequence[float]],
+                  dates_series: Optional[Sequence[Sequence[str]]] = None,
+                  guess: float = 0.10,
+                  tol: float = 1e-10,
+                  max_iter: int = 50) -> Dict[str, np.ndarray]:
+        """
+        IRR / XIRR 일괄 계산 (길이가 다른 현금흐름 시리즈를 한 번에 계산)
+
+        시리즈를 (시리즈 수 × 최대 길이) 행렬로 채워 NPV를 NumPy로 동시에 평가하며,
+        변수 x = ln(1 + r)에 대해 풀어 r > -100% 제약을 자동으로 만족
+
+        1단계: 전 시리즈 동시 Newton-Raphson
+        2단계: 미수렴 시리즈만 격자 탐색으로 부호 변화 구간을 찾아 이분법
+
+        Args:
+            cash_flow_series: 시리즈별 현금흐름 (t=0부터, 투자는 음수)
+            dates_series: 시리즈별 날짜 (YYYY-MM-DD). 생략 시 연 단위 기간 0, 1, 2, ...
+            guess: 초기 추정 수익률
+            tol: 수렴 기준 (|NPV| / Σ|PV(CF)|, 또는 x 변화량)
+            max_iter: Newton 최대 반복 횟수
+
+        Returns:
+            {
+                'n_series': 1000,
+                'rate': array,          # 미수렴 시 NaN
+                'converged': array(bool),
+                'method': array(str),   # 'newton' | 'bisection' | 'failed'
+                'iterations': array(int),
+                'npv_residual': array,  # |NPV| / Σ|PV(CF)|
+                'message': array(str)
+            }
         """
-        raise NotImplementedError("XIRR은 추후 구현 예정")
+        n_series = len(cash_flow_series)
+        lengths = np.fromiter((len(series) for series in cash_flow_series), dtype=np.int64, count=n_series)
+        width = int(lengths.max()) if n_series else 0
+
+        # 래그드 입력 → 0으로 채운 행렬 (채움 칸은 CF=0, t=0이므로 NPV에 영향 없음)
+        rows = np.repeat(np.arange(n_series), lengths)
+        starts = np.cumsum(lengths) - lengths
+        cols = np.arange(lengths.sum()) - np.repeat(starts, lengths)
+
+        flows = np.zeros((n_series, width))
+        flows[rows, cols] = np.concatenate([np.asarray(s, dtype=float) for s in cash_flow_series]) \
+            if n_series else []
+
+        times = np.zeros((n_series, width))
+        if dates_series is None:
+            times[rows, cols] = cols
+        else:
+            if any(len(d) != n for d, n in zip(dates_series, lengths)) or len(dates_series) != n_series:
+                raise ValueError("현금흐름과 날짜의 개수가 같아야 합니다")
+            days = np.array([d for dates in dates_series for d in dates], dtype='datetime64[D]')
+            days = days.astype(np.int64)
+            times[rows, cols] = (days - np.repeat(days[starts], lengths)) / 365.0
+
+        def npv(x, subset):
+            """(NPV, dNPV/dx), 둘 다 Σ|PV(CF)|로 정규화"""
+            weighted = flows[subset] * np.exp(-times[subset] * x[:, None])
+            scale = np.abs(weighted).sum(axis=1)
+            scale[scale == 0] = 1.0
+            return weighted.sum(axis=1) / scale, -(weighted * times[subset]).sum(axis=1) / scale
+
+        rate = np.full(n_series, np.nan)
+        iterations = np.zeros(n_series, dtype=np.int64)
+        residual = np.full(n_series, np.nan)
+        method = np.full(n_series, 'failed', dtype=object)
+        message = np.full(n_series, '', dtype=object)
+
+        # 부호 변화가 없으면 해 없음
+        solvable = (flows > 0).any(axis=1) & (flows < 0).any(axis=1)
+        message[~solvable] = '현금흐름에 부호 변화가 없음'
+
+        lo_bound, hi_bound = FinancialCalculator.IRR_LOG_BOUNDS
+
+        # 1단계: Newton-Raphson (활성 시리즈만 갱신)
+        x = np.full(n_series, np.log1p(guess))
+        active = np.flatnonzero(solvable)
+        done = np.zeros(n_series, dtype=bool)
+
+        for step in range(1, max_iter + 1):
+            if active.size == 0:
+                break
+            f, df = npv(x[active], active)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                delta = f / df
+            x_new = x[active] - delta
+            iterations[active] = step
+
+            ok = np.isfinite(x_new) & (x_new > lo_bound) & (x_new < hi_bound)
+            hit = ok & ((np.abs(f) < tol) | (np.abs(delta) < tol))
+
+            x[active[ok]] = x_new[ok]
+            done[active[hit]] = True
+            active = active[ok & ~hit]
+
+        newton_ok = np.flatnonzero(done)
+        method[newton_ok] = 'newton'
+
+        # 2단계: 구간 탐색 + 이분법
+        pending = np.flatnonzero(solvable & ~done)
+        if pending.size:
+            grid = np.linspace(lo_bound, hi_bound, FinancialCalculator.IRR_BRACKET_GRID)
+            discount = np.exp(-times[pending][:, :, None] * grid[None, None, :])
+            values = (flows[pending][:, :, None] * discount).sum(axis=1)
+            change = np.sign(values[:, :-1]) * np.sign(values[:, 1:]) <= 0
+
+            # 부호 변화 구간 중 초기 추정값에 가장 가까운 구간 선택
+            midpoints = (grid[:-1] + grid[1:]) / 2
+            distance = np.where(change, np.abs(midpoints - np.log1p(guess)), np.inf)
+            pick = distance.argmin(axis=1)
+            bracketed = np.isfinite(distance[np.arange(pending.size), pick])
+            message[pending[~bracketed]] = '탐색 범위 내 부호 변화 구간 없음'
+
+            pending, pick = pending[bracketed], pick[bracketed]
+            lo, hi = grid[pick], grid[pick + 1]
+            f_lo, _ = npv(lo, pending)
+
+            n_bisect = int(np.ceil(np.log2((grid[1] - grid[0]) / tol))) if pending.size else 0
+            for _ in range(n_bisect):
+                mid = (lo + hi) / 2
+                f_mid, _ = npv(mid, pending)
+                same = np.sign(f_mid) == np.sign(f_lo)
+                lo = np.where(same, mid, lo)
+                f_lo = np.where(same, f_mid, f_lo)
+                hi = np.where(same, hi, mid)
+
+            x[pending] = (lo + hi) / 2
+            iterations[pending] += n_bisect
+            done[pending] = True
+            method[pending] = 'bisection'
+
+        solved = np.flatnonzero(done)
+        rate[solved] = np.expm1(x[solved])
+        residual[solved] = np.abs(npv(x[solved], solved)[0]) if solved.size else []
+        message[solved] = 'ok'
+
+        return {
+            'n_series': n_series,
+            'rate': rate,
+            'converged': done,
+            'method': method,
+            'iterations': iterations,
+            'npv_residual': residual,
+            'message': message
+        }
 
     @staticmethod
     def cagr(begin_value: float, end_value: float, periods: int) -> float:
@@ -437,6 +595,60 @@ if __name__ == "__main__":
     print(f"TV Ratio: {tv_ratio:.2%}")
     print(f"Is Normal (50~80%): {is_normal}")
 
+    # Test 6: IRR / XIRR
+    print("\n[Test 6] IRR / XIRR")
+    irr_result = FinancialCalculator.irr([100, 110, 121, 133, 146], 400)
+    print(f"IRR: {irr_result:.4%}")
+    xirr_result = FinancialCalculator.xirr(
+        [-1000, 300, 400, 500],
+        ['2024-01-01', '2024-07-01', '2025-03-15', '2026-01-01']
+    )
+    print(f"XIRR: {xirr_result:.4%}")
+
+    # Test 7: Batch IRR (래그드 시리즈, scipy brentq 대조)
+    print("\n[Test 7] Batch XIRR")
+    import time
+    from scipy.optimize import brentq
+
+    rng = np.random.default_rng(7)
+    n_deals = 10_000
+    series, dates = [], []
+    for _ in range(n_deals):
+        n = int(rng.integers(2, 16))
+        flows = rng.normal(150, 120, n)
+        flows[0] = -rng.uniform(300, 2000)
+        offsets = np.sort(rng.integers(1, 365 * 8, n - 1))
+        series.append(flows.tolist())
+        dates.append([str(np.datetime64('2020-01-01') + int(d)) for d in np.concatenate([[0], offsets])])
+    series.append([-100, 230, -132])       # 다중 해 (10%, 20%)
+    dates.append(['2021-01-01', '2022-01-01', '2023-01-01'])
+    series.append([100, 50])               # 부호 변화 없음
+    dates.append(['2020-01-01', '2021-01-01'])
+
+    start = time.perf_counter()
+    batch = FinancialCalculator.irr_batch(series, dates)
+    elapsed = time.perf_counter() - start
+
+    methods, counts = np.unique(batch['method'].astype(str), return_counts=True)
+    method_counts = {str(m): int(c) for m, c in zip(methods, counts)}
+    print(f"{batch['n_series']:,} series: {elapsed * 1e3:.1f} ms {method_counts}")
+    print(f"Max NPV residual: {np.nanmax(batch['npv_residual']):.2e}")
+    print(f"Multi-root series: {batch['rate'][-2]:.4%}, no sign change: {batch['message'][-1]}")
+
+    # 단일 해 시리즈는 brentq와 일치해야 함
+    checked = 0
+    for i in rng.choice(n_deals, 300, replace=False):
+        if np.count_nonzero(np.diff(np.sign(series[i]))) != 1:
+            continue
+        t = (np.array(dates[i], dtype='datetime64[D]') - np.datetime64(dates[i][0])).astype(float) / 365
+        f = lambda r: np.sum(np.array(series[i]) / (1 + r) ** t)
+        if f(-0.9999) * f(100) > 0:
+            continue
+        reference = brentq(f, -0.9999, 100, xtol=1e-14)
+        assert abs(batch['rate'][i] - reference) < 1e-8, (i, batch['rate'][i], reference)
+        checked += 1
+    print(f"brentq 대조 (부호 변화 1회 시리즈): {checked}건 일치")
+
     print("\n" + "=" * 80)
     print("All tests completed successfully!")
     print("=" * 80)
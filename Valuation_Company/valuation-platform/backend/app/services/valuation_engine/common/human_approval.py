@@ -79,14 +79,14 @@ class HumanApprovalManager:
             ),
             Scenario(
                 label="중립적",
-                value={(year: (bp_rate + industry_avg) / 2)
+                value={year: (bp_rate + industry_avg) / 2
                        for year, bp_rate in business_plan.items()},
                 description=f"사업계획서와 업종 평균 절충 (연평균 {(bp_avg + industry_avg)/2:.0%})",
                 is_recommended=True  # 추천
             ),
             Scenario(
                 label="보수적",
-                value={(year: industry_avg) for year in business_plan.keys()},
+                value={year: industry_avg for year in business_plan.keys()},
                 description=f"업종 평균 수준 (연평균 {industry_avg:.0%})",
                 is_recommended=False
             )
@@ -112,7 +112,12 @@ class HumanApprovalManager:
         return point
 
     def request_wacc_approval(self, auto_calculated_wacc: float,
-                             beta: float, rf: float, mrp: float) -> ApprovalPoint:
+                             beta: Optional[float] = None, rf: Optional[float] = None,
+                             mrp: Optional[float] = None,
+                             valuation_date: Optional[str] = None,
+                             beta_key: Optional[str] = None,
+                             market_data=None,
+                             beta_estimation: Optional[Dict] = None) -> ApprovalPoint:
         """
         DCF #2: WACC 승인 요청 ⭐⭐⭐
 
@@ -121,10 +126,35 @@ class HumanApprovalManager:
             beta: 업종 베타
             rf: 무위험이자율
             mrp: 시장위험 프리미엄
+            valuation_date: 평가기준일 (beta / rf / mrp 생략 시 시장 데이터 as-of 조회에 사용)
+            beta_key: 베타 시계열 키 (종목코드 또는 업종명)
+            market_data: MarketDataStore (생략 시 기본 저장소)
+            beta_estimation: beta_estimation.peer_beta_summary 결과
+                (beta 생략 시 리레버드 중위값 사용, 분포는 context에 표시)
 
         Returns:
             ApprovalPoint
         """
+        as_of = {}
+        if beta is None and beta_estimation is not None:
+            beta = beta_estimation['beta']
+        if beta is None or rf is None or mrp is None:
+            from common.market_data import get_default_store
+
+            store = market_data or get_default_store()
+            if store is None or valuation_date is None:
+                raise ValueError("beta / rf / mrp를 생략하려면 valuation_date와 시장 데이터 저장소가 필요합니다")
+            if rf is None:
+                rf, as_of['risk_free_rate'] = store.as_of('ktb_yield', store.DEFAULT_TENOR, valuation_date,
+                                                          with_date=True)
+            if beta is None:
+                if beta_key is None:
+                    raise ValueError("베타 조회에는 beta_key(종목코드 또는 업종명)가 필요합니다")
+                beta, as_of['beta'] = store.as_of('beta', beta_key, valuation_date, with_date=True)
+            if mrp is None:
+                mrp, as_of['market_premium'] = store.as_of('mrp', store.DEFAULT_MARKET, valuation_date,
+                                                           with_date=True)
+
         scenarios = [
             Scenario(
                 label="낙관적",
@@ -158,6 +188,15 @@ class HumanApprovalManager:
                 'warning': "WACC는 DCF 결과에 가장 큰 영향을 미칩니다."
             }
         )
+        if as_of:
+            point.context['market_data_as_of'] = as_of
+        if beta_estimation is not None:
+            relevered = beta_estimation['relevered']
+            point.context['beta_range'] = (
+                f"비교기업 {beta_estimation['n_peers']}개 리레버드 베타 "
+                f"Q1 {relevered['q1']:.2f} / 중위 {relevered['median']:.2f} / Q3 {relevered['q3']:.2f} "
+                f"({beta_estimation['as_of']} 기준)"
+            )
 
         self.approval_points[point.id] = point
         self.approval_order.append(point.id)
@@ -0,0 +1,599 @@
+"""
+시장 데이터 저장소 (As-of Market Data Store)
+
+WACC 구성요소(국고채 수익률, 업종/종목 베타, 시장위험프리미엄, 신용스프레드)를
+시계열로 보관하고 평가기준일 기준 as-of 값을 조회
+
+- 시계열 키: (종류, 키)  예: ('ktb_yield', '10Y'), ('beta', '소프트웨어'), ('credit_spread', 'BBB')
+- 저장 구조: 전 시계열을 (시계열 번호, 일자) 순으로 정렬한 컬럼 배열 → 조회는 이진 탐색
+- 대량 조회(as_of_many)는 (시계열 번호 << 32 | 일자) 복합 키 1회 searchsorted로 처리
+- 단건 조회는 (시계열, 일자) LRU 캐시
+- 디스크 형식: 컬럼별 배열을 담은 압축 .npz (종류/키 사전 + 시계열 번호 / 일자 / 값)
+- 기본 저장소: 환경변수 MARKET_DATA_PATH의 파일을 최초 사용 시 로드
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import csv
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+DateLike = Union[str, 'np.datetime64', object]
+
+
+class MarketDataStore:
+    """종류·키별 시계열의 as-of 조회 저장소"""
+
+    KINDS = ('ktb_yield', 'beta', 'mrp', 'credit_spread')
+
+    # 평가기준일보다 이만큼(일) 이상 오래된 값은 사용하지 않음
+    MAX_AGE_DAYS = {
+        'ktb_yield': 14,
+        'credit_spread': 14,
+        'beta': 400,
+        'mrp': 400
+    }
+
+    # resolve_wacc_inputs 기본 선택자
+    DEFAULT_TENOR = '10Y'
+    DEFAULT_MARKET = 'KR'
+    DEFAULT_RATING = 'BBB'
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_size: int = 4096):
+        self._series: List[Tuple[str, str]] = []
+        self._series_id: Dict[Tuple[str, str], int] = {}
+        self._dates: List[np.ndarray] = []  # 시계열별 정렬된 일자 (1970-01-01 기준 일수, int64)
+        self._values: List[np.ndarray] = []
+
+        # 대량 조회용 평탄화 컬럼 (쓰기 후 첫 조회 때 재구성)
+        self._flat_key: Optional[np.ndarray] = None
+        self._flat_day: Optional[np.ndarray] = None
+        self._flat_value: Optional[np.ndarray] = None
+        self._fingerprint: Optional[str] = None
+        self._key_indexes: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[int, int], Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0}
+
+    # ==================== 일자 변환 ====================
+
+    @staticmethod
+    def to_days(dates) -> np.ndarray:
+        """'2025-01-01' / date / datetime64 (또는 그 배열) → 1970-01-01 기준 일수 (int64)"""
+        return np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+
+    @staticmethod
+    def to_date_str(days) -> str:
+        return str(np.datetime64(int(days), 'D'))
+
+    # ==================== 저장 ====================
+
+    def _sid(self, kind: str, key: str, create: bool = False) -> int:
+        if kind not in self.KINDS:
+            raise ValueError(f"지원하지 않는 시장 데이터 종류: {kind} (지원: {', '.join(self.KINDS)})")
+        series = (kind, str(key))
+        sid = self._series_id.get(series)
+        if sid is None and create:
+            sid = len(self._series)
+            self._series.append(series)
+            self._series_id[series] = sid
+            self._dates.append(np.empty(0, dtype=np.int64))
+            self._values.append(np.empty(0, dtype=float))
+        return -1 if sid is None else sid
+
+    def add_series(self, kind: str, key: str, dates: Iterable, values: Iterable):
+        """
+        시계열 추가 (같은 일자는 새 값으로 덮어씀)
+
+        Args:
+            kind: 'ktb_yield' | 'beta' | 'mrp' | 'credit_spread'
+            key: 만기('10Y'), 업종명/종목코드, 시장('KR'), 신용등급('BBB') 등
+            dates: 일자 배열
+            values: 값 배열 (수익률·프리미엄·스프레드는 소수, 예: 0.035)
+        """
+        days = self.to_days(list(dates) if not isinstance(dates, np.ndarray) else dates).ravel()
+        values = np.asarray(list(values) if not isinstance(values, np.ndarray) else values, dtype=float).ravel()
+        if days.shape != values.shape:
+            raise ValueError(f"일자({days.size})와 값({values.size})의 개수가 다릅니다")
+
+        with self._lock:
+            sid = self._sid(kind, key, create=True)
+            # 새 값이 뒤에 오도록 이어 붙인 뒤, 일자별 마지막 값만 남김
+            merged_days = np.concatenate([self._dates[sid], days])
+            merged_values = np.concatenate([self._values[sid], values])
+            order = np.argsort(merged_days, kind='stable')
+            merged_days, merged_values = merged_days[order], merged_values[order]
+            last = np.append(merged_days[1:] != merged_days[:-1], True)
+            self._dates[sid] = merged_days[last]
+            self._values[sid] = merged_values[last]
+            self._invalidate()
+
+    def upsert(self, kind: str, key: str, date: DateLike, value: float):
+        """단일 관측치 추가/수정"""
+        self.add_series(kind, key, [date], [value])
+
+    def _invalidate(self):
+        self._flat_key = self._flat_day = self._flat_value = None
+        self._fingerprint = None
+        self._key_indexes = {}
+        self._cache.clear()
+
+    def series(self, kind: Optional[str] = None) -> List[Tuple[str, str]]:
+        """보관 중인 (종류, 키) 목록"""
+        return [s for s in self._series if kind is None or s[0] == kind]
+
+    def __len__(self) -> int:
+        """전체 관측치 수"""
+        return int(sum(d.size for d in self._dates))
+
+    # ==================== 단건 조회 ====================
+
+    def as_of(self, kind: str, key: str, date: DateLike,
+              max_age_days: Optional[int] = None, with_date: bool = False):
+        """
+        기준일 이전(당일 포함) 가장 최근 값
+
+        Args:
+            kind / key: 시계열
+            date: 기준일
+            max_age_days: 허용 경과일 (생략 시 MAX_AGE_DAYS[kind])
+            with_date: True면 (값, 관측일 'YYYY-MM-DD') 반환
+
+        Raises:
+            LookupError: 시계열이 없거나 기준일 이전 관측치가 없거나 너무 오래된 경우
+        """
+        sid = self._sid(kind, key)
+        if sid < 0:
+            raise LookupError(f"시장 데이터 없음: {kind}/{key}")
+        day = int(self.to_days(date))
+
+        with self._lock:
+            cached = self._cache.get((sid, day))
+            if cached is not None:
+                self._cache.move_to_end((sid, day))
+                self.counters['hits'] += 1
+            else:
+                self.counters['misses'] += 1
+                dates = self._dates[sid]
+                idx = int(np.searchsorted(dates, day, side='right')) - 1
+                if idx < 0:
+                    raise LookupError(f"{kind}/{key}: {self.to_date_str(day)} 이전 관측치가 없습니다")
+                cached = (float(self._values[sid][idx]), int(dates[idx]))
+                self._cache[(sid, day)] = cached
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        value, observed = cached
+        limit = self.MAX_AGE_DAYS[kind] if max_age_days is None else max_age_days
+        if day - observed > limit:
+            raise LookupError(
+                f"{kind}/{key}: 최근 관측치({self.to_date_str(observed)})가 "
+                f"기준일({self.to_date_str(day)})보다 {day - observed}일 오래되었습니다 (허용 {limit}일)"
+            )
+        return (value, self.to_date_str(observed)) if with_date else value
+
+    # ==================== 대량 조회 ====================
+
+    def _flatten(self):
+        """(시계열 번호, 일자) 정렬 컬럼 재구성 (시계열 번호 순으로 이어 붙이면 이미 정렬됨)"""
+        with self._lock:
+            if self._flat_key is not None:
+                return
+            sids = np.repeat(np.arange(len(self._series), dtype=np.int64), [d.size for d in self._dates])
+            days = np.concatenate(self._dates) if self._dates else np.empty(0, dtype=np.int64)
+            self._flat_value = np.concatenate(self._values) if self._values else np.empty(0)
+            self._flat_day = days
+            self._flat_key = (sids << 32) | (days - np.iinfo(np.int32).min)
+
+    def _key_index(self, kind: str) -> Tuple[np.ndarray, np.ndarray]:
+        """종류별 (정렬된 키 배열, 시계열 번호 배열)"""
+        if kind not in self.KINDS:
+            raise ValueError(f"지원하지 않는 시장 데이터 종류: {kind} (지원: {', '.join(self.KINDS)})")
+        index = self._key_indexes.get(kind)
+        if index is None:
+            pairs = sorted((key, sid) for (k, key), sid in self._series_id.items() if k == kind)
+            index = (np.array([p[0] for p in pairs], dtype=str),
+                     np.array([p[1] for p in pairs], dtype=np.int64))
+            self._key_indexes[kind] = index
+        return index
+
+    def as_of_many(self, kind: str, keys, dates,
+                   max_age_days: Optional[int] = None,
+                   with_dates: bool = False):
+        """
+        대량 as-of 조회 (벡터화)
+
+        Args:
+            kind: 시계열 종류
+            keys: 키 1개 또는 (N,) 배열 (종목코드·업종 등)
+            dates: 기준일 1개 또는 (N,) 배열
+            max_age_days: 허용 경과일 (생략 시 MAX_AGE_DAYS[kind])
+            with_dates: True면 (값, 관측일 datetime64[D]) 반환
+
+        Returns:
+            np.ndarray (N,): 값이 없거나 너무 오래된 위치는 NaN
+        """
+        self._flatten()
+        days = np.atleast_1d(self.to_days(dates))
+        if np.ndim(keys) == 0:
+            sid = np.array([self._sid(kind, keys)], dtype=np.int64)
+        else:
+            # 키 → 시계열 번호 (정렬된 키 배열에서 이진 탐색)
+            known, known_sid = self._key_index(kind)
+            key_arr = np.asarray(keys).astype(str)
+            pos = np.clip(np.searchsorted(known, key_arr), 0, max(known.size - 1, 0))
+            sid = np.where(known[pos] == key_arr, known_sid[pos], -1) if known.size else \
+                np.full(key_arr.size, -1, dtype=np.int64)
+        n = max(days.size, sid.size)
+        days = np.broadcast_to(days, (n,))
+        sid = np.broadcast_to(sid, (n,))
+
+        query = (sid << 32) | (days - np.iinfo(np.int32).min)
+        if n > 1024:
+            # 정렬된 질의로 탐색하면 메모리 접근이 순차적이 되어 대량 조회가 2배가량 빠름
+            order = np.argsort(query, kind='stable')
+            pos = np.empty(n, dtype=np.int64)
+            pos[order] = np.searchsorted(self._flat_key, query[order], side='right') - 1
+        else:
+            pos = np.searchsorted(self._flat_key, query, side='right') - 1
+        safe = np.clip(pos, 0, None)
+
+        found = (sid >= 0) & (pos >= 0)
+        if self._flat_key.size:
+            found &= (self._flat_key[safe] >> 32) == sid
+            observed = self._flat_day[safe]
+        else:
+            observed = np.zeros(n, dtype=np.int64)
+        limit = self.MAX_AGE_DAYS[kind] if max_age_days is None else max_age_days
+        found &= (days - observed) <= limit
+
+        values = np.where(found, self._flat_value[safe] if self._flat_value.size else np.nan, np.nan)
+        if with_dates:
+            return values, np.where(found, observed, np.iinfo(np.int64).min).astype('datetime64[D]')
+        return values
+
+    # ==================== WACC 구성요소 ====================
+
+    WACC_COMPONENTS = ('risk_free_rate', 'beta', 'market_premium', 'cost_of_debt')
+
+    def resolve_wacc_inputs(self, valuation_date, wacc_inputs: Optional[Dict] = None) -> Dict:
+        """
+        wacc_inputs 중 비어 있는 구성요소를 평가기준일 as-of 값으로 채움
+
+        직접 입력된 값은 그대로 사용 (평가자 판단 우선)
+
+        Args:
+            valuation_date: 평가기준일 1개, 또는 (N,) 배열 (BatchDCFEngine 시나리오별 기준일)
+            wacc_inputs:
+                {
+                    'ticker': '035420',  # 종목 베타 (있으면 업종 베타보다 우선)
+                    'industry': '소프트웨어',  # 업종 베타
+                    'credit_rating': 'BBB',  # 신용스프레드 등급 (기본 BBB)
+                    'rf_tenor': '10Y',  # 무위험이자율 만기 (기본 10Y)
+                    'market': 'KR',  # 시장위험프리미엄 시장 (기본 KR)
+                    'debt_ratio': 0.30, 'tax_rate': 0.25,  # 회사 고유값 (저장소에서 채우지 않음)
+                    'risk_free_rate' / 'beta' / 'market_premium' / 'cost_of_debt': 직접 입력 시 우선
+                }
+
+        Returns:
+            Dict: 입력에 구성요소를 채운 새 dict
+                + 'market_data_as_of': {구성요소: 관측일}  (배치 조회면 생략)
+
+        Raises:
+            LookupError: 필요한 시계열이 없거나 기준일에 유효한 값이 없는 경우
+        """
+        resolved = dict(wacc_inputs or {})
+        missing = [c for c in self.WACC_COMPONENTS if resolved.get(c) is None]
+        if not missing:
+            return resolved
+
+        tenor = resolved.get('rf_tenor', self.DEFAULT_TENOR)
+        rating = resolved.get('credit_rating', self.DEFAULT_RATING)
+        market = resolved.get('market', self.DEFAULT_MARKET)
+        beta_key = resolved.get('ticker') or resolved.get('industry')
+        if 'beta' in missing and beta_key is None:
+            raise LookupError("베타 조회에는 wacc_inputs['ticker'] 또는 ['industry']가 필요합니다")
+
+        if np.ndim(valuation_date) > 0:
+            return self._resolve_wacc_batch(resolved, missing, valuation_date, tenor, rating, market, beta_key)
+
+        as_of = {}
+
+        def lookup(component: str, kind: str, key: str) -> float:
+            value, observed = self.as_of(kind, key, valuation_date, with_date=True)
+            as_of[component] = observed
+            return value
+
+        if 'risk_free_rate' in missing or 'cost_of_debt' in missing:
+            rf = lookup('risk_free_rate', 'ktb_yield', tenor)
+        if 'risk_free_rate' in missing:
+            resolved['risk_free_rate'] = rf
+        if 'beta' in missing:
+            resolved['beta'] = lookup('beta', 'beta', beta_key)
+        if 'market_premium' in missing:
+            resolved['market_premium'] = lookup('market_premium', 'mrp', market)
+        if 'cost_of_debt' in missing:
+            # 세전 타인자본비용 = 국고채 수익률 + 신용스프레드
+            resolved['cost_of_debt'] = rf + lookup('credit_spread', 'credit_spread', rating)
+
+        resolved['market_data_as_of'] = as_of
+        return resolved
+
+    def _resolve_wacc_batch(self, resolved: Dict, missing: List[str], valuation_dates,
+                            tenor, rating, market, beta_key) -> Dict:
+        """resolve_wacc_inputs의 배치 경로 (구성요소별 as_of_many 1회)"""
+        checks = []
+        if 'risk_free_rate' in missing or 'cost_of_debt' in missing:
+            rf = self.as_of_many('ktb_yield', tenor, valuation_dates)
+            checks.append(('ktb_yield', rf))
+        if 'risk_free_rate' in missing:
+            resolved['risk_free_rate'] = rf
+        if 'beta' in missing:
+            resolved['beta'] = self.as_of_many('beta', beta_key, valuation_dates)
+            checks.append(('beta', resolved['beta']))
+        if 'market_premium' in missing:
+            resolved['market_premium'] = self.as_of_many('mrp', market, valuation_dates)
+            checks.append(('mrp', resolved['market_premium']))
+        if 'cost_of_debt' in missing:
+            spread = self.as_of_many('credit_spread', rating, valuation_dates)
+            checks.append(('credit_spread', spread))
+            resolved['cost_of_debt'] = rf + spread
+
+        for kind, values in checks:
+            if np.isnan(values).any():
+                first = np.atleast_1d(valuation_dates)[np.argmax(np.isnan(values))] \
+                    if np.ndim(valuation_dates) else valuation_dates
+                raise LookupError(f"{kind}: 기준일 {first}에 유효한 값이 없습니다 "
+                                  f"({int(np.isnan(values).sum())}건)")
+        return resolved
+
+    # ==================== 디스크 / 로더 ====================
+
+    @property
+    def fingerprint(self) -> str:
+        """저장 내용 해시 (결과 캐시 키에 포함해 시장 데이터 갱신 시 재계산되도록)"""
+        if self._fingerprint is None:
+            self._flatten()
+            digest = hashlib.sha256(repr(self._series).encode('utf-8'))
+            digest.update(self._flat_key.tobytes())
+            digest.update(self._flat_value.tobytes())
+            self._fingerprint = digest.hexdigest()[:16]
+        return self._fingerprint
+
+    def save(self, path: str):
+        """컬럼형 압축 .npz로 저장"""
+        self._flatten()
+        np.savez_compressed(
+            path,
+            format_version=np.array(self.FORMAT_VERSION),
+            series_kind=np.array([s[0] for s in self._series], dtype=str),
+            series_key=np.array([s[1] for s in self._series], dtype=str),
+            series_id=(self._flat_key >> 32).astype(np.int32),
+            date=self._flat_day.astype(np.int32),
+            value=self._flat_value
+        )
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'MarketDataStore':
+        """save()로 저장한 .npz 로드"""
+        store = cls(**kwargs)
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['format_version']) != cls.FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 시장 데이터 형식 버전: {int(data['format_version'])}")
+            sids = data['series_id'].astype(np.int64)
+            days = data['date'].astype(np.int64)
+            values = data['value']
+            bounds = np.searchsorted(sids, np.arange(len(data['series_kind']) + 1))
+            for sid, (kind, key) in enumerate(zip(data['series_kind'], data['series_key'])):
+                store._sid(str(kind), str(key), create=True)
+                store._dates[sid] = days[bounds[sid]:bounds[sid + 1]]
+                store._values[sid] = values[bounds[sid]:bounds[sid + 1]]
+        return store
+
+    @classmethod
+    def from_csv(cls, path: str, encoding: str = 'utf-8-sig', **kwargs) -> 'MarketDataStore':
+        """
+        CSV 로드 (컬럼: kind, key, date, value — 행 순서 무관)
+
+        예: ktb_yield,10Y,2025-01-02,0.0285
+        """
+        rows: Dict[Tuple[str, str], Tuple[List[str], List[float]]] = {}
+        with open(path, encoding=encoding, newline='') as f:
+            for row in csv.DictReader(f):
+                dates, values = rows.setdefault((row['kind'].strip(), row['key'].strip()), ([], []))
+                dates.append(row['date'].strip())
+                values.append(float(row['value']))
+
+        store = cls(**kwargs)
+        for (kind, key), (dates, values) in rows.items():
+            store.add_series(kind, key, dates, values)
+        return store
+
+    def stats(self) -> Dict:
+        lookups = self.counters['hits'] + self.counters['misses']
+        return {
+            'series': len(self._series),
+            'observations': len(self),
+            'cache_entries': len(self._cache),
+            **self.counters,
+            'hit_ratio': round(self.counters['hits'] / lookups, 4) if lookups else 0.0
+        }
+
+
+# ==================== 기본 저장소 ====================
+
+_default_store: Optional[MarketDataStore] = None
+_default_loaded = False
+_default_lock = threading.Lock()
+
+
+def get_default_store() -> Optional[MarketDataStore]:
+    """
+    기본 저장소 (MARKET_DATA_PATH의 .npz 또는 .csv를 최초 호출 시 1회 로드)
+
+    환경변수가 없거나 파일이 없으면 None (엔진은 wacc_inputs의 직접 입력값만 사용)
+    """
+    global _default_store, _default_loaded
+    if _default_loaded:
+        return _default_store
+    with _default_lock:
+        if not _default_loaded:
+            path = os.environ.get('MARKET_DATA_PATH')
+            if path and os.path.exists(path):
+                loader = MarketDataStore.from_csv if path.endswith('.csv') else MarketDataStore.load
+                _default_store = loader(path)
+            _default_loaded = True
+    return _default_store
+
+
+def set_default_store(store: Optional[MarketDataStore]):
+    """기본 저장소 교체 (일일 적재 배치 / 테스트용)"""
+    global _default_store, _default_loaded
+    with _default_lock:
+        _default_store = store
+        _default_loaded = True
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("=" * 80)
+    print("Market Data Store - As-of Lookup Test")
+    print("=" * 80)
+
+    rng = np.random.default_rng(7)
+    business_days = np.arange(np.datetime64('2020-01-01'), np.datetime64('2026-01-01'))
+    business_days = business_days[np.is_busday(business_days)]
+
+    store = MarketDataStore()
+    ktb = 0.03 + 0.008 * np.sin(np.linspace(0, 6, business_days.size)) + rng.normal(0, 0.0003, business_days.size)
+    store.add_series('ktb_yield', '10Y', business_days, ktb)
+    store.add_series('credit_spread', 'BBB', business_days, np.full(business_days.size, 0.018))
+    store.add_series('mrp', 'KR', ['2020-01-01', '2023-01-01', '2025-01-01'], [0.065, 0.070, 0.075])
+    month_ends = np.arange(np.datetime64('2020-01'), np.datetime64('2026-01')).astype('datetime64[D]')
+    tickers = [f"{i:06d}" for i in range(2000)]
+    for ticker in tickers:
+        store.add_series('beta', ticker, month_ends, 0.6 + rng.random() + rng.normal(0, 0.05, month_ends.size))
+    store.add_series('beta', '소프트웨어', month_ends, np.full(month_ends.size, 1.15))
+    print(f"시계열 {len(store.series())}개, 관측치 {len(store):,}건")
+
+    # 단건 as-of: 주말 기준일은 직전 영업일 값
+    value, observed = store.as_of('ktb_yield', '10Y', '2025-03-01', with_date=True)
+    print(f"\n국고채 10Y @ 2025-03-01(토) → {value:.4%} (관측일 {observed})")
+    assert observed == '2025-02-28'
+
+    wacc_inputs = store.resolve_wacc_inputs('2025-03-01', {'industry': '소프트웨어',
+                                                          'debt_ratio': 0.3, 'tax_rate': 0.22})
+    print(f"WACC 구성요소: rf={wacc_inputs['risk_free_rate']:.4%}, β={wacc_inputs['beta']:.2f}, "
+          f"MRP={wacc_inputs['market_premium']:.2%}, Rd={wacc_inputs['cost_of_debt']:.4%}")
+    print(f"  관측일: {wacc_inputs['market_data_as_of']}")
+
+    try:
+        store.as_of('ktb_yield', '10Y', '2019-06-30')
+    except LookupError as e:
+        print(f"기준일 이전 데이터 없음 → LookupError: {e}")
+
+    # 대량 조회: 벡터화 vs 단건 반복
+    n = 200_000
+    query_tickers = rng.choice(tickers, n)
+    query_dates = rng.choice(business_days, n)
+    store.as_of_many('beta', tickers[0], '2025-01-01')  # 평탄화 컬럼 구성 (쓰기 후 1회)
+    start = time.perf_counter()
+    betas = store.as_of_many('beta', query_tickers, query_dates)
+    vectorized = time.perf_counter() - start
+
+    sample = 2_000
+    start = time.perf_counter()
+    loop = [store.as_of('beta', t, d) if d >= month_ends[0] else np.nan
+            for t, d in zip(query_tickers[:sample], query_dates[:sample])]
+    per_call = (time.perf_counter() - start) / sample
+    assert np.allclose(betas[:sample], loop, equal_nan=True)
+    print(f"\n대량 조회 {n:,}건: {vectorized * 1000:.1f} ms (단건 반복 추정 {per_call * n * 1000:,.0f} ms)")
+
+    # 디스크 왕복
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'market_data.npz')
+        start = time.perf_counter()
+        store.save(path)
+        size = os.path.getsize(path)
+        loaded = MarketDataStore.load(path)
+        print(f"저장/로드: {size / 1024:,.0f} KiB, {(time.perf_counter() - start) * 1000:.1f} ms")
+        assert loaded.fingerprint == store.fingerprint
+        assert np.array_equal(loaded.as_of_many('beta', query_tickers, query_dates), betas, equal_nan=True)
+
+    print(f"\n캐시 통계: {store.stats()}")
+
+    # 시장 데이터로 채운 wacc_inputs를 직접 읽던 도구들: 선택자만 준 입력 == 구성요소를 미리 채운 입력
+    import contextlib
+    import io
+    import sys
+    # valuation_engine 디렉터리 / common 디렉터리 어느 쪽에서 실행해도 엔진 패키지를 찾도록 엔진 루트 추가
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import market_data as engine_market_data  # 엔진이 보는 모듈 (이 파일은 __main__으로 실행 중)
+    from common.approval_preview import ApprovalImpactPreview
+    from common.human_approval import HumanApprovalManager
+    from dcf.reverse_dcf import ReverseDCFSolver
+    from dcf.sensitivity_analysis import SensitivityAnalyzer
+
+    store_inputs = {
+        'valuation_date': '2025-03-01',
+        'historical_financials': [
+            {'year': 2022, 'revenue': 100_000, 'operating_income': 12_000, 'net_income': 8_000,
+             'depreciation': 3_000, 'capex': 4_000, 'working_capital_change': 1_000},
+            {'year': 2023, 'revenue': 115_000, 'operating_income': 15_000, 'net_income': 10_000,
+             'depreciation': 3_500, 'capex': 5_000, 'working_capital_change': 1_500},
+            {'year': 2024, 'revenue': 130_000, 'operating_income': 18_000, 'net_income': 12_000,
+             'depreciation': 4_000, 'capex': 6_000, 'working_capital_change': 1_500}
+        ],
+        'assumptions': {
+            'base_year': 2024, 'revenue_growth': [0.12, 0.10, 0.08, 0.06, 0.05],
+            'target_operating_margin': 0.15, 'tax_rate': 0.22, 'terminal_growth': 0.03
+        },
+        'wacc_inputs': {'industry': '소프트웨어', 'debt_ratio': 0.3, 'tax_rate': 0.22},
+        'adjustments': {'cash': 10_000, 'total_debt': 30_000,
+                        'non_operating_assets': 5_000, 'shares_outstanding': 10_000_000}
+    }
+    explicit_inputs = {**store_inputs, 'wacc_inputs': store.resolve_wacc_inputs('2025-03-01', store_inputs['wacc_inputs'])}
+
+    manager = HumanApprovalManager()
+    manager.request_growth_rate_approval({2025: 0.25, 2026: 0.20, 2027: 0.15, 2028: 0.12, 2029: 0.10},
+                                         {'avg_3yr': 0.14}, 0.08)
+    manager.request_ebitda_margin_approval([0.12, 0.13, 0.138], 0.16)
+    analyzer = SensitivityAnalyzer()
+    axes = {'wacc': np.linspace(0.08, 0.12, 5), 'terminal_growth': np.linspace(0.02, 0.04, 5)}
+    distributions = {'beta': {'dist': 'normal', 'mean': 1.15, 'std': 0.1},
+                     'terminal_growth': {'dist': 'uniform', 'low': 0.02, 'high': 0.035}}
+
+    def consumers(inputs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            cube = analyzer.create_sensitivity_cube(inputs, axes)
+            mc = analyzer.monte_carlo_analysis(inputs, distributions, n_paths=2_000, seed=3)
+        return {
+            'cube_base_wacc': cube.base_case['wacc'],
+            'monte_carlo_mean': mc['mean'],
+            'reverse_dcf_base': ReverseDCFSolver(inputs).base_value_per_share,
+            'preview_base': ApprovalImpactPreview(manager, inputs).preview()['baseline']['value_per_share']
+        }
+
+    engine_market_data.set_default_store(store)
+    try:
+        from_store, from_explicit = consumers(store_inputs), consumers(explicit_inputs)
+    finally:
+        engine_market_data.set_default_store(None)
+    print("\n선택자만 준 wacc_inputs로 민감도 큐브 / 몬테카를로 / 역산 / 승인 미리보기 실행")
+    for name, value in from_store.items():
+        print(f"  {name:<18} {value:>16,.4f}")
+        assert np.isclose(value, from_explicit[name]), (name, value, from_explicit[name])
+    print("✅ 구성요소를 미리 채운 입력과 일치")
+    print("=" * 80)
@@ -0,0 +1,516 @@
+"""
+DCF 배치 평가 엔진 (Vectorized Batch DCF)
+
+하나의 기업에 대해 N개의 가정 세트를 NumPy 배열로 받아
+예측 → 할인 → 영구가치 → 주주가치를 한 번에 계산
+
+- 계산 순서와 수식은 DCFEngine(스칼라 경로)과 동일
+- 연도 루프(5년)만 남기고 시나리오 축(N)은 전부 배열 연산
+- 결과는 컬럼형 Dict[str, np.ndarray]로 반환
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import sys
+sys.path.append('..')
+
+from typing import Dict, Optional
+import numpy as np
+from dcf.dcf_engine import DCFEngine
+
+
+class BatchDCFEngine:
+    """N개 가정 세트를 한 번에 평가하는 DCF 배치 엔진"""
+
+    # project_financials 기본값 (DCFEngine과 동일)
+    DEFAULT_ASSUMPTIONS = {
+        'tax_rate': 0.25,
+        'depreciation_rate': 0.03,
+        'capex_rate': 0.05,
+        'wc_rate': 0.10
+    }
+
+    def __init__(self, market_data=None):
+        self.engine = DCFEngine(market_data)
+
+    # ==================== 입력 정리 ====================
+
+    def resolve_wacc_inputs(self, inputs: Dict) -> Dict:
+        """
+        WACC 입력 확정 (할인율 'wacc' 직접 지정은 그대로, 그 외는 DCFEngine.resolve_wacc_inputs로 시장 데이터 보완)
+
+        민감도·역산·미리보기 등 wacc_inputs를 직접 읽는 도구도 이 메서드를 거쳐야
+        선택자만 있는 입력(예: {'industry', 'debt_ratio', 'tax_rate'})을 처리할 수 있다.
+        """
+        wacc_inputs = inputs['wacc_inputs']
+        return wacc_inputs if 'wacc' in wacc_inputs else self.engine.resolve_wacc_inputs(inputs)
+
+    @staticmethod
+    def _column(value, n: int) -> np.ndarray:
+        """스칼라 또는 (N,) 배열을 (N,) float 배열로 브로드캐스트"""
+        return np.broadcast_to(np.asarray(value, dtype=float), (n,))
+
+    @staticmethod
+    def _growth_matrix(revenue_growth, periods: int) -> np.ndarray:
+        """성장률 경로를 (N, periods) 배열로 변환"""
+        growth = np.asarray(revenue_growth, dtype=float)
+        if growth.ndim == 1:
+            growth = growth[np.newaxis, :]
+
+        if growth.shape[1] < periods:
+            raise ValueError(
+                f"성장률 경로 길이({growth.shape[1]})가 예측 기간({periods})보다 짧습니다"
+            )
+
+        return growth[:, :periods]
+
+    @staticmethod
+    def batch_size(assumptions: Dict, wacc_inputs: Dict, adjustments: Dict = None) -> int:
+        """입력 배열로부터 시나리오 수(N) 결정 (adjustments의 (N,) 배열 포함)"""
+        sizes = []
+
+        growth = np.asarray(assumptions['revenue_growth'])
+        if growth.ndim == 2:
+            sizes.append(growth.shape[0])
+
+        for source in (assumptions, wacc_inputs, adjustments or {}):
+            for key, value in source.items():
+                if key == 'revenue_growth':
+                    continue
+                arr = np.asarray(value)
+                if arr.ndim == 1:
+                    sizes.append(arr.shape[0])
+
+        sizes = set(sizes)
+        if len(sizes) > 1:
+            raise ValueError(f"가정 배열의 길이가 일치하지 않습니다: {sorted(sizes)}")
+
+        return sizes.pop() if sizes else 1
+
+    @staticmethod
+    def stack_assumptions(assumption_sets: list) -> Dict:
+        """
+        스칼라 가정 Dict 리스트를 배치 입력(컬럼형)으로 변환
+
+        Args:
+            assumption_sets: [{'revenue_growth': [...], 'terminal_growth': 0.03, ...}, ...]
+
+        Returns:
+            Dict: 키별 np.ndarray (revenue_growth는 (N, T))
+        """
+        keys = set().union(*(s.keys() for s in assumption_sets))
+        stacked = {}
+
+        for key in keys:
+            values = [s[key] for s in assumption_sets if key in s]
+            if len(values) != len(assumption_sets):
+                raise ValueError(f"일부 가정 세트에 '{key}'가 없습니다")
+            if key == 'base_year':
+                stacked[key] = values[0]
+                continue
+            stacked[key] = np.asarray(values, dtype=float)
+
+        return stacked
+
+    # ==================== 단계별 계산 ====================
+
+    def project_financials(self,
+                           base_financials: Dict,
+                           assumptions: Dict,
+                           periods: int = 5,
+                           n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        재무제표 예측 (배치)
+
+        Args:
+            base_financials: 정규화된 과거 재무 데이터 (DCFEngine.normalize_financials 결과)
+            assumptions: 예측 가정 (값은 스칼라 또는 (N,) 배열, revenue_growth는 (T,) 또는 (N, T))
+            periods: 예측 기간
+            n: 시나리오 수 (생략 시 입력에서 추론)
+
+        Returns:
+            Dict: 항목별 (N, T) 배열 {'revenue', 'operating_income', 'nopat', ..., 'fcf'}
+        """
+        growth = self._growth_matrix(assumptions['revenue_growth'], periods)
+        if n is None:
+            n = growth.shape[0]
+        growth = np.broadcast_to(growth, (n, periods))
+
+        target_margin = self._column(
+            assumptions.get('target_operating_margin', base_financials['avg_operating_margin']), n
+        )
+        tax_rate = self._column(assumptions.get('tax_rate', self.DEFAULT_ASSUMPTIONS['tax_rate']), n)
+        dep_rate = self._column(
+            assumptions.get('depreciation_rate', self.DEFAULT_ASSUMPTIONS['depreciation_rate']), n
+        )
+        capex_rate = self._column(assumptions.get('capex_rate', self.DEFAULT_ASSUMPTIONS['capex_rate']), n)
+        wc_rate = self._column(assumptions.get('wc_rate', self.DEFAULT_ASSUMPTIONS['wc_rate']), n)
+
+        shape = (n, periods)
+        revenue = np.empty(shape)
+        operating_income = np.empty(shape)
+        nopat = np.empty(shape)
+        depreciation = np.empty(shape)
+        capex = np.empty(shape)
+        wc_change = np.empty(shape)
+        fcf = np.empty(shape)
+
+        # 연도 순서대로 누적 (스칼라 경로와 동일한 연산 순서 유지)
+        last_revenue = np.full(n, float(base_financials['revenues'][-1]))
+        for t in range(periods):
+            projected_revenue = last_revenue * (1 + growth[:, t])
+            projected_oi = projected_revenue * target_margin
+
+            revenue[:, t] = projected_revenue
+            operating_income[:, t] = projected_oi
+            nopat[:, t] = projected_oi * (1 - tax_rate)
+            depreciation[:, t] = projected_revenue * dep_rate
+            capex[:, t] = projected_revenue * capex_rate
+            wc_change[:, t] = (projected_revenue - last_revenue) * wc_rate
+            fcf[:, t] = nopat[:, t] + depreciation[:, t] - capex[:, t] - wc_change[:, t]
+
+            last_revenue = projected_revenue
+
+        return {
+            'revenue': revenue,
+            'operating_income': operating_income,
+            'nopat': nopat,
+            'depreciation': depreciation,
+            'capex': capex,
+            'wc_change': wc_change,
+            'fcf': fcf,
+            'operating_margin': target_margin,
+            'fcf_margin': fcf / revenue
+        }
+
+    def calculate_wacc(self, wacc_inputs: Dict, n: int) -> Dict[str, np.ndarray]:
+        """
+        WACC 계산 (배치)
+
+        Formula: WACC = (E/V) × (Rf + β × MRP) + (D/V) × Rd × (1 - T)
+
+        wacc_inputs에 'wacc'가 있으면 구성요소 대신 해당 값을 할인율로 직접 사용
+        (회계사가 WACC를 직접 지정하는 시뮬레이션용)
+
+        Returns:
+            Dict: {'wacc', 'cost_of_equity', 'after_tax_cost_of_debt'} 각 (N,) 배열
+        """
+        if 'wacc' in wacc_inputs:
+            wacc = self._column(wacc_inputs['wacc'], n)
+            missing = np.full(n, np.nan)
+            return {
+                'wacc': wacc,
+                'cost_of_equity': missing,
+                'after_tax_cost_of_debt': missing
+            }
+
+        rf = self._column(wacc_inputs['risk_free_rate'], n)
+        beta = self._column(wacc_inputs['beta'], n)
+        mrp = self._column(wacc_inputs['market_premium'], n)
+        cost_of_debt = self._column(wacc_inputs['cost_of_debt'], n)
+        debt_ratio = self._column(wacc_inputs['debt_ratio'], n)
+        tax_rate = self._column(wacc_inputs['tax_rate'], n)
+
+        cost_of_equity = rf + beta * mrp
+        wacc = ((1 - debt_ratio) * cost_of_equity) + (debt_ratio * cost_of_debt * (1 - tax_rate))
+
+        return {
+            'wacc': wacc,
+            'cost_of_equity': cost_of_equity,
+            'after_tax_cost_of_debt': cost_of_debt * (1 - tax_rate)
+        }
+
+    @staticmethod
+    def discount_cash_flows(fcf: np.ndarray, wacc: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        FCF 현재가치 할인 (배치)
+
+        Args:
+            fcf: (N, T) 예측 FCF
+            wacc: (N,) 할인율
+
+        Returns:
+            Dict: {'discount_factor': (N, T), 'pv_fcf': (N, T), 'total_pv_fcf': (N,)}
+        """
+        n, periods = fcf.shape
+        discount_factor = np.empty((n, periods))
+        total_pv_fcf = np.zeros(n)
+
+        for t in range(1, periods + 1):
+            discount_factor[:, t - 1] = 1 / ((1 + wacc) ** t)
+            total_pv_fcf = total_pv_fcf + fcf[:, t - 1] * discount_factor[:, t - 1]
+
+        return {
+            'discount_factor': discount_factor,
+            'pv_fcf': fcf * discount_factor,
+            'total_pv_fcf': total_pv_fcf
+        }
+
+    @staticmethod
+    def calculate_terminal_value(last_fcf: np.ndarray,
+                                 terminal_growth: np.ndarray,
+                                 wacc: np.ndarray,
+                                 last_period: int) -> Dict[str, np.ndarray]:
+        """
+        영구가치 계산 (배치, Gordon Growth Model)
+
+        WACC <= 영구성장률인 시나리오는 스칼라 경로에서 ValueError이므로
+        여기서는 NaN으로 채우고 'valid' 마스크로 표시
+
+        Returns:
+            Dict: {'terminal_value', 'pv_terminal_value', 'valid'} 각 (N,) 배열
+        """
+        valid = wacc > terminal_growth
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fcf_next_year = last_fcf * (1 + terminal_growth)
+            terminal_value = np.where(valid, fcf_next_year / (wacc - terminal_growth), np.nan)
+            pv_terminal_value = terminal_value / (1 + wacc) ** last_period
+
+        return {
+            'fcf_next_year': fcf_next_year,
+            'terminal_value': terminal_value,
+            'pv_terminal_value': pv_terminal_value,
+            'valid': valid
+        }
+
+    @staticmethod
+    def calculate_equity_value(pv_fcf: np.ndarray,
+                               pv_tv: np.ndarray,
+                               adjustments: Dict) -> Dict[str, np.ndarray]:
+        """
+        기업가치 → 주주가치 → 주당가치 (배치)
+
+        adjustments 값은 스칼라(기업 공통) 또는 (N,) 배열 모두 허용
+        """
+        enterprise_value = pv_fcf + pv_tv
+        net_debt = np.asarray(adjustments.get('total_debt', 0), dtype=float) - \
+            np.asarray(adjustments.get('cash', 0), dtype=float)
+        non_op_assets = np.asarray(adjustments.get('non_operating_assets', 0), dtype=float)
+        shares = np.asarray(adjustments['shares_outstanding'], dtype=float)
+
+        equity_value = enterprise_value - net_debt + non_op_assets
+        value_per_share = (equity_value * 1_000_000) / shares  # 백만원 → 원
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tv_ratio = pv_tv / (pv_fcf + pv_tv)
+
+        return {
+            'enterprise_value': enterprise_value,
+            'equity_value': equity_value,
+            'value_per_share': value_per_share,
+            'terminal_value_ratio': tv_ratio,
+            'tv_ratio_is_normal': (tv_ratio >= 0.50) & (tv_ratio <= 0.80)
+        }
+
+    # ==================== 전체 실행 ====================
+
+    def run_valuation(self,
+                      inputs: Dict,
+                      normalized: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+        """
+        배치 DCF 평가 실행
+
+        Args:
+            inputs: DCFEngine.run_valuation과 같은 구조.
+                assumptions / wacc_inputs / adjustments의 값은 스칼라 또는 (N,) 배열,
+                assumptions['revenue_growth']는 (T,) 또는 (N, T) 배열
+            normalized: 정규화 결과 재사용 시 전달 (생략 시 historical_financials로 계산)
+
+        Returns:
+            Dict: 컬럼형 결과
+                {
+                    'n_scenarios': N,
+                    'years': [2025, ..., 2029],
+                    'fcf': (N, T), 'pv_fcf': (N, T), ...,
+                    'wacc': (N,), 'total_pv_fcf': (N,), 'pv_terminal_value': (N,),
+                    'enterprise_value': (N,), 'equity_value': (N,), 'value_per_share': (N,),
+                    'valid': (N,) bool
+                }
+        """
+        assumptions = inputs['assumptions']
+        # valuation_date가 (N,) 배열이면 시나리오별 기준일로 시장 데이터 일괄 조회
+        wacc_inputs = self.resolve_wacc_inputs(inputs)
+        periods = inputs.get('projection_period', 5)
+
+        if normalized is None:
+            normalized = self.engine.normalize_financials(inputs['historical_financials'])
+
+        n = self.batch_size(assumptions, wacc_inputs, inputs['adjustments'])
+
+        projections = self.project_financials(normalized, assumptions, periods, n=n)
+        wacc_result = self.calculate_wacc(wacc_inputs, n)
+        discounted = self.discount_cash_flows(projections['fcf'], wacc_result['wacc'])
+        tv_result = self.calculate_terminal_value(
+            projections['fcf'][:, -1],
+            self._column(assumptions['terminal_growth'], n),
+            wacc_result['wacc'],
+            periods
+        )
+        equity_result = self.calculate_equity_value(
+            discounted['total_pv_fcf'],
+            tv_result['pv_terminal_value'],
+            inputs['adjustments']
+        )
+
+        base_year = assumptions['base_year']
+
+        return {
+            'n_scenarios': n,
+            'years': [base_year + t for t in range(1, periods + 1)],
+            **projections,
+            **wacc_result,
+            **discounted,
+            **tv_result,
+            **equity_result
+        }
+
+
+# 정합성 검증 및 벤치마크
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import time
+
+    print("=" * 80)
+    print("Batch DCF Engine - Consistency Check & Benchmark")
+    print("=" * 80)
+
+    base_inputs = {
+        'company_id': 'TEST001',
+        'company_name': '테스트기업',
+        'valuation_date': '2025-01-01',
+        'historical_financials': [
+            {'year': 2022, 'revenue': 100000000000, 'operating_income': 12000000000,
+             'net_income': 8000000000, 'depreciation': 3000000000, 'capex': 4000000000,
+             'working_capital_change': 1000000000, 'tax_rate': 0.25,
+             'one_time_items': [500000000]},
+            {'year': 2023, 'revenue': 115000000000, 'operating_income': 15000000000,
+             'net_income': 10000000000, 'depreciation': 3500000000, 'capex': 5000000000,
+             'working_capital_change': 1500000000, 'tax_rate': 0.25},
+            {'year': 2024, 'revenue': 130000000000, 'operating_income': 18000000000,
+             'net_income': 12000000000, 'depreciation': 4000000000, 'capex': 6000000000,
+             'working_capital_change': 1500000000, 'tax_rate': 0.25}
+        ],
+        'assumptions': {
+            'base_year': 2024,
+            'revenue_growth': [0.12, 0.10, 0.08, 0.06, 0.05],
+            'target_operating_margin': 0.15,
+            'tax_rate': 0.25,
+            'depreciation_rate': 0.03,
+            'capex_rate': 0.05,
+            'wc_rate': 0.10,
+            'terminal_growth': 0.03
+        },
+        'wacc_inputs': {
+            'risk_free_rate': 0.035,
+            'beta': 1.2,
+            'market_premium': 0.07,
+            'cost_of_debt': 0.05,
+            'debt_ratio': 0.30,
+            'tax_rate': 0.25
+        },
+        'adjustments': {
+            'cash': 10000000000,
+            'total_debt': 30000000000,
+            'non_operating_assets': 5000000000,
+            'shares_outstanding': 10000000
+        }
+    }
+
+    def random_inputs(n: int, seed: int = 42) -> Dict:
+        rng = np.random.default_rng(seed)
+        return {
+            **base_inputs,
+            'assumptions': {
+                'base_year': 2024,
+                'revenue_growth': rng.uniform(0.0, 0.15, size=(n, 5)),
+                'target_operating_margin': rng.uniform(0.08, 0.20, size=n),
+                'tax_rate': 0.25,
+                'depreciation_rate': rng.uniform(0.02, 0.04, size=n),
+                'capex_rate': rng.uniform(0.03, 0.07, size=n),
+                'wc_rate': rng.uniform(0.05, 0.15, size=n),
+                'terminal_growth': rng.uniform(0.01, 0.04, size=n)
+            },
+            'wacc_inputs': {
+                'risk_free_rate': rng.uniform(0.025, 0.045, size=n),
+                'beta': rng.uniform(0.8, 1.5, size=n),
+                'market_premium': rng.uniform(0.06, 0.08, size=n),
+                'cost_of_debt': 0.05,
+                'debt_ratio': rng.uniform(0.1, 0.5, size=n),
+                'tax_rate': 0.25
+            }
+        }
+
+    batch_engine = BatchDCFEngine()
+    scalar_engine = DCFEngine()
+
+    # [1] 스칼라 경로와 동일한 값인지 확인
+    print("\n[1] 스칼라 경로 대비 정합성 (200개 시나리오)")
+    check_inputs = random_inputs(200)
+    batch = batch_engine.run_valuation(check_inputs)
+
+    max_rel_err = 0.0
+    for i in range(batch['n_scenarios']):
+        scenario = {
+            **base_inputs,
+            'assumptions': {
+                k: (v[i].tolist() if isinstance(v, np.ndarray) else v)
+                for k, v in check_inputs['assumptions'].items()
+            },
+            'wacc_inputs': {
+                k: (float(v[i]) if isinstance(v, np.ndarray) else v)
+                for k, v in check_inputs['wacc_inputs'].items()
+            }
+        }
+        with contextlib.redirect_stdout(io.StringIO()):
+            scalar = scalar_engine.run_valuation(scenario)
+
+        for key, expected in (
+            ('wacc', scalar['wacc']['wacc']),
+            ('total_pv_fcf', scalar['discounted_fcf']['total_pv_fcf']),
+            ('pv_terminal_value', scalar['terminal_value']['pv_terminal_value']),
+            ('enterprise_value', scalar['valuation_result']['enterprise_value']),
+            ('equity_value', scalar['valuation_result']['equity_value']),
+            ('value_per_share', scalar['valuation_result']['value_per_share']),
+        ):
+            max_rel_err = max(max_rel_err, abs(batch[key][i] - expected) / abs(expected))
+
+    print(f"  최대 상대오차: {max_rel_err:.2e}")
+    assert max_rel_err < 1e-12, "배치 결과가 스칼라 경로와 다릅니다"
+
+    # [1-1] adjustments만 (N,) 배열인 경우에도 N개 시나리오로 계산
+    shares = np.array([5_000_000, 10_000_000, 20_000_000], dtype=float)
+    adjusted = batch_engine.run_valuation({
+        **base_inputs,
+        'adjustments': {**base_inputs['adjustments'], 'shares_outstanding': shares}
+    })
+    print(f"  adjustments 배치: N={adjusted['n_scenarios']}, "
+          f"주당가치 {np.round(adjusted['value_per_share']).tolist()}")
+    assert adjusted['n_scenarios'] == 3
+    assert adjusted['equity_value'].shape == (3,)
+    assert np.allclose(adjusted['value_per_share'] * shares, adjusted['equity_value'] * 1_000_000)
+
+    # [2] 시나리오당 비용
+    print("\n[2] 시나리오당 비용")
+    normalized = scalar_engine.normalize_financials(base_inputs['historical_financials'])
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(200):
+            scalar_engine.run_valuation(base_inputs)
+        scalar_cost = (time.perf_counter() - start) / 200
+    print(f"  {'스칼라 run_valuation':<22}{scalar_cost * 1e6:>12.2f} µs/시나리오")
+
+    for n in (1, 1_000, 100_000):
+        bench_inputs = random_inputs(n, seed=n)
+        repeats = max(1, 2_000 // n) if n < 100_000 else 3
+        start = time.perf_counter()
+        for _ in range(repeats):
+            batch_engine.run_valuation(bench_inputs, normalized=normalized)
+        elapsed = (time.perf_counter() - start) / repeats
+        print(f"  {'배치 N=' + format(n, ','):<22}{elapsed / n * 1e6:>12.3f} µs/시나리오"
+              f"  (호출당 {elapsed * 1e3:,.2f} ms)")
+
+    print("\n" + "=" * 80)
@@ -17,14 +17,16 @@ sys.path.append('..')
 from typing import List, Dict, Optional
 from datetime import datetime
 from common.financial_math import FinancialCalculator, ValidationLibrary
+from common.market_data import MarketDataStore, get_default_store
 
 
 class DCFEngine:
     """DCF 평가 엔진 핵심 클래스"""
 
-    def __init__(self):
+    def __init__(self, market_data: Optional[MarketDataStore] = None):
         self.calc = FinancialCalculator()
         self.validator = ValidationLibrary()
+        self.market_data = market_data  # None이면 기본 저장소(MARKET_DATA_PATH) 사용
 
     def normalize_financials(self, raw_financials: List[Dict]) -> Dict:
         """
@@ -175,6 +177,30 @@ class DCFEngine:
 
         return projections
 
+    def resolve_wacc_inputs(self, inputs: Dict) -> Dict:
+        """
+        WACC 입력 확정
+
+        wacc_inputs에 무위험이자율·베타·시장위험프리미엄·부채비용이 모두 있으면 그대로 사용하고,
+        빠진 항목은 시장 데이터 저장소에서 valuation_date 기준 as-of 값으로 채움
+        (선택자: ticker / industry / credit_rating / rf_tenor / market → MarketDataStore.resolve_wacc_inputs)
+
+        Args:
+            inputs: run_valuation 입력 (valuation_date, wacc_inputs 사용)
+
+        Returns:
+            Dict: calculate_wacc_detailed에 넘길 wacc_inputs
+        """
+        wacc_inputs = inputs['wacc_inputs']
+        if all(wacc_inputs.get(c) is not None for c in MarketDataStore.WACC_COMPONENTS):
+            return wacc_inputs
+
+        store = self.market_data or get_default_store()
+        if store is None:
+            missing = [c for c in MarketDataStore.WACC_COMPONENTS if wacc_inputs.get(c) is None]
+            raise ValueError(f"WACC 입력 누락: {', '.join(missing)} (시장 데이터 저장소 미설정)")
+        return store.resolve_wacc_inputs(inputs['valuation_date'], wacc_inputs)
+
     def calculate_wacc_detailed(self, wacc_inputs: Dict) -> Dict:
         """
         WACC 상세 계산
@@ -280,6 +306,154 @@ class DCFEngine:
             'capitalization_rate': wacc - terminal_growth
         }
 
+    def calculate_value_sensitivities(self,
+                                      projections: List[Dict],
+                                      assumptions: Dict,
+                                      base_revenue: float,
+                                      wacc: float,
+                                      terminal_growth: float,
+                                      adjustments: Dict,
+                                      shocks: Optional[Dict] = None) -> Dict:
+        """
+        기업가치/주당가치의 해석적 민감도 (1차·2차 미분)
+
+        FCF_t = R_t × u - ΔR_t × w   (u = m(1-τ) + d - c, w = 운전자본율)
+        EV    = Σ FCF_t·D_t + FCF_T(1+g)/(r-g)·D_T,   D_t = (1+r)^-t
+
+        - ∂EV/∂r   : ∂D_t/∂r = -t·D_t/(1+r), ∂²D_t/∂r² = t(t+1)·D_t/(1+r)²
+        - ∂EV/∂g   : FCF_T·D_T·(1+r)/(r-g)²,  ∂²EV/∂g² = FCF_T·D_T·2(1+r)/(r-g)³
+        - ∂EV/∂m   : (1-τ)·[Σ R_t·D_t + R_T(1+g)/(r-g)·D_T],  2차 = 0 (선형)
+        - ∂EV/∂g_k : t ≥ k인 R_t가 R_t/(1+g_k)만큼 변동,  2차 = 0 (R_t가 (1+g_k)에 선형)
+
+        Args:
+            projections: project_financials 결과
+            assumptions: 예측 가정 (tax/depreciation/capex/wc 비율)
+            base_revenue: 기준연도 매출 (예측 1년차 직전)
+            wacc: 할인율
+            terminal_growth: 영구성장률
+            adjustments: 순부채·주식수 등 (주당가치 환산용)
+            shocks: 토네이도 차트 변동폭 (기본: WACC ±1%p, 성장률 ±0.5%p,
+                    마진 ±1%p, 연도별 매출성장률 ±1%p)
+
+        Returns:
+            Dict:
+                {
+                    'derivatives': {
+                        'wacc': {'d_ev': ..., 'd2_ev': ..., 'd_vps': ..., 'd2_vps': ...},
+                        'terminal_growth': {...},
+                        'target_operating_margin': {...},
+                        'revenue_growth_2025': {...}, ...
+                    },
+                    'tornado': [{'driver': 'wacc', 'shock': 0.01,
+                                 'value_low': ..., 'value_high': ..., 'range': ...}, ...]
+                }
+        """
+        r = wacc
+        g = terminal_growth
+        n = len(projections)
+
+        revenues = [p['revenue'] for p in projections]
+        prev_revenues = [base_revenue] + revenues[:-1]
+        fcfs = [p['fcf'] for p in projections]
+        discount = [1 / ((1 + r) ** t) for t in range(1, n + 1)]
+
+        tax_rate = assumptions.get('tax_rate', 0.25)
+        wc_rate = assumptions.get('wc_rate', 0.10)
+        unit_fcf = (projections[-1]['operating_margin'] * (1 - tax_rate)
+                    + assumptions.get('depreciation_rate', 0.03)
+                    - assumptions.get('capex_rate', 0.05))
+
+        # 영구가치 승수: PV(TV) = FCF_T × tv_multiple
+        tv_multiple = (1 + g) / (r - g) * discount[-1]
+
+        ev = sum(f * d for f, d in zip(fcfs, discount)) + fcfs[-1] * tv_multiple
+
+        # WACC
+        d_ev_r = sum(-t * f * d / (1 + r) for t, (f, d) in enumerate(zip(fcfs, discount), start=1))
+        d2_ev_r = sum(t * (t + 1) * f * d / (1 + r) ** 2
+                      for t, (f, d) in enumerate(zip(fcfs, discount), start=1))
+        k = fcfs[-1] * (1 + g)
+        d_dt = -n * discount[-1] / (1 + r)
+        d2_dt = n * (n + 1) * discount[-1] / (1 + r) ** 2
+        d_ev_r += k * (-discount[-1] / (r - g) ** 2 + d_dt / (r - g))
+        d2_ev_r += k * (2 * discount[-1] / (r - g) ** 3 - 2 * d_dt / (r - g) ** 2 + d2_dt / (r - g))
+
+        # 영구성장률
+        d_ev_g = fcfs[-1] * discount[-1] * (1 + r) / (r - g) ** 2
+        d2_ev_g = fcfs[-1] * discount[-1] * 2 * (1 + r) / (r - g) ** 3
+
+        # 영업이익률
+        d_ev_m = (1 - tax_rate) * (sum(rv * d for rv, d in zip(revenues, discount))
+                                   + revenues[-1] * tv_multiple)
+
+        derivatives_ev = {
+            'wacc': (d_ev_r, d2_ev_r),
+            'terminal_growth': (d_ev_g, d2_ev_g),
+            'target_operating_margin': (d_ev_m, 0.0)
+        }
+
+        # 연도별 매출성장률
+        for k_idx, projection in enumerate(projections):
+            growth_k = assumptions['revenue_growth'][k_idx]
+            d_fcf = [0.0] * n
+            for t in range(k_idx, n):
+                d_revenue = revenues[t] / (1 + growth_k)
+                d_prev_revenue = prev_revenues[t] / (1 + growth_k) if t > k_idx else 0.0
+                d_fcf[t] = unit_fcf * d_revenue - wc_rate * (d_revenue - d_prev_revenue)
+
+            d_ev_gk = sum(df * d for df, d in zip(d_fcf, discount)) + d_fcf[-1] * tv_multiple
+            derivatives_ev[f"revenue_growth_{projection['year']}"] = (d_ev_gk, 0.0)
+
+        # 주당가치 환산 (주주가치 = EV - 순부채 + 비영업자산, 백만원 → 원)
+        per_share = 1_000_000 / adjustments['shares_outstanding']
+        net_debt = adjustments.get('total_debt', 0) - adjustments.get('cash', 0)
+        base_vps = (ev - net_debt + adjustments.get('non_operating_assets', 0)) * per_share
+
+        derivatives = {
+            driver: {
+                'd_ev': d1,
+                'd2_ev': d2,
+                'd_vps': d1 * per_share,
+                'd2_vps': d2 * per_share
+            }
+            for driver, (d1, d2) in derivatives_ev.items()
+        }
+
+        # 토네이도 차트 (2차 테일러 근사)
+        shocks = shocks or {
+            'wacc': 0.01,
+            'terminal_growth': 0.005,
+            'target_operating_margin': 0.01,
+            'revenue_growth': 0.01
+        }
+
+        tornado = []
+        for driver, greek in derivatives.items():
+            shock_key = 'revenue_growth' if driver.startswith('revenue_growth_') else driver
+            shock = shocks.get(shock_key)
+            if not shock:
+                continue
+
+            down = base_vps - greek['d_vps'] * shock + 0.5 * greek['d2_vps'] * shock ** 2
+            up = base_vps + greek['d_vps'] * shock + 0.5 * greek['d2_vps'] * shock ** 2
+
+            tornado.append({
+                'driver': driver,
+                'shock': shock,
+                'value_low': min(down, up),
+                'value_high': max(down, up),
+                'range': abs(up - down)
+            })
+
+        tornado.sort(key=lambda row: row['range'], reverse=True)
+
+        return {
+            'enterprise_value': ev,
+            'value_per_share': base_vps,
+            'derivatives': derivatives,
+            'tornado': tornado
+        }
+
     def calculate_equity_value(self,
                               pv_fcf: float,
                               pv_tv: float,
@@ -372,9 +546,12 @@ class DCFEngine:
 
         # Step 3: WACC 계산
         print(f"\n[Step 3] WACC 계산...")
-        wacc_result = self.calculate_wacc_detailed(inputs['wacc_inputs'])
+        wacc_inputs = self.resolve_wacc_inputs(inputs)
+        wacc_result = self.calculate_wacc_detailed(wacc_inputs)
         print(f"  - WACC: {wacc_result['wacc']:.4f} ({wacc_result['wacc']:.2%})")
         print(f"  - 자기자본비용: {wacc_result['cost_of_equity']:.2%}")
+        if 'market_data_as_of' in wacc_inputs:
+            print(f"  - 시장 데이터 기준: {wacc_inputs['market_data_as_of']}")
 
         # Step 4: FCF 할인
         print(f"\n[Step 4] FCF 현재가치 할인...")
@@ -393,6 +570,16 @@ class DCFEngine:
         print(f"  - 영구가치: {tv_result['terminal_value']:,.0f}")
         print(f"  - PV(TV): {tv_result['pv_terminal_value']:,.0f}")
 
+        # Step 5-1: 해석적 민감도 (할인·영구가치와 같은 입력으로 1회 계산)
+        sensitivities = self.calculate_value_sensitivities(
+            projections,
+            inputs['assumptions'],
+            normalized['revenues'][-1],
+            wacc_result['wacc'],
+            terminal_growth,
+            inputs['adjustments']
+        )
+
         # Step 6: 기업가치 및 주당가치
         print(f"\n[Step 6] 기업가치 및 주당가치 산출...")
         equity_result = self.calculate_equity_value(
@@ -416,6 +603,7 @@ class DCFEngine:
             'wacc': wacc_result,
             'discounted_fcf': discounted,
             'terminal_value': tv_result,
+            'value_sensitivities': sensitivities,
             'valuation_result': equity_result,
             'created_at': datetime.now().isoformat()
         }
@@ -502,3 +690,58 @@ if __name__ == "__main__":
     print(f"주주가치: {result['valuation_result']['equity_value']:,.0f}원")
     print(f"주당가치: {result['valuation_result']['value_per_share']:,.0f}원")
     print("=" * 80)
+
+    # 해석적 민감도 vs 유한차분 검증
+    print("\n해석적 민감도 검증 (중앙차분 대비)")
+    import contextlib
+    import copy
+    import io
+
+    def ev_with(mutate) -> float:
+        bumped = copy.deepcopy(test_inputs)
+        mutate(bumped)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return engine.run_valuation(bumped)['valuation_result']['enterprise_value']
+
+    def bump_wacc(h):
+        # Rf만 이동: ∂WACC/∂Rf = (1 - D/V)
+        equity_ratio = 1 - test_inputs['wacc_inputs']['debt_ratio']
+        return lambda x: x['wacc_inputs'].update(
+            risk_free_rate=test_inputs['wacc_inputs']['risk_free_rate'] + h / equity_ratio)
+
+    def bump_assumption(key, h):
+        return lambda x: x['assumptions'].update({key: test_inputs['assumptions'][key] + h})
+
+    def bump_growth(idx, h):
+        def mutate(x):
+            x['assumptions']['revenue_growth'][idx] += h
+        return mutate
+
+    checks = {
+        'wacc': bump_wacc,
+        'terminal_growth': lambda h: bump_assumption('terminal_growth', h),
+        'target_operating_margin': lambda h: bump_assumption('target_operating_margin', h),
+    }
+    for idx, projection in enumerate(result['projections']):
+        checks[f"revenue_growth_{projection['year']}"] = lambda h, idx=idx: bump_growth(idx, h)
+
+    h = 1e-4
+    base_ev = result['valuation_result']['enterprise_value']
+    greeks = result['value_sensitivities']['derivatives']
+    print(f"{'변수':<24}{'∂EV 해석':>18}{'∂EV 차분':>18}{'∂²EV 해석':>20}{'∂²EV 차분':>20}")
+    for driver, make_bump in checks.items():
+        ev_up = ev_with(make_bump(h))
+        ev_down = ev_with(make_bump(-h))
+        fd1 = (ev_up - ev_down) / (2 * h)
+        fd2 = (ev_up - 2 * base_ev + ev_down) / h ** 2
+        analytic = greeks[driver]
+        print(f"{driver:<24}{analytic['d_ev']:>18,.0f}{fd1:>18,.0f}"
+              f"{analytic['d2_ev']:>20,.0f}{fd2:>20,.0f}")
+        assert abs(fd1 - analytic['d_ev']) <= 1e-5 * abs(analytic['d_ev']), driver
+        assert abs(fd2 - analytic['d2_ev']) <= 1e-3 * max(abs(analytic['d2_ev']), abs(base_ev)), driver
+
+    print("\n토네이도 (주당가치, 원):")
+    for row in result['value_sensitivities']['tornado']:
+        print(f"  {row['driver']:<24}±{row['shock']:.1%}  "
+              f"{row['value_low']:>14,.0f} ~ {row['value_high']:>14,.0f}")
+    print("=" * 80)
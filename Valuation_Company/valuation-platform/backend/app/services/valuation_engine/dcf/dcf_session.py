@@ -0,0 +1,277 @@
+"""
+DCF 평가 세션 (의존성 그래프 기반 증분 재계산)
+
+DCF 파이프라인을 작은 DAG로 모델링하고 노드별 결과를 입력 해시로 메모이즈
+
+    normalize ─→ project ─┬─→ discount ──────┐
+                          │                  ├─→ equity
+    wacc ─────────────────┼─→ terminal ──────┤
+                          └─→ sensitivities ←┘
+
+- 노드 키 = hash(노드 이름, 직접 입력, 상위 노드 키)
+- 입력이 바뀐 노드와 그 하위 노드만 재계산
+  (예: terminal_growth만 수정 → terminal, sensitivities, equity만 재계산)
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import sys
+sys.path.append('..')
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from datetime import datetime
+from dcf.dcf_engine import DCFEngine
+
+
+def _json_default(obj):
+    """numpy 배열/스칼라 등 JSON 비호환 객체 직렬화"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+class DCFValuationSession:
+    """프로젝트 단위 DCF 계산 그래프 (노드별 메모이제이션)"""
+
+    NODES = ('normalize', 'project', 'wacc', 'discount', 'terminal', 'sensitivities', 'equity')
+
+    def __init__(self, project_id: Optional[str] = None, engine: Optional[DCFEngine] = None):
+        self.project_id = project_id
+        self.engine = engine or DCFEngine()
+        self.inputs: Optional[Dict] = None
+        self.last_recomputed: List[str] = []
+        self.last_reused: List[str] = []
+        self.stats = {'runs': 0, 'recomputed': 0, 'reused': 0}
+        self._cache: Dict[str, Tuple[str, Any]] = {}  # node → (key, value)
+
+    # ==================== 그래프 ====================
+
+    @staticmethod
+    def fingerprint(*parts) -> str:
+        """입력의 정규화 JSON 해시"""
+        payload = json.dumps(parts, sort_keys=True, default=_json_default, ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _node(self,
+              name: str,
+              deps: Sequence[str],
+              direct_inputs: Any,
+              compute: Callable[[], Any]) -> Tuple[str, Any]:
+        """노드 평가 (키가 같으면 캐시 재사용)"""
+        key = self.fingerprint(name, list(deps), direct_inputs)
+        cached = self._cache.get(name)
+
+        if cached is not None and cached[0] == key:
+            self.last_reused.append(name)
+            return key, cached[1]
+
+        value = compute()
+        self._cache[name] = (key, value)
+        self.last_recomputed.append(name)
+        return key, value
+
+    def invalidate(self, node: Optional[str] = None):
+        """캐시 삭제 (node 생략 시 전체)"""
+        if node is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(node, None)
+
+    # ==================== 실행 ====================
+
+    def run(self, inputs: Dict) -> Dict:
+        """
+        DCF 평가 실행 (변경된 노드만 재계산)
+
+        Args:
+            inputs: DCFEngine.run_valuation과 같은 입력
+
+        Returns:
+            Dict: DCFEngine.run_valuation과 같은 구조의 결과.
+                  노드 결과는 캐시와 공유되므로 읽기 전용으로 사용
+        """
+        self.inputs = inputs
+        self.last_recomputed = []
+        self.last_reused = []
+
+        engine = self.engine
+        assumptions = inputs['assumptions']
+        adjustments = inputs['adjustments']
+        periods = inputs.get('projection_period', 5)
+        terminal_growth = assumptions['terminal_growth']
+        # 시장 데이터로 채운 구성요소까지 해시에 포함 (데이터 갱신 시 wacc 노드 재계산)
+        wacc_inputs = engine.resolve_wacc_inputs(inputs)
+
+        # 입력 구역별 해시 (노드 키에는 이 다이제스트만 사용)
+        # 영구성장률은 terminal 노드의 직접 입력이므로 project 구역에서 제외
+        projection_assumptions = {k: v for k, v in assumptions.items() if k != 'terminal_growth'}
+        digest = {
+            'historical': self.fingerprint(inputs['historical_financials']),
+            'projection': self.fingerprint(projection_assumptions, periods),
+            'wacc': self.fingerprint(wacc_inputs),
+            'adjustments': self.fingerprint(adjustments)
+        }
+
+        k_norm, normalized = self._node(
+            'normalize', [], digest['historical'],
+            lambda: engine.normalize_financials(inputs['historical_financials'])
+        )
+        k_proj, projections = self._node(
+            'project', [k_norm], digest['projection'],
+            lambda: engine.project_financials(normalized, assumptions, periods=periods)
+        )
+        k_wacc, wacc_result = self._node(
+            'wacc', [], digest['wacc'],
+            lambda: engine.calculate_wacc_detailed(wacc_inputs)
+        )
+        k_disc, discounted = self._node(
+            'discount', [k_proj, k_wacc], None,
+            lambda: engine.discount_cash_flows(projections, wacc_result['wacc'])
+        )
+        k_tv, tv_result = self._node(
+            'terminal', [k_proj, k_wacc], terminal_growth,
+            lambda: engine.calculate_terminal_value_detailed(
+                projections[-1]['fcf'], terminal_growth, wacc_result['wacc'], len(projections)
+            )
+        )
+        _, sensitivities = self._node(
+            'sensitivities', [k_norm, k_proj, k_wacc, k_tv], digest['adjustments'],
+            lambda: engine.calculate_value_sensitivities(
+                projections, assumptions, normalized['revenues'][-1],
+                wacc_result['wacc'], terminal_growth, adjustments
+            )
+        )
+        _, equity_result = self._node(
+            'equity', [k_disc, k_tv], digest['adjustments'],
+            lambda: engine.calculate_equity_value(
+                discounted['total_pv_fcf'], tv_result['pv_terminal_value'], adjustments
+            )
+        )
+
+        self.stats['runs'] += 1
+        self.stats['recomputed'] += len(self.last_recomputed)
+        self.stats['reused'] += len(self.last_reused)
+
+        return {
+            'valuation_id': f"DCF_{inputs['company_id']}_{inputs['valuation_date'].replace('-', '')}",
+            'company_id': inputs['company_id'],
+            'company_name': inputs.get('company_name', ''),
+            'valuation_date': inputs['valuation_date'],
+            'normalized_financials': normalized,
+            'projections': projections,
+            'wacc': wacc_result,
+            'discounted_fcf': discounted,
+            'terminal_value': tv_result,
+            'value_sensitivities': sensitivities,
+            'valuation_result': equity_result,
+            'created_at': datetime.now().isoformat()
+        }
+
+    def update(self,
+               assumptions: Optional[Dict] = None,
+               wacc_inputs: Optional[Dict] = None,
+               adjustments: Optional[Dict] = None,
+               **fields) -> Dict:
+        """
+        직전 입력에 부분 수정을 반영해 재실행
+
+        Example:
+            >>> session.update(assumptions={'terminal_growth': 0.025})
+            >>> session.last_recomputed
+            ['terminal', 'sensitivities', 'equity']
+        """
+        if self.inputs is None:
+            raise ValueError("run()으로 초기 입력을 먼저 설정해야 합니다")
+
+        inputs = {**self.inputs, **fields}
+        if assumptions:
+            inputs['assumptions'] = {**self.inputs['assumptions'], **assumptions}
+        if wacc_inputs:
+            inputs['wacc_inputs'] = {**self.inputs['wacc_inputs'], **wacc_inputs}
+        if adjustments:
+            inputs['adjustments'] = {**self.inputs['adjustments'], **adjustments}
+
+        return self.run(inputs)
+
+    def report(self) -> Dict:
+        """직전 실행의 재계산/재사용 노드 및 누적 통계"""
+        return {
+            'project_id': self.project_id,
+            'recomputed': list(self.last_recomputed),
+            'reused': list(self.last_reused),
+            'stats': dict(self.stats)
+        }
+
+
+# 테스트
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import time
+
+    print("=" * 80)
+    print("DCF Valuation Session - Incremental Recalculation")
+    print("=" * 80)
+
+    test_inputs = {
+        'company_id': 'TEST001',
+        'company_name': '테스트기업',
+        'valuation_date': '2025-01-01',
+        'historical_financials': [
+            {'year': 2022, 'revenue': 100_000, 'operating_income': 12_000, 'net_income': 8_000,
+             'depreciation': 3_000, 'capex': 4_000, 'working_capital_change': 1_000,
+             'one_time_items': [500]},
+            {'year': 2023, 'revenue': 115_000, 'operating_income': 15_000, 'net_income': 10_000,
+             'depreciation': 3_500, 'capex': 5_000, 'working_capital_change': 1_500},
+            {'year': 2024, 'revenue': 130_000, 'operating_income': 18_000, 'net_income': 12_000,
+             'depreciation': 4_000, 'capex': 6_000, 'working_capital_change': 1_500}
+        ],
+        'assumptions': {
+            'base_year': 2024,
+            'revenue_growth': [0.12, 0.10, 0.08, 0.06, 0.05],
+            'target_operating_margin': 0.15,
+            'tax_rate': 0.25,
+            'depreciation_rate': 0.03,
+            'capex_rate': 0.05,
+            'wc_rate': 0.10,
+            'terminal_growth': 0.03
+        },
+        'wacc_inputs': {
+            'risk_free_rate': 0.035, 'beta': 1.2, 'market_premium': 0.07,
+            'cost_of_debt': 0.05, 'debt_ratio': 0.30, 'tax_rate': 0.25
+        },
+        'adjustments': {
+            'cash': 10_000, 'total_debt': 30_000,
+            'non_operating_assets': 5_000, 'shares_outstanding': 10_000_000
+        }
+    }
+
+    session = DCFValuationSession(project_id='TEST001')
+
+    def timed(label, action):
+        start = time.perf_counter()
+        result = action()
+        elapsed = (time.perf_counter() - start) * 1e6
+        print(f"\n{label}: {elapsed:,.0f} µs")
+        print(f"  재계산: {session.last_recomputed}")
+        print(f"  주당가치: {result['valuation_result']['value_per_share']:,.0f}원")
+        return result
+
+    timed("[1] 최초 실행", lambda: session.run(test_inputs))
+    timed("[2] 입력 변경 없음", lambda: session.run(test_inputs))
+    timed("[3] 영구성장률 수정", lambda: session.update(assumptions={'terminal_growth': 0.025}))
+    growth = [0.12, 0.10, 0.09, 0.06, 0.05]
+    timed("[4] 3년차 성장률 수정", lambda: session.update(assumptions={'revenue_growth': growth}))
+    timed("[5] 베타 수정", lambda: session.update(wacc_inputs={'beta': 1.1}))
+    result = timed("[6] 순부채 수정", lambda: session.update(adjustments={'cash': 12_000}))
+
+    # 전체 재실행과 동일한지 확인
+    with contextlib.redirect_stdout(io.StringIO()):
+        full = DCFEngine().run_valuation(session.inputs)
+    assert full['valuation_result'] == result['valuation_result']
+    print("\n전체 재실행 결과와 일치")
+    print(f"누적 통계: {session.report()['stats']}")
+    print("=" * 80)
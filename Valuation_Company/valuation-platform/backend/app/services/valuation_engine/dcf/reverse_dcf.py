@@ -0,0 +1,419 @@
+"""
+역DCF 목표가 역산 (Reverse DCF Goal-Seek)
+
+목표 주당가치(또는 주주가치)를 정당화하는 가정 값을 역산
+- 단일 드라이버: "이 라운드 가격이면 영구성장률은 몇 %여야 하나?"
+- 2개 드라이버 프론티어: x 드라이버 격자별로 목표가를 맞추는 y 드라이버 값
+
+계산 방식:
+- 정규화 재무, 기준 FCF, 기준 할인계수를 최초 1회 계산해 보관
+- 반복 계산에서는 풀고 있는 드라이버가 영향을 주는 단계만 다시 계산
+  (wacc → 할인계수, terminal_growth → 영구가치, 예측 가정 → FCF)
+- 여러 목표값(라운드별 가격 등)을 배열로 받아 Illinois 할선법으로 동시에 풀이
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import sys
+sys.path.append('..')
+
+import time
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+from dcf.batch_dcf_engine import BatchDCFEngine
+
+
+class ReverseDCFSolver:
+    """목표가 → 내재 가정 역산기 (기업 1개 기준 상태 캐시)"""
+
+    # 드라이버별 기본 탐색 범위
+    DRIVER_BOUNDS = {
+        'wacc': (0.005, 0.60),
+        'terminal_growth': (-0.05, 0.10),
+        'target_operating_margin': (-0.50, 0.90),
+        'revenue_growth': (-0.50, 3.00),   # 예측 기간 전체 동일 성장률
+        'capex_rate': (0.0, 0.50),
+        'wc_rate': (-0.50, 1.00),
+        'depreciation_rate': (0.0, 0.50),
+        'tax_rate': (0.0, 0.60)
+    }
+
+    # FCF 재예측이 필요한 드라이버
+    PROJECTION_DRIVERS = ('target_operating_margin', 'revenue_growth', 'capex_rate',
+                          'wc_rate', 'depreciation_rate', 'tax_rate')
+
+    # WACC가 영구성장률에 너무 가까워지지 않도록 두는 간격
+    SPREAD_FLOOR = 1e-4
+
+    def __init__(self, inputs: Dict, engine: Optional[BatchDCFEngine] = None):
+        """
+        기준 상태 준비 (정규화 · 기준 FCF · 기준 할인계수)
+
+        Args:
+            inputs: DCFEngine.run_valuation과 같은 입력 (스칼라 가정)
+            engine: 공유할 BatchDCFEngine (생략 시 생성)
+        """
+        self.batch = engine or BatchDCFEngine()
+        self.inputs = inputs
+        self.assumptions = inputs['assumptions']
+        self.periods = inputs.get('projection_period', 5)
+        self.normalized = self.batch.engine.normalize_financials(inputs['historical_financials'])
+
+        adjustments = inputs['adjustments']
+        self.shares = float(adjustments['shares_outstanding'])
+        self.equity_bridge = float(adjustments.get('non_operating_assets', 0)) - \
+            (float(adjustments.get('total_debt', 0)) - float(adjustments.get('cash', 0)))
+
+        self.base_fcf = self.batch.project_financials(
+            self.normalized, self.assumptions, self.periods, n=1
+        )['fcf']
+        self.base_wacc = float(self.batch.calculate_wacc(self.batch.resolve_wacc_inputs(inputs), 1)['wacc'][0])
+        self.base_terminal_growth = float(self.assumptions['terminal_growth'])
+        self.exponents = np.arange(1, self.periods + 1, dtype=float)
+        self.base_discount = self._discount(np.array([self.base_wacc]))
+
+        self.base_equity_value = float(self.equity_value({})[0])
+        self.base_value_per_share = self.base_equity_value * 1_000_000 / self.shares
+
+    # ==================== 부분 재계산 평가기 ====================
+
+    def _discount(self, wacc: np.ndarray) -> np.ndarray:
+        """(K,) 할인율 → (K, T) 할인계수"""
+        return (1 + wacc[:, None]) ** -self.exponents
+
+    def _fcf(self, overrides: Dict[str, np.ndarray]) -> np.ndarray:
+        """예측 가정 수정분만 반영해 FCF 재예측 (없으면 기준 FCF)"""
+        changed = {k: v for k, v in overrides.items() if k in self.PROJECTION_DRIVERS}
+        if not changed:
+            return self.base_fcf
+
+        n = len(next(iter(changed.values())))
+        assumptions = {**self.assumptions, **changed}
+        if 'revenue_growth' in changed:
+            assumptions['revenue_growth'] = np.repeat(changed['revenue_growth'][:, None], self.periods, axis=1)
+
+        return self.batch.project_financials(self.normalized, assumptions, self.periods, n=n)['fcf']
+
+    def equity_value(self,
+                     overrides: Dict[str, np.ndarray],
+                     fcf: Optional[np.ndarray] = None,
+                     discount: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        드라이버 수정 시 주주가치 (백만원, 벡터)
+
+        Args:
+            overrides: {드라이버: (K,) 배열}. 없는 드라이버는 기준값 사용
+            fcf: 미리 계산한 (K, T) 또는 (1, T) FCF (반복 중 재사용)
+            discount: 미리 계산한 할인계수 (반복 중 재사용)
+
+        Returns:
+            np.ndarray: (K,) 주주가치. WACC <= 영구성장률이면 NaN
+        """
+        wacc = overrides.get('wacc', np.array([self.base_wacc]))
+        growth = overrides.get('terminal_growth', np.array([self.base_terminal_growth]))
+
+        if fcf is None:
+            fcf = self._fcf(overrides)
+        if discount is None:
+            discount = self.base_discount if 'wacc' not in overrides else self._discount(wacc)
+
+        pv_fcf = (fcf * discount).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terminal_value = np.where(wacc > growth, fcf[:, -1] * (1 + growth) / (wacc - growth), np.nan)
+
+        return pv_fcf + terminal_value * discount[:, -1] + self.equity_bridge
+
+    # ==================== 목표가 역산 ====================
+
+    def _target_equity(self, target, target_type: str) -> np.ndarray:
+        """목표값 → 주주가치(백만원) 배열"""
+        target = np.atleast_1d(np.asarray(target, dtype=float))
+        if target_type == 'value_per_share':
+            return target * self.shares / 1_000_000
+        if target_type == 'equity_value':
+            return target
+        raise ValueError(f"target_type은 'value_per_share' 또는 'equity_value'여야 합니다: {target_type}")
+
+    def _bounds(self, driver: str, bounds: Optional[Tuple[float, float]], wacc, growth):
+        """드라이버 탐색 범위 (WACC > 영구성장률 조건 반영)"""
+        if driver not in self.DRIVER_BOUNDS:
+            raise ValueError(f"역산할 수 없는 드라이버입니다: {driver}")
+
+        lo, hi = bounds or self.DRIVER_BOUNDS[driver]
+        lo, hi = np.asarray(lo, dtype=float), np.asarray(hi, dtype=float)
+        if driver == 'wacc':
+            lo = np.maximum(lo, growth + self.SPREAD_FLOOR)
+        elif driver == 'terminal_growth':
+            hi = np.minimum(hi, wacc - self.SPREAD_FLOOR)
+        return lo, hi
+
+    def _solve(self,
+               driver: str,
+               target_equity: np.ndarray,
+               fixed: Dict[str, np.ndarray],
+               bounds: Optional[Tuple[float, float]],
+               tol: float,
+               max_iter: int) -> Dict[str, np.ndarray]:
+        """
+        벡터화 Illinois 할선법 (브래킷 유지)
+
+        fixed의 드라이버(프론티어 x축)는 K개 문제마다 다른 값을 가질 수 있음
+        """
+        k = target_equity.size
+        fixed = {key: np.broadcast_to(value, (k,)) for key, value in fixed.items()}
+
+        wacc = fixed.get('wacc', np.full(k, self.base_wacc))
+        growth = fixed.get('terminal_growth', np.full(k, self.base_terminal_growth))
+        lo, hi = self._bounds(driver, bounds, wacc, growth)
+        lo, hi = np.broadcast_to(lo, (k,)).copy(), np.broadcast_to(hi, (k,)).copy()
+
+        # 풀고 있는 드라이버와 무관한 단계는 미리 계산해 재사용
+        fcf = None if driver in self.PROJECTION_DRIVERS else self._fcf(fixed)
+        discount = None if driver == 'wacc' else (
+            self._discount(fixed['wacc']) if 'wacc' in fixed else self.base_discount
+        )
+
+        def residual(x, idx):
+            overrides = {key: value[idx] for key, value in fixed.items()}
+            overrides[driver] = x
+            sub_fcf = fcf if fcf is None or fcf.shape[0] == 1 else fcf[idx]
+            sub_discount = discount if discount is None or discount.shape[0] == 1 else discount[idx]
+            return self.equity_value(overrides, fcf=sub_fcf, discount=sub_discount) - target_equity[idx]
+
+        everything = np.arange(k)
+        f_lo, f_hi = residual(lo, everything), residual(hi, everything)
+
+        implied = np.full(k, np.nan)
+        iterations = np.zeros(k, dtype=np.int64)
+        converged = np.zeros(k, dtype=bool)
+        message = np.full(k, '', dtype=object)
+
+        bracketed = np.isfinite(f_lo) & np.isfinite(f_hi) & (np.sign(f_lo) != np.sign(f_hi))
+        message[~bracketed] = '목표값이 탐색 범위 밖에 있음'
+
+        scale = np.maximum(np.abs(target_equity), 1.0)
+        side = np.zeros(k, dtype=np.int8)
+        active = np.flatnonzero(bracketed)
+
+        for step in range(1, max_iter + 1):
+            if active.size == 0:
+                break
+            a, b, fa, fb = lo[active], hi[active], f_lo[active], f_hi[active]
+            x = (a * fb - b * fa) / (fb - fa)
+            fx = residual(x, active)
+            iterations[active] = step
+
+            hit = (np.abs(fx) <= tol * scale[active]) | (np.abs(b - a) <= tol)
+            implied[active[hit]] = x[hit]
+            converged[active[hit]] = True
+
+            # 같은 쪽 끝점이 연속으로 갱신되면 반대쪽 함수값을 절반으로 (Illinois)
+            replace_hi = np.sign(fx) == np.sign(fb)
+            hi[active] = np.where(replace_hi, x, b)
+            f_hi[active] = np.where(replace_hi, fx, np.where(side[active] == 1, fb / 2, fb))
+            lo[active] = np.where(replace_hi, a, x)
+            f_lo[active] = np.where(replace_hi, np.where(side[active] == -1, fa / 2, fa), fx)
+            side[active] = np.where(replace_hi, -1, 1)
+
+            active = active[~hit]
+
+        message[active] = '최대 반복 횟수 도달'
+        message[converged] = 'ok'
+
+        return {
+            'implied_value': implied,
+            'converged': converged,
+            'iterations': iterations,
+            'message': message
+        }
+
+    def solve(self,
+              target,
+              driver: str,
+              target_type: str = 'value_per_share',
+              bounds: Optional[Tuple[float, float]] = None,
+              tol: float = 1e-10,
+              max_iter: int = 100) -> Dict:
+        """
+        목표가를 정당화하는 단일 드라이버 값 역산
+
+        Args:
+            target: 목표 주당가치(원) 또는 주주가치(백만원). 스칼라 또는 배열(라운드별)
+            driver: 'wacc', 'terminal_growth', 'target_operating_margin', 'revenue_growth', ...
+            target_type: 'value_per_share' | 'equity_value'
+            bounds: 탐색 범위 (생략 시 DRIVER_BOUNDS)
+
+        Returns:
+            {
+                'driver': 'terminal_growth',
+                'base_value': 0.03,
+                'implied_value': array,    # 미수렴 시 NaN
+                'converged': array(bool),
+                'iterations': array(int),
+                'message': array(str),
+                'target_equity_value': array,
+                'base_equity_value': 211663.0,
+                'elapsed_ms': 0.2
+            }
+        """
+        start = time.perf_counter()
+        target_equity = self._target_equity(target, target_type)
+
+        result = self._solve(driver, target_equity, {}, bounds, tol, max_iter)
+
+        return {
+            'driver': driver,
+            'base_value': self.base_driver_value(driver),
+            **result,
+            'target_equity_value': target_equity,
+            'base_equity_value': self.base_equity_value,
+            'elapsed_ms': (time.perf_counter() - start) * 1e3
+        }
+
+    def frontier(self,
+                 target: float,
+                 x_driver: str,
+                 x_values: Sequence[float],
+                 y_driver: str,
+                 target_type: str = 'value_per_share',
+                 bounds: Optional[Tuple[float, float]] = None,
+                 tol: float = 1e-10,
+                 max_iter: int = 100) -> Dict:
+        """
+        2개 드라이버 등가치 곡선: x 드라이버 값마다 목표가를 맞추는 y 드라이버 값
+
+        Example:
+            >>> solver.frontier(90_000, 'wacc', np.linspace(0.08, 0.12, 41), 'terminal_growth')
+            {'x': array([...]), 'y': array([...]), 'converged': array([...]), ...}
+        """
+        if x_driver == y_driver:
+            raise ValueError("x, y 드라이버는 서로 달라야 합니다")
+        if x_driver not in self.DRIVER_BOUNDS:
+            raise ValueError(f"프론티어에 사용할 수 없는 드라이버입니다: {x_driver}")
+
+        start = time.perf_counter()
+        x = np.asarray(x_values, dtype=float)
+        target_equity = np.broadcast_to(self._target_equity(target, target_type), x.shape)
+
+        result = self._solve(y_driver, target_equity, {x_driver: x}, bounds, tol, max_iter)
+
+        return {
+            'x_driver': x_driver,
+            'y_driver': y_driver,
+            'x': x,
+            'y': result['implied_value'],
+            'converged': result['converged'],
+            'iterations': result['iterations'],
+            'message': result['message'],
+            'elapsed_ms': (time.perf_counter() - start) * 1e3
+        }
+
+    def base_driver_value(self, driver: str) -> float:
+        """기준 가정의 드라이버 값 (성장률은 예측 기간 평균)"""
+        if driver == 'wacc':
+            return self.base_wacc
+        if driver == 'revenue_growth':
+            return float(np.mean(self.assumptions['revenue_growth'][:self.periods]))
+        if driver == 'target_operating_margin':
+            return float(self.assumptions.get('target_operating_margin',
+                                              self.normalized['avg_operating_margin']))
+        return float(self.assumptions.get(driver, BatchDCFEngine.DEFAULT_ASSUMPTIONS.get(driver, np.nan)))
+
+
+# 테스트
+if __name__ == "__main__":
+    import contextlib
+    import io
+    from dcf.dcf_engine import DCFEngine
+
+    print("=" * 80)
+    print("Reverse DCF Goal-Seek Solver")
+    print("=" * 80)
+
+    test_inputs = {
+        'company_id': 'TEST001',
+        'company_name': '테스트기업',
+        'valuation_date': '2025-01-01',
+        'historical_financials': [
+            {'year': 2022, 'revenue': 100_000, 'operating_income': 12_000, 'net_income': 8_000,
+             'depreciation': 3_000, 'capex': 4_000, 'working_capital_change': 1_000},
+            {'year': 2023, 'revenue': 115_000, 'operating_income': 15_000, 'net_income': 10_000,
+             'depreciation': 3_500, 'capex': 5_000, 'working_capital_change': 1_500},
+            {'year': 2024, 'revenue': 130_000, 'operating_income': 18_000, 'net_income': 12_000,
+             'depreciation': 4_000, 'capex': 6_000, 'working_capital_change': 1_500}
+        ],
+        'assumptions': {
+            'base_year': 2024,
+            'revenue_growth': [0.12, 0.10, 0.08, 0.06, 0.05],
+            'target_operating_margin': 0.15,
+            'tax_rate': 0.25,
+            'depreciation_rate': 0.03,
+            'capex_rate': 0.05,
+            'wc_rate': 0.10,
+            'terminal_growth': 0.03
+        },
+        'wacc_inputs': {
+            'risk_free_rate': 0.035, 'beta': 1.2, 'market_premium': 0.07,
+            'cost_of_debt': 0.05, 'debt_ratio': 0.30, 'tax_rate': 0.25
+        },
+        'adjustments': {
+            'cash': 10_000, 'total_debt': 30_000,
+            'non_operating_assets': 5_000, 'shares_outstanding': 10_000_000
+        }
+    }
+
+    solver = ReverseDCFSolver(test_inputs)
+    print(f"\n기준 주당가치: {solver.base_value_per_share:,.0f}원 (WACC {solver.base_wacc:.2%})")
+
+    target_price = 25_000
+    print(f"\n[1] 목표 주당가치 {target_price:,}원을 정당화하는 가정")
+    for driver in ('terminal_growth', 'wacc', 'target_operating_margin', 'revenue_growth'):
+        result = solver.solve(target_price, driver)
+        print(f"  {driver:<25} {result['base_value']:>8.2%} → {result['implied_value'][0]:>8.2%}"
+              f"  ({result['iterations'][0]}회, {result['elapsed_ms']:.2f} ms)")
+
+        # 스칼라 엔진으로 재평가해 목표가 확인
+        check_inputs = {**test_inputs, 'assumptions': {**test_inputs['assumptions']}}
+        implied = float(result['implied_value'][0])
+        engine = DCFEngine()
+        if driver == 'wacc':
+            wacc_detail = engine.calculate_wacc_detailed(test_inputs['wacc_inputs'])
+            engine.calculate_wacc_detailed = lambda _: {**wacc_detail, 'wacc': implied}
+        elif driver == 'revenue_growth':
+            check_inputs['assumptions']['revenue_growth'] = [implied] * 5
+        else:
+            check_inputs['assumptions'][driver] = implied
+        with contextlib.redirect_stdout(io.StringIO()):
+            check = engine.run_valuation(check_inputs)
+        assert abs(check['valuation_result']['value_per_share'] - target_price) < 1e-3, driver
+
+    print("  → DCFEngine 재평가 결과가 목표가와 일치")
+
+    print("\n[2] 라운드별 가격 일괄 역산 (영구성장률)")
+    round_prices = np.array([15_000, 20_000, 25_000, 30_000, 1_000_000])
+    rounds = solver.solve(round_prices, 'terminal_growth')
+    for price, value, message in zip(round_prices, rounds['implied_value'], rounds['message']):
+        print(f"  {price:>10,}원 → {value:>8.3%}  {message}")
+
+    print("\n[3] WACC × 영구성장률 등가치 곡선")
+    curve = solver.frontier(target_price, 'wacc', np.linspace(0.08, 0.12, 5), 'terminal_growth')
+    for x, y in zip(curve['x'], curve['y']):
+        print(f"  WACC {x:.2%} → g {y:.3%}")
+    print(f"  ({curve['elapsed_ms']:.2f} ms)")
+
+    print("\n[4] 벤치마크")
+    for label, run in (
+        ("단일 역산 (영구성장률)", lambda: solver.solve(target_price, 'terminal_growth')),
+        ("단일 역산 (매출성장률)", lambda: solver.solve(target_price, 'revenue_growth')),
+        ("1,000개 라운드 (WACC)", lambda: solver.solve(np.linspace(15_000, 40_000, 1000), 'wacc')),
+        ("프론티어 200점 (마진 × WACC)",
+         lambda: solver.frontier(target_price, 'target_operating_margin',
+                                 np.linspace(0.10, 0.25, 200), 'wacc'))
+    ):
+        start = time.perf_counter()
+        for _ in range(50):
+            run()
+        print(f"  {label:<28} {(time.perf_counter() - start) / 50 * 1e3:.3f} ms")
+
+    print("=" * 80)
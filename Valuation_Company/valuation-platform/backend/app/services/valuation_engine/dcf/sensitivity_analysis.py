@@ -2,6 +2,7 @@
 DCF 민감도 분석 모듈
 
 WACC와 영구성장률 변화에 따른 주당가치 변동 분석
++ 몬테카를로 시뮬레이션 (주당가치 확률분포)
 
 Author: Valuation Engine Team
 Date: 2025-10-17
@@ -10,14 +11,208 @@ Date: 2025-10-17
 import sys
 sys.path.append('..')
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Sequence
+from dataclasses import dataclass
 import numpy as np
+from scipy.special import ndtr
 from common.financial_math import FinancialCalculator
+from dcf.batch_dcf_engine import BatchDCFEngine
+
+
+class _StreamingHistogram:
+    """
+    고정 bin 수의 스트리밍 히스토그램 (분위수 추정용)
+
+    - 청크 단위로 값을 누적하며 메모리는 bin 수에 비례 (경로 수와 무관)
+    - 범위를 벗어난 값이 들어오면 인접 bin을 2개씩 병합해 범위를 2배로 확장
+    - 분위수 오차는 최대 bin 폭 이내
+    """
+
+    def __init__(self, n_bins: int = 4000):
+        if n_bins % 2:
+            raise ValueError("n_bins는 짝수여야 합니다")
+        self.n_bins = n_bins
+        self.counts: Optional[np.ndarray] = None
+        self.lo = 0.0
+        self.width = 0.0
+        self.total = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def hi(self) -> float:
+        return self.lo + self.width * self.n_bins
+
+    def update(self, values: np.ndarray):
+        if values.size == 0:
+            return
+
+        vmin = float(values.min())
+        vmax = float(values.max())
+
+        if self.counts is None:
+            # 첫 청크 범위에 여유폭을 두고 초기화
+            span = vmax - vmin
+            pad = span * 0.5 if span > 0 else max(abs(vmin), 1.0) * 0.01
+            self.lo = vmin - pad
+            self.width = (span + 2 * pad) / self.n_bins
+            self.counts = np.zeros(self.n_bins, dtype=np.int64)
+
+        while vmin < self.lo or vmax >= self.hi:
+            self._expand(downward=vmin < self.lo)
+
+        idx = ((values - self.lo) / self.width).astype(np.int64)
+        np.clip(idx, 0, self.n_bins - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=self.n_bins)
+
+        self.total += values.size
+        self.min = min(self.min, vmin)
+        self.max = max(self.max, vmax)
+
+    def _expand(self, downward: bool):
+        """bin 폭 2배 확장 (downward면 아래쪽, 아니면 위쪽으로 범위 확장)"""
+        merged = self.counts.reshape(-1, 2).sum(axis=1)
+        half = self.n_bins // 2
+        self.counts = np.zeros(self.n_bins, dtype=np.int64)
+
+        if downward:
+            self.lo -= self.width * self.n_bins
+            self.counts[half:] = merged
+        else:
+            self.counts[:half] = merged
+
+        self.width *= 2
+
+    def quantile(self, q: float) -> float:
+        """누적 히스토그램 선형보간으로 분위수(0~1) 추정"""
+        if self.total == 0:
+            return float('nan')
+
+        target = q * self.total
+        cum = np.cumsum(self.counts)
+        idx = int(np.searchsorted(cum, target, side='left'))
+        idx = min(idx, self.n_bins - 1)
+
+        prev = cum[idx - 1] if idx > 0 else 0
+        frac = (target - prev) / self.counts[idx] if self.counts[idx] else 0.0
+        value = self.lo + (idx + frac) * self.width
+
+        return float(min(max(value, self.min), self.max))
+
+    def coarse(self, bins: int) -> Dict:
+        """관측 범위(min~max)를 bins개 구간으로 재집계한 히스토그램"""
+        if self.total == 0:
+            return {'bin_edges': [], 'counts': []}
+
+        nonzero = np.flatnonzero(self.counts)
+        first, last = int(nonzero[0]), int(nonzero[-1]) + 1
+        bins = min(bins, last - first)
+
+        boundaries = np.linspace(first, last, bins + 1).round().astype(int)
+        counts = np.add.reduceat(self.counts[first:last], boundaries[:-1] - first)
+        edges = self.lo + boundaries * self.width
+
+        return {
+            'bin_edges': edges.tolist(),
+            'counts': counts.tolist()
+        }
+
+
+@dataclass
+class SensitivityCube:
+    """
+    N차원 민감도 분석 결과
+
+    axes 순서대로 각 축이 배열의 한 차원을 차지하며,
+    table()/to_matrix()로 임의의 두 축 2차원 표를 추출
+    """
+    axes: List[str]  # 축 이름 (차원 순서)
+    coords: Dict[str, np.ndarray]  # 축별 좌표값
+    value_per_share: np.ndarray  # 주당가치 (원)
+    enterprise_value: np.ndarray  # 기업가치
+    equity_value: np.ndarray  # 주주가치
+    base_case: Dict[str, float]  # 축별 기준값
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.value_per_share.shape
+
+    def index_of(self, axis: str, value: float) -> int:
+        """축 좌표 중 value에 가장 가까운 인덱스"""
+        return int(np.abs(self.coords[axis] - value).argmin())
+
+    def select(self, field: str = 'value_per_share', **fixed: float) -> np.ndarray:
+        """
+        지정한 축을 해당 값(가장 가까운 좌표)으로 고정한 부분 배열
+
+        Example:
+            >>> cube.select(target_operating_margin=0.15, capex_rate=0.05)  # (wacc, growth) 2-D
+        """
+        unknown = set(fixed) - set(self.axes)
+        if unknown:
+            raise ValueError(f"존재하지 않는 축: {sorted(unknown)}")
+
+        index = tuple(
+            self.index_of(axis, fixed[axis]) if axis in fixed else slice(None)
+            for axis in self.axes
+        )
+        return getattr(self, field)[index]
+
+    def table(self,
+              row_axis: str,
+              col_axis: str,
+              field: str = 'value_per_share',
+              **fixed: float) -> np.ndarray:
+        """
+        두 축에 대한 2차원 표 (row × col)
+
+        지정하지 않은 나머지 축은 기준값(base_case)에 가장 가까운 좌표로 고정
+        """
+        others = {
+            axis: fixed.get(axis, self.base_case[axis])
+            for axis in self.axes if axis not in (row_axis, col_axis)
+        }
+        sub = self.select(field, **others)
+
+        remaining = [axis for axis in self.axes if axis not in others]
+        return sub if remaining == [row_axis, col_axis] else sub.T
+
+    def to_matrix(self,
+                  row_axis: str = 'wacc',
+                  col_axis: str = 'terminal_growth',
+                  **fixed: float) -> Dict:
+        """
+        create_wacc_growth_matrix와 같은 형식의 Dict로 변환 (보고서 표 생성용)
+
+        무효 조합(WACC <= 성장률)은 None
+        """
+        table = self.table(row_axis, col_axis, **fixed)
+
+        return {
+            'row_axis': row_axis,
+            'col_axis': col_axis,
+            'row_values': self.coords[row_axis].tolist(),
+            'col_values': self.coords[col_axis].tolist(),
+            'value_matrix': [
+                [None if np.isnan(v) else float(v) for v in row]
+                for row in table
+            ],
+            'base_case': self.base_case
+        }
 
 
 class SensitivityAnalyzer:
     """민감도 분석 클래스"""
 
+    # 몬테카를로 확률변수 → 입력 위치
+    ASSUMPTION_DRIVERS = ('revenue_growth', 'target_operating_margin', 'terminal_growth',
+                          'tax_rate', 'depreciation_rate', 'capex_rate', 'wc_rate')
+    WACC_DRIVERS = ('risk_free_rate', 'beta', 'market_premium', 'cost_of_debt', 'debt_ratio')
+
+    # N차원 민감도 그리드 축
+    GRID_AXES = ('wacc', 'terminal_growth', 'revenue_growth_shift', 'target_operating_margin',
+                 'tax_rate', 'depreciation_rate', 'capex_rate', 'wc_rate')
+
     def __init__(self):
         self.calc = FinancialCalculator()
 
@@ -74,6 +269,10 @@ class SensitivityAnalyzer:
         value_matrix = []
 
         for wacc in wacc_values:
+            # PV(FCF)는 WACC에만 의존하므로 행 단위로 1회 계산
+            pv_fcf = sum(fcf / (1 + wacc) ** (t + 1)
+                         for t, fcf in enumerate(fcf_list))
+
             row = []
             for growth in growth_values:
                 # 무효한 조합 (WACC <= 성장률)
@@ -81,10 +280,6 @@ class SensitivityAnalyzer:
                     row.append(None)
                     continue
 
-                # PV(FCF) 계산
-                pv_fcf = sum(fcf / (1 + wacc) ** (t + 1)
-                           for t, fcf in enumerate(fcf_list))
-
                 # Terminal Value 계산
                 fcf_next = last_fcf * (1 + growth)
                 tv = fcf_next / (wacc - growth)
@@ -186,6 +381,127 @@ class SensitivityAnalyzer:
             'base_value': base_value
         }
 
+    def create_sensitivity_cube(self,
+                                inputs: Dict,
+                                axes: Dict[str, Sequence[float]],
+                                normalized: Optional[Dict] = None) -> SensitivityCube:
+        """
+        N차원 민감도 분석 (브로드캐스팅)
+
+        축마다 배열 차원을 하나씩 배정하고, 각 중간값은 실제로 의존하는 축의
+        차원만 갖도록 계산한 뒤 마지막에 브로드캐스트:
+
+            매출 경로 R_t            ← revenue_growth_shift
+            할인계수 DF_t            ← wacc
+            A = Σ R_t·DF_t, B = Σ ΔR_t·DF_t  ← wacc × revenue_growth_shift
+            단위 FCF 마진 u = m(1-τ) + d - c  ← margin, tax, depreciation, capex
+            PV(FCF) = A·u - B·w
+            FCF_T   = R_T·u - ΔR_T·w
+            PV(TV)  = FCF_T(1+g) / (WACC-g) · DF_T
+
+        Args:
+            inputs: DCFEngine.run_valuation 입력 (기준 가정)
+            axes: 축 이름 → 좌표값 (GRID_AXES 중 선택, 입력 순서 = 차원 순서)
+                {
+                    'wacc': np.linspace(0.075, 0.115, 50),
+                    'terminal_growth': np.linspace(0.02, 0.04, 50),
+                    'target_operating_margin': np.linspace(0.10, 0.20, 20),
+                    'capex_rate': np.linspace(0.03, 0.07, 20)
+                }
+                revenue_growth_shift는 연도별 성장률 경로에 더하는 평행이동폭
+            normalized: 정규화 결과 재사용 시 전달
+
+        Returns:
+            SensitivityCube: 축 순서대로 차원을 갖는 결과 (무효 조합은 NaN)
+        """
+        unknown = [axis for axis in axes if axis not in self.GRID_AXES]
+        if unknown:
+            raise ValueError(f"지원하지 않는 축: {unknown} (지원: {self.GRID_AXES})")
+
+        engine = BatchDCFEngine()
+        if normalized is None:
+            normalized = engine.engine.normalize_financials(inputs['historical_financials'])
+
+        assumptions = inputs['assumptions']
+        adjustments = inputs['adjustments']
+        periods = inputs.get('projection_period', 5)
+        ndim = len(axes)
+        coords = {axis: np.asarray(values, dtype=float) for axis, values in axes.items()}
+
+        base_case = {
+            'wacc': float(engine.calculate_wacc(engine.resolve_wacc_inputs(inputs), 1)['wacc'][0]),
+            'terminal_growth': assumptions['terminal_growth'],
+            'revenue_growth_shift': 0.0,
+            'target_operating_margin': assumptions.get('target_operating_margin',
+                                                       normalized['avg_operating_margin']),
+            'tax_rate': assumptions.get('tax_rate', BatchDCFEngine.DEFAULT_ASSUMPTIONS['tax_rate']),
+            'depreciation_rate': assumptions.get('depreciation_rate',
+                                                 BatchDCFEngine.DEFAULT_ASSUMPTIONS['depreciation_rate']),
+            'capex_rate': assumptions.get('capex_rate', BatchDCFEngine.DEFAULT_ASSUMPTIONS['capex_rate']),
+            'wc_rate': assumptions.get('wc_rate', BatchDCFEngine.DEFAULT_ASSUMPTIONS['wc_rate'])
+        }
+
+        def param(name: str):
+            """축이면 해당 차원에만 길이를 갖는 배열, 아니면 기준값 스칼라"""
+            if name not in coords:
+                return base_case[name]
+            shape = [1] * ndim
+            shape[list(axes).index(name)] = -1
+            return coords[name].reshape(shape)
+
+        def timed(x):
+            """연도 차원(마지막)을 붙이기 위한 확장"""
+            return np.asarray(x)[..., np.newaxis]
+
+        # 매출 경로 (revenue_growth_shift에만 의존)
+        growth_path = np.asarray(assumptions['revenue_growth'][:periods], dtype=float)
+        growth = growth_path + timed(param('revenue_growth_shift'))
+        last_revenue = float(normalized['revenues'][-1])
+        revenue = last_revenue * np.cumprod(1 + growth, axis=-1)
+        prev_revenue = np.concatenate(
+            [np.full(revenue.shape[:-1] + (1,), last_revenue), revenue[..., :-1]], axis=-1
+        )
+        revenue_increase = revenue - prev_revenue
+
+        # 할인계수 (WACC에만 의존)
+        wacc = param('wacc')
+        t = np.arange(1, periods + 1)
+        discount_factor = 1 / (1 + timed(wacc)) ** t
+
+        # 연도 합산은 매출×할인 축에서만 수행
+        pv_revenue = (revenue * discount_factor).sum(axis=-1)
+        pv_revenue_increase = (revenue_increase * discount_factor).sum(axis=-1)
+
+        # 매출 1원당 FCF (마진·세율·감가상각·CAPEX 축)
+        unit_fcf = (param('target_operating_margin') * (1 - param('tax_rate'))
+                    + param('depreciation_rate') - param('capex_rate'))
+        wc_rate = param('wc_rate')
+
+        pv_fcf = pv_revenue * unit_fcf - pv_revenue_increase * wc_rate
+        last_fcf = revenue[..., -1] * unit_fcf - revenue_increase[..., -1] * wc_rate
+
+        # 영구가치
+        growth_tv = param('terminal_growth')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terminal_value = last_fcf * (1 + growth_tv) / (wacc - growth_tv)
+            pv_tv = np.where(wacc > growth_tv, terminal_value * discount_factor[..., -1], np.nan)
+
+        enterprise_value = pv_fcf + pv_tv
+        net_debt = adjustments.get('total_debt', 0) - adjustments.get('cash', 0)
+        equity_value = enterprise_value - net_debt + adjustments.get('non_operating_assets', 0)
+        value_per_share = (equity_value * 1_000_000) / adjustments['shares_outstanding']
+
+        full_shape = tuple(len(coords[axis]) for axis in axes)
+
+        return SensitivityCube(
+            axes=list(axes),
+            coords=coords,
+            value_per_share=np.broadcast_to(value_per_share, full_shape),
+            enterprise_value=np.broadcast_to(enterprise_value, full_shape),
+            equity_value=np.broadcast_to(equity_value, full_shape),
+            base_case={axis: base_case[axis] for axis in axes}
+        )
+
     def scenario_analysis(self,
                          projections: List[Dict],
                          base_wacc: float,
@@ -257,6 +573,203 @@ class SensitivityAnalyzer:
 
         return results
 
+    # ==================== 몬테카를로 시뮬레이션 ====================
+
+    @staticmethod
+    def _sample_marginal(spec: Dict, z: np.ndarray) -> np.ndarray:
+        """
+        표준정규 표본 z를 주변분포 spec에 맞게 변환 (가우시안 코퓰라)
+
+        spec 파라미터가 리스트(예: 연도별 성장률)이면 (N, T)로 브로드캐스트
+
+        지원 분포:
+            {'dist': 'normal', 'mean': μ, 'std': σ}
+            {'dist': 'lognormal', 'mu': μ, 'sigma': σ}
+            {'dist': 'uniform', 'low': a, 'high': b}
+            {'dist': 'triangular', 'low': a, 'mode': c, 'high': b}
+            공통 옵션: 'clip': (min, max)
+        """
+        dist = spec.get('dist', 'normal')
+
+        def param(name):
+            value = np.asarray(spec[name], dtype=float)
+            return value if value.ndim == 0 else value[np.newaxis, :]
+
+        if any(np.ndim(v) > 0 for k, v in spec.items() if k not in ('dist', 'clip')):
+            z = z[:, np.newaxis]
+
+        if dist == 'normal':
+            values = param('mean') + param('std') * z
+        elif dist == 'lognormal':
+            values = np.exp(param('mu') + param('sigma') * z)
+        elif dist == 'uniform':
+            low = param('low')
+            values = low + (param('high') - low) * ndtr(z)
+        elif dist == 'triangular':
+            low, mode, high = param('low'), param('mode'), param('high')
+            u = ndtr(z)
+            split = (mode - low) / (high - low)
+            values = np.where(
+                u < split,
+                low + np.sqrt(u * (high - low) * (mode - low)),
+                high - np.sqrt((1 - u) * (high - low) * (high - mode))
+            )
+        else:
+            raise ValueError(f"지원하지 않는 분포: {dist}")
+
+        if 'clip' in spec:
+            values = np.clip(values, *spec['clip'])
+
+        return values
+
+    def monte_carlo_analysis(self,
+                             inputs: Dict,
+                             distributions: Dict[str, Dict],
+                             correlation: Optional[Sequence[Sequence[float]]] = None,
+                             n_paths: int = 100_000,
+                             chunk_size: int = 50_000,
+                             price_threshold: Optional[float] = None,
+                             percentiles: Sequence[float] = (5, 10, 25, 50, 75, 90, 95),
+                             bins: int = 50,
+                             seed: Optional[int] = None) -> Dict:
+        """
+        몬테카를로 시뮬레이션 (주당가치 확률분포)
+
+        핵심 가정을 확률분포로 두고 상관관계를 반영해 n_paths개 경로를 평가.
+        chunk_size 단위로 BatchDCFEngine을 호출하고 결과는 스트리밍 히스토그램에만
+        누적하므로, 1M 경로도 전체 경로를 메모리에 보관하지 않음.
+
+        Args:
+            inputs: DCFEngine.run_valuation 입력 (기준 가정)
+            distributions: 확률변수별 분포 (키 순서 = 상관행렬 순서)
+                {
+                    'revenue_growth': {'dist': 'normal',
+                                       'mean': [0.12, 0.10, 0.08, 0.06, 0.05], 'std': 0.02},
+                    # 또는 스칼라 (경로별 한 값을 모든 예측 연도에 적용):
+                    # 'revenue_growth': {'dist': 'normal', 'mean': 0.08, 'std': 0.03},
+                    'target_operating_margin': {'dist': 'triangular',
+                                                'low': 0.10, 'mode': 0.15, 'high': 0.18},
+                    'beta': {'dist': 'normal', 'mean': 1.2, 'std': 0.15, 'clip': (0.3, 3.0)},
+                    'terminal_growth': {'dist': 'uniform', 'low': 0.02, 'high': 0.04}
+                }
+            correlation: 확률변수 간 상관행렬 (k × k, 생략 시 독립)
+            n_paths: 시뮬레이션 경로 수
+            chunk_size: 청크당 경로 수 (메모리 상한 결정)
+            price_threshold: 하회 확률을 계산할 주당가격 (원)
+            percentiles: 산출할 백분위 (0~100)
+            bins: 반환 히스토그램 구간 수
+            seed: 난수 시드
+
+        Returns:
+            Dict: 시뮬레이션 결과
+                {
+                    'n_paths': 100000,
+                    'n_valid': 99980,  # WACC > 영구성장률 경로 수
+                    'mean': ..., 'std': ..., 'min': ..., 'max': ...,
+                    'percentiles': {'p5': ..., 'p50': ..., 'p95': ...},
+                    'histogram': {'bin_edges': [...], 'counts': [...]},
+                    'price_threshold': 50000,
+                    'prob_below_threshold': 0.12
+                }
+        """
+        drivers = list(distributions.keys())
+        unknown = [d for d in drivers if d not in self.ASSUMPTION_DRIVERS + self.WACC_DRIVERS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 확률변수: {unknown}")
+
+        # 할인율을 직접 지정하면 구성요소 표본이 WACC에 반영되지 않음
+        wacc_drivers = [d for d in drivers if d in self.WACC_DRIVERS]
+        if wacc_drivers and 'wacc' in inputs['wacc_inputs']:
+            raise ValueError(
+                f"wacc_inputs에 'wacc'가 직접 지정되어 있어 {wacc_drivers} 표본을 반영할 수 없습니다 "
+                f"('wacc'를 제거하고 구성요소로 입력하세요)"
+            )
+
+        k = len(drivers)
+        if correlation is None:
+            chol = np.eye(k)
+        else:
+            corr = np.asarray(correlation, dtype=float)
+            if corr.shape != (k, k):
+                raise ValueError(f"상관행렬 크기({corr.shape})가 확률변수 수({k})와 다릅니다")
+            try:
+                chol = np.linalg.cholesky(corr)
+            except np.linalg.LinAlgError:
+                raise ValueError("상관행렬이 양의 정부호(positive definite)가 아닙니다")
+
+        engine = BatchDCFEngine()
+        normalized = engine.engine.normalize_financials(inputs['historical_financials'])
+        # 시장 데이터 보완은 경로 청크마다 반복하지 않고 한 번만
+        base_wacc_inputs = engine.resolve_wacc_inputs(inputs)
+        periods = inputs.get('projection_period', 5)
+        rng = np.random.default_rng(seed)
+        histogram = _StreamingHistogram()
+
+        n_valid = 0
+        n_below = 0
+        value_sum = 0.0
+        value_sq_sum = 0.0
+
+        remaining = n_paths
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            remaining -= n
+
+            # 상관된 표준정규 표본 (N, k)
+            z = rng.standard_normal((n, k)) @ chol.T
+
+            assumptions = dict(inputs['assumptions'])
+            wacc_inputs = dict(base_wacc_inputs)
+            for j, driver in enumerate(drivers):
+                target = assumptions if driver in self.ASSUMPTION_DRIVERS else wacc_inputs
+                target[driver] = self._sample_marginal(distributions[driver], z[:, j])
+
+            if np.ndim(assumptions['revenue_growth']) == 1 and 'revenue_growth' in distributions:
+                # 스칼라 성장률 분포: 경로별 한 번 뽑은 성장률을 모든 예측 연도에 적용 (N,) → (N, T)
+                assumptions['revenue_growth'] = np.repeat(
+                    assumptions['revenue_growth'][:, np.newaxis], periods, axis=1
+                )
+            elif 'revenue_growth' not in distributions:
+                assumptions['revenue_growth'] = np.broadcast_to(
+                    np.asarray(assumptions['revenue_growth'], dtype=float),
+                    (n, len(assumptions['revenue_growth']))
+                )
+
+            chunk = engine.run_valuation(
+                {**inputs, 'assumptions': assumptions, 'wacc_inputs': wacc_inputs},
+                normalized=normalized
+            )
+
+            values = chunk['value_per_share'][chunk['valid']]
+            histogram.update(values)
+
+            n_valid += values.size
+            value_sum += float(values.sum())
+            value_sq_sum += float(np.square(values).sum())
+            if price_threshold is not None:
+                n_below += int(np.count_nonzero(values < price_threshold))
+
+        mean = value_sum / n_valid if n_valid else float('nan')
+        variance = value_sq_sum / n_valid - mean ** 2 if n_valid else float('nan')
+
+        return {
+            'n_paths': n_paths,
+            'n_valid': n_valid,
+            'n_invalid': n_paths - n_valid,
+            'drivers': drivers,
+            'mean': mean,
+            'std': float(np.sqrt(max(variance, 0.0))),
+            'min': histogram.min if n_valid else None,
+            'max': histogram.max if n_valid else None,
+            'percentiles': {
+                f"p{q:g}": histogram.quantile(q / 100) for q in percentiles
+            },
+            'histogram': histogram.coarse(bins),
+            'price_threshold': price_threshold,
+            'prob_below_threshold': (n_below / n_valid
+                                     if price_threshold is not None and n_valid else None)
+        }
+
 
 # 테스트
 if __name__ == "__main__":
@@ -297,7 +810,8 @@ if __name__ == "__main__":
 
     # 민감도 매트릭스 출력
     print("\n민감도 매트릭스 (주당가치, 원):")
-    print(f"{'WACC\\성장률':<12}", end="")
+    header_label = 'WACC\\성장률'
+    print(f"{header_label:<12}", end="")
     for g in sensitivity['growth_values']:
         print(f"{g:>10.1%}", end="")
     print()
@@ -334,4 +848,117 @@ if __name__ == "__main__":
         print(f"  WACC: {result['wacc']:.2%}, 성장률: {result['growth']:.2%}")
         print(f"  주당가치: {result['value_per_share']:,.0f}원")
 
+    # 몬테카를로 시뮬레이션
+    print("\n[5] 몬테카를로 시뮬레이션 (1,000,000 경로)")
+    import time
+    import tracemalloc
+
+    mc_inputs = {
+        'company_id': 'TEST001',
+        'valuation_date': '2025-01-01',
+        'historical_financials': [  # 백만원
+            {'year': 2023, 'revenue': 115_000, 'operating_income': 15_000,
+             'depreciation': 3_500, 'capex': 5_000, 'working_capital_change': 1_500},
+            {'year': 2024, 'revenue': 130_000, 'operating_income': 18_000,
+             'depreciation': 4_000, 'capex': 6_000, 'working_capital_change': 1_500}
+        ],
+        'assumptions': {
+            'base_year': 2024,
+            'revenue_growth': [0.12, 0.10, 0.08, 0.06, 0.05],
+            'target_operating_margin': 0.15,
+            'terminal_growth': 0.03
+        },
+        'wacc_inputs': {
+            'risk_free_rate': 0.035, 'beta': 1.2, 'market_premium': 0.07,
+            'cost_of_debt': 0.05, 'debt_ratio': 0.30, 'tax_rate': 0.25
+        },
+        'adjustments': {
+            'cash': 10_000,
+            'total_debt': 30_000,
+            'non_operating_assets': 5_000,
+            'shares_outstanding': 10_000_000
+        }
+    }
+
+    mc_distributions = {
+        'revenue_growth': {'dist': 'normal', 'mean': [0.12, 0.10, 0.08, 0.06, 0.05], 'std': 0.02},
+        'target_operating_margin': {'dist': 'triangular', 'low': 0.11, 'mode': 0.15, 'high': 0.18},
+        'beta': {'dist': 'normal', 'mean': 1.2, 'std': 0.15, 'clip': (0.3, 3.0)},
+        'terminal_growth': {'dist': 'uniform', 'low': 0.02, 'high': 0.04}
+    }
+    mc_correlation = [
+        [1.0, 0.5, 0.0, 0.3],
+        [0.5, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.3, 0.0, 0.0, 1.0]
+    ]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    mc = analyzer.monte_carlo_analysis(
+        mc_inputs, mc_distributions, mc_correlation,
+        n_paths=1_000_000, price_threshold=15_000, seed=7
+    )
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  소요시간: {elapsed:.2f}초, 최대 메모리: {peak / 1e6:,.1f} MB")
+    print(f"  유효 경로: {mc['n_valid']:,} / {mc['n_paths']:,}")
+    print(f"  평균: {mc['mean']:,.0f}원, 표준편차: {mc['std']:,.0f}원")
+    for name, value in mc['percentiles'].items():
+        print(f"  {name:>4}: {value:,.0f}원")
+    print(f"  15,000원 하회 확률: {mc['prob_below_threshold']:.2%}")
+
+    # 스칼라 성장률 분포 → 경로마다 다른 성장률 (분포가 한 점으로 붕괴하지 않아야 함)
+    scalar_mc = analyzer.monte_carlo_analysis(
+        mc_inputs, {'revenue_growth': {'dist': 'normal', 'mean': 0.08, 'std': 0.03}},
+        n_paths=20_000, seed=11
+    )
+    assert scalar_mc['std'] > 0 and scalar_mc['percentiles']['p5'] < scalar_mc['percentiles']['p95']
+    print(f"  스칼라 성장률 분포: 표준편차 {scalar_mc['std']:,.0f}원, "
+          f"p5 {scalar_mc['percentiles']['p5']:,.0f}원 ~ p95 {scalar_mc['percentiles']['p95']:,.0f}원 ✓")
+
+    # 'wacc' 직접 지정 + 구성요소 표본 → 표본이 무시되므로 거부
+    direct_wacc_inputs = {**mc_inputs, 'wacc_inputs': {**mc_inputs['wacc_inputs'], 'wacc': 0.10}}
+    try:
+        analyzer.monte_carlo_analysis(
+            direct_wacc_inputs, {'beta': {'dist': 'normal', 'mean': 1.2, 'std': 0.15}}, n_paths=1_000
+        )
+    except ValueError as exc:
+        print(f"  직접 WACC + beta 표본 거부 ✓ ({exc})")
+    else:
+        raise AssertionError("직접 지정된 'wacc'와 구성요소 표본이 함께 허용되었습니다")
+
+    # N차원 민감도 그리드
+    print("\n[6] 4차원 민감도 그리드 (WACC × 성장률 × 마진 × CAPEX = 50×50×20×20)")
+    start = time.perf_counter()
+    cube = analyzer.create_sensitivity_cube(mc_inputs, {
+        'wacc': np.linspace(0.075, 0.115, 50),
+        'terminal_growth': np.linspace(0.02, 0.04, 50),
+        'target_operating_margin': np.linspace(0.10, 0.20, 20),
+        'capex_rate': np.linspace(0.03, 0.07, 20)
+    })
+    elapsed = time.perf_counter() - start
+    print(f"  셀 수: {cube.value_per_share.size:,}, 소요시간: {elapsed * 1e3:.1f} ms")
+
+    # 그리드 셀 하나를 배치 엔진(스칼라 경로와 동일) 결과와 대조
+    i, j, k, m = 10, 25, 7, 12
+    check = BatchDCFEngine().run_valuation({
+        **mc_inputs,
+        'assumptions': {**mc_inputs['assumptions'],
+                        'terminal_growth': cube.coords['terminal_growth'][j],
+                        'target_operating_margin': cube.coords['target_operating_margin'][k],
+                        'capex_rate': cube.coords['capex_rate'][m]},
+        # Rf=0, β=1, D/V=0 → WACC = MRP
+        'wacc_inputs': {'risk_free_rate': 0.0, 'beta': 1.0, 'market_premium': cube.coords['wacc'][i],
+                        'cost_of_debt': 0.0, 'debt_ratio': 0.0, 'tax_rate': 0.0}
+    })
+    rel_err = abs(cube.value_per_share[i, j, k, m] / check['value_per_share'][0] - 1)
+    print(f"  배치 엔진 대비 상대오차: {rel_err:.2e}")
+
+    table = cube.table('wacc', 'terminal_growth', target_operating_margin=0.15, capex_rate=0.05)
+    print(f"  2-D 표 추출 (마진 15%, CAPEX 5%): {table.shape}")
+    print(f"  표 중앙값: {table[25, 25]:,.0f}원")
+
     print("\n" + "=" * 80)
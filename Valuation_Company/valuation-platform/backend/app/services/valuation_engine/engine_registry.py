@@ -0,0 +1,344 @@
+"""
+Engine Registry
+평가 엔진 레지스트리 - 지연 import + 프로세스 단위 싱글톤
+
+- 평가 엔진 모듈은 처음 사용될 때 import / 생성 (요청은 사용하는 엔진 비용만 부담)
+- 생성된 엔진 인스턴스는 프로세스 안에서 재사용
+- 평가법별 run_valuation 호출 규약을 evaluate(inputs) 하나로 통일
+- 엔진별 콜드 스타트 비용 (import / 생성 시간) 기록
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import hashlib
+import importlib
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# 엔진 모듈은 'from common.financial_math import ...' 형태로 서로를 참조하므로
+# 엔진 루트를 sys.path에 한 번만 등록한다
+ENGINE_ROOT = Path(__file__).resolve().parent
+if str(ENGINE_ROOT) not in sys.path:
+    sys.path.insert(0, str(ENGINE_ROOT))
+
+
+# ==================== 평가법별 입력 어댑터 ====================
+
+def _evaluate_dcf(engine, inputs: Dict) -> Dict:
+    return engine.run_valuation(inputs)
+
+
+def _evaluate_relative(engine, inputs: Dict) -> Dict:
+    return engine.run_valuation(
+        company_data=inputs.get('company_data'),
+        comparable_companies=inputs.get('comparable_companies'),
+        industry_benchmarks=inputs.get('industry_benchmarks')
+    )
+
+
+def _evaluate_intrinsic(engine, inputs: Dict) -> Dict:
+    return engine.run_valuation(
+        asset_value=inputs.get('asset_value'),
+        income_value=inputs.get('income_value'),
+        purpose=inputs.get('purpose', '합병')
+    )
+
+
+def _evaluate_asset(engine, inputs: Dict) -> Dict:
+    return engine.run_valuation(
+        balance_sheet=inputs.get('balance_sheet'),
+        fair_value_data=inputs.get('fair_value_data')
+    )
+
+
+def _evaluate_asset_batch(engine, inputs: Dict) -> Dict:
+    return engine.run_valuation(
+        balance_sheets=inputs.get('balance_sheets'),
+        fair_value_data=inputs.get('fair_value_data'),
+        detail=inputs.get('detail', False)
+    )
+
+
+def _evaluate_inheritance_tax(engine, inputs: Dict) -> Dict:
+    return engine.run_valuation(
+        net_income_3yr=inputs.get('net_income_3yr'),
+        net_assets=inputs.get('net_assets'),
+        controlling_premium=inputs.get('controlling_premium', False),
+        minority_discount=inputs.get('minority_discount', 0.0),
+        marketability_discount=inputs.get('marketability_discount', 0.0)
+    )
+
+
+# ==================== 레지스트리 ====================
+
+@dataclass
+class EngineSpec:
+    """엔진 등록 정보"""
+    name: str  # 정규 평가법 코드 (예: 'dcf')
+    module: str  # 엔진 루트 기준 모듈 경로 (예: 'dcf.dcf_engine')
+    class_name: str  # 엔진 클래스명
+    adapter: Callable[[Any, Dict], Dict]  # (엔진, inputs) → run_valuation 결과
+    aliases: Tuple[str, ...] = ()  # 다른 계층에서 쓰는 평가법 코드
+    version: Optional[str] = None  # 엔진 소스 해시 (처음 조회 시 계산)
+
+
+@dataclass
+class RegisteredEngine:
+    """생성된 엔진 인스턴스 + 콜드 스타트 / 호출 통계"""
+    spec: EngineSpec
+    instance: Any
+    import_ms: float
+    init_ms: float
+    loaded_at: float = field(default_factory=time.time)
+    calls: int = 0
+    total_ms: float = 0.0
+
+    @property
+    def cold_start_ms(self) -> float:
+        return self.import_ms + self.init_ms
+
+    def evaluate(self, inputs: Dict) -> Dict:
+        """
+        평가 실행 (평가법과 무관한 공통 호출 규약)
+
+        Args:
+            inputs: 평가법별 입력 dict (어댑터가 run_valuation 인자로 변환)
+
+        Returns:
+            Dict: 엔진 run_valuation 결과
+        """
+        start = time.perf_counter()
+        try:
+            return self.spec.adapter(self.instance, inputs)
+        finally:
+            self.calls += 1
+            self.total_ms += (time.perf_counter() - start) * 1000
+
+
+class EngineRegistry:
+    """
+    평가 엔진 레지스트리
+
+    사용법:
+        engine_registry.evaluate('dcf', inputs)
+        engine_registry.get('capital_market_law').evaluate(inputs)
+        engine_registry.stats()  # 엔진별 콜드 스타트 비용
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, EngineSpec] = {}
+        self._aliases: Dict[str, str] = {}
+        self._engines: Dict[str, RegisteredEngine] = {}
+        self._errors: Dict[str, str] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+
+    def register(self,
+                 name: str,
+                 module: str,
+                 class_name: str,
+                 adapter: Callable[[Any, Dict], Dict] = _evaluate_dcf,
+                 aliases: Tuple[str, ...] = ()) -> EngineSpec:
+        """엔진 등록 (import는 하지 않음)"""
+        spec = EngineSpec(name, module, class_name, adapter, tuple(aliases))
+        self._specs[name] = spec
+        self._locks[name] = threading.Lock()
+        for code in (name,) + spec.aliases:
+            self._aliases[code] = name
+        return spec
+
+    def resolve(self, method: str) -> str:
+        """평가법 코드 → 정규 엔진 이름"""
+        try:
+            return self._aliases[method]
+        except KeyError:
+            raise ValueError(f"Unknown valuation method: {method}") from None
+
+    def supports(self, method: str) -> bool:
+        return method in self._aliases
+
+    def codes(self, method: str) -> Tuple[str, ...]:
+        """같은 엔진으로 해석되는 평가법 코드 전체 (정규 이름 + 별칭)"""
+        name = self.resolve(method)
+        return (name,) + self._specs[name].aliases
+
+    def get(self, method: str) -> RegisteredEngine:
+        """
+        엔진 조회 (최초 호출 시 import + 생성, 이후 같은 인스턴스 반환)
+
+        Raises:
+            ValueError: 등록되지 않은 평가법
+            ImportError: 엔진 모듈 import 실패
+        """
+        name = self.resolve(method)
+        engine = self._engines.get(name)
+        if engine is not None:
+            return engine
+
+        with self._locks[name]:
+            engine = self._engines.get(name)
+            if engine is None:
+                engine = self._load(self._specs[name])
+                self._engines[name] = engine
+        return engine
+
+    def _load(self, spec: EngineSpec) -> RegisteredEngine:
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(spec.module)
+            engine_cls = getattr(module, spec.class_name)
+        except (ImportError, AttributeError) as e:
+            self._errors[spec.name] = str(e)
+            raise ImportError(f"{spec.name} 엔진 import 실패: {e}") from e
+        imported = time.perf_counter()
+        instance = engine_cls()
+        initialized = time.perf_counter()
+
+        self._errors.pop(spec.name, None)
+        return RegisteredEngine(
+            spec=spec,
+            instance=instance,
+            import_ms=(imported - start) * 1000,
+            init_ms=(initialized - imported) * 1000
+        )
+
+    def version(self, method: str) -> str:
+        """
+        엔진 버전 (엔진 패키지 + common 모듈 소스의 해시)
+
+        엔진 코드가 바뀌면 값이 달라지므로 결과 캐시 키에 넣어 자동 무효화에 쓴다.
+        import 없이 소스 파일만 읽으므로 엔진을 로드하지 않는다.
+        """
+        spec = self._specs[self.resolve(method)]
+        if spec.version is None:
+            package = spec.module.split('.')[0]
+            sources = sorted((ENGINE_ROOT / package).glob('*.py')) + sorted((ENGINE_ROOT / 'common').glob('*.py'))
+            digest = hashlib.sha256()
+            for path in sources:
+                digest.update(path.name.encode())
+                digest.update(path.read_bytes())
+            spec.version = digest.hexdigest()[:16]
+        return spec.version
+
+    def instance(self, method: str) -> Any:
+        """엔진 객체 자체 (run_valuation 외 메서드가 필요한 경우)"""
+        return self.get(method).instance
+
+    def is_available(self, method: str) -> bool:
+        """엔진 사용 가능 여부 (필요하면 이 시점에 로드)"""
+        try:
+            self.get(method)
+            return True
+        except ImportError:
+            return False
+
+    def evaluate(self, method: str, inputs: Dict) -> Dict:
+        """평가법 코드로 평가 실행"""
+        return self.get(method).evaluate(inputs)
+
+    def reset(self, method: Optional[str] = None):
+        """
+        생성된 인스턴스 폐기 (다음 get에서 재생성)
+
+        이미 import된 모듈은 sys.modules에 남으므로 재측정되는 것은 생성 비용뿐이다.
+        """
+        if method is None:
+            self._engines.clear()
+        else:
+            self._engines.pop(self.resolve(method), None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        엔진별 로드 상태 / 콜드 스타트 / 호출 통계
+
+        Returns:
+            {
+                'dcf': {
+                    'loaded': True,
+                    'import_ms': 12.3,
+                    'init_ms': 0.01,
+                    'cold_start_ms': 12.31,
+                    'calls': 5,
+                    'avg_evaluate_ms': 0.8,
+                    'error': None
+                },
+                ...
+            }
+        """
+        stats = {}
+        for name in self._specs:
+            engine = self._engines.get(name)
+            if engine is None:
+                stats[name] = {'loaded': False, 'error': self._errors.get(name)}
+                continue
+            stats[name] = {
+                'loaded': True,
+                'import_ms': round(engine.import_ms, 3),
+                'init_ms': round(engine.init_ms, 3),
+                'cold_start_ms': round(engine.cold_start_ms, 3),
+                'calls': engine.calls,
+                'avg_evaluate_ms': round(engine.total_ms / engine.calls, 3) if engine.calls else None,
+                'error': None
+            }
+        return stats
+
+
+# 프로세스 공용 레지스트리
+# 평가법 코드는 오케스트레이터('intrinsic', 'inheritance_tax')와
+# 프로젝트/라우터('capital_market_law', 'inheritance_tax_law') 표기를 모두 받는다
+engine_registry = EngineRegistry()
+engine_registry.register('dcf', 'dcf.dcf_engine', 'DCFEngine', _evaluate_dcf)
+engine_registry.register('dcf_batch', 'dcf.batch_dcf_engine', 'BatchDCFEngine', _evaluate_dcf)
+engine_registry.register('relative', 'relative.relative_engine', 'RelativeValuationEngine',
+                         _evaluate_relative)
+engine_registry.register('intrinsic', 'intrinsic.intrinsic_value_engine', 'CapitalMarketLawEngine',
+                         _evaluate_intrinsic, aliases=('capital_market_law',))
+engine_registry.register('asset', 'asset.asset_engine', 'AssetValuationEngine', _evaluate_asset)
+engine_registry.register('asset_batch', 'asset.batch_asset_engine', 'BatchAssetValuationEngine',
+                         _evaluate_asset_batch)
+engine_registry.register('inheritance_tax', 'tax.tax_law_engine', 'InheritanceTaxLawEngine',
+                         _evaluate_inheritance_tax, aliases=('inheritance_tax_law',))
+
+
+# ==================== 테스트 코드 ====================
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+
+    print("=" * 60)
+    print("Engine Registry - 콜드 스타트 측정")
+    print("=" * 60)
+
+    samples = {
+        'intrinsic': {'asset_value': 50000, 'income_value': 80000},
+        'inheritance_tax': {'net_income_3yr': 30000, 'net_assets': 120000,
+                            'controlling_premium': True},
+        'asset': {'balance_sheet': {'total_assets': 100000, 'total_liabilities': 40000,
+                                    'shares_outstanding': 1000000}},
+    }
+
+    for method, inputs in samples.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = engine_registry.evaluate(method, inputs)
+        print(f"{method:<16} 결과 키: {sorted(result)[:4]}")
+
+    # 별칭은 같은 인스턴스를 공유
+    assert engine_registry.get('capital_market_law') is engine_registry.get('intrinsic')
+    assert engine_registry.get('inheritance_tax_law') is engine_registry.get('inheritance_tax')
+
+    print(f"\n{'엔진':<16} {'로드':>5} {'import(ms)':>11} {'init(ms)':>9} {'호출':>5}")
+    for name, s in engine_registry.stats().items():
+        if s['loaded']:
+            print(f"{name:<16} {'O':>5} {s['import_ms']:>11.2f} {s['init_ms']:>9.3f} {s['calls']:>5}")
+        else:
+            print(f"{name:<16} {'-':>5}")
+
+    # 사용하지 않은 엔진은 import되지 않는다
+    assert 'dcf.dcf_engine' not in sys.modules
+    assert 'relative.relative_engine' not in sys.modules
+    print("\n✅ 사용한 엔진만 로드됨")
@@ -0,0 +1,410 @@
+"""
+비교기업 유니버스 (Comparable-Company Universe)
+
+업종 × 규모 구간별로 비교기업 배수(PER, PBR, PSR, EV/EBITDA)를 배열로 보관하고
+IQR 이상치 제거 후 통계(중위값, 평균, 사분위수)를 미리 계산
+
+- 그룹 키: (업종, 규모 구간) 및 (업종, 전체)
+- 비교기업 추가/수정 시 해당 그룹만 dirty 표시 → 다음 조회 때 그 그룹만 재계산
+- 조회는 캐시된 Dict 반환 (O(1)), 반환 형식은 RelativeValuationEngine의 benchmarks 인자와 동일
+- 유사기업 검색용 특성(성장률, 이익률, 상장 여부, 업종 코드)도 함께 보관
+- 로컬 CSV / Parquet 스냅샷 로더 제공 (오프라인 사용)
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import csv
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+
+class ComparableUniverse:
+    """업종 × 규모 구간 키의 비교기업 배수 저장소"""
+
+    MULTIPLES = ('per', 'pbr', 'psr', 'ev_ebitda')
+
+    # 유사기업 검색용 특성 (매출액은 _revenue에 별도 보관)
+    FEATURES = ('growth_rate_3yr', 'operating_margin', 'net_margin', 'is_listed')
+
+    # 매출액 기준 규모 구간 (백만원): 1,000억 미만 / 1조 미만 / 1조 이상
+    SIZE_BUCKETS = (('small', 100_000), ('mid', 1_000_000), ('large', float('inf')))
+    ALL_SIZES = '*'
+
+    # IQR 필터 최소 표본 수 (RelativeValuationEngine._remove_outliers와 동일)
+    MIN_IQR_SAMPLES = 4
+
+    def __init__(self, capacity: int = 1024):
+        self._names: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._industry: List[str] = []
+        self._industry_code: List[str] = []
+        self._ticker: List[Optional[str]] = []
+        self._bucket: List[str] = []
+        self._revenue = np.full(capacity, np.nan)
+        self._multiples = np.full((capacity, len(self.MULTIPLES)), np.nan)
+        self._features = np.full((capacity, len(self.FEATURES)), np.nan)
+        self.version = 0  # 추가/수정/제외마다 증가 (검색 인덱스 재구축 판단용)
+
+        self._members: Dict[Tuple[str, str], Dict[int, None]] = {}  # 그룹 → 행 번호 (순서 유지 집합)
+        self._stats: Dict[Tuple[str, str], Dict] = {}
+        self._dirty: set = set()
+        self.stats_recomputed = 0
+
+    # ==================== 구간 / 저장 ====================
+
+    @classmethod
+    def size_bucket(cls, revenue: Optional[float]) -> str:
+        """매출액(백만원) → 규모 구간"""
+        if revenue is None or not np.isfinite(revenue):
+            return cls.ALL_SIZES
+        for label, upper in cls.SIZE_BUCKETS:
+            if revenue < upper:
+                return label
+        return cls.SIZE_BUCKETS[-1][0]
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._row_of
+
+    def _ensure_capacity(self, size: int):
+        """배열 용량 2배씩 확장"""
+        capacity = self._revenue.shape[0]
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2)
+        self._revenue = np.concatenate([self._revenue, np.full(new_capacity - capacity, np.nan)])
+        self._multiples = np.vstack([
+            self._multiples, np.full((new_capacity - capacity, len(self.MULTIPLES)), np.nan)
+        ])
+        self._features = np.vstack([
+            self._features, np.full((new_capacity - capacity, len(self.FEATURES)), np.nan)
+        ])
+
+    def _groups(self, industry: str, bucket: str) -> Tuple[Tuple[str, str], ...]:
+        if bucket == self.ALL_SIZES:
+            return ((industry, self.ALL_SIZES),)
+        return (industry, bucket), (industry, self.ALL_SIZES)
+
+    @staticmethod
+    def _clean(value) -> float:
+        """배수 값 정리 (없거나 0 이하는 NaN → 통계에서 제외)"""
+        if value is None or value == '':
+            return np.nan
+        value = float(value)
+        return value if value > 0 else np.nan
+
+    @staticmethod
+    def _number(value) -> float:
+        if value is None or value == '':
+            return np.nan
+        if isinstance(value, str) and value.strip().lower() in ('true', 'false', 'y', 'n'):
+            return 1.0 if value.strip().lower() in ('true', 'y') else 0.0
+        return float(value)
+
+    @classmethod
+    def _feature_row(cls, company: Dict, revenue: float) -> List[float]:
+        """특성 벡터 (이익률이 없으면 이익 / 매출액으로 계산)"""
+        row = {name: cls._number(company.get(name)) for name in cls.FEATURES}
+        for margin, income in (('operating_margin', 'operating_income'), ('net_margin', 'net_income')):
+            if np.isnan(row[margin]) and company.get(income) not in (None, '') and revenue > 0:
+                row[margin] = float(company[income]) / revenue
+        return [row[name] for name in cls.FEATURES]
+
+    def upsert(self, company: Dict):
+        """
+        비교기업 추가 또는 수정
+
+        Args:
+            company: {'name', 'industry', 'revenue', 'per', 'pbr', 'psr', 'ev_ebitda'}
+                     배수는 일부 누락 가능. 선택: 'ticker', 'industry_code',
+                     'growth_rate_3yr', 'operating_margin', 'net_margin', 'is_listed'
+        """
+        name = company['name']
+        industry = company.get('industry') or ''
+        revenue = company.get('revenue')
+        revenue = float(revenue) if revenue not in (None, '') else np.nan
+        bucket = self.size_bucket(revenue)
+
+        row = self._row_of.get(name)
+        if row is None:
+            row = len(self._names)
+            self._ensure_capacity(row + 1)
+            self._names.append(name)
+            self._industry.append(industry)
+            self._industry_code.append('')
+            self._ticker.append(None)
+            self._bucket.append(bucket)
+            self._row_of[name] = row
+        else:
+            # 그룹이 바뀌면 기존 그룹에서 제거
+            old_groups = self._groups(self._industry[row], self._bucket[row])
+            for key in old_groups:
+                del self._members[key][row]
+                self._dirty.add(key)
+            self._industry[row] = industry
+            self._bucket[row] = bucket
+
+        self._industry_code[row] = str(company.get('industry_code') or industry)
+        self._ticker[row] = company.get('ticker') or None
+        self._revenue[row] = revenue
+        self._multiples[row] = [self._clean(company.get(m)) for m in self.MULTIPLES]
+        self._features[row] = self._feature_row(company, revenue)
+        self.version += 1
+
+        for key in self._groups(industry, bucket):
+            self._members.setdefault(key, {})[row] = None
+            self._dirty.add(key)
+
+    def extend(self, companies: Iterable[Dict]):
+        """여러 비교기업 일괄 추가 (통계는 조회 시점에 그룹별 1회만 계산)"""
+        for company in companies:
+            self.upsert(company)
+
+    def remove(self, name: str):
+        """비교기업 제외 (행은 비워두고 그룹에서만 제거)"""
+        row = self._row_of.pop(name, None)
+        if row is None:
+            return
+        for key in self._groups(self._industry[row], self._bucket[row]):
+            del self._members[key][row]
+            self._dirty.add(key)
+        self._multiples[row] = np.nan
+        self.version += 1
+
+    # ==================== 통계 ====================
+
+    @classmethod
+    def iqr_stats(cls, values: np.ndarray) -> Optional[Dict]:
+        """
+        IQR 이상치 제거 후 통계
+
+        사분위수는 statistics.quantiles(method='exclusive')와 같은 방식 (numpy 'weibull')
+        """
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return None
+
+        if values.size >= cls.MIN_IQR_SAMPLES:
+            q1, q3 = np.percentile(values, [25, 75], method='weibull')
+            iqr = q3 - q1
+            clean = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        else:
+            clean = values
+
+        q1, median, q3 = np.percentile(clean, [25, 50, 75], method='weibull') \
+            if clean.size >= 2 else (clean[0],) * 3
+
+        return {
+            'median': float(median),
+            'mean': float(clean.mean()),
+            'q1': float(q1),
+            'q3': float(q3),
+            'count': int(values.size),
+            'count_clean': int(clean.size)
+        }
+
+    def _refresh(self, key: Tuple[str, str]):
+        """dirty 그룹 통계 재계산"""
+        rows = np.fromiter(self._members.get(key, {}), dtype=np.int64)
+        group = self._multiples[rows]
+
+        stats = {'industry': key[0], 'size_bucket': key[1], 'peer_count': int(rows.size)}
+        for col, multiple in enumerate(self.MULTIPLES):
+            summary = self.iqr_stats(group[:, col])
+            if summary is None:
+                continue
+            stats[f'median_{multiple}'] = summary['median']
+            stats[f'avg_{multiple}'] = summary['mean']
+            stats[f'q1_{multiple}'] = summary['q1']
+            stats[f'q3_{multiple}'] = summary['q3']
+            stats[f'count_{multiple}'] = summary['count_clean']
+
+        self._stats[key] = stats
+        self._dirty.discard(key)
+        self.stats_recomputed += 1
+
+    def refresh(self):
+        """모든 dirty 그룹 통계 재계산 (적재 직후 미리 호출 가능)"""
+        for key in list(self._dirty):
+            self._refresh(key)
+
+    def benchmark(self,
+                  industry: str,
+                  size_bucket: Optional[str] = None,
+                  min_peers: int = 3) -> Optional[Dict]:
+        """
+        업종(·규모) 배수 벤치마크 조회
+
+        (업종, 규모) 그룹의 비교기업이 min_peers 미만이면 (업종, 전체)로 대체
+
+        Returns:
+            {
+                'industry': '소프트웨어', 'size_bucket': 'mid', 'peer_count': 12,
+                'median_per': 11.5, 'avg_per': 11.2, 'q1_per': 10.1, 'q3_per': 12.4, 'count_per': 11,
+                ...  (PBR, PSR, EV/EBITDA 동일)
+            }
+            업종 데이터가 없으면 None
+        """
+        candidates = []
+        if size_bucket and size_bucket != self.ALL_SIZES:
+            candidates.append((industry, size_bucket))
+        candidates.append((industry, self.ALL_SIZES))
+
+        for key in candidates:
+            if key not in self._members:
+                continue
+            if key in self._dirty:
+                self._refresh(key)
+            stats = self._stats[key]
+            if stats['peer_count'] >= min_peers or key[1] == self.ALL_SIZES:
+                return stats if stats['peer_count'] > 0 else None
+
+        return None
+
+    def benchmark_for(self, company_data: Dict, min_peers: int = 3) -> Optional[Dict]:
+        """대상 기업의 업종·매출액으로 벤치마크 조회"""
+        return self.benchmark(
+            company_data.get('industry', ''),
+            self.size_bucket(company_data.get('revenue')),
+            min_peers=min_peers
+        )
+
+    def record(self, row: int) -> Dict:
+        """행 번호 → 비교기업 Dict (누락 값 제외)"""
+        values = {
+            'revenue': self._revenue[row],
+            **{m: self._multiples[row, col] for col, m in enumerate(self.MULTIPLES)},
+            **{f: self._features[row, col] for col, f in enumerate(self.FEATURES)}
+        }
+        return {
+            'name': self._names[row],
+            'ticker': self._ticker[row],
+            'industry': self._industry[row],
+            'industry_code': self._industry_code[row],
+            **{key: float(value) for key, value in values.items() if not np.isnan(value)}
+        }
+
+    def rows(self) -> np.ndarray:
+        """현재 포함된 비교기업 행 번호 (제외된 행 제외)"""
+        return np.fromiter(self._row_of.values(), dtype=np.int64, count=len(self._row_of))
+
+    def columns(self, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """유사기업 검색용 컬럼 (매출액, 특성, 업종 코드)"""
+        return {
+            'revenue': self._revenue[rows],
+            **{f: self._features[rows, col] for col, f in enumerate(self.FEATURES)},
+            'industry_code': np.array([self._industry_code[row] for row in rows], dtype=object)
+        }
+
+    def peers(self, industry: str, size_bucket: Optional[str] = None) -> List[Dict]:
+        """그룹 소속 비교기업 목록 (보고서·승인 화면용)"""
+        rows = self._members.get((industry, size_bucket or self.ALL_SIZES), {})
+        return [self.record(row) for row in rows]
+
+    # ==================== 로더 ====================
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'ComparableUniverse':
+        universe = cls()
+        universe.extend(records)
+        universe.refresh()
+        return universe
+
+    @classmethod
+    def from_csv(cls, path: str, encoding: str = 'utf-8-sig') -> 'ComparableUniverse':
+        """
+        CSV 스냅샷 로드
+
+        필수 컬럼: name, industry / 선택 컬럼: revenue, per, pbr, psr, ev_ebitda
+        """
+        with open(path, newline='', encoding=encoding) as f:
+            return cls.from_records(csv.DictReader(f))
+
+    @classmethod
+    def from_parquet(cls, path: str) -> 'ComparableUniverse':
+        """Parquet 스냅샷 로드 (pandas + pyarrow 필요)"""
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("Parquet 로드에는 pandas와 pyarrow가 필요합니다") from e
+
+        frame = pd.read_parquet(path)
+        frame = frame.astype(object).where(frame.notna(), None)
+        return cls.from_records(frame.to_dict('records'))
+
+    def to_csv(self, path: str):
+        """현재 유니버스를 CSV 스냅샷으로 저장"""
+        fields = ['name', 'ticker', 'industry', 'industry_code', 'revenue', *self.MULTIPLES, *self.FEATURES]
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=fields, restval='')
+            writer.writeheader()
+            for row in self._row_of.values():
+                writer.writerow({k: ('' if v is None else v) for k, v in self.record(row).items()})
+
+
+# 테스트
+if __name__ == "__main__":
+    import os
+    import statistics
+    import tempfile
+    import time
+
+    print("=" * 80)
+    print("Comparable-Company Universe")
+    print("=" * 80)
+
+    rng = np.random.default_rng(9)
+    industries = ['소프트웨어', '반도체', '바이오', '유통', '플랫폼', '2차전지', '게임', '제조']
+    records = []
+    for i in range(20_000):
+        records.append({
+            'name': f'C{i:05d}',
+            'industry': industries[i % len(industries)],
+            'revenue': float(rng.lognormal(11, 1.5)),
+            'per': float(rng.lognormal(2.4, 0.5)) if rng.random() > 0.1 else None,
+            'pbr': float(rng.lognormal(0.2, 0.5)),
+            'psr': float(rng.lognormal(0.8, 0.7)),
+            'ev_ebitda': float(rng.lognormal(2.1, 0.4)) if rng.random() > 0.2 else -3.0
+        })
+
+    start = time.perf_counter()
+    universe = ComparableUniverse.from_records(records)
+    print(f"\n적재 + 통계 계산: {len(universe):,}개 기업, {(time.perf_counter() - start) * 1e3:.1f} ms "
+          f"({universe.stats_recomputed}개 그룹)")
+
+    # 기존 _remove_outliers + statistics.median과 일치 여부
+    bench = universe.benchmark('소프트웨어', 'mid')
+    peers = [r for r in records if r['industry'] == '소프트웨어'
+             and ComparableUniverse.size_bucket(r['revenue']) == 'mid' and r['per']]
+    per_list = [r['per'] for r in peers]
+    q1, _, q3 = statistics.quantiles(per_list, n=4)
+    clean = [x for x in per_list if q1 - 1.5 * (q3 - q1) <= x <= q3 + 1.5 * (q3 - q1)]
+    assert abs(bench['median_per'] - statistics.median(clean)) < 1e-9
+    assert abs(bench['avg_per'] - statistics.mean(clean)) < 1e-9
+    print(f"소프트웨어/mid PER: 중위 {bench['median_per']:.2f}, 평균 {bench['avg_per']:.2f} "
+          f"(n={bench['count_per']}) → statistics 계산과 일치")
+
+    # O(1) 조회
+    start = time.perf_counter()
+    for _ in range(100_000):
+        universe.benchmark('반도체', 'large')
+    print(f"조회: {(time.perf_counter() - start) / 100_000 * 1e6:.2f} µs/회")
+
+    # 증분 갱신: 바뀐 그룹만 재계산
+    before = universe.stats_recomputed
+    universe.upsert({**records[1], 'per': 500.0})
+    universe.benchmark('반도체', ComparableUniverse.size_bucket(records[1]['revenue']))
+    universe.benchmark('소프트웨어', 'mid')
+    print(f"1개 기업 수정 후 재계산 그룹 수: {universe.stats_recomputed - before}")
+
+    # CSV 스냅샷 왕복
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'universe.csv')
+        universe.to_csv(path)
+        reloaded = ComparableUniverse.from_csv(path)
+        assert reloaded.benchmark('바이오', 'small') == universe.benchmark('바이오', 'small')
+    print("CSV 스냅샷 왕복 일치")
+    print("=" * 80)
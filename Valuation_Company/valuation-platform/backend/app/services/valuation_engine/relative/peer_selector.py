@@ -0,0 +1,306 @@
+"""
+유사기업 자동 선정 (Nearest-Neighbour Peer Selection)
+
+비교기업 유니버스에서 대상 기업과 가장 비슷한 k개 기업을 찾아
+HumanApprovalManager.request_comparable_companies_approval의 auto_selected로 전달
+
+거리 (가중 유클리드):
+    d² = Σ wᵢ² (zᵢ(대상) - zᵢ(후보))² + w_업종² × [업종 코드 다름]
+
+    z: 표준화 특성 (log10 매출액, 3년 성장률, 영업이익률, 순이익률, 상장 여부)
+
+검색:
+- 업종 코드별 KD-tree + 전체 KD-tree (scipy.spatial.cKDTree)
+  같은 업종에서 k개를 먼저 찾고, 다른 업종 후보는 업종 페널티를 더해도
+  더 가까울 수 있는 반경 안에서만 탐색 → 전수 계산과 같은 결과
+- scipy가 없거나 대상 기업에 누락 특성이 있으면 벡터화 전수 계산으로 대체
+
+설명: 선정 기업마다 특성별 거리 기여 비율(d² 대비)을 함께 반환
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import sys
+sys.path.append('..')
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from relative.comparable_universe import ComparableUniverse
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy 미설치 시 전수 계산
+    cKDTree = None
+
+
+class PeerSelector:
+    """비교기업 유니버스 기반 유사기업 검색기"""
+
+    NUMERIC_FEATURES = ('revenue', 'growth_rate_3yr', 'operating_margin', 'net_margin', 'is_listed')
+
+    DEFAULT_WEIGHTS = {
+        'revenue': 1.0,           # log10 매출액 (규모)
+        'growth_rate_3yr': 1.0,
+        'operating_margin': 1.0,
+        'net_margin': 0.5,
+        'is_listed': 0.5,
+        'industry_code': 2.0      # 업종 코드가 다를 때 거리 페널티
+    }
+
+    def __init__(self,
+                 universe: ComparableUniverse,
+                 weights: Optional[Dict[str, float]] = None,
+                 use_tree: bool = True):
+        self.universe = universe
+        self.weights = {**self.DEFAULT_WEIGHTS, **(weights or {})}
+        self.use_tree = use_tree and cKDTree is not None
+        self._version = None
+
+    # ==================== 인덱스 ====================
+
+    @staticmethod
+    def _raw_features(columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """원 특성 → (n, F) 배열 (매출액은 log10)"""
+        revenue = np.asarray(columns['revenue'], dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_revenue = np.where(revenue > 0, np.log10(revenue), np.nan)
+        return np.column_stack([log_revenue] + [
+            np.asarray(columns[name], dtype=float) for name in PeerSelector.NUMERIC_FEATURES[1:]
+        ])
+
+    def _build(self):
+        """유니버스가 바뀌었으면 표준화 통계와 KD-tree 재구축"""
+        if self._version == self.universe.version:
+            return
+
+        self._rows = self.universe.rows()
+        columns = self.universe.columns(self._rows)
+        raw = self._raw_features(columns)
+
+        self._mean = np.nanmean(raw, axis=0)
+        std = np.nanstd(raw, axis=0)
+        self._std = np.where(std > 0, std, 1.0)
+        self._w = np.array([self.weights[name] for name in self.NUMERIC_FEATURES])
+
+        # 누락 특성은 평균(표준화 0)으로 대체
+        self._z = np.nan_to_num((raw - self._mean) / self._std) * self._w
+        self._codes = columns['industry_code']
+
+        self._trees = {}
+        self._global_tree = None
+        if self.use_tree and self._rows.size:
+            self._global_tree = cKDTree(self._z)
+            order = np.argsort(self._codes.astype(str), kind='stable')
+            codes_sorted = self._codes[order]
+            boundaries = np.flatnonzero(codes_sorted[1:] != codes_sorted[:-1]) + 1
+            for members in np.split(order, boundaries):
+                self._trees[self._codes[members[0]]] = (cKDTree(self._z[members]), members)
+
+        self._version = self.universe.version
+
+    def _target_vector(self, company_data: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """대상 기업 → (가중 표준화 벡터, 특성 사용 마스크)"""
+        revenue = company_data.get('revenue')
+        columns = {'revenue': [revenue if revenue is not None else np.nan]}
+        for name in self.NUMERIC_FEATURES[1:]:
+            value = company_data.get(name)
+            if value is None and name in ('operating_margin', 'net_margin') and revenue:
+                income = company_data.get('operating_income' if name == 'operating_margin' else 'net_income')
+                value = income / revenue if income is not None else None
+            columns[name] = [np.nan if value is None else float(value)]
+
+        raw = self._raw_features(columns)[0]
+        present = ~np.isnan(raw)
+        z = np.where(present, (raw - self._mean) / self._std, 0.0) * self._w
+        return z, present
+
+    # ==================== 검색 ====================
+
+    def _search_brute(self, z: np.ndarray, present: np.ndarray, code: str, k: int):
+        """전수 계산 (누락 특성은 거리에서 제외)"""
+        diff = (self._z - z) * present
+        d2 = np.einsum('ij,ij->i', diff, diff) + \
+            (self._codes != code) * self.weights['industry_code'] ** 2
+        k = min(k, d2.size)
+        top = np.argpartition(d2, k - 1)[:k] if k < d2.size else np.arange(d2.size)
+        top = top[np.argsort(d2[top], kind='stable')]
+        return top, np.sqrt(d2[top])
+
+    def _search_tree(self, z: np.ndarray, code: str, k: int):
+        """업종별 KD-tree → 필요 시 전체 KD-tree에서 다른 업종 후보 보완"""
+        penalty2 = self.weights['industry_code'] ** 2
+        candidates_idx, candidates_d2 = [], []
+
+        same_count = 0
+        if code in self._trees:
+            tree, members = self._trees[code]
+            same_count = members.size
+            d, i = tree.query(z, k=min(k, same_count))
+            d, i = np.atleast_1d(d), np.atleast_1d(i)
+            candidates_idx.append(members[i])
+            candidates_d2.append(d ** 2)
+
+        found = candidates_idx[0].size if candidates_idx else 0
+        kth_d2 = candidates_d2[0][-1] if found == k else np.inf
+
+        # 다른 업종 후보: 특성 거리² + 페널티 < 현재 k번째 거리² 인 경우만 의미 있음
+        if kth_d2 > penalty2:
+            radius = np.sqrt(kth_d2 - penalty2) if np.isfinite(kth_d2) else np.inf
+            k_global = min(self._rows.size, k + same_count)
+            d, i = self._global_tree.query(z, k=k_global, distance_upper_bound=radius)
+            d, i = np.atleast_1d(d), np.atleast_1d(i)
+            keep = np.isfinite(d)
+            d, i = d[keep], i[keep]
+            other = self._codes[i] != code
+            candidates_idx.append(i[other])
+            candidates_d2.append(d[other] ** 2 + penalty2)
+
+        idx = np.concatenate(candidates_idx) if candidates_idx else np.array([], dtype=np.int64)
+        d2 = np.concatenate(candidates_d2) if candidates_d2 else np.array([])
+        order = np.argsort(d2, kind='stable')[:k]
+        return idx[order], np.sqrt(d2[order])
+
+    def select(self,
+               company_data: Dict,
+               k: int = 10,
+               exclude: Optional[List[str]] = None) -> List[Dict]:
+        """
+        유사기업 k개 선정
+
+        Args:
+            company_data: 대상 기업 {'revenue', 'growth_rate_3yr', 'operating_margin' (또는
+                          'operating_income'), 'net_margin' (또는 'net_income'), 'is_listed',
+                          'industry_code' (또는 'industry')}
+            k: 선정 기업 수
+            exclude: 제외할 기업명 (대상 기업 자신 등)
+
+        Returns:
+            [
+                {
+                    'name': 'A사', 'ticker': '000000', 'industry': '소프트웨어', 'revenue': 45_000,
+                    'per': 10.0, ...,
+                    'similarity': 78.5,          # 100 / (1 + 거리)
+                    'distance': 0.27,
+                    'distance_contributions': {'revenue': 0.61, 'growth_rate_3yr': 0.22, ...}
+                },
+                ...
+            ]
+            auto_selected 형식으로 HumanApprovalManager에 그대로 전달 가능
+        """
+        self._build()
+        if self._rows.size == 0:
+            return []
+
+        exclude = set(exclude or ())
+        if company_data.get('name'):
+            exclude.add(company_data['name'])
+
+        code = str(company_data.get('industry_code') or company_data.get('industry', ''))
+        z, present = self._target_vector(company_data)
+
+        # 제외 대상이 검색 결과에 섞일 수 있으므로 여유분을 더해 검색
+        k_search = min(self._rows.size, k + len(exclude))
+        if self.use_tree and present.all():
+            idx, distance = self._search_tree(z, code, k_search)
+        else:
+            idx, distance = self._search_brute(z, present, code, k_search)
+
+        selected = []
+        for i, d in zip(idx, distance):
+            record = self.universe.record(self._rows[i])
+            if record['name'] in exclude:
+                continue
+            record.update(self._explain(z, present, code, i, d))
+            selected.append(record)
+            if len(selected) == k:
+                break
+
+        return selected
+
+    def _explain(self, z: np.ndarray, present: np.ndarray, code: str, i: int, distance: float) -> Dict:
+        """특성별 거리 기여 비율 (d² 분해)"""
+        parts = ((self._z[i] - z) * present) ** 2
+        contributions = dict(zip(self.NUMERIC_FEATURES, parts))
+        contributions['industry_code'] = self.weights['industry_code'] ** 2 if self._codes[i] != code else 0.0
+
+        total = distance ** 2
+        return {
+            'similarity': round(100 / (1 + distance), 1),
+            'distance': round(float(distance), 4),
+            'distance_contributions': {
+                name: round(float(value / total), 4) if total > 0 else 0.0
+                for name, value in contributions.items()
+            }
+        }
+
+
+# 테스트
+if __name__ == "__main__":
+    import time
+    from common.human_approval import HumanApprovalManager
+
+    print("=" * 80)
+    print("Nearest-Neighbour Peer Selection")
+    print("=" * 80)
+
+    rng = np.random.default_rng(10)
+    codes = ['J58221', 'J58222', 'C26110', 'C21210', 'G47910', 'J63120', 'C28202', 'J58211']
+    universe = ComparableUniverse.from_records([
+        {
+            'name': f'C{i:05d}',
+            'ticker': f'{100000 + i}',
+            'industry': code,
+            'industry_code': code,
+            'revenue': float(rng.lognormal(11, 1.5)),
+            'growth_rate_3yr': float(rng.normal(0.10, 0.12)),
+            'operating_margin': float(rng.normal(0.08, 0.08)),
+            'net_margin': float(rng.normal(0.05, 0.07)),
+            'is_listed': bool(rng.random() > 0.3),
+            'per': float(rng.lognormal(2.4, 0.5)),
+            'psr': float(rng.lognormal(0.8, 0.7))
+        }
+        for i, code in enumerate(rng.choice(codes, 5_000))
+    ])
+
+    target = {
+        'name': '테크밸리',
+        'industry_code': 'J58221',
+        'revenue': 50_000,
+        'growth_rate_3yr': 0.25,
+        'operating_income': 8_000,
+        'net_income': 6_000,
+        'is_listed': False
+    }
+
+    tree_selector = PeerSelector(universe)
+    brute_selector = PeerSelector(universe, use_tree=False)
+
+    peers = tree_selector.select(target, k=10)
+    brute = brute_selector.select(target, k=10)
+    assert [p['name'] for p in peers] == [p['name'] for p in brute]
+    print(f"\nKD-tree 결과 = 전수 계산 결과 ({len(universe):,}개 후보 중 10개)")
+
+    print(f"\n{'기업':<8} {'업종':<8} {'매출액':>10} {'성장률':>7} {'영업이익률':>9} {'유사도':>6}  주요 거리 요인")
+    for peer in peers:
+        top = sorted(peer['distance_contributions'].items(), key=lambda kv: -kv[1])[:2]
+        reasons = ', '.join(f"{name} {share:.0%}" for name, share in top)
+        print(f"{peer['name']:<8} {peer['industry']:<8} {peer['revenue']:>10,.0f} "
+              f"{peer['growth_rate_3yr']:>7.1%} {peer['operating_margin']:>9.1%} {peer['similarity']:>6}  {reasons}")
+
+    # 누락 특성 (전수 계산 경로)
+    partial = tree_selector.select({'industry_code': 'C26110', 'revenue': 300_000}, k=3)
+    print(f"\n매출액만 있는 대상: {[p['name'] for p in partial]}")
+
+    for label, selector in (("KD-tree", tree_selector), ("전수 계산", brute_selector)):
+        start = time.perf_counter()
+        for _ in range(200):
+            selector.select(target, k=10)
+        print(f"{label}: {(time.perf_counter() - start) / 200 * 1e3:.3f} ms/회")
+
+    # 승인 요청으로 전달
+    manager = HumanApprovalManager()
+    point = manager.request_comparable_companies_approval(peers)
+    print(f"\n승인 요청: {point.name} ({point.context['total_count']}개, "
+          f"평균 유사도 {point.context['avg_similarity']:.1f})")
+    print("=" * 80)
@@ -6,9 +6,13 @@ Market Approach - PER, PBR, PSR, EV/EBITDA
 핵심 질문: "시장은 유사 기업을 얼마라고 평가할까?"
 """
 
+import sys
+sys.path.append('..')
+
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import statistics
+from relative.comparable_universe import ComparableUniverse
 
 
 @dataclass
@@ -25,8 +29,14 @@ class ValuationResult:
 class RelativeValuationEngine:
     """상대가치평가법 엔진"""
 
-    def __init__(self):
+    def __init__(self, universe: Optional[ComparableUniverse] = None):
+        """
+        Args:
+            universe: 비교기업 유니버스. 비교기업·업종 배수가 주어지지 않으면
+                      대상 기업의 업종·규모 구간 벤치마크를 여기서 조회
+        """
         self.results: List[ValuationResult] = []
+        self.universe = universe
 
     def run_valuation(self,
                      company_data: Dict,
@@ -51,6 +61,10 @@ class RelativeValuationEngine:
         """
         results = {}
 
+        # 0. 유니버스 벤치마크 (미리 계산된 업종·규모 구간 통계)
+        if not comparable_companies and not industry_benchmarks and self.universe is not None:
+            industry_benchmarks = self.universe.benchmark_for(company_data)
+
         # 1. PER 평가 (흑자 기업만)
         if company_data.get('net_income', 0) > 0:
             results['per_valuation'] = self.calculate_per_valuation(
@@ -343,9 +357,7 @@ class RelativeValuationEngine:
         if len(data) < 4:
             return data
 
-        sorted_data = sorted(data)
-        q1 = statistics.quantiles(sorted_data, n=4)[0]  # 25%
-        q3 = statistics.quantiles(sorted_data, n=4)[2]  # 75%
+        q1, _, q3 = statistics.quantiles(data, n=4)  # 25%, 50%, 75%
         iqr = q3 - q1
 
         lower_bound = q1 - 1.5 * iqr
@@ -484,4 +496,14 @@ if __name__ == "__main__":
     print(f"  사용 방법: {', '.join(integrated['methods_used'])}")
     print(f"  가중치: {integrated['weights']}")
 
+    # 유니버스 벤치마크 사용 (비교기업 목록 없이 업종·규모 구간 통계 조회)
+    universe = ComparableUniverse.from_records([
+        {**c, "name": f"{c['name']}{i}", "industry": "소프트웨어", "revenue": 40_000 + 1_000 * i}
+        for i in range(4) for c in comparables
+    ])
+    universe_results = RelativeValuationEngine(universe=universe).run_valuation(company_data)
+    print(f"\n[유니버스 벤치마크]")
+    print(f"  PER 배수: {universe_results['per_valuation']['multiple_used']}배")
+    print(f"  최종 기업가치: {universe_results['integrated']['equity_value']:,}백만원")
+
     print("\n" + "=" * 60)
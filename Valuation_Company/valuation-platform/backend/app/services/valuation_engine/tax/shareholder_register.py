@@ -0,0 +1,334 @@
+"""
+주주명부 일괄 평가 (Shareholder Register Bulk Valuation)
+
+상속·증여 평가에서 주주명부 전체(수천 명)의 주주별 평가액과 과세가액을 산출
+- 기본가치(순손익가치 × 3 + 순자산가치 × 2) ÷ 5는 회사 단위로 1회만 계산
+- 주주 유형(지분율 구간) / 지배주주 할증 / 소액주주 할인 / 유동성 할인은 전 주주에 배열 연산으로 적용
+- 주주별 할인율 입력(NaN = 지분율 구간 권장값)과 지배주주 여부 지정 지원
+- 결과는 컬럼형 배열, 또는 청크 단위 CSV 스트리밍 (대형 명부도 결과 Dict를 만들지 않음)
+- 계산 규칙과 반올림은 InheritanceTaxLawEngine.generate_full_report와 동일
+
+Author: Valuation Engine Team
+Date: 2026-10-18
+"""
+
+import sys
+sys.path.append('..')
+
+import csv
+from typing import Dict, Iterable, Iterator, Optional, TextIO, Union
+
+import numpy as np
+from tax.tax_law_engine import InheritanceTaxLawEngine
+
+
+class ShareholderRegisterValuation:
+    """주주명부 일괄 상증세법 평가"""
+
+    # determine_shareholder_type의 지분율 구간 경계 (이상 기준)
+    TIER_BOUNDS = (0.10, 0.30, 0.50)
+    CONTROLLING_PREMIUM = 0.20
+    UNLISTED_MARKETABILITY_DISCOUNT = 0.20
+
+    OUTPUT_COLUMNS = ('holder_id', 'ownership_ratio', 'shares', 'shareholder_type', 'controlling_premium',
+                      'minority_discount', 'marketability_discount', 'itl_value', 'value_per_share',
+                      'taxable_value')
+
+    def __init__(self, engine: Optional[InheritanceTaxLawEngine] = None):
+        self.engine = engine or InheritanceTaxLawEngine()
+
+        # 구간별 유형/권장 할인율은 스칼라 엔진 규칙에서 가져옴 (규칙 변경 시 자동 반영)
+        tiers = [self.engine.determine_shareholder_type(r) for r in (0.0,) + self.TIER_BOUNDS]
+        self._tier_types = np.array([t['type'] for t in tiers], dtype=object)
+        self._tier_control = np.array([t['controlling_premium'] for t in tiers])
+        self._tier_discount = np.array([t['recommended_minority_discount'] for t in tiers])
+
+    # ==================== 입력 ====================
+
+    @staticmethod
+    def _column(register: Dict, key: str, n: int, default=np.nan) -> np.ndarray:
+        value = register.get(key)
+        if value is None:
+            return np.full(n, default, dtype=float)
+        return np.broadcast_to(np.asarray(value, dtype=float), (n,))
+
+    @staticmethod
+    def read_register_csv(path: str, chunk_size: int = 50_000,
+                          encoding: str = 'utf-8-sig') -> Iterator[Dict[str, np.ndarray]]:
+        """
+        주주명부 CSV를 청크 단위 컬럼형 Dict로 읽기
+
+        컬럼: holder_id, ownership_ratio 또는 shares, (선택) minority_discount,
+              marketability_discount, controlling_premium (1/0) — 빈 값은 NaN
+        """
+        with open(path, encoding=encoding, newline='') as f:
+            reader = csv.DictReader(f)
+            numeric = [c for c in reader.fieldnames if c != 'holder_id']
+            rows = []
+            for row in reader:
+                rows.append(row)
+                if len(rows) == chunk_size:
+                    yield ShareholderRegisterValuation._to_columns(rows, numeric)
+                    rows = []
+            if rows:
+                yield ShareholderRegisterValuation._to_columns(rows, numeric)
+
+    @staticmethod
+    def _to_columns(rows, numeric) -> Dict[str, np.ndarray]:
+        columns = {'holder_id': np.array([r.get('holder_id', '') for r in rows], dtype=object)}
+        for name in numeric:
+            columns[name] = np.array([float(r[name]) if r[name] not in ('', None) else np.nan for r in rows])
+        return columns
+
+    # ==================== 평가 ====================
+
+    def base_value(self, net_income_3yr: float, net_assets: float) -> Dict:
+        """회사 단위 기본가치 (1회 계산)"""
+        return self.engine.calculate_base_value(net_income_3yr, net_assets)
+
+    def value_holders(self,
+                      base_value: float,
+                      shares_outstanding: int,
+                      register: Dict,
+                      is_listed: bool = False) -> Dict[str, np.ndarray]:
+        """
+        주주별 평가 (배열 연산 1회)
+
+        Args:
+            base_value: 할증/할인 전 기본가치 (백만원, base_value()의 'base_value')
+            shares_outstanding: 발행주식수
+            register: 주주명부 컬럼 (N,)
+                {
+                    'holder_id': [...],
+                    'ownership_ratio': [...] 또는 'shares': [...],
+                    'minority_discount': [...],  # 선택, NaN = 지분율 구간 권장값
+                    'marketability_discount': [...],  # 선택, NaN = 상장 0% / 비상장 20%
+                    'controlling_premium': [...]  # 선택 (1/0), NaN = 지분율 50% 이상 여부
+                }
+            is_listed: 상장 여부 (유동성 할인 기본값 결정)
+
+        Returns:
+            Dict: OUTPUT_COLUMNS 키의 (N,) 배열
+                itl_value(백만원, 해당 주주 관점의 기업 평가액), value_per_share(원),
+                taxable_value(백만원, 주당가치 × 보유주식수)
+        """
+        if 'shares' in register:
+            shares = np.asarray(register['shares'], dtype=float)
+            ownership = shares / shares_outstanding
+        else:
+            ownership = np.asarray(register['ownership_ratio'], dtype=float)
+            shares = ownership * shares_outstanding
+        n = ownership.shape[0]
+
+        tier = np.searchsorted(self.TIER_BOUNDS, ownership, side='right')
+
+        control = self._column(register, 'controlling_premium', n)
+        control = np.where(np.isnan(control), self._tier_control[tier], control != 0)
+
+        minority = self._column(register, 'minority_discount', n)
+        minority = np.where(np.isnan(minority), self._tier_discount[tier], minority)
+        minority = np.where(control, 0.0, minority)  # 지배주주는 소액주주 할인 없음
+
+        default_marketability = 0.0 if is_listed else self.UNLISTED_MARKETABILITY_DISCOUNT
+        marketability = self._column(register, 'marketability_discount', n)
+        marketability = np.where(np.isnan(marketability), default_marketability, marketability)
+
+        # 스칼라 엔진과 같은 순서로 가감 (반올림 경계에서 결과가 갈리지 않도록)
+        final_value = (base_value + base_value * np.where(control, self.CONTROLLING_PREMIUM, 0.0)
+                       - base_value * minority - base_value * marketability)
+
+        # generate_full_report와 같은 반올림: 평가액 → 주당가치 순
+        itl_value = np.round(final_value, 0)
+        value_per_share = np.round(itl_value * 1_000_000 / shares_outstanding, 0)
+
+        return {
+            'holder_id': np.asarray(register.get('holder_id', np.arange(n)), dtype=object),
+            'ownership_ratio': ownership,
+            'shares': shares,
+            'shareholder_type': self._tier_types[tier],
+            'controlling_premium': control.astype(bool),
+            'minority_discount': minority,
+            'marketability_discount': marketability,
+            'itl_value': itl_value,
+            'value_per_share': value_per_share,
+            'taxable_value': value_per_share * shares / 1_000_000
+        }
+
+    def run_valuation(self,
+                      net_income_3yr: float,
+                      net_assets: float,
+                      shares_outstanding: int,
+                      register: Dict,
+                      is_listed: bool = False) -> Dict:
+        """
+        주주명부 전체 평가 (메모리 내 결과)
+
+        Returns:
+            {
+                'base': base_value() 결과,
+                'holders': value_holders() 결과,
+                'summary': summarize() 결과
+            }
+        """
+        base = self.base_value(net_income_3yr, net_assets)
+        holders = self.value_holders(base['base_value'], shares_outstanding, register, is_listed)
+        summary = self.summarize([holders])
+        return {'base': base, 'holders': holders, 'summary': summary}
+
+    # ==================== 요약 / 스트리밍 ====================
+
+    def summarize(self, chunks: Iterable[Dict[str, np.ndarray]], summary: Optional[Dict] = None) -> Dict:
+        """
+        주주 유형별 인원 / 보유주식 / 과세가액 합계
+
+        Args:
+            chunks: value_holders() 결과 이터러블
+            summary: 이어서 누적할 기존 요약 (스트리밍용)
+
+        Returns:
+            {'holders': int, 'shares': float, 'taxable_value': float,
+             'by_type': {유형: {'holders', 'shares', 'taxable_value'}}}
+        """
+        summary = summary or {'holders': 0, 'shares': 0.0, 'taxable_value': 0.0,
+                               'by_type': {t: {'holders': 0, 'shares': 0.0, 'taxable_value': 0.0}
+                                           for t in self._tier_types}}
+        for chunk in chunks:
+            summary['holders'] += int(chunk['shares'].shape[0])
+            summary['shares'] += float(chunk['shares'].sum())
+            summary['taxable_value'] += float(chunk['taxable_value'].sum())
+            for label in self._tier_types:
+                mask = chunk['shareholder_type'] == label
+                bucket = summary['by_type'][label]
+                bucket['holders'] += int(mask.sum())
+                bucket['shares'] += float(chunk['shares'][mask].sum())
+                bucket['taxable_value'] += float(chunk['taxable_value'][mask].sum())
+        return summary
+
+    def write_csv(self,
+                  net_income_3yr: float,
+                  net_assets: float,
+                  shares_outstanding: int,
+                  registers: Union[Dict, Iterable[Dict]],
+                  output: Union[str, TextIO],
+                  is_listed: bool = False) -> Dict:
+        """
+        주주별 결과를 CSV로 스트리밍 (청크별 계산 → 즉시 기록, 요약만 반환)
+
+        Args:
+            registers: 주주명부 컬럼 Dict 1개 또는 청크 이터레이터 (read_register_csv 결과 등)
+            output: 파일 경로 또는 쓰기 가능한 텍스트 스트림
+
+        Returns:
+            {'base': 기본가치, 'summary': summarize() 결과}
+        """
+        base = self.base_value(net_income_3yr, net_assets)
+        chunks = [registers] if isinstance(registers, dict) else registers
+
+        stream = open(output, 'w', encoding='utf-8-sig', newline='') if isinstance(output, str) else output
+        try:
+            writer = csv.writer(stream)
+            writer.writerow(self.OUTPUT_COLUMNS)
+            summary = None
+            for register in chunks:
+                result = self.value_holders(base['base_value'], shares_outstanding, register, is_listed)
+                summary = self.summarize([result], summary)
+                writer.writerows(zip(
+                    result['holder_id'],
+                    np.round(result['ownership_ratio'], 8).tolist(),
+                    np.round(result['shares'], 4).tolist(),
+                    result['shareholder_type'],
+                    result['controlling_premium'].astype(int).tolist(),
+                    result['minority_discount'].tolist(),
+                    result['marketability_discount'].tolist(),
+                    result['itl_value'].tolist(),
+                    result['value_per_share'].tolist(),
+                    np.round(result['taxable_value'], 6).tolist()
+                ))
+        finally:
+            if isinstance(output, str):
+                stream.close()
+
+        return {'base': base, 'summary': summary or self.summarize([])}
+
+
+if __name__ == "__main__":
+    import io
+    import os
+    import tempfile
+    import time
+
+    print("=" * 80)
+    print("주주명부 일괄 평가 테스트")
+    print("=" * 80)
+
+    net_income_3yr = 35_000
+    net_assets = 60_000
+    shares_outstanding = 1_000_000
+
+    # 지분율 합계 100%: 대주주 2명 + 소액주주 다수
+    rng = np.random.default_rng(5)
+    n = 50_000
+    minor = rng.dirichlet(np.ones(n - 2)) * 0.25
+    ownership = np.concatenate([[0.55, 0.20], minor])
+    register = {
+        'holder_id': np.array([f"H{i:06d}" for i in range(n)], dtype=object),
+        'ownership_ratio': ownership,
+        'minority_discount': np.where(rng.random(n) < 0.01, 0.15, np.nan)  # 일부 개별 할인율
+    }
+
+    valuator = ShareholderRegisterValuation()
+    start = time.perf_counter()
+    result = valuator.run_valuation(net_income_3yr, net_assets, shares_outstanding, register)
+    elapsed = time.perf_counter() - start
+
+    # 스칼라 엔진과 비교 (개별 할인율 없는 주주)
+    engine = InheritanceTaxLawEngine()
+    holders = result['holders']
+    checked = 0
+    for i in list(range(5)) + list(range(n - 5, n)):
+        if not np.isnan(register['minority_discount'][i]):
+            continue
+        report = engine.generate_full_report(net_income_3yr, net_assets, shares_outstanding, ownership[i])
+        assert report['shareholder_type'] == holders['shareholder_type'][i]
+        assert report['itl_value'] == holders['itl_value'][i]
+        assert report['value_per_share'] == holders['value_per_share'][i]
+        checked += 1
+    print(f"generate_full_report와 {checked}건 일치")
+
+    start_loop = time.perf_counter()
+    for i in range(500):
+        engine.generate_full_report(net_income_3yr, net_assets, shares_outstanding, ownership[i])
+    loop = (time.perf_counter() - start_loop) / 500 * n
+    print(f"\n주주 {n:,}명 평가: {elapsed * 1000:.1f} ms (주주별 반복 추정 {loop * 1000:,.0f} ms)")
+
+    summary = result['summary']
+    print(f"\n기본가치: {result['base']['base_value']:,.0f}백만원")
+    print(f"총 과세가액: {summary['taxable_value']:,.0f}백만원 ({summary['shares']:,.0f}주)")
+    for label, bucket in summary['by_type'].items():
+        print(f"  {label:<10} {bucket['holders']:>7,}명  {bucket['taxable_value']:>12,.0f}백만원")
+
+    # CSV 스트리밍: 명부 CSV → 청크별 결과 CSV
+    with tempfile.TemporaryDirectory() as tmp:
+        register_csv = os.path.join(tmp, 'register.csv')
+        with open(register_csv, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['holder_id', 'ownership_ratio', 'minority_discount'])
+            for i in range(n):
+                discount = register['minority_discount'][i]
+                writer.writerow([register['holder_id'][i], repr(float(ownership[i])),
+                                 '' if np.isnan(discount) else discount])
+
+        output_csv = os.path.join(tmp, 'valuation.csv')
+        start = time.perf_counter()
+        streamed = valuator.write_csv(net_income_3yr, net_assets, shares_outstanding,
+                                      ShareholderRegisterValuation.read_register_csv(register_csv, chunk_size=10_000),
+                                      output_csv)
+        print(f"\nCSV 스트리밍 (청크 10,000명): {(time.perf_counter() - start) * 1000:.0f} ms, "
+              f"{os.path.getsize(output_csv) / 1024:,.0f} KiB")
+        assert abs(streamed['summary']['taxable_value'] - summary['taxable_value']) < 1e-6 * summary['taxable_value']
+
+    buffer = io.StringIO()
+    valuator.write_csv(net_income_3yr, net_assets, shares_outstanding,
+                       {k: v[:3] for k, v in register.items()}, buffer)
+    print("\n" + buffer.getvalue().strip())
+    print("=" * 80)
@@ -45,17 +45,12 @@ class InheritanceTaxLawEngine:
             }
         """
 
-        # 1. 순손익가치 계산
-        # 순손익가치 = (최근 3년 순손익 합계 / 3) × 3 / 0.10
-        # = 평균 순손익 × 30
-        avg_net_income = net_income_3yr / 3
-        income_value = avg_net_income * 3 / 0.10  # 할인율 10% 적용
-
-        # 2. 순자산가치
-        asset_value = net_assets
-
-        # 3. 가중평균 (순손익가치 × 3, 순자산가치 × 2)
-        base_value = (income_value * 3 + asset_value * 2) / 5
+        # 1~3. 순손익가치 / 순자산가치 / 가중평균
+        base = self.calculate_base_value(net_income_3yr, net_assets)
+        avg_net_income = base['avg_net_income']
+        income_value = base['income_value']
+        asset_value = base['asset_value']
+        base_value = base['base_value']
 
         # 4. 할증/할인 적용
         adjustments = []
@@ -106,6 +101,36 @@ class InheritanceTaxLawEngine:
             'formula': f'({income_value:,.0f} × 3 + {asset_value:,.0f} × 2) ÷ 5'
         }
 
+    def calculate_base_value(self, net_income_3yr: float, net_assets: float) -> Dict:
+        """
+        할증/할인 전 기본가치 (반올림 전)
+
+        Args:
+            net_income_3yr: 최근 3년 순손익 합계 (백만원)
+            net_assets: 순자산 장부가액 (백만원)
+
+        Returns:
+            {'avg_net_income', 'income_value', 'asset_value', 'base_value'}
+        """
+        # 1. 순손익가치 계산
+        # 순손익가치 = (최근 3년 순손익 합계 / 3) × 3 / 0.10
+        # = 평균 순손익 × 30
+        avg_net_income = net_income_3yr / 3
+        income_value = avg_net_income * 3 / 0.10  # 할인율 10% 적용
+
+        # 2. 순자산가치
+        asset_value = net_assets
+
+        # 3. 가중평균 (순손익가치 × 3, 순자산가치 × 2)
+        base_value = (income_value * 3 + asset_value * 2) / 5
+
+        return {
+            'avg_net_income': avg_net_income,
+            'income_value': income_value,
+            'asset_value': asset_value,
+            'base_value': base_value
+        }
+
     def calculate_value_per_share(self, itl_value: float, shares_outstanding: int) -> float:
         """
         주당 가치 계산
@@ -11,11 +11,7 @@ from datetime import datetime
 import asyncio
 
 from app.db.supabase_client import supabase_client
-from app.services.valuation_engine.dcf.dcf_engine import DCFEngine
-from app.services.valuation_engine.relative.relative_engine import RelativeValuationEngine
-from app.services.valuation_engine.intrinsic.intrinsic_value_engine import CapitalMarketLawEngine
-from app.services.valuation_engine.asset.asset_engine import AssetValuationEngine
-from app.services.valuation_engine.tax.tax_law_engine import InheritanceTaxLawEngine
+from app.services.valuation_engine.engine_registry import engine_registry
 
 
 class ValuationOrchestrator:
@@ -59,20 +55,12 @@ class ValuationOrchestrator:
         self.supabase = supabase_client
 
     def _load_engine(self):
-        """평가 방법에 따라 적절한 엔진 로드"""
-        engines = {
-            'dcf': DCFEngine(),
-            'relative': RelativeValuationEngine(),
-            'intrinsic': CapitalMarketLawEngine(),
-            'asset': AssetValuationEngine(),
-            'inheritance_tax': InheritanceTaxLawEngine()
-        }
-
-        engine = engines.get(self.method)
-        if not engine:
-            raise ValueError(f"Unknown valuation method: {self.method}")
+        """
+        평가 방법에 해당하는 엔진 조회
 
-        return engine
+        엔진은 레지스트리에서 처음 사용될 때만 import / 생성되고 프로세스 안에서 재사용된다.
+        """
+        return engine_registry.get(self.method)
 
     async def start_valuation(self) -> Dict:
         """
@@ -177,36 +165,8 @@ class ValuationOrchestrator:
                 'next_step': 7
             }
         """
-        # 1. 평가 실행
-        if self.method == 'dcf':
-            result = self.engine.run_valuation(inputs)
-        elif self.method == 'relative':
-            result = self.engine.run_valuation(
-                company_data=inputs.get('company_data'),
-                comparable_companies=inputs.get('comparable_companies'),
-                industry_benchmarks=inputs.get('industry_benchmarks')
-            )
-        elif self.method == 'intrinsic':
-            result = self.engine.run_valuation(
-                asset_value=inputs.get('asset_value'),
-                income_value=inputs.get('income_value'),
-                purpose=inputs.get('purpose', '합병')
-            )
-        elif self.method == 'asset':
-            result = self.engine.run_valuation(
-                balance_sheet=inputs.get('balance_sheet'),
-                fair_value_data=inputs.get('fair_value_data')
-            )
-        elif self.method == 'inheritance_tax':
-            result = self.engine.run_valuation(
-                net_income_3yr=inputs.get('net_income_3yr'),
-                net_assets=inputs.get('net_assets'),
-                controlling_premium=inputs.get('controlling_premium', False),
-                minority_discount=inputs.get('minority_discount', 0.0),
-                marketability_discount=inputs.get('marketability_discount', 0.0)
-            )
-        else:
-            raise ValueError(f"Unsupported method: {self.method}")
+        # 1. 평가 실행 (평가법별 입력 매핑은 레지스트리 어댑터가 담당)
+        result = self.engine.evaluate(inputs)
 
         # 2. 결과를 DB에 저장
         await self._save_valuation_result(result)
@@ -9,6 +9,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
+from app.core.response_cache import response_cache, COMPANIES, NEWS, COLLECTIONS
 from app.db.supabase_client import supabase_client
 from app.services.news_crawler import CrawlerManager, CrawledNews
 from app.services.news_parser import NewsParser
@@ -86,6 +87,8 @@ class WeeklyCollector:
             "started_at": now.isoformat()
         })
 
+        await response_cache.invalidate(COLLECTIONS)
+
         if result and isinstance(result, dict) and "id" in result:
             self.collection_id = result["id"]
             logger.info(f"Created collection record: {self.collection_id}")
@@ -95,13 +98,22 @@ class WeeklyCollector:
     async def _complete_collection(self, success: bool) -> None:
         """수집 작업 완료 처리"""
         if self.collection_id:
-            await supabase_client.update("weekly_collections", self.collection_id, {
+            await supabase_client.update("weekly_collections", {
                 "status": "completed" if success else "failed",
                 "completed_at": datetime.utcnow().isoformat(),
                 "total_news_collected": self.stats["news_crawled"],
                 "new_companies_found": self.stats["new_companies"],
                 "error_log": str(self.stats["errors"]) if self.stats["errors"] else None
-            })
+            }, {"id": self.collection_id})
+
+        # 대시보드 요약 통계 재계산 (트리거 증분 갱신의 드리프트 보정)
+        try:
+            await supabase_client.refresh_dashboard_stats()
+        except Exception as e:
+            logger.warning(f"Dashboard stats refresh failed: {e}")
+
+        # 수집으로 바뀐 기업 / 뉴스 / 수집 이력 조회 응답 무효화
+        await response_cache.invalidate(COMPANIES, NEWS, COLLECTIONS)
 
     async def _crawl_news(
         self,
@@ -247,7 +259,7 @@ class WeeklyCollector:
 
         result = await supabase_client.insert("startup_companies", {
             "name_ko": company_name,
-            "investment_stage": stage,
+            "latest_stage": stage,
             "total_funding_krw": amount
         })
 
@@ -282,7 +294,7 @@ class WeeklyCollector:
                     update_data["name_en"] = extracted.company_name_en
 
                 if update_data:
-                    await supabase_client.update("startup_companies", company_id, update_data)
+                    await supabase_client.update("startup_companies", update_data, {"id": company_id})
 
             return company_id
 
@@ -298,14 +310,14 @@ class WeeklyCollector:
             if extracted.sub_industry:
                 company_data["sub_industry"] = extracted.sub_industry
             if extracted.investment_stage:
-                company_data["investment_stage"] = extracted.investment_stage
+                company_data["latest_stage"] = extracted.investment_stage
             if extracted.investment_amount_krw:
                 company_data["total_funding_krw"] = extracted.investment_amount_krw * 100_000_000  # 억원 → 원
             if extracted.valuation_post_krw:
                 company_data["latest_valuation_krw"] = extracted.valuation_post_krw * 100_000_000
         else:
             # Fallback: regex 추출
-            company_data["investment_stage"] = self._extract_stage(news.title)
+            company_data["latest_stage"] = self._extract_stage(news.title)
             amount = self._extract_amount(news.title)
             if amount:
                 company_data["total_funding_krw"] = amount
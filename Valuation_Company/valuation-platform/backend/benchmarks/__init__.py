@@ -0,0 +1,10 @@
+"""
+Valuation Engine Benchmarks
+
+- fixtures: validation/sample_inputs → 엔진 입력 변환
+- engine_benchmark: 엔진 / 통합 평가 서비스 처리량·지연시간·메모리 측정 및 기준선 비교
+- db_load_test: 동기 Session vs AsyncSession 동시 처리량 비교 (SQLite 대역 / 로컬 PostgreSQL)
+- postgrest_stub: PostgREST 호환 인메모리 스텁 서버 (SupabaseClient 검증용)
+- supabase_client_check: SupabaseClient 풀링 / 재시도 / 커서 페이지네이션 / 대시보드 통계 검증 및 부하 비교
+- response_cache_check: 투자 트래커 응답 캐시 적중 / 무효화 / stale-while-revalidate 검증 및 부하 비교
+"""
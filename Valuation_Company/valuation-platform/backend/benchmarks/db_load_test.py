@@ -0,0 +1,295 @@
+"""
+DB 세션 부하 테스트 (동기 Session vs AsyncSession)
+
+async def 핸들러에서 동기 Session을 쓰면 쿼리마다 이벤트 루프가 막혀 동시 요청이 직렬화된다.
+같은 조회 엔드포인트(관리자 전체 프로젝트 조회: COUNT + 페이지 조회)를
+- before: 마이그레이션 전 방식 (동기 Session, db.query)
+- after : routers/admin_router.py 실제 핸들러 (AsyncSession)
+로 띄워 동시성 단계별 처리량 / 지연시간을 비교
+
+SQLite 대역을 쓸 때는 --rtt-ms로 쿼리당 네트워크 왕복 지연을 흉내 낸다
+(SQLite trace 콜백에서 sleep → 동기 드라이버는 이벤트 루프 스레드에서, aiosqlite는 워커 스레드에서 대기).
+로컬 PostgreSQL을 쓰면 실제 왕복 지연이 있으므로 --rtt-ms 0 권장.
+
+동시성이 풀 용량(pool_size + max_overflow = 30)을 넘으면 before는 풀 대기 중 루프가 멈춰
+세션 반납도 진행되지 않으므로 POOL_TIMEOUT 후 오류 응답으로 집계된다.
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.db_load_test                                   # SQLite 대역, 왕복 2ms
+    python -m benchmarks.db_load_test --concurrency 1,16,64 --requests 800
+    python -m benchmarks.db_load_test --database-url postgresql://user:pw@localhost/valuation_bench --rtt-ms 0
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+from fastapi import APIRouter, Depends, FastAPI
+from sqlalchemy import JSON, create_engine, event
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.util import await_only
+
+from auth import User, get_admin_user
+from database import get_async_db, to_async_url
+from models import Base
+from models.project import Project
+from routers import admin_router
+
+ENDPOINT = "/api/admin/projects?limit=20"
+POOL_SIZE = 10
+MAX_OVERFLOW = 20
+POOL_TIMEOUT = 5
+
+
+# ==================== 테스트 DB ====================
+
+def use_sqlite_types():
+    """SQLite 대역용: PostgreSQL 전용 타입(ARRAY, JSONB) 컬럼을 JSON으로 대체 (이 프로세스의 메타데이터만)"""
+    for table in Base.metadata.tables.values():
+        for column in table.columns:
+            if isinstance(column.type, (ARRAY, JSONB)):
+                column.type = JSON()
+
+
+def install_rtt(sync_engine, rtt_ms: float, is_async: bool):
+    """SQLite 문장 실행마다 rtt_ms만큼 대기 (문장을 실행하는 스레드에서)"""
+    if rtt_ms <= 0:
+        return
+    delay = rtt_ms / 1000.0
+
+    def on_statement(_sql):
+        time.sleep(delay)
+
+    @event.listens_for(sync_engine, "connect")
+    def _connect(dbapi_connection, _record):
+        if is_async:
+            await_only(dbapi_connection.driver_connection.set_trace_callback(on_statement))
+        else:
+            dbapi_connection.set_trace_callback(on_statement)
+
+
+def seed(sync_engine, n_projects: int):
+    """projects 테이블 생성 + 더미 프로젝트 적재"""
+    Base.metadata.drop_all(bind=sync_engine, tables=[Project.__table__])
+    Base.metadata.create_all(bind=sync_engine, tables=[Project.__table__])
+    statuses = ["requested", "quote_sent", "negotiating", "approved", "evaluating"]
+    with Session(sync_engine) as db:
+        db.add_all([
+            Project(
+                project_id=f"BENCH-{i:05d}",
+                status=statuses[i % len(statuses)],
+                company_name_kr=f"벤치마크{i}",
+                company_name_en=f"Bench {i}",
+                business_number=f"{i:010d}",
+                ceo_name="홍길동",
+                industry="제조업",
+                founded_date=date(2010, 1, 1),
+                contact_name="담당자",
+                contact_email=f"bench{i}@example.com",
+                contact_phone="02-0000-0000",
+                valuation_methods=["dcf", "relative"],
+                valuation_purpose="MA",
+                valuation_date=date(2026, 6, 30)
+            )
+            for i in range(n_projects)
+        ])
+        db.commit()
+
+
+# ==================== before / after 앱 ====================
+
+def build_sync_app(session_factory) -> FastAPI:
+    """마이그레이션 전 방식: async def 핸들러 + 동기 Session"""
+    router = APIRouter(prefix="/admin")
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @router.get("/projects")
+    async def list_all_projects(skip: int = 0, limit: int = 100, status: str = None,
+                                db: Session = Depends(get_db)):
+        query = db.query(Project)
+        if status:
+            query = query.filter(Project.status == status)
+        total = query.count()
+        projects = query.offset(skip).limit(limit).all()
+        return {
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "projects": [
+                {
+                    "project_id": p.project_id,
+                    "company_name_kr": p.company_name_kr,
+                    "status": p.status,
+                    "valuation_methods": p.valuation_methods,
+                    "created_at": p.created_at,
+                    "assigned_accountant": p.assigned_accountant
+                }
+                for p in projects
+            ]
+        }
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return app
+
+
+def build_async_app(session_factory) -> FastAPI:
+    """마이그레이션 후: 실제 관리자 라우터 (AsyncSession), 인증 / 세션 의존성만 교체"""
+    async def get_bench_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(admin_router.router, prefix="/api")
+    app.dependency_overrides[get_async_db] = get_bench_db
+    app.dependency_overrides[get_admin_user] = lambda: User(user_id="bench", email="bench@example.com", role="admin")
+    return app
+
+
+# ==================== 부하 발생 ====================
+
+async def run_load(app: FastAPI, n_requests: int, concurrency: int) -> Dict[str, Any]:
+    """
+    ASGI 인프로세스 부하 발생 (서버와 같은 이벤트 루프 → 루프 블로킹이 그대로 드러남)
+
+    Returns:
+        {'concurrency': int, 'requests': int, 'errors': int,
+         'rps': float, 'p50_ms': float, 'p95_ms': float, 'max_ms': float}
+    """
+    latencies: List[float] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(n_requests):
+        queue.put_nowait(None)
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            nonlocal errors
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                start = time.perf_counter()
+                response = await client.get(ENDPOINT)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        # 워밍업 (커넥션 풀 / 라우트 초기화)
+        await client.get(ENDPOINT)
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'concurrency': concurrency,
+        'requests': n_requests,
+        'errors': errors,
+        'rps': round(n_requests / elapsed, 1),
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(latencies[int(0.95 * (len(latencies) - 1))], 2),
+        'max_ms': round(latencies[-1], 2)
+    }
+
+
+async def compare(database_url: str, levels: List[int], n_requests: int, rtt_ms: float) -> List[Dict[str, Any]]:
+    is_sqlite = database_url.startswith("sqlite")
+    pool_args = {'pool_size': POOL_SIZE, 'max_overflow': MAX_OVERFLOW, 'pool_timeout': POOL_TIMEOUT,
+                 'pool_pre_ping': True}
+
+    sync_engine = create_engine(database_url, **pool_args)
+    async_engine = create_async_engine(to_async_url(database_url), **pool_args)
+    if is_sqlite:
+        install_rtt(sync_engine, rtt_ms, is_async=False)
+        install_rtt(async_engine.sync_engine, rtt_ms, is_async=True)
+
+    sync_app = build_sync_app(sessionmaker(bind=sync_engine, autoflush=False))
+    async_app = build_async_app(async_sessionmaker(bind=async_engine, expire_on_commit=False, autoflush=False))
+
+    rows = []
+    try:
+        for level in levels:
+            before = await run_load(sync_app, n_requests, level)
+            after = await run_load(async_app, n_requests, level)
+            rows.append({'concurrency': level, 'before': before, 'after': after,
+                         'speedup': round(after['rps'] / before['rps'], 2) if before['rps'] else None})
+    finally:
+        sync_engine.dispose()
+        await async_engine.dispose()
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]], database_url: str, rtt_ms: float):
+    print("=" * 92)
+    print(f"DB 세션 부하 테스트  ({database_url.split('://')[0]}, 쿼리당 왕복 {rtt_ms}ms, {ENDPOINT})")
+    print("=" * 92)
+    print(f"{'동시성':>6} │ {'before rps':>10} {'p50':>8} {'p95':>8} │ {'after rps':>10} {'p50':>8} {'p95':>8} │ {'배율':>6}")
+    print("-" * 92)
+    for row in rows:
+        b, a = row['before'], row['after']
+        print(f"{row['concurrency']:>6} │ {b['rps']:>10.1f} {b['p50_ms']:>7.1f}ms {b['p95_ms']:>7.1f}ms │ "
+              f"{a['rps']:>10.1f} {a['p50_ms']:>7.1f}ms {a['p95_ms']:>7.1f}ms │ {row['speedup']:>5.2f}x")
+        if b['errors'] or a['errors']:
+            print(f"       ⚠️ 오류 응답: before {b['errors']}건, after {a['errors']}건")
+    print("=" * 92)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="동기 Session vs AsyncSession 동시 처리량 비교")
+    parser.add_argument("--database-url", default=None,
+                        help="동기 드라이버 URL (기본: 임시 SQLite 파일). 비동기 URL은 자동 파생")
+    parser.add_argument("--concurrency", default="1,8,24", help="동시 요청 수 목록 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=400, help="동시성 단계별 요청 수")
+    parser.add_argument("--projects", type=int, default=200, help="적재할 더미 프로젝트 수")
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="SQLite 대역 쿼리당 왕복 지연 (ms)")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    tmpdir = None
+    database_url = args.database_url
+    if database_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{Path(tmpdir.name) / 'db_load_test.db'}"
+
+    if database_url.startswith("sqlite"):
+        use_sqlite_types()
+    seed_engine = create_engine(database_url)
+    seed(seed_engine, args.projects)
+    seed_engine.dispose()
+
+    levels = [int(x) for x in args.concurrency.split(",") if x.strip()]
+    rows = asyncio.run(compare(database_url, levels, args.requests, args.rtt_ms))
+    print_report(rows, database_url, args.rtt_ms)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({'database': database_url.split('://')[0], 'rtt_ms': args.rtt_ms, 'results': rows},
+                      f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json_path}")
+
+    if tmpdir is not None:
+        tmpdir.cleanup()
+    return 1 if any(r['before']['errors'] or r['after']['errors'] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
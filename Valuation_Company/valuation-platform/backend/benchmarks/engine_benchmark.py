@@ -0,0 +1,338 @@
+"""
+평가 엔진 벤치마크
+
+엔진별(DCF, 민감도, 상대가치, 자산가치, 상증세법, 자본시장법)과 MasterValuationService의
+처리량 / 지연시간 백분위 / 최대 메모리를 측정하고 JSON 기준선과 비교해 회귀를 표시
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.engine_benchmark                       # 측정 + 기준선 비교
+    python -m benchmarks.engine_benchmark --save                # 기준선 갱신
+    python -m benchmarks.engine_benchmark --cases dcf,relative --scale 0.2   # 케이스 이름 접두사
+    python -m benchmarks.engine_benchmark --repeat 5                         # 반복 라운드 수 (중앙값 비교)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
+
+import numpy as np
+
+from app.services.valuation_engine.engine_registry import engine_registry
+from benchmarks.fixtures import load_fixtures, SAMPLE_DIR
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# 회귀 판정 기준: 기준선 대비 증가량이 증가율 허용치와
+# 라운드 간 편차(기준선 / 현재 중 큰 값의 NOISE_FACTOR배, 허용치의 NOISE_CAP배 이내)를 모두 넘을 때
+# (절대 하한은 두지 않음 - 1ms 미만 케이스도 같은 비율로 판정)
+TOLERANCES = {
+    'p50_ms': 0.25,
+    'p95_ms': 0.50,
+    'peak_kib': 0.20
+}
+NOISE_FACTOR = 2.0
+NOISE_CAP = 1.5
+SPREAD_KEYS = {'p50_ms': 'p50_spread_ms', 'p95_ms': 'p95_spread_ms', 'peak_kib': 'peak_spread_kib'}
+DEFAULT_REPEAT = 5
+
+
+class BenchmarkCase:
+    """벤치마크 케이스 (호출 함수 + 기본 반복 횟수)"""
+
+    def __init__(self, name: str, fn: Callable[[], Any], iterations: int, warmup: int = 3):
+        self.name = name
+        self.fn = fn
+        self.iterations = iterations
+        self.warmup = warmup
+
+
+def measure(case: BenchmarkCase, scale: float = 1.0, repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """
+    케이스 1개 측정
+
+    지연시간 측정과 메모리 측정은 분리 (tracemalloc은 할당마다 비용이 있어 지연시간을 왜곡)
+    지연시간은 repeat 라운드를 돌려 라운드별 백분위의 중앙값을 쓰고, 라운드 간 편차(max - min)를
+    함께 기록해 회귀 판정의 잡음 하한으로 쓴다. 최대 메모리도 repeat회 호출의 중앙값과 편차를 쓴다
+    (워커 풀 결과 수신 시점 등에 따라 호출마다 달라질 수 있음).
+
+    Returns:
+        {'iterations', 'repeat', 'throughput_per_s', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms',
+         'p50_spread_ms', 'p95_spread_ms', 'peak_kib', 'peak_spread_kib'}
+    """
+    iterations = max(1, int(case.iterations * scale))
+    repeat = max(1, repeat)
+    rounds = []
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(case.warmup):
+            case.fn()
+
+        for _ in range(repeat):
+            latencies = np.empty(iterations)
+            started = time.perf_counter()
+            for i in range(iterations):
+                t0 = time.perf_counter()
+                case.fn()
+                latencies[i] = (time.perf_counter() - t0) * 1000
+            wall = time.perf_counter() - started
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            rounds.append({
+                'throughput_per_s': iterations / wall,
+                'mean_ms': latencies.mean(),
+                'p50_ms': p50,
+                'p95_ms': p95,
+                'p99_ms': p99,
+                'max_ms': latencies.max()
+            })
+
+        peaks = []
+        for _ in range(repeat):
+            tracemalloc.start()
+            case.fn()
+            peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+            tracemalloc.stop()
+
+    def median(metric: str) -> float:
+        return float(np.median([r[metric] for r in rounds]))
+
+    def spread(metric: str) -> float:
+        values = [r[metric] for r in rounds]
+        return round(float(max(values) - min(values)), 4)
+
+    return {
+        'iterations': iterations,
+        'repeat': repeat,
+        'throughput_per_s': round(median('throughput_per_s'), 2),
+        'mean_ms': round(median('mean_ms'), 4),
+        'p50_ms': round(median('p50_ms'), 4),
+        'p95_ms': round(median('p95_ms'), 4),
+        'p99_ms': round(median('p99_ms'), 4),
+        'max_ms': round(median('max_ms'), 4),
+        'p50_spread_ms': spread('p50_ms'),
+        'p95_spread_ms': spread('p95_ms'),
+        'peak_kib': round(float(np.median(peaks)), 1),
+        'peak_spread_kib': round(float(max(peaks) - min(peaks)), 1)
+    }
+
+
+def build_cases(fixture: Dict[str, Dict[str, Any]]) -> List[BenchmarkCase]:
+    """샘플 1건의 입력으로 케이스 구성"""
+    from dcf.sensitivity_analysis import SensitivityAnalyzer
+    from services.master_valuation_service import MasterValuationService
+
+    dcf_inputs = fixture['dcf']
+    dcf_engine = engine_registry.instance('dcf')
+    with contextlib.redirect_stdout(io.StringIO()):
+        dcf_result = dcf_engine.run_valuation(dcf_inputs)
+
+    analyzer = SensitivityAnalyzer()
+    base_wacc = dcf_result['wacc']['wacc']
+    base_growth = dcf_inputs['assumptions']['terminal_growth']
+
+    cube_axes = {
+        'wacc': np.linspace(base_wacc - 0.02, base_wacc + 0.02, 41),
+        'terminal_growth': np.linspace(base_growth - 0.01, base_growth + 0.01, 21),
+        'target_operating_margin': np.linspace(0.10, 0.22, 13)
+    }
+    distributions = {
+        'revenue_growth': {'dist': 'normal', 'mean': dcf_inputs['assumptions']['revenue_growth'], 'std': 0.03},
+        'target_operating_margin': {'dist': 'triangular', 'low': 0.12, 'mode': 0.16, 'high': 0.20},
+        'beta': {'dist': 'normal', 'mean': dcf_inputs['wacc_inputs']['beta'], 'std': 0.15, 'clip': (0.3, 3.0)},
+        'terminal_growth': {'dist': 'uniform', 'low': 0.015, 'high': 0.035}
+    }
+
+    master = MasterValuationService()
+    methods = ['dcf', 'relative', 'capital_market_law', 'asset', 'inheritance_tax_law']
+    master_inputs = {
+        'dcf': dcf_inputs,
+        'relative': fixture['relative'],
+        'capital_market_law': fixture['intrinsic'],
+        'asset': fixture['asset'],
+        'inheritance_tax_law': fixture['inheritance_tax']
+    }
+
+    # 입력 검증 실패 경로를 재지 않도록 모든 평가법 성공을 먼저 확인
+    with contextlib.redirect_stdout(io.StringIO()):
+        summary = master.run_integrated_valuation(methods, master_inputs)['valuation_summary']
+    if summary['failed_methods']:
+        raise RuntimeError(f"통합 평가 입력 오류 (실패 평가법: {summary['failed_methods']})")
+
+    return [
+        BenchmarkCase('dcf_engine', lambda: dcf_engine.run_valuation(dcf_inputs), 200),
+        BenchmarkCase('sensitivity_wacc_growth', lambda: analyzer.create_wacc_growth_matrix(
+            dcf_result['projections'], base_wacc, base_growth, dcf_inputs['adjustments']), 500),
+        BenchmarkCase('sensitivity_cube', lambda: analyzer.create_sensitivity_cube(dcf_inputs, cube_axes), 100),
+        BenchmarkCase('monte_carlo_20k', lambda: analyzer.monte_carlo_analysis(
+            dcf_inputs, distributions, n_paths=20_000, seed=7), 10, warmup=1),
+        BenchmarkCase('relative_engine', lambda: engine_registry.evaluate('relative', fixture['relative']), 500),
+        BenchmarkCase('asset_engine', lambda: engine_registry.evaluate('asset', fixture['asset']), 2000),
+        BenchmarkCase('inheritance_tax_engine',
+                      lambda: engine_registry.evaluate('inheritance_tax', fixture['inheritance_tax']), 2000),
+        BenchmarkCase('capital_market_law_engine',
+                      lambda: engine_registry.evaluate('intrinsic', fixture['intrinsic']), 2000),
+        BenchmarkCase('master_sequential',
+                      lambda: master.run_integrated_valuation(methods, master_inputs), 100),
+        BenchmarkCase('master_parallel',
+                      lambda: master.run_integrated_valuation(methods, master_inputs, parallel=True), 30)
+    ]
+
+
+def select_case(name: str, cases: Optional[List[str]]) -> bool:
+    """--cases 필터: 이름 또는 접두사 일치 (예: 'dcf' → dcf_engine, 'master' → master_*)"""
+    return not cases or any(name == c or name.startswith(c) for c in cases)
+
+
+def run_suite(cases: Optional[List[str]] = None,
+              scale: float = 1.0,
+              sample_dir: Path = SAMPLE_DIR,
+              repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """
+    전체 벤치마크 실행
+
+    Args:
+        cases: 실행할 케이스 이름 / 접두사 (생략 시 전체)
+
+    Returns:
+        {
+            'meta': {'created_at', 'python', 'numpy', 'platform', 'scale', 'repeat', 'samples'},
+            'results': {'테크밸리/dcf_engine': {...}, ...}
+        }
+    """
+    fixtures = load_fixtures(sample_dir)
+    results = {}
+
+    for sample_name, fixture in fixtures.items():
+        for case in build_cases(fixture):
+            if not select_case(case.name, cases):
+                continue
+            results[f"{sample_name}/{case.name}"] = measure(case, scale, repeat)
+
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'scale': scale,
+            'repeat': repeat,
+            'samples': list(fixtures)
+        },
+        'results': results
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    기준선 대비 회귀 판정
+
+    증가량이 증가율 허용치와 라운드 간 편차 × NOISE_FACTOR를 모두 넘을 때만 회귀
+    (편차 여유는 증가율 허용치의 NOISE_CAP배를 넘지 않음)
+    (편차 기록이 없는 이전 기준선은 0으로 간주)
+
+    Returns:
+        [{'case', 'metric', 'baseline', 'current', 'change_pct'}, ...]  # 회귀 항목만
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        for metric, tolerance in TOLERANCES.items():
+            before, after = base[metric], result[metric]
+            spread_key = SPREAD_KEYS.get(metric)
+            noise = max(base.get(spread_key, 0), result.get(spread_key, 0)) if spread_key else 0
+            # 잡음 큰 기준선이 회귀를 가리지 않도록 편차 여유 상한을 기준선에 묶음
+            band = min(noise * NOISE_FACTOR, before * tolerance * NOISE_CAP)
+            if after - before > max(before * tolerance, band):
+                regressions.append({
+                    'case': name,
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'change_pct': round((after / before - 1) * 100, 1) if before else None
+                })
+    return regressions
+
+
+def print_report(current: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    """결과 표 출력 (기준선이 있으면 p50 변화율 함께 표시)"""
+    print("=" * 100)
+    print(f"{'케이스':<40} {'처리량/s':>10} {'p50(ms)':>10} {'p95(ms)':>10} {'p99(ms)':>10} "
+          f"{'peak(KiB)':>10} {'Δp50':>7}")
+    print("-" * 100)
+    for name, r in current['results'].items():
+        change = ""
+        if baseline and name in baseline['results']:
+            before = baseline['results'][name]['p50_ms']
+            change = f"{(r['p50_ms'] / before - 1) * 100:+.0f}%" if before else ""
+        print(f"{name:<40} {r['throughput_per_s']:>10,.1f} {r['p50_ms']:>10.3f} {r['p95_ms']:>10.3f} "
+              f"{r['p99_ms']:>10.3f} {r['peak_kib']:>10,.1f} {change:>7}")
+    print("=" * 100)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="평가 엔진 벤치마크")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="기준선 JSON 경로")
+    parser.add_argument("--save", action="store_true", help="이번 측정값을 기준선으로 저장")
+    parser.add_argument("--cases", help="실행할 케이스 이름 또는 접두사 (쉼표 구분, 생략 시 전체)")
+    parser.add_argument("--scale", type=float, default=1.0, help="반복 횟수 배율")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="측정 라운드 수 (라운드별 백분위의 중앙값 사용)")
+    parser.add_argument("--samples", type=Path, default=SAMPLE_DIR, help="sample_inputs 디렉터리")
+    args = parser.parse_args(argv)
+
+    cases = args.cases.split(',') if args.cases else None
+    current = run_suite(cases, args.scale, args.samples, args.repeat)
+    if not current['results']:
+        print(f"일치하는 케이스가 없습니다: {args.cases}")
+        return 1
+
+    baseline = None
+    if args.baseline.exists():
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print_report(current, baseline)
+
+    from services.master_valuation_service import MasterValuationService
+    MasterValuationService.shutdown_pools()
+
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"기준선 저장: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print("기준선이 없습니다 (--save로 생성)")
+        return 0
+
+    regressions = compare(current, baseline)
+    if regressions:
+        # 일시적 잡음 배제: 회귀로 잡힌 케이스만 다시 측정해 재현된 항목만 회귀로 판정
+        retry_cases = sorted({r['case'].split('/', 1)[1] for r in regressions})
+        flagged = {(r['case'], r['metric']) for r in regressions}
+        retry = run_suite(retry_cases, args.scale, args.samples, args.repeat)
+        regressions = [r for r in compare(retry, baseline) if (r['case'], r['metric']) in flagged]
+        MasterValuationService.shutdown_pools()
+
+    if not regressions:
+        print("✅ 회귀 없음")
+        return 0
+
+    print(f"⚠️ 회귀 {len(regressions)}건")
+    for r in regressions:
+        print(f"  {r['case']:<40} {r['metric']:<8} {r['baseline']:>10} → {r['current']:>10} "
+              f"({r['change_pct']:+}%)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+벤치마크 픽스처
+
+validation/sample_inputs의 평가보고서 입력(JSON, 한글 키)을 각 평가 엔진 입력으로 변환
+금액 단위는 샘플과 같은 백만원
+
+상대·본질·자산·상증세법 입력에는 엔진 입력과 함께 서비스 계층(services/*_service.py)
+검증 필드도 담아 MasterValuationService 경로에서도 그대로 쓸 수 있게 한다
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, List
+
+SAMPLE_DIR = (Path(__file__).resolve().parent.parent.parent.parent
+              / "기업가치평가플랫폼" / "valuation_engine" / "validation" / "sample_inputs")
+
+
+def _mean(values: List[float]) -> float:
+    values = [v for v in values if v is not None]
+    return sum(values) / len(values)
+
+
+def _identity(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """서비스 계층 공통 필수 필드 (company_id, company_name, valuation_date)"""
+    info = sample['보고서_정보']
+    return {
+        'company_id': info['평가대상회사'],
+        'company_name': info['평가대상회사'],
+        'valuation_date': info['평가기준일']
+    }
+
+
+def _reported_equity(sample: Dict[str, Any]) -> float:
+    """보고서 채택 평가액 기준 주주가치 (원 → 백만원)"""
+    equity = sample['주주가치_계산']
+    return sample['보고서_최종결과']['채택된_평가액_원'] * equity['발행주식수'] / 1_000_000
+
+
+def to_dcf_inputs(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    DCFEngine.run_valuation 입력
+
+    예측 비율(감가상각·CAPEX·운전자본)은 첫 예측연도 매출액 대비 비율을 사용
+    (validation/test_dcf_with_techvalley.py의 수기 입력과 같은 기준)
+    """
+    hist = sample['역사적_재무데이터']
+    forecast = sample['예측_재무데이터']
+    wacc = sample['할인율_WACC']
+    equity = sample['주주가치_계산']
+    tax_rate = forecast['유효법인세율'][0]
+    first_revenue = forecast['매출액'][0]
+
+    return {
+        **_identity(sample),
+        'historical_financials': [
+            {
+                'year': int(year),
+                'revenue': hist['매출액'][i],
+                'operating_income': hist['영업이익'][i],
+                'net_income': hist['순이익'][i],
+                'depreciation': hist['감가상각비'][i],
+                'capex': hist['자본적지출_CAPEX'][i],
+                'working_capital_change': hist['운전자본_증감'][i],
+                'tax_rate': tax_rate
+            }
+            for i, year in enumerate(hist['기간'])
+        ],
+        'assumptions': {
+            'base_year': int(hist['기간'][-1]),
+            'revenue_growth': list(forecast['매출성장률']),
+            'target_operating_margin': forecast['영업이익률'][0],
+            'tax_rate': tax_rate,
+            'depreciation_rate': round(forecast['감가상각비'][0] / first_revenue, 3),
+            'capex_rate': round(forecast['자본적지출_CAPEX'][0] / first_revenue, 3),
+            'wc_rate': round(forecast['운전자본_증감'][0] / first_revenue, 3),
+            'terminal_growth': sample['영구성장_가정']['영구성장률']
+        },
+        'wacc_inputs': {
+            'risk_free_rate': wacc['무위험이자율'],
+            'beta': wacc['베타'],
+            'market_premium': wacc['시장위험프리미엄'],
+            'cost_of_debt': wacc['타인자본비용_Rd_세전'],
+            'debt_ratio': wacc['타인자본비율'],
+            'tax_rate': tax_rate
+        },
+        'adjustments': {
+            'cash': equity['현금성자산'],
+            'total_debt': equity['순차입금'],
+            'non_operating_assets': equity['비영업자산'],
+            'shares_outstanding': equity['발행주식수']
+        }
+    }
+
+
+def to_relative_inputs(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    RelativeValuationEngine.run_valuation 입력
+
+    샘플에는 비교기업 배수가 없으므로 보고서 채택 평가액의 내재 배수 ±10%로 비교기업 3개 구성
+    """
+    hist = sample['역사적_재무데이터']
+    equity = sample['주주가치_계산']
+    reported = _reported_equity(sample)
+
+    company_data = {
+        'company_name': sample['보고서_정보']['평가대상회사'],
+        'industry': sample['보고서_정보']['업종'],
+        'revenue': hist['매출액'][-1],
+        'net_income': hist['순이익'][-1],
+        'book_value': hist['자기자본'][-1],
+        'ebitda': hist['EBITDA'][-1],
+        'shares_outstanding': equity['발행주식수'],
+        'growth_rate_3yr': _mean(hist['매출성장률']),
+        'roe': hist['순이익'][-1] / hist['자기자본'][-1],
+        'total_debt': equity['순차입금'],
+        'cash': equity['현금성자산']
+    }
+    ev = reported + equity['순차입금'] - equity['현금성자산']
+    implied = {
+        'per': reported / company_data['net_income'],
+        'pbr': reported / company_data['book_value'],
+        'psr': reported / company_data['revenue'],
+        'ev_ebitda': ev / company_data['ebitda']
+    }
+    comparables = [
+        {'name': f"비교기업{i + 1}", **{k: round(v * factor, 2) for k, v in implied.items()}}
+        for i, factor in enumerate((0.9, 1.0, 1.1))
+    ]
+    return {
+        **_identity(sample),
+        'company_data': company_data,
+        'comparable_companies': comparables,
+        # RelativeService 검증 필드
+        'financial_data': company_data,
+        'multiples': ['PER', 'PBR', 'PSR', 'EV/EBITDA']
+    }
+
+
+def to_asset_inputs(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    AssetValuationEngine.run_valuation 입력
+
+    총자산에서 현금을 뺀 나머지는 매출채권, 부채는 차입금과 유동부채로 배분
+    """
+    hist = sample['역사적_재무데이터']
+    equity = sample['주주가치_계산']
+    total_assets = hist['총자산'][-1]
+    total_liabilities = total_assets - hist['자기자본'][-1]
+    current_liabilities = total_liabilities - equity['순차입금']
+
+    return {
+        **_identity(sample),
+        'balance_sheet': {
+            'shares_outstanding': equity['발행주식수'],
+            'total_assets': total_assets,
+            'total_liabilities': total_liabilities,
+            'cash': equity['현금성자산'],
+            'accounts_receivable': total_assets - equity['현금성자산'],
+            'long_term_debt': equity['순차입금'],
+            'current_liabilities': current_liabilities
+        },
+        'fair_value_data': {'bad_debt_rate': 0.03},
+        # AssetService 검증 필드
+        'assets': {'current_assets': total_assets},
+        'liabilities': {
+            'current_liabilities': current_liabilities,
+            'non_current_liabilities': equity['순차입금']
+        }
+    }
+
+
+def to_tax_inputs(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    InheritanceTaxLawEngine.run_valuation 입력 (비상장 유동성 할인 20%)
+
+    TaxService 검증용 가중평균 PER은 보고서 채택 평가액의 내재 PER 사용
+    """
+    hist = sample['역사적_재무데이터']
+    return {
+        **_identity(sample),
+        'net_income_3yr': sum(hist['순이익'][-3:]),
+        'net_assets': hist['자기자본'][-1],
+        'marketability_discount': 0.20,
+        # TaxService 검증 필드
+        'company_type': 'unlisted',
+        'net_asset_value': hist['자기자본'][-1],
+        'earnings': list(hist['순이익'][-3:]),
+        'weighted_average_per': round(_reported_equity(sample) / hist['순이익'][-1], 2)
+    }
+
+
+def to_intrinsic_inputs(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """CapitalMarketLawEngine.run_valuation 입력 (수익가치 = 3년 평균 순이익 ÷ 자본환원율 10%)"""
+    hist = sample['역사적_재무데이터']
+    asset_value = hist['자기자본'][-1]
+    income_value = _mean(hist['순이익'][-3:]) / 0.10
+    return {
+        **_identity(sample),
+        'asset_value': asset_value,
+        'income_value': income_value,
+        'purpose': '합병',
+        # IntrinsicService 검증 필드
+        'transaction_type': 'merger',
+        'shares_outstanding': sample['주주가치_계산']['발행주식수'],
+        'net_asset_value': asset_value,
+        'earning_power_value': income_value
+    }
+
+
+def load_fixtures(sample_dir: Path = SAMPLE_DIR) -> Dict[str, Dict[str, Any]]:
+    """
+    샘플 파일별 엔진 입력 묶음
+
+    Returns:
+        {
+            '테크밸리': {
+                'dcf': {...}, 'relative': {...}, 'asset': {...},
+                'inheritance_tax': {...}, 'intrinsic': {...}
+            },
+            ...
+        }
+    """
+    fixtures = {}
+    for path in sorted(Path(sample_dir).glob('*_input.json')):
+        with open(path, encoding='utf-8') as f:
+            sample = json.load(f)
+        fixtures[path.stem.replace('_dcf_input', '').replace('_input', '')] = {
+            'dcf': to_dcf_inputs(sample),
+            'relative': to_relative_inputs(sample),
+            'asset': to_asset_inputs(sample),
+            'inheritance_tax': to_tax_inputs(sample),
+            'intrinsic': to_intrinsic_inputs(sample)
+        }
+
+    if not fixtures:
+        raise FileNotFoundError(f"샘플 입력이 없습니다: {sample_dir}")
+    return fixtures
@@ -0,0 +1,328 @@
+"""
+PostgREST 호환 로컬 스텁 서버
+
+SupabaseClient 검증용 인메모리 /rest/v1/{table} 서버
+- GET / HEAD / POST / PATCH / DELETE
+- 필터: eq, neq, gt, gte, lt, lte, like, ilike, is, in
+- 논리 필터: or=(...), and=(...) (중첩 / 큰따옴표 인용 값 지원)
+- select (컬럼 목록), order (col.asc|desc[.nullsfirst|nullslast], 쉼표로 다중), limit, offset
+- Prefer: count=exact → Content-Range 헤더
+- 장애 주입 (fail_next): 다음 N건을 지정 상태 코드로 응답 (Retry-After 포함 가능)
+- 뷰 (add_view): GET 시 현재 테이블 상태로 행 계산, RPC (add_rpc): POST /rpc/{function}
+- 한 번도 적재/기록되지 않은 테이블 GET/HEAD → 404 (PostgREST의 없는 릴레이션 응답)
+- 요청별 지연 (latency_ms), 클라이언트 커넥션(원격 포트) 추적
+
+사용법:
+    with StubServer(PostgRESTStub()) as server:
+        client = SupabaseClient(url=server.url, key="stub")
+"""
+
+import asyncio
+import re
+import socket
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+RESERVED_PARAMS = {"select", "order", "limit", "offset"}
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+def _coerce(raw: str) -> Any:
+    """쿼리 문자열 값 → 비교용 파이썬 값"""
+    if raw == "null":
+        return None
+    if raw in ("true", "false"):
+        return raw == "true"
+    if re.fullmatch(r"-?\d+", raw):
+        return int(raw)
+    if re.fullmatch(r"-?\d+\.\d*", raw):
+        return float(raw)
+    return raw
+
+
+def _like(value: Any, pattern: str, case_insensitive: bool) -> bool:
+    if value is None:
+        return False
+    regex = "^" + re.escape(pattern).replace("%", ".*").replace(r"\*", ".*") + "$"
+    return re.match(regex, str(value), re.IGNORECASE if case_insensitive else 0) is not None
+
+
+def _compare(value: Any, op: str, raw: str) -> bool:
+    if op == "is":
+        return value is _coerce(raw) if raw in ("null", "true", "false") else False
+    if op in ("like", "ilike"):
+        return _like(value, raw, op == "ilike")
+    if op == "in":
+        options = [_coerce(v.strip().strip('"')) for v in raw.strip("()").split(",") if v.strip()]
+        return value in options or str(value) in [str(o) for o in options]
+
+    target = _coerce(raw)
+    if value is None:
+        return op == "neq" and target is not None
+    if isinstance(target, (int, float)) and not isinstance(value, (int, float)):
+        target = raw
+    if isinstance(value, (int, float)) and isinstance(target, str):
+        value = str(value)
+    return {
+        "eq": value == target,
+        "neq": value != target,
+        "gt": value > target,
+        "gte": value >= target,
+        "lt": value < target,
+        "lte": value <= target,
+    }.get(op, False)
+
+
+def _split_top(expr: str) -> List[str]:
+    """괄호 / 큰따옴표 밖의 쉼표로 분리"""
+    parts, depth, quoted, escaped, current = [], 0, False, False, ""
+    for ch in expr:
+        if escaped:
+            escaped = False
+        elif ch == "\\" and quoted:
+            escaped = True
+        elif ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ",":
+            parts.append(current)
+            current = ""
+            continue
+        current += ch
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _unquote(raw: str) -> str:
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+        return re.sub(r"\\(.)", r"\1", raw[1:-1])
+    return raw
+
+
+def _condition(term: str) -> Predicate:
+    """col.op.value 또는 or(...) / and(...) → 행 판정 함수"""
+    for logical in ("or", "and"):
+        if term.startswith(logical + "(") and term.endswith(")"):
+            return _logical(logical, term[len(logical) + 1:-1])
+    column, op, raw = term.split(".", 2)
+    raw = _unquote(raw)
+    return lambda row: _compare(row.get(column), op, raw)
+
+
+def _logical(op: str, inner: str) -> Predicate:
+    conditions = [_condition(t) for t in _split_top(inner)]
+    combine = any if op == "or" else all
+    return lambda row: combine(c(row) for c in conditions)
+
+
+def parse_filters(params: List[Tuple[str, str]]) -> List[Predicate]:
+    """쿼리 파라미터 → 행 판정 함수 목록 (예약 파라미터 제외)"""
+    filters = []
+    for key, value in params:
+        if key in RESERVED_PARAMS:
+            continue
+        if key in ("or", "and"):
+            filters.append(_logical(key, value.strip()[1:-1]))
+            continue
+        op, _, raw = value.partition(".")
+        filters.append(lambda row, column=key, op=op, raw=raw: _compare(row.get(column), op, raw))
+    return filters
+
+
+def apply_order(rows: List[Dict[str, Any]], order: str) -> List[Dict[str, Any]]:
+    """order=col.desc.nullslast,id.desc (마지막 키부터 안정 정렬)"""
+    for spec in reversed([s for s in order.split(",") if s]):
+        parts = spec.split(".")
+        column = parts[0]
+        descending = "desc" in parts[1:]
+        nulls_first = "nullsfirst" in parts[1:] or ("nullslast" not in parts[1:] and descending)
+        present = [r for r in rows if r.get(column) is not None]
+        missing = [r for r in rows if r.get(column) is None]
+        present.sort(key=lambda r: r[column], reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+class PostgRESTStub:
+    """인메모리 PostgREST 스텁 (Starlette 앱)"""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.tables: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.next_id: Dict[str, int] = defaultdict(lambda: 1)
+        self.latency_ms = latency_ms
+        self.requests: Dict[str, int] = defaultdict(int)
+        self.connections = set()
+        self.views: Dict[str, Callable[[Dict[str, List[Dict[str, Any]]]], List[Dict[str, Any]]]] = {}
+        self.rpcs: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._faults: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self.app = Starlette(routes=[
+            Route("/rest/v1/rpc/{function}", self.handle_rpc, methods=["POST"]),
+            Route("/rest/v1/{table}", self.handle, methods=["GET", "HEAD", "POST", "PATCH", "DELETE"])
+        ])
+
+    # ==================== 데이터 / 장애 주입 ====================
+
+    def seed(self, table: str, rows: List[Dict[str, Any]]):
+        with self._lock:
+            for row in rows:
+                row = dict(row)
+                if "id" not in row:
+                    row["id"] = self.next_id[table]
+                self.next_id[table] = max(self.next_id[table], row["id"] + 1)
+                self.tables[table].append(row)
+
+    def add_view(self, name: str, compute: Callable[[Dict[str, List[Dict[str, Any]]]], List[Dict[str, Any]]]):
+        """읽기 전용 뷰 등록 (compute(tables) → 행 목록)"""
+        self.views[name] = compute
+
+    def add_rpc(self, name: str, function: Callable[[Dict[str, Any]], Any]):
+        """RPC 함수 등록 (function(params) → 응답 JSON)"""
+        self.rpcs[name] = function
+
+    def fail_next(self, table: str, status: int, count: int = 1,
+                  method: Optional[str] = None, retry_after: Optional[float] = None):
+        """table(, method)의 다음 count건을 status로 응답"""
+        with self._lock:
+            self._faults.append({"table": table, "method": method, "status": status,
+                                 "remaining": count, "retry_after": retry_after})
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests.clear()
+            self.connections.clear()
+
+    def _take_fault(self, table: str, method: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for fault in self._faults:
+                if fault["table"] == table and fault["method"] in (None, method) and fault["remaining"] > 0:
+                    fault["remaining"] -= 1
+                    return fault
+        return None
+
+    # ==================== 요청 처리 ====================
+
+    def _match(self, table: str, filters: List[Predicate]) -> List[Dict[str, Any]]:
+        source = self.views[table](self.tables) if table in self.views else self.tables[table]
+        return [row for row in source if all(f(row) for f in filters)]
+
+    async def handle_rpc(self, request: Request) -> Response:
+        function = request.path_params["function"]
+        with self._lock:
+            self.requests[f"rpc/{function}"] += 1
+        body = await request.json() if await request.body() else {}
+        if function not in self.rpcs:
+            return JSONResponse({"message": f"function {function} not found"}, status_code=404)
+        with self._lock:
+            return JSONResponse(self.rpcs[function](body or {}))
+
+    async def handle(self, request: Request) -> Response:
+        table = request.path_params["table"]
+        method = request.method
+        with self._lock:
+            self.requests[table] += 1
+            if request.client is not None:
+                self.connections.add((request.client.host, request.client.port))
+
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000.0)
+
+        fault = self._take_fault(table, method)
+        if fault is not None:
+            headers = {"Retry-After": str(fault["retry_after"])} if fault["retry_after"] is not None else {}
+            return JSONResponse({"message": "injected fault"}, status_code=fault["status"], headers=headers)
+
+        params = list(request.query_params.multi_items())
+        filters = parse_filters(params)
+        query = dict(params)
+        prefer = request.headers.get("prefer", "")
+        body = await request.json() if method in ("POST", "PATCH") else None
+
+        with self._lock:
+            if method in ("GET", "HEAD") and table not in self.tables and table not in self.views:
+                return JSONResponse({"message": f"relation {table} does not exist"}, status_code=404)
+
+            if method in ("GET", "HEAD"):
+                rows = self._match(table, filters)
+                total = len(rows)
+                if "order" in query:
+                    rows = apply_order(rows, query["order"])
+                offset = int(query.get("offset", 0))
+                limit = int(query["limit"]) if "limit" in query else None
+                rows = rows[offset:offset + limit if limit is not None else None]
+                columns = query.get("select", "*")
+                if columns != "*":
+                    keep = [c.strip() for c in columns.split(",")]
+                    rows = [{c: r.get(c) for c in keep} for r in rows]
+                headers = {}
+                if "count=exact" in prefer:
+                    end = offset + len(rows) - 1
+                    headers["Content-Range"] = f"{offset}-{end}/{total}" if rows else f"*/{total}"
+                if method == "HEAD":
+                    return Response(status_code=200, headers=headers)
+                return JSONResponse([dict(r) for r in rows], headers=headers)
+
+            if method == "POST":
+                items = body if isinstance(body, list) else [body]
+                created = []
+                for item in items:
+                    row = dict(item)
+                    row.setdefault("id", self.next_id[table])
+                    self.next_id[table] = max(self.next_id[table], row["id"] + 1)
+                    self.tables[table].append(row)
+                    created.append(dict(row))
+                return JSONResponse(created, status_code=201)
+
+            matched = self._match(table, filters)
+            if method == "PATCH":
+                for row in matched:
+                    row.update(body)
+                return JSONResponse([dict(r) for r in matched])
+
+            self.tables[table] = [r for r in self.tables[table] if r not in matched]
+            return Response(status_code=204)
+
+
+class StubServer:
+    """uvicorn으로 스텁을 로컬 포트에 띄우는 컨텍스트 매니저 (백그라운드 스레드)"""
+
+    def __init__(self, stub: PostgRESTStub, host: str = "127.0.0.1"):
+        self.stub = stub
+        self.host = host
+        with socket.socket() as sock:
+            sock.bind((host, 0))
+            self.port = sock.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(
+            stub.app, host=host, port=self.port, log_level="warning", lifespan="off"
+        ))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self) -> "StubServer":
+        self.thread.start()
+        deadline = time.time() + 10
+        while not self.server.started:
+            if time.time() > deadline:
+                raise RuntimeError("PostgREST stub failed to start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
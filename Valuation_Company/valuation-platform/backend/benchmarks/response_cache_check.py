@@ -0,0 +1,241 @@
+"""
+투자 트래커 응답 캐시 검증 / 부하 비교 (로컬 PostgREST 스텁)
+
+실제 investment_tracker 라우터를 스텁 Supabase에 연결해
+1. 같은 쿼리 파라미터는 적중, 다른 파라미터는 별도 키
+2. create_company / update_company API 호출 후 기업 목록 / 업종 / 대시보드 무효화, 뉴스는 유지
+3. WeeklyCollector 무효화 훅 (수집 완료 시 기업 / 뉴스 / 수집 이력)
+4. 대시보드 stale-while-revalidate: TTL 경과 후 이전 응답 즉시 반환 + 백그라운드 갱신
+5. 부하: 캐시 끔 vs 켬 (기업 목록 / 대시보드 혼합 조회) 처리량 / 지연시간 / 스텁 요청 수
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.response_cache_check
+    python -m benchmarks.response_cache_check --requests 1000 --concurrency 32 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import investment_tracker
+from app.core.config import settings
+from app.core.response_cache import MemoryCacheBackend, response_cache
+from app.db.supabase_client import SupabaseClient
+from benchmarks.postgrest_stub import PostgRESTStub, StubServer
+from benchmarks.supabase_client_check import dashboard_stats_view, seed_stub
+
+# app.db가 인스턴스 supabase_client를 같은 이름으로 재노출하므로 모듈은 import_module로
+supabase_module = importlib.import_module("app.db.supabase_client")
+
+PATHS = [
+    "/companies?page_size=20",
+    "/companies?page_size=20&industry=AI",
+    "/companies?page_size=20&industry=바이오",
+    "/dashboard/stats",
+    "/industries",
+    "/news?page_size=20",
+]
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(investment_tracker.router)
+    return app
+
+
+def connect(url: str) -> SupabaseClient:
+    """엔드포인트 / 수집기가 쓰는 전역 클라이언트를 스텁으로 교체"""
+    settings.SUPABASE_URL, settings.SUPABASE_KEY = url, "stub"
+    client = SupabaseClient(url=url, key="stub")
+    supabase_module.supabase_client = client
+    return client
+
+
+def stub_requests(stub: PostgRESTStub) -> int:
+    return sum(stub.requests.values())
+
+
+# ==================== 1~4. 기능 ====================
+
+async def check_functional(stub: PostgRESTStub, client: httpx.AsyncClient):
+    await response_cache.clear()
+    response_cache.reset_stats()
+
+    stub.reset_counters()
+    first = (await client.get("/companies?page_size=5&industry=AI")).json()
+    after_first = stub_requests(stub)
+    second = (await client.get("/companies?page_size=5&industry=AI")).json()
+    assert first == second and stub_requests(stub) == after_first
+    await client.get("/companies?page_size=5&industry=핀테크")
+    assert stub_requests(stub) > after_first
+    print("  같은 파라미터 적중 / 다른 파라미터 별도 키   ✓")
+
+    await client.get("/industries")
+    await client.get("/dashboard/stats")
+    await client.get("/news?page_size=5")
+    stub.reset_counters()
+    created = await client.post("/companies", json={"name_ko": "캐시검증기업", "industry": "로봇"})
+    assert created.status_code == 200, created.text
+    assert "로봇" in (await client.get("/industries")).json()["industries"]
+    assert (await client.get("/companies?page_size=5&industry=AI")).json()["total"] == first["total"]
+    assert stub.requests["startup_companies"] >= 3  # 중복 확인 + 생성 + 목록 재조회
+    before_news = stub.requests["investment_news"]
+    await client.get("/news?page_size=5")
+    assert stub.requests["investment_news"] == before_news
+    print("  create_company → 기업 / 업종 무효화, 뉴스 유지 ✓")
+
+    company_id = created.json()["id"]
+    await client.patch(f"/companies/{company_id}", json={"industry": "AI"})
+    relisted = (await client.get("/companies?page_size=5&industry=AI")).json()
+    assert relisted["total"] == first["total"] + 1
+    print("  update_company → 기업 목록 무효화           ✓")
+
+    await client.get("/news?page_size=5")
+    stats_before = (await client.get("/dashboard/stats")).json()
+    try:
+        # 수집기 의존성 (크롤러 / AI 파서 SDK, API 키)이 없는 환경에서는 건너뜀
+        import app.services.weekly_collector as weekly_collector_module
+    except Exception as e:
+        print(f"  WeeklyCollector 무효화 훅 건너뜀 ({type(e).__name__}: {e})")
+    else:
+        weekly_collector_module.supabase_client = supabase_module.supabase_client
+        collector = weekly_collector_module.WeeklyCollector(use_ai_parser=False)
+        await collector._create_collection_record()
+        await collector._complete_collection(success=True)
+        stub.reset_counters()
+        await client.get("/news?page_size=5")
+        stats_after = (await client.get("/dashboard/stats")).json()
+        assert stub.requests["investment_news"] == 1 and stub.requests["dashboard_stats_view"] == 1
+        assert stats_after["last_collection_status"] == "completed"
+        assert stats_after["last_collection_date"] != stats_before["last_collection_date"]
+        stats_before = stats_after
+        print("  WeeklyCollector 완료 → 뉴스 / 대시보드 무효화 ✓")
+
+    # TTL 경과를 흉내: 저장된 대시보드 응답의 신선 기간을 지난 것으로 표시
+    backend = response_cache.backend
+    for key, (expires_at, entry) in list(backend._entries.items()):
+        if key.startswith("dashboard_stats:"):
+            entry["fresh_until"] = time.time() - 1
+    stub.seed("investment_news", [{"title": "새 뉴스", "source": "demo", "source_url": "https://news.example.com/new"}])
+    stub.reset_counters()
+    stale = (await client.get("/dashboard/stats")).json()
+    assert stale == stats_before and stub.requests["dashboard_stats_view"] == 0
+    for _ in range(100):
+        if not response_cache._refreshing:
+            break
+        await asyncio.sleep(0.01)
+    fresh = (await client.get("/dashboard/stats")).json()
+    assert stub.requests["dashboard_stats_view"] == 1 and fresh["total_news"] == stats_before["total_news"] + 1
+    assert response_cache.stats()["routes"]["dashboard_stats"]["refreshes"] == 1
+    print("  대시보드 stale-while-revalidate            ✓")
+
+    bad = await client.get("/companies?cursor=bogus")
+    assert bad.status_code == 400
+    print("  잘못된 커서 400 (오류 응답은 캐시 안 함)      ✓")
+
+
+# ==================== 5. 부하 비교 ====================
+
+async def run_load(client: httpx.AsyncClient, n_requests: int, concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = n_requests
+
+    async def worker(offset: int):
+        nonlocal remaining, errors
+        i = offset
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await client.get(PATHS[i % len(PATHS)])
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += response.status_code != 200
+            i += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rps": round(n_requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 2),
+        "errors": errors
+    }
+
+
+async def main_async(args) -> Dict[str, Any]:
+    stub = PostgRESTStub()
+    seed_stub(stub, args.companies)
+    stub.add_view("dashboard_stats_view", dashboard_stats_view)
+    stub.add_rpc("refresh_dashboard_stats", lambda params: None)
+
+    with StubServer(stub) as server:
+        supabase = connect(server.url)
+        response_cache.use_backend(MemoryCacheBackend())
+        transport = httpx.ASGITransport(app=build_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://tracker") as client:
+            print("응답 캐시 검증")
+            await check_functional(stub, client)
+
+            stub.latency_ms = args.latency_ms
+            results = {}
+            for name, enabled in (("cache_off", False), ("cache_on", True)):
+                response_cache.enabled = enabled
+                await response_cache.clear()
+                response_cache.reset_stats()
+                stub.reset_counters()
+                results[name] = await run_load(client, args.requests, args.concurrency)
+                results[name]["supabase_requests"] = stub_requests(stub)
+            results["cache_stats"] = response_cache.stats()
+        await supabase.close()
+    return results
+
+
+def print_report(results: Dict[str, Any], args):
+    print("=" * 80)
+    print(f"조회 {args.requests}회 ({len(PATHS)}개 경로 순환), 동시성 {args.concurrency}, 스텁 지연 {args.latency_ms}ms")
+    print("=" * 80)
+    print(f"{'':10} {'rps':>8} {'p50':>9} {'p95':>9} {'Supabase 요청':>14} {'오류':>5}")
+    for name in ("cache_off", "cache_on"):
+        r = results[name]
+        print(f"{name:10} {r['rps']:>8.1f} {r['p50_ms']:>7.1f}ms {r['p95_ms']:>7.1f}ms "
+              f"{r['supabase_requests']:>14} {r['errors']:>5}")
+    print(f"처리량 배율: {results['cache_on']['rps'] / results['cache_off']['rps']:.2f}x")
+
+    stats = results["cache_stats"]
+    print(f"\n적중률 {stats['hit_ratio']:.1%} (백엔드 {stats['backend']}, 항목 {stats['entries']})")
+    print(f"{'라우트':<18} {'적중':>6} {'stale':>6} {'합류':>6} {'미적중':>6} {'적중률':>8} {'TTL':>6}")
+    for route, r in stats["routes"].items():
+        print(f"{route:<18} {r['hits']:>6} {r['stale_hits']:>6} {r['coalesced']:>6} {r['misses']:>6} "
+              f"{r['hit_ratio']:>8.1%} {r['ttl']:>5}s")
+    print("=" * 80)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="투자 트래커 응답 캐시 검증 (로컬 PostgREST 스텁)")
+    parser.add_argument("--requests", type=int, default=600, help="부하 비교 조회 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--companies", type=int, default=300, help="스텁에 적재할 기업 수")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="스텁 요청당 지연 (ms)")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(main_async(args))
+    print_report(results, args)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 1 if results["cache_on"]["errors"] or results["cache_off"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,355 @@
+"""
+SupabaseClient 검증 / 부하 비교 (로컬 PostgREST 스텁)
+
+1. CRUD / count가 스텁과 올바르게 통신하는지
+2. 재시도: GET 503 → 재시도 후 성공, POST 429 (Retry-After) → 재시도, POST 503 → 재시도하지 않음
+3. 목록 커서 페이지네이션: 필터 조건에서 next_cursor로 끝까지 순회한 결과가
+   전체 정렬 결과와 같은지, 총건수가 필터를 반영하는지, 페이지당 HTTP 요청 수
+   (NULL 정렬 값 구간으로 넘어가는 페이지만 2회)
+4. 대시보드 통계: 요약 뷰(dashboard_stats_view) 1행 조회 결과가 전체 스캔 계산과 같은지,
+   뷰가 없는 DB(404)에서 전체 스캔으로 대체되는지, 호출당 HTTP 요청 수 / 지연시간 비교
+5. 풀링: 대시보드 통계를 동시 호출했을 때
+   - before: 호출마다 httpx.AsyncClient를 새로 여는 기존 방식
+   - after : 공유 풀 클라이언트
+   처리량 / 지연시간 / 스텁이 본 TCP 커넥션 수 비교
+6. 계측 (stats): 풀 사용률 / 테이블별 지연시간
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.supabase_client_check
+    python -m benchmarks.supabase_client_check --requests 400 --concurrency 32 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.db.supabase_client import InvalidCursorError, SupabaseClient, dashboard_week_start
+from benchmarks.postgrest_stub import PostgRESTStub, StubServer
+
+
+class LegacySupabaseClient(SupabaseClient):
+    """기존 방식 재현: 요청마다 새 httpx.AsyncClient (TCP 핸드셰이크 매번)"""
+
+    async def _send(self, method, table, params=None, data=None, filters="", headers=None, timeout=None):
+        async with httpx.AsyncClient() as client:
+            return await client.request(
+                method=method,
+                url=f"{self.url}/rest/v1/{table}{filters or ''}",
+                headers={**self.headers, **(headers or {})},
+                params=params,
+                json=data
+            )
+
+
+def seed_stub(stub: PostgRESTStub, n_companies: int):
+    now = datetime.utcnow()
+    stub.seed("startup_companies", [
+        {"name_ko": f"스타트업{i}", "industry": ["AI", "바이오", "핀테크"][i % 3],
+         "latest_stage": ["seed", "series_a", "series_b"][i % 3],
+         "total_funding_krw": 1_000_000_000 + i * 10_000_000,
+         "latest_round_date": f"2026-{1 + i % 9:02d}-{1 + i % 28:02d}",
+         "created_at": (now - timedelta(days=i % 20, hours=1)).isoformat(),
+         "updated_at": (now - timedelta(days=i % 20, hours=1)).isoformat(),
+         "first_discovered_at": (now - timedelta(days=i % 20, hours=1)).isoformat()}
+        for i in range(n_companies)
+    ])
+    stub.seed("investment_news", [
+        {"title": f"투자 뉴스 {i}", "source": "demo", "company_id": 1 + i % n_companies,
+         "source_url": f"https://news.example.com/{i}", "published_date": f"2026-09-{1 + i % 28:02d}",
+         "created_at": (now - timedelta(days=i % 15, hours=1)).isoformat()}
+        for i in range(n_companies * 2)
+    ])
+    stub.seed("weekly_collections", [
+        {"collection_date": "2026-10-12T09:00:00", "status": "completed", "week_number": 41, "year": 2026}
+    ])
+
+
+def dashboard_stats_view(tables: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """dashboard_stats_view 대역 (migrations/005와 같은 집계, 스텁에서는 조회 시 계산)"""
+    week_start = dashboard_week_start()
+    companies = tables["startup_companies"]
+    news = tables["investment_news"]
+    industry: Dict[str, int] = {}
+    stage: Dict[str, int] = {}
+    for c in companies:
+        if c.get("industry"):
+            industry[c["industry"]] = industry.get(c["industry"], 0) + 1
+        if c.get("latest_stage"):
+            stage[c["latest_stage"]] = stage.get(c["latest_stage"], 0) + 1
+    collections = sorted((r for r in tables["weekly_collections"] if r.get("collection_date")),
+                         key=lambda r: r["collection_date"])
+    last = collections[-1] if collections else {}
+    return [{
+        "total_companies": len(companies),
+        "total_news": len(news),
+        "total_funding_krw": sum(c.get("total_funding_krw") or 0 for c in companies),
+        "this_week_new_companies": sum(1 for c in companies if (c.get("created_at") or "") >= week_start),
+        "this_week_new_news": sum(1 for n in news if (n.get("created_at") or "") >= week_start),
+        "industry_distribution": industry,
+        "stage_distribution": stage,
+        "last_collection_date": last.get("collection_date"),
+        "last_collection_status": last.get("status")
+    }]
+
+
+# ==================== 1~2. 기능 / 재시도 ====================
+
+async def check_functional(stub: PostgRESTStub, url: str):
+    client = SupabaseClient(url=url, key="stub", backoff_base=0.01)
+    try:
+        page = await client.get_companies(page=2, page_size=5)
+        assert len(page["items"]) == 5 and page["total"] == len(stub.tables["startup_companies"])
+        assert await client.count("startup_companies", filters={"industry": "AI"}) == \
+            sum(1 for c in stub.tables["startup_companies"] if c["industry"] == "AI")
+
+        created = await client.create_company({"name_ko": "검증기업", "industry": "AI"})
+        assert created["id"] and (await client.get_company_by_name("검증기업"))["id"] == created["id"]
+        updated = await client.update_company(created["id"], {"latest_stage": "seed"})
+        assert updated["latest_stage"] == "seed"
+        await client.delete("startup_companies", {"id": created["id"]})
+        assert await client.get_company_by_id(created["id"]) is None
+        print("  CRUD / count                         ✓")
+
+        stub.fail_next("investment_news", 503, count=2, method="GET")
+        news = await client.get_news(page_size=3)
+        assert len(news["items"]) == 3
+        assert client.stats()["tables"]["investment_news"]["retries"] == 2
+        print("  GET 503 ×2 → 재시도 후 성공            ✓")
+
+        stub.fail_next("weekly_collections", 429, count=1, method="POST", retry_after=0)
+        collection = await client.create_collection({"status": "pending"})
+        assert collection["id"]
+        print("  POST 429 (Retry-After) → 재시도        ✓")
+
+        stub.fail_next("weekly_collections", 503, count=1, method="POST")
+        before = len(stub.tables["weekly_collections"])
+        try:
+            await client.create_collection({"status": "pending"})
+            raise AssertionError("POST 503 should not be retried")
+        except httpx.HTTPStatusError as e:
+            assert e.response.status_code == 503
+        assert len(stub.tables["weekly_collections"]) == before
+        print("  POST 503 → 재시도 안 함 (중복 방지)    ✓")
+
+        stub.fail_next("startup_companies", 503, count=10, method="GET")
+        try:
+            await client.get_company_by_id(1)
+            raise AssertionError("retries should be exhausted")
+        except httpx.HTTPStatusError:
+            pass
+        assert client.stats()["tables"]["startup_companies"]["retries"] >= client.max_retries
+        stub._faults.clear()
+        print(f"  재시도 {client.max_retries}회 소진 → 오류 전파            ✓")
+    finally:
+        await client.close()
+
+
+# ==================== 3. 커서 페이지네이션 ====================
+
+async def check_pagination(stub: PostgRESTStub, url: str):
+    client = SupabaseClient(url=url, key="stub")
+    try:
+        # 같은 최근 투자일 / 투자일 없음이 섞인 정렬 키 (keyset 동률 처리 확인)
+        for i, company in enumerate(stub.tables["startup_companies"]):
+            if i % 10 == 0:
+                company["latest_round_date"] = None
+        expected = [
+            c["id"] for c in sorted(
+                (c for c in stub.tables["startup_companies"] if c["industry"] == "AI"),
+                key=lambda c: (c["latest_round_date"] is not None, c["latest_round_date"] or "", c["id"]),
+                reverse=True
+            )
+        ]
+
+        seen, cursor, pages, requests = [], None, 0, 0
+        while True:
+            stub.reset_counters()
+            result = await client.get_companies(page_size=7, industry="AI", cursor=cursor)
+            requests += sum(stub.requests.values())
+            assert result["total"] == len(expected) and result["page"] == pages + 1
+            seen.extend(c["id"] for c in result["items"])
+            pages += 1
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == expected and pages == result["total_pages"], (seen, expected)
+        assert requests == pages + 1
+        print(f"  커서 순회 {pages}페이지 = 전체 정렬 결과        ✓")
+        print(f"  필터 반영 총건수 / HTTP 요청 {requests}회 ({pages}페이지)  ✓")
+
+        offset_page = await client.get_companies(page=3, page_size=7, industry="AI")
+        assert [c["id"] for c in offset_page["items"]] == expected[14:21]
+        print("  page(offset) 호환                      ✓")
+
+        first = await client.get_companies(page_size=7, industry="AI")
+        for bad in ("not-a-cursor", first["next_cursor"]):
+            try:
+                await client.get_companies(page_size=7, industry="바이오", cursor=bad)
+                raise AssertionError("cursor should be rejected")
+            except InvalidCursorError:
+                pass
+        print("  잘못된 / 다른 필터의 커서 거부           ✓")
+
+        news = await client.get_news(page_size=50)
+        tail = await client.get_news(page_size=50, cursor=news["next_cursor"])
+        assert not {n["id"] for n in news["items"]} & {n["id"] for n in tail["items"]}
+        assert tail["total"] == news["total"] == len(stub.tables["investment_news"])
+        collections = await client.get_collections(page_size=1)
+        assert collections["next_cursor"] and collections["total"] == len(stub.tables["weekly_collections"])
+        print("  뉴스 / 수집 이력 커서                   ✓")
+    finally:
+        await client.close()
+
+
+# ==================== 4. 대시보드 통계 ====================
+
+async def check_dashboard(stub: PostgRESTStub, url: str, rounds: int = 20) -> Dict[str, Any]:
+    """
+    전체 스캔(뷰 없음) vs 요약 뷰 1행 조회
+
+    Returns:
+        {'full_scan': {'http_requests': int, 'mean_ms': float},
+         'summary': {'http_requests': int, 'mean_ms': float}}
+    """
+    client = SupabaseClient(url=url, key="stub")
+    results = {}
+    try:
+        stub.views.pop("dashboard_stats_view", None)
+        stub.rpcs.pop("refresh_dashboard_stats", None)
+        for name in ("full_scan", "summary"):
+            if name == "summary":
+                stub.add_view("dashboard_stats_view", dashboard_stats_view)
+                stub.add_rpc("refresh_dashboard_stats", lambda params: None)
+            stub.reset_counters()
+            start = time.perf_counter()
+            for _ in range(rounds):
+                stats = await client.get_dashboard_stats()
+            results[name] = {
+                "stats": stats,
+                "http_requests": sum(stub.requests.values()) / rounds,
+                "mean_ms": round((time.perf_counter() - start) * 1000 / rounds, 2)
+            }
+
+        full, summary = results["full_scan"]["stats"], results["summary"]["stats"]
+        assert full == summary, (full, summary)
+        assert summary["this_week_new_companies"] > 0 and summary["stage_distribution"]
+        print("  뷰 없음(404) → 전체 스캔 대체            ✓")
+        print("  요약 뷰 결과 = 전체 스캔 결과 (전 필드)   ✓")
+
+        await client.refresh_dashboard_stats()
+        assert stub.requests["rpc/refresh_dashboard_stats"] == 1
+        print("  refresh_dashboard_stats RPC            ✓")
+    finally:
+        await client.close()
+
+    for name in ("full_scan", "summary"):
+        results[name].pop("stats")
+    return results
+
+
+# ==================== 5. 풀링 부하 비교 ====================
+
+async def run_load(client: SupabaseClient, n_requests: int, concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    remaining = n_requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await client.get_dashboard_stats()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rps": round(n_requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 2)
+    }
+
+
+async def compare(stub: PostgRESTStub, url: str, n_requests: int, concurrency: int) -> Dict[str, Any]:
+    results = {}
+    for name, cls in (("before", LegacySupabaseClient), ("after", SupabaseClient)):
+        client = cls(url=url, key="stub")
+        stub.reset_counters()
+        results[name] = await run_load(client, n_requests, concurrency)
+        results[name]["tcp_connections"] = len(stub.connections)
+        results[name]["http_requests"] = sum(stub.requests.values())
+        if name == "after":
+            results["after_stats"] = client.stats()
+        await client.close()
+    return results
+
+
+def print_report(results: Dict[str, Any], n_requests: int, concurrency: int, latency_ms: float):
+    print("=" * 80)
+    print(f"대시보드 통계 호출당 (스텁 지연 {latency_ms}ms)")
+    print("=" * 80)
+    for name, label in (("full_scan", "전체 스캔"), ("summary", "요약 뷰")):
+        r = results["dashboard"][name]
+        print(f"{label:<10} HTTP 요청 {r['http_requests']:>4.1f}회, 평균 {r['mean_ms']:>7.2f}ms")
+    print("=" * 80)
+    print(f"대시보드 통계 {n_requests}회, 동시성 {concurrency}, 스텁 지연 {latency_ms}ms")
+    print("=" * 80)
+    print(f"{'':8} {'rps':>8} {'p50':>9} {'p95':>9} {'HTTP 요청':>10} {'TCP 연결':>9}")
+    for name in ("before", "after"):
+        r = results[name]
+        print(f"{name:8} {r['rps']:>8.1f} {r['p50_ms']:>7.1f}ms {r['p95_ms']:>7.1f}ms "
+              f"{r['http_requests']:>10} {r['tcp_connections']:>9}")
+    print(f"처리량 배율: {results['after']['rps'] / results['before']['rps']:.2f}x")
+
+    stats = results["after_stats"]
+    pool = stats["pool"]
+    print(f"\n풀: 최대 {pool['max_connections']}, 최대 동시 {pool['peak_in_flight']} "
+          f"(사용률 {pool['peak_utilisation']:.0%}), 커넥션 {pool['connections']}")
+    print(f"{'테이블':<22} {'요청':>6} {'재시도':>6} {'평균':>9} {'p50':>9} {'p95':>9}")
+    for table, t in stats["tables"].items():
+        print(f"{table:<22} {t['requests']:>6} {t['retries']:>6} {t['mean_ms']:>7.2f}ms "
+              f"{t['p50_ms']:>7.2f}ms {t['p95_ms']:>7.2f}ms")
+    print("=" * 80)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="SupabaseClient 풀링 / 재시도 검증 (로컬 PostgREST 스텁)")
+    parser.add_argument("--requests", type=int, default=200, help="대시보드 통계 호출 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 호출 수")
+    parser.add_argument("--companies", type=int, default=300, help="스텁에 적재할 기업 수")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="스텁 요청당 지연 (ms)")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    stub = PostgRESTStub()
+    seed_stub(stub, args.companies)
+
+    with StubServer(stub) as server:
+        print("기능 / 재시도 검증")
+        asyncio.run(check_functional(stub, server.url))
+        print("커서 페이지네이션 검증")
+        asyncio.run(check_pagination(stub, server.url))
+        stub.latency_ms = args.latency_ms
+        print("대시보드 통계 검증")
+        dashboard = asyncio.run(check_dashboard(stub, server.url))
+        results = asyncio.run(compare(stub, server.url, args.requests, args.concurrency))
+        results["dashboard"] = dashboard
+
+    print_report(results, args.requests, args.concurrency, args.latency_ms)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
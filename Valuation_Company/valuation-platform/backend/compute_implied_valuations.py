@@ -0,0 +1,79 @@
+"""
+Compute Implied Valuations
+데일리 수집기가 저장한 Deal의 라운드 밸류에이션으로부터 역DCF 내재 가정 계산
+
+사용법:
+    python compute_implied_valuations.py dcf_inputs.json --driver terminal_growth
+
+dcf_inputs.json: {기업명: DCFEngine 입력} (금액 단위 백만원)
+"""
+import argparse
+import json
+import logging
+import sys
+import os
+from collections import defaultdict
+from dotenv import load_dotenv
+
+# 경로 설정 (평가 엔진은 app/services/valuation_engine)
+BACKEND_DIR = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'app', 'services', 'valuation_engine'))
+
+from dcf.reverse_dcf import ReverseDCFSolver
+from supabase import create_client
+
+load_dotenv(override=True)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("ImpliedValuations")
+
+EOK_TO_MILLION = 100  # 억원 → 백만원
+
+
+def compute_implied_valuations(dcf_inputs: dict, driver: str):
+    supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+
+    deals = supabase.table("deals")\
+        .select("id, company_name, stage, news_date, valuation_post_krw")\
+        .not_.is_("valuation_post_krw", "null")\
+        .order("news_date").execute().data
+    logger.info(f"밸류에이션이 있는 Deal {len(deals)}건")
+
+    # 기업별로 모아 라운드 전체를 한 번에 역산
+    rounds_by_company = defaultdict(list)
+    for deal in deals:
+        rounds_by_company[deal["company_name"]].append(deal)
+
+    rows = []
+    for company_name, rounds in rounds_by_company.items():
+        if company_name not in dcf_inputs:
+            logger.info(f"⏭️ [SKIP] DCF 입력 없음: {company_name}")
+            continue
+
+        solver = ReverseDCFSolver(dcf_inputs[company_name])
+        targets = [float(r["valuation_post_krw"]) * EOK_TO_MILLION for r in rounds]
+        result = solver.solve(targets, driver, target_type="equity_value")
+
+        for deal, value, message in zip(rounds, result["implied_value"], result["message"]):
+            rows.append((company_name, deal["stage"], deal["news_date"],
+                         deal["valuation_post_krw"], result["base_value"], value, message))
+
+    print(f"{'Company':<15} | {'Stage':<10} | {'Date':<10} | {'Post(억원)':>10} | "
+          f"{'Base':>8} | {'Implied ' + driver}")
+    print("-" * 90)
+    for company_name, stage, date, post, base, value, message in rows:
+        implied = f"{value:.2%}" if message == "ok" else message
+        print(f"{company_name:<15} | {stage or '-':<10} | {date or '-':<10} | {post:>10,.0f} | "
+              f"{base:>8.2%} | {implied}")
+
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="라운드 밸류에이션 역DCF 내재 가정 계산")
+    parser.add_argument("inputs", help="기업명 → DCF 입력 JSON 파일")
+    parser.add_argument("--driver", default="terminal_growth",
+                        choices=sorted(ReverseDCFSolver.DRIVER_BOUNDS))
+    args = parser.parse_args()
+
+    with open(args.inputs, encoding="utf-8") as f:
+        compute_implied_valuations(json.load(f), args.driver)
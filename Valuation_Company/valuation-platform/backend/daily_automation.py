@@ -117,6 +117,8 @@ async def run_daily_automation():
                 "industry": extracted.industry,
                 "stage": extracted.investment_stage,
                 "amount": extracted.investment_amount_krw,
+                "valuation_pre_krw": extracted.valuation_pre_krw,
+                "valuation_post_krw": extracted.valuation_post_krw,
                 "investors": ", ".join([inv.get("name", "") for inv in extracted.investors]) if extracted.investors else extracted.lead_investor,
                 "news_title": news.title,
                 "news_url": news.source_url,
@@ -2,12 +2,15 @@
 Database Configuration
 
 PostgreSQL 데이터베이스 설정
+- 동기 세션 (get_db): 스크립트 / 동기 라우터용
+- 비동기 세션 (get_async_db): async def 라우터용 (이벤트 루프를 막지 않음)
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
-from typing import Generator
+from typing import AsyncGenerator, Generator
 import os
 from dotenv import load_dotenv
 
@@ -38,6 +41,47 @@ SessionLocal = sessionmaker(
 )
 
 
+def to_async_url(url: str) -> str:
+    """
+    동기 드라이버 URL → 비동기 드라이버 URL
+
+    postgresql(+psycopg2):// → postgresql+asyncpg://
+    sqlite:// → sqlite+aiosqlite://
+    이미 드라이버가 지정된 비동기 URL은 그대로 반환
+    """
+    scheme, sep, rest = url.partition("://")
+    backend = scheme.split("+", 1)[0]
+    async_drivers = {"postgresql": "asyncpg", "postgres": "asyncpg", "sqlite": "aiosqlite"}
+    if backend not in async_drivers or scheme.endswith(("+asyncpg", "+aiosqlite")):
+        return url
+    driver = async_drivers[backend]
+    if backend == "postgres":
+        backend = "postgresql"
+    return f"{backend}+{driver}{sep}{rest}"
+
+
+# 비동기 데이터베이스 URL (미지정 시 DATABASE_URL에서 파생)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+# 비동기 Engine 생성 (동기 엔진과 같은 풀 크기)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    echo=False,
+)
+
+# AsyncSessionLocal 클래스 생성
+# expire_on_commit=False: 커밋 후 속성 접근 시 암묵적 재조회(await 불가)를 막음
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
 # 데이터베이스 세션 의존성
 def get_db() -> Generator[Session, None, None]:
     """
@@ -55,6 +99,21 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# 비동기 데이터베이스 세션 의존성
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI 의존성으로 사용할 비동기 데이터베이스 세션 생성
+
+    Usage:
+        @app.get("/items")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # 테이블 생성 함수
 def create_tables():
     """
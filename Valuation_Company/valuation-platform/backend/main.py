@@ -7,6 +7,7 @@ FastAPI Main Application
 - 11단계 워크플로우 (requested → completed)
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -24,6 +25,9 @@ from routers import (
     internal_router
 )
 
+from database import engine, async_engine
+from services.master_valuation_service import MasterValuationService
+
 # 기존 라우터 (레퍼런스용 - 사용 안 함)
 # from routers import (
 #     projects,
@@ -37,8 +41,23 @@ from routers import (
 #     master_valuation
 # )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명 주기
+
+    종료 시 통합 평가 워커 풀(스레드/프로세스)과 DB 커넥션 풀을 정리
+    """
+    yield
+    MasterValuationService.shutdown_pools()
+    await async_engine.dispose()
+    engine.dispose()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
+    lifespan=lifespan,
     title="기업가치평가 플랫폼 API",
     description="""
 5가지 평가법을 지원하는 통합 기업가치평가 시스템
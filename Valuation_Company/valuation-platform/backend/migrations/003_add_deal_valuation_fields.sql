@@ -0,0 +1,18 @@
+-- Migration: Add round valuation fields to deals
+-- Date: 2026-10-18
+-- Description: 라운드 밸류에이션 저장 (역DCF 내재 가정 계산용)
+
+-- ============================================================
+-- deals 테이블에 밸류에이션 필드 추가 (억원 단위)
+-- ============================================================
+
+-- Pre-money 밸류에이션
+ALTER TABLE deals
+ADD COLUMN IF NOT EXISTS valuation_pre_krw NUMERIC;
+
+-- Post-money 밸류에이션
+ALTER TABLE deals
+ADD COLUMN IF NOT EXISTS valuation_post_krw NUMERIC;
+
+-- 스키마 캐시 갱신
+NOTIFY pgrst, 'reload schema';
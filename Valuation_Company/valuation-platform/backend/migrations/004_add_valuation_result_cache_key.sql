@@ -0,0 +1,27 @@
+-- Migration: Add result cache key to valuation_results
+-- Date: 2026-10-18
+-- Description: 평가 결과 캐시 (평가법 + 엔진 버전 + 정규화 입력 해시) 워커 간 공유
+
+-- ============================================================
+-- valuation_results 테이블에 캐시 키 필드 추가
+-- ============================================================
+
+-- 입력 해시 (SHA-256, 엔진 버전 포함)
+ALTER TABLE valuation_results
+ADD COLUMN IF NOT EXISTS input_hash VARCHAR(64);
+
+-- 평가 엔진 버전 (엔진 소스 해시)
+ALTER TABLE valuation_results
+ADD COLUMN IF NOT EXISTS engine_version VARCHAR(32);
+
+
+-- ============================================================
+-- 인덱스 추가
+-- ============================================================
+
+-- 캐시 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_valuation_results_input_hash
+ON valuation_results(method, input_hash);
+
+-- 스키마 캐시 갱신
+NOTIFY pgrst, 'reload schema';
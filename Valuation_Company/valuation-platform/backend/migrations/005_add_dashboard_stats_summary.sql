@@ -0,0 +1,289 @@
+-- Migration: Add incrementally maintained dashboard statistics
+-- Date: 2026-10-18
+-- Description: 대시보드 통계 요약 (쓰기 시 트리거로 증분 기록 → /dashboard/stats는 뷰 1행 조회)
+--
+-- 동시 쓰기 경합: 트리거가 단일 누계 행을 UPDATE하면 기업/뉴스를 쓰는 모든 트랜잭션이
+-- 그 행 잠금에서 직렬화된다. 그래서 트리거는 (일자, 슬롯) 증분 행에 UPSERT만 하고
+-- (슬롯 = 백엔드 PID % 16 → 동시 세션은 대개 서로 다른 행), 누계는 조회 시
+-- 기준 행 + 증분 합계로 계산한다. refresh_dashboard_stats()가 증분을 기준 행으로 접는다
+-- (주간 수집 완료 시 호출, 짧게 증분 쓰기를 막음).
+--
+-- 이번 주: 오늘(DB 세션 시간대, 기본 UTC) 포함 최근 7개 달력일 (day > current_date - 7)
+-- app/db/supabase_client.py의 뷰 미적용 대체 계산도 같은 기준을 쓴다.
+
+-- ============================================================
+-- 요약 테이블
+-- ============================================================
+
+-- 기준 누계 (단일 행, id = 1): 마지막 refresh 시점 값 + 최근 수집 정보
+CREATE TABLE IF NOT EXISTS dashboard_stats (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    total_companies BIGINT NOT NULL DEFAULT 0,
+    total_news BIGINT NOT NULL DEFAULT 0,
+    total_funding_krw NUMERIC NOT NULL DEFAULT 0,
+    industry_distribution JSONB NOT NULL DEFAULT '{}',
+    stage_distribution JSONB NOT NULL DEFAULT '{}',
+    last_collection_date TIMESTAMPTZ,
+    last_collection_status VARCHAR(20),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- 증분 (일자 = 대상 행 created_at 일자, 슬롯 = 쓰는 세션)
+-- new_* 는 해당 일자 신규 건수 (이번 주 신규 집계), 나머지는 기준 누계에 더할 증감
+CREATE TABLE IF NOT EXISTS dashboard_stats_deltas (
+    day DATE NOT NULL,
+    slot SMALLINT NOT NULL,
+    companies BIGINT NOT NULL DEFAULT 0,
+    news BIGINT NOT NULL DEFAULT 0,
+    funding_krw NUMERIC NOT NULL DEFAULT 0,
+    new_companies BIGINT NOT NULL DEFAULT 0,
+    new_news BIGINT NOT NULL DEFAULT 0,
+    industry_distribution JSONB NOT NULL DEFAULT '{}',
+    stage_distribution JSONB NOT NULL DEFAULT '{}',
+    PRIMARY KEY (day, slot)
+);
+
+INSERT INTO dashboard_stats (id) VALUES (1) ON CONFLICT (id) DO NOTHING;
+
+
+-- ============================================================
+-- 분포(JSONB) 증감 헬퍼
+-- ============================================================
+
+-- {key: delta} (key가 NULL이면 빈 객체)
+CREATE OR REPLACE FUNCTION dashboard_stats_one(key TEXT, delta INTEGER)
+RETURNS JSONB AS $$
+    SELECT CASE WHEN key IS NULL OR delta = 0 THEN '{}'::JSONB ELSE jsonb_build_object(key, delta) END
+$$ LANGUAGE sql IMMUTABLE;
+
+-- 키별 합산 (합이 0인 키는 제거, 증분 행에서는 음수 유지)
+CREATE OR REPLACE FUNCTION dashboard_stats_merge(a JSONB, b JSONB)
+RETURNS JSONB AS $$
+    SELECT COALESCE(jsonb_object_agg(key, n) FILTER (WHERE n <> 0), '{}')
+    FROM (
+        SELECT key, sum(value::BIGINT) AS n
+        FROM (SELECT * FROM jsonb_each_text(a) UNION ALL SELECT * FROM jsonb_each_text(b)) e
+        GROUP BY key
+    ) s
+$$ LANGUAGE sql IMMUTABLE;
+
+-- 증분 기록 (현재 세션 슬롯 행에 UPSERT)
+CREATE OR REPLACE FUNCTION dashboard_stats_record(
+    p_day DATE,
+    p_companies INTEGER DEFAULT 0,
+    p_news INTEGER DEFAULT 0,
+    p_funding_krw NUMERIC DEFAULT 0,
+    p_new_companies INTEGER DEFAULT 0,
+    p_new_news INTEGER DEFAULT 0,
+    p_industry JSONB DEFAULT '{}',
+    p_stage JSONB DEFAULT '{}'
+)
+RETURNS VOID AS $$
+    INSERT INTO dashboard_stats_deltas AS d
+        (day, slot, companies, news, funding_krw, new_companies, new_news, industry_distribution, stage_distribution)
+    VALUES
+        (p_day, (pg_backend_pid() % 16)::SMALLINT, p_companies, p_news, p_funding_krw,
+         p_new_companies, p_new_news, p_industry, p_stage)
+    ON CONFLICT (day, slot) DO UPDATE SET
+        companies = d.companies + EXCLUDED.companies,
+        news = d.news + EXCLUDED.news,
+        funding_krw = d.funding_krw + EXCLUDED.funding_krw,
+        new_companies = d.new_companies + EXCLUDED.new_companies,
+        new_news = d.new_news + EXCLUDED.new_news,
+        industry_distribution = dashboard_stats_merge(d.industry_distribution, EXCLUDED.industry_distribution),
+        stage_distribution = dashboard_stats_merge(d.stage_distribution, EXCLUDED.stage_distribution)
+$$ LANGUAGE sql;
+
+
+-- ============================================================
+-- 증분 기록 트리거
+-- ============================================================
+
+-- startup_companies: 기업 수 / 총 투자금 / 업종·단계 분포 / 일자별 신규 기업
+CREATE OR REPLACE FUNCTION dashboard_stats_on_company()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM dashboard_stats_record(
+            COALESCE(NEW.created_at, now())::DATE,
+            p_companies => 1,
+            p_funding_krw => COALESCE(NEW.total_funding_krw, 0)::NUMERIC,
+            p_new_companies => 1,
+            p_industry => dashboard_stats_one(NEW.industry, 1),
+            p_stage => dashboard_stats_one(NEW.latest_stage::TEXT, 1)
+        );
+
+    ELSIF TG_OP = 'UPDATE' THEN
+        IF OLD.total_funding_krw IS DISTINCT FROM NEW.total_funding_krw
+           OR OLD.industry IS DISTINCT FROM NEW.industry
+           OR OLD.latest_stage IS DISTINCT FROM NEW.latest_stage THEN
+            PERFORM dashboard_stats_record(
+                COALESCE(NEW.created_at, now())::DATE,
+                p_funding_krw => (COALESCE(NEW.total_funding_krw, 0) - COALESCE(OLD.total_funding_krw, 0))::NUMERIC,
+                p_industry => dashboard_stats_merge(
+                    dashboard_stats_one(OLD.industry, -1), dashboard_stats_one(NEW.industry, 1)),
+                p_stage => dashboard_stats_merge(
+                    dashboard_stats_one(OLD.latest_stage::TEXT, -1), dashboard_stats_one(NEW.latest_stage::TEXT, 1))
+            );
+        END IF;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM dashboard_stats_record(
+            COALESCE(OLD.created_at, now())::DATE,
+            p_companies => -1,
+            p_funding_krw => -COALESCE(OLD.total_funding_krw, 0)::NUMERIC,
+            p_new_companies => -1,
+            p_industry => dashboard_stats_one(OLD.industry, -1),
+            p_stage => dashboard_stats_one(OLD.latest_stage::TEXT, -1)
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_dashboard_stats_company ON startup_companies;
+CREATE TRIGGER trg_dashboard_stats_company
+AFTER INSERT OR DELETE OR UPDATE OF total_funding_krw, industry, latest_stage ON startup_companies
+FOR EACH ROW EXECUTE FUNCTION dashboard_stats_on_company();
+
+-- investment_news: 뉴스 수 / 일자별 신규 뉴스
+CREATE OR REPLACE FUNCTION dashboard_stats_on_news()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM dashboard_stats_record(COALESCE(NEW.created_at, now())::DATE, p_news => 1, p_new_news => 1);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM dashboard_stats_record(COALESCE(OLD.created_at, now())::DATE, p_news => -1, p_new_news => -1);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_dashboard_stats_news ON investment_news;
+CREATE TRIGGER trg_dashboard_stats_news
+AFTER INSERT OR DELETE ON investment_news
+FOR EACH ROW EXECUTE FUNCTION dashboard_stats_on_news();
+
+-- weekly_collections: 최근 수집 일시 / 상태 (주 1회 수준의 쓰기라 기준 행을 직접 갱신)
+CREATE OR REPLACE FUNCTION dashboard_stats_on_collection()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE dashboard_stats SET
+        last_collection_date = NEW.collection_date,
+        last_collection_status = NEW.status,
+        updated_at = now()
+    WHERE id = 1
+      AND NEW.collection_date IS NOT NULL
+      AND (last_collection_date IS NULL OR NEW.collection_date >= last_collection_date);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_dashboard_stats_collection ON weekly_collections;
+CREATE TRIGGER trg_dashboard_stats_collection
+AFTER INSERT OR UPDATE OF status, collection_date ON weekly_collections
+FOR EACH ROW EXECUTE FUNCTION dashboard_stats_on_collection();
+
+
+-- ============================================================
+-- 전체 재계산 + 증분 접기 (초기 적재 / 드리프트 보정, RPC로 호출 가능)
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION refresh_dashboard_stats()
+RETURNS VOID AS $$
+BEGIN
+    -- 재계산 ~ 증분 삭제 사이에 커밋된 증분이 사라지지 않도록 증분 쓰기를 잠시 막음 (조회는 허용)
+    LOCK TABLE dashboard_stats_deltas IN EXCLUSIVE MODE;
+
+    UPDATE dashboard_stats SET
+        total_companies = (SELECT count(*) FROM startup_companies),
+        total_news = (SELECT count(*) FROM investment_news),
+        total_funding_krw = (SELECT COALESCE(sum(total_funding_krw), 0) FROM startup_companies),
+        industry_distribution = COALESCE((
+            SELECT jsonb_object_agg(industry, n)
+            FROM (SELECT industry, count(*) AS n FROM startup_companies
+                  WHERE industry IS NOT NULL GROUP BY industry) s
+        ), '{}'),
+        stage_distribution = COALESCE((
+            SELECT jsonb_object_agg(stage, n)
+            FROM (SELECT latest_stage::TEXT AS stage, count(*) AS n FROM startup_companies
+                  WHERE latest_stage IS NOT NULL GROUP BY latest_stage) s
+        ), '{}'),
+        last_collection_date = (SELECT collection_date FROM weekly_collections
+                                WHERE collection_date IS NOT NULL
+                                ORDER BY collection_date DESC LIMIT 1),
+        last_collection_status = (SELECT status FROM weekly_collections
+                                  WHERE collection_date IS NOT NULL
+                                  ORDER BY collection_date DESC LIMIT 1),
+        updated_at = now()
+    WHERE id = 1;
+
+    -- 증분을 비우고 최근 8일 신규 건수만 슬롯 0에 다시 적재
+    DELETE FROM dashboard_stats_deltas;
+    INSERT INTO dashboard_stats_deltas (day, slot, new_companies, new_news)
+    SELECT day, 0, sum(new_companies), sum(new_news)
+    FROM (
+        SELECT created_at::DATE AS day, count(*) AS new_companies, 0 AS new_news
+        FROM startup_companies WHERE created_at >= current_date - 7 GROUP BY 1
+        UNION ALL
+        SELECT created_at::DATE, 0, count(*)
+        FROM investment_news WHERE created_at >= current_date - 7 GROUP BY 1
+    ) d
+    GROUP BY day;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- ============================================================
+-- 조회용 뷰 (대시보드 1회 조회: 기준 행 + 증분 합계)
+-- ============================================================
+
+CREATE OR REPLACE VIEW dashboard_stats_view AS
+SELECT
+    (s.total_companies + COALESCE(d.companies, 0))::BIGINT AS total_companies,
+    (s.total_news + COALESCE(d.news, 0))::BIGINT AS total_news,
+    s.total_funding_krw + COALESCE(d.funding_krw, 0) AS total_funding_krw,
+    COALESCE(d.new_companies, 0)::BIGINT AS this_week_new_companies,
+    COALESCE(d.new_news, 0)::BIGINT AS this_week_new_news,
+    (SELECT COALESCE(jsonb_object_agg(key, n), '{}')
+     FROM (SELECT key, sum(value::BIGINT) AS n
+           FROM (SELECT industry_distribution FROM dashboard_stats WHERE id = 1
+                 UNION ALL SELECT industry_distribution FROM dashboard_stats_deltas) x(dist),
+                jsonb_each_text(x.dist)
+           GROUP BY key HAVING sum(value::BIGINT) > 0) i) AS industry_distribution,
+    (SELECT COALESCE(jsonb_object_agg(key, n), '{}')
+     FROM (SELECT key, sum(value::BIGINT) AS n
+           FROM (SELECT stage_distribution FROM dashboard_stats WHERE id = 1
+                 UNION ALL SELECT stage_distribution FROM dashboard_stats_deltas) x(dist),
+                jsonb_each_text(x.dist)
+           GROUP BY key HAVING sum(value::BIGINT) > 0) g) AS stage_distribution,
+    s.last_collection_date,
+    s.last_collection_status,
+    s.updated_at
+FROM dashboard_stats s
+LEFT JOIN LATERAL (
+    SELECT
+        sum(companies) AS companies,
+        sum(news) AS news,
+        sum(funding_krw) AS funding_krw,
+        sum(new_companies) FILTER (WHERE day > current_date - 7) AS new_companies,
+        sum(new_news) FILTER (WHERE day > current_date - 7) AS new_news
+    FROM dashboard_stats_deltas
+) d ON TRUE
+WHERE s.id = 1;
+
+
+-- ============================================================
+-- 초기 적재
+-- ============================================================
+
+SELECT refresh_dashboard_stats();
+
+COMMENT ON TABLE dashboard_stats IS '대시보드 통계 기준 누계 (refresh_dashboard_stats() 시점 값 + 최근 수집 정보)';
+COMMENT ON TABLE dashboard_stats_deltas IS '대시보드 통계 증분 (일자·세션 슬롯별, 트리거가 기록하고 refresh_dashboard_stats()가 접음)';
+
+-- 스키마 캐시 갱신
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,26 @@
+-- Migration: Add keyset pagination indexes for tracker list endpoints
+-- Date: 2026-10-18
+-- Description: 목록 API 커서(keyset) 페이지네이션용 (정렬 컬럼, id) 복합 인덱스
+
+-- ============================================================
+-- 인덱스 추가
+-- ============================================================
+
+-- 기업 목록: ORDER BY latest_round_date DESC NULLS LAST, id DESC
+CREATE INDEX IF NOT EXISTS idx_companies_round_date_id
+ON startup_companies(latest_round_date DESC NULLS LAST, id DESC);
+
+-- 뉴스 목록: ORDER BY published_date DESC NULLS LAST, id DESC
+CREATE INDEX IF NOT EXISTS idx_news_published_date_id
+ON investment_news(published_date DESC NULLS LAST, id DESC);
+
+-- 기업 상세의 관련 뉴스 (company_id 필터 + 같은 정렬)
+CREATE INDEX IF NOT EXISTS idx_news_company_published_date_id
+ON investment_news(company_id, published_date DESC NULLS LAST, id DESC);
+
+-- 수집 이력: ORDER BY collection_date DESC NULLS LAST, id DESC
+CREATE INDEX IF NOT EXISTS idx_collections_date_id
+ON weekly_collections(collection_date DESC NULLS LAST, id DESC);
+
+-- 스키마 캐시 갱신
+NOTIFY pgrst, 'reload schema';
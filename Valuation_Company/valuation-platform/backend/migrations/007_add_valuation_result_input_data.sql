@@ -0,0 +1,27 @@
+-- Migration: Add full engine input to valuation_results
+-- Date: 2026-10-18
+-- Description: 가정 수정 시뮬레이션 기준 상태 적재용 평가 엔진 입력 전체 + 계산 시각 저장
+
+-- ============================================================
+-- valuation_results 테이블에 입력 데이터 필드 추가
+-- ============================================================
+
+-- 평가 엔진 입력 전체 (DCF: historical_financials, assumptions, wacc_inputs, adjustments ...)
+ALTER TABLE valuation_results
+ADD COLUMN IF NOT EXISTS input_data JSONB;
+
+-- 계산 시각 (프로젝트별 최신 결과 조회)
+ALTER TABLE valuation_results
+ADD COLUMN IF NOT EXISTS calculation_date TIMESTAMP;
+
+
+-- ============================================================
+-- 인덱스 추가
+-- ============================================================
+
+-- 프로젝트별 최신 결과 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_valuation_results_project_method_date
+ON valuation_results(project_id, method, calculation_date DESC);
+
+-- 스키마 캐시 갱신
+NOTIFY pgrst, 'reload schema';
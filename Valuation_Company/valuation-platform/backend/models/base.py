@@ -2,11 +2,13 @@
 SQLAlchemy Base Model
 """
 
+from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, DateTime
 from datetime import datetime
 
-Base = declarative_base()
+# AsyncAttrs: AsyncSession에서 관계 속성을 `await obj.awaitable_attrs.<관계>`로 지연 로딩
+Base = declarative_base(cls=AsyncAttrs)
 
 
 class TimestampMixin:
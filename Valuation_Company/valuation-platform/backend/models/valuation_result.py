@@ -4,7 +4,7 @@ Valuation Result Model
 평가 결과 (5가지 평가법)
 """
 
-from sqlalchemy import Column, String, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
@@ -55,6 +55,16 @@ class ValuationResult(Base, TimestampMixin):
     # 주요 가정
     key_assumptions = Column(JSONB, nullable=True, comment="주요 가정")
 
+    # 평가 엔진 입력 전체 (시뮬레이션 기준 상태 적재용)
+    input_data = Column(JSONB, nullable=True, comment="평가 엔진 입력 (historical_financials, assumptions, wacc_inputs, adjustments 등)")
+
+    # 결과 캐시 키 (평가법 + 엔진 버전 + 정규화 입력의 SHA-256)
+    input_hash = Column(String(64), nullable=True, comment="입력 해시 (결과 캐시 키)")
+    engine_version = Column(String(32), nullable=True, comment="평가 엔진 버전 (소스 해시)")
+
+    # 계산 시각
+    calculation_date = Column(DateTime, nullable=True, comment="계산 시각")
+
     # 에러 정보 (실패 시)
     error_message = Column(String(1000), nullable=True, comment="에러 메시지")
 
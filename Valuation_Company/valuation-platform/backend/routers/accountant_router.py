@@ -8,13 +8,15 @@
 4. 초안 생성
 5. 최종 확정
 6. 보고서 발행
+7. 가정 수정 시뮬레이션 (What-if)
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
-from database import get_db
+from database import get_async_db
 from auth import get_accountant_user, User
 from schemas.approval import (
     ApprovalPointsListResponse,
@@ -24,6 +26,12 @@ from schemas.approval import (
     BatchApprovalRequest,
     BatchApprovalResponse
 )
+from schemas.valuation import (
+    SimulationRequest,
+    SimulationResponse,
+    SimulationResult,
+    ImpactBreakdown
+)
 from schemas.draft import DraftGenerateRequest, DraftGenerateResponse
 from schemas.report import (
     FinalizeRequest,
@@ -36,6 +44,7 @@ from models.approval_point import ApprovalPoint
 from models.draft import Draft
 from models.report import Report
 from models.valuation_result import ValuationResult
+from services.simulation_service import simulation_service
 
 # 라우터 생성
 router = APIRouter(
@@ -47,7 +56,7 @@ router = APIRouter(
 @router.get("/projects/{project_id}/approval-points", response_model=ApprovalPointsListResponse)
 async def list_approval_points(
     project_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_accountant_user)
 ):
     """
@@ -67,7 +76,7 @@ async def list_approval_points(
     """
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -79,9 +88,9 @@ async def list_approval_points(
         #     raise HTTPException(status_code=403, detail="배정된 프로젝트가 아닙니다.")
 
         # 판단 포인트 조회
-        approval_points = db.query(ApprovalPoint).filter(
-            ApprovalPoint.project_id == project_id
-        ).all()
+        approval_points = (await db.scalars(
+            select(ApprovalPoint).where(ApprovalPoint.project_id == project_id)
+        )).all()
 
         if not approval_points:
             raise HTTPException(
@@ -141,7 +150,7 @@ async def approve_point(
     project_id: str,
     point_id: str,
     request: ApprovalDecisionRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_accountant_user)
 ):
     """
@@ -160,7 +169,7 @@ async def approve_point(
     """
     try:
         # 프로젝트 및 판단 포인트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -173,10 +182,12 @@ async def approve_point(
                 detail=f"판단 포인트 승인은 'human_approval' 상태에서만 가능합니다. (현재: {project.status})"
             )
 
-        approval_point = db.query(ApprovalPoint).filter(
-            ApprovalPoint.project_id == project_id,
-            ApprovalPoint.point_id == point_id
-        ).first()
+        approval_point = await db.scalar(
+            select(ApprovalPoint).where(
+                ApprovalPoint.project_id == project_id,
+                ApprovalPoint.point_id == point_id
+            ).limit(1)
+        )
 
         if not approval_point:
             raise HTTPException(
@@ -200,8 +211,8 @@ async def approve_point(
         }
         approval_point.impact_analysis = impact_analysis
 
-        db.commit()
-        db.refresh(approval_point)
+        await db.commit()
+        await db.refresh(approval_point)
 
         return ApprovalDecisionResponse(
             project_id=project_id,
@@ -216,7 +227,7 @@ async def approve_point(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"판단 포인트 처리 중 오류가 발생했습니다: {str(e)}"
@@ -227,7 +238,7 @@ async def approve_point(
 async def batch_approve_points(
     project_id: str,
     request: BatchApprovalRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_accountant_user)
 ):
     """
@@ -239,7 +250,7 @@ async def batch_approve_points(
     - 회계사만 가능
     """
     try:
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -258,10 +269,12 @@ async def batch_approve_points(
 
         for decision in request.decisions:
             try:
-                approval_point = db.query(ApprovalPoint).filter(
-                    ApprovalPoint.project_id == project_id,
-                    ApprovalPoint.point_id == decision.point_id
-                ).first()
+                approval_point = await db.scalar(
+                    select(ApprovalPoint).where(
+                        ApprovalPoint.project_id == project_id,
+                        ApprovalPoint.point_id == decision.point_id
+                    ).limit(1)
+                )
 
                 if not approval_point:
                     failed_count += 1
@@ -287,17 +300,19 @@ async def batch_approve_points(
                     "error": str(e)
                 })
 
-        db.commit()
+        await db.commit()
 
         # 모든 판단 포인트 처리되었는지 확인
-        pending_points = db.query(ApprovalPoint).filter(
-            ApprovalPoint.project_id == project_id,
-            ApprovalPoint.status == "pending"
-        ).count()
+        pending_points = await db.scalar(
+            select(func.count()).select_from(ApprovalPoint).where(
+                ApprovalPoint.project_id == project_id,
+                ApprovalPoint.status == "pending"
+            )
+        )
 
         if pending_points == 0:
             project.status = "draft_generated"
-            db.commit()
+            await db.commit()
             message = f"{success_count}개 항목이 승인되었습니다. 초안 생성을 진행하세요."
         else:
             message = f"{success_count}개 항목이 승인되었습니다. (대기 중: {pending_points}개)"
@@ -313,7 +328,7 @@ async def batch_approve_points(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"일괄 승인 처리 중 오류가 발생했습니다: {str(e)}"
@@ -324,7 +339,7 @@ async def batch_approve_points(
 async def generate_draft(
     project_id: str,
     request: DraftGenerateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_accountant_user)
 ):
     """
@@ -347,7 +362,7 @@ async def generate_draft(
     """
     try:
         # 프로젝트 존재 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -362,10 +377,12 @@ async def generate_draft(
             )
 
         # 모든 판단 포인트가 처리되었는지 확인
-        pending_points = db.query(ApprovalPoint).filter(
-            ApprovalPoint.project_id == project_id,
-            ApprovalPoint.status == "pending"
-        ).count()
+        pending_points = await db.scalar(
+            select(func.count()).select_from(ApprovalPoint).where(
+                ApprovalPoint.project_id == project_id,
+                ApprovalPoint.status == "pending"
+            )
+        )
 
         if pending_points > 0:
             raise HTTPException(
@@ -374,9 +391,9 @@ async def generate_draft(
             )
 
         # 평가 결과 조회
-        valuation_results = db.query(ValuationResult).filter(
-            ValuationResult.project_id == project_id
-        ).all()
+        valuation_results = (await db.scalars(
+            select(ValuationResult).where(ValuationResult.project_id == project_id)
+        )).all()
 
         if not valuation_results:
             raise HTTPException(
@@ -385,9 +402,9 @@ async def generate_draft(
             )
 
         # 판단 포인트 조회
-        approval_points = db.query(ApprovalPoint).filter(
-            ApprovalPoint.project_id == project_id
-        ).all()
+        approval_points = (await db.scalars(
+            select(ApprovalPoint).where(ApprovalPoint.project_id == project_id)
+        )).all()
 
         # 초안 콘텐츠 생성
         draft_content = {
@@ -446,8 +463,8 @@ async def generate_draft(
         # 프로젝트 상태 업데이트
         project.status = "draft_generated"
 
-        db.commit()
-        db.refresh(draft)
+        await db.commit()
+        await db.refresh(draft)
 
         return DraftGenerateResponse(
             project_id=project_id,
@@ -464,7 +481,7 @@ async def generate_draft(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"초안 생성 중 오류가 발생했습니다: {str(e)}"
@@ -475,7 +492,7 @@ async def generate_draft(
 async def finalize_project(
     project_id: str,
     request: FinalizeRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_accountant_user)
 ):
     """
@@ -496,7 +513,7 @@ async def finalize_project(
     """
     try:
         # 프로젝트 존재 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -511,9 +528,11 @@ async def finalize_project(
             )
 
         # 최신 초안 확인
-        latest_draft = db.query(Draft).filter(
-            Draft.project_id == project_id
-        ).order_by(Draft.draft_version.desc()).first()
+        latest_draft = await db.scalar(
+            select(Draft).where(
+                Draft.project_id == project_id
+            ).order_by(Draft.draft_version.desc()).limit(1)
+        )
 
         if not latest_draft:
             raise HTTPException(
@@ -524,7 +543,7 @@ async def finalize_project(
         # 프로젝트 상태 업데이트
         project.status = "completed"
 
-        db.commit()
+        await db.commit()
 
         return FinalizeResponse(
             project_id=project_id,
@@ -537,7 +556,7 @@ async def finalize_project(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"확정 처리 중 오류가 발생했습니다: {str(e)}"
@@ -548,7 +567,7 @@ async def finalize_project(
 async def generate_report(
     project_id: str,
     request: ReportGenerateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_accountant_user)
 ):
     """
@@ -574,7 +593,7 @@ async def generate_report(
     """
     try:
         # 프로젝트 존재 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -589,9 +608,11 @@ async def generate_report(
             )
 
         # 최신 초안 확인
-        latest_draft = db.query(Draft).filter(
-            Draft.project_id == project_id
-        ).order_by(Draft.draft_version.desc()).first()
+        latest_draft = await db.scalar(
+            select(Draft).where(
+                Draft.project_id == project_id
+            ).order_by(Draft.draft_version.desc()).limit(1)
+        )
 
         if not latest_draft:
             raise HTTPException(
@@ -601,9 +622,11 @@ async def generate_report(
 
         # 보고서 번호 생성
         year = datetime.now().year
-        report_count = db.query(Report).filter(
-            Report.report_number.like(f"VR-{year}-%")
-        ).count()
+        report_count = await db.scalar(
+            select(func.count()).select_from(Report).where(
+                Report.report_number.like(f"VR-{year}-%")
+            )
+        )
         report_number = f"VR-{year}-{report_count + 1:05d}"
 
         # TODO: 실제 보고서 생성 (PDF)
@@ -622,8 +645,8 @@ async def generate_report(
         )
 
         db.add(report)
-        db.commit()
-        db.refresh(report)
+        await db.commit()
+        await db.refresh(report)
 
         return ReportGenerateResponse(
             project_id=project_id,
@@ -637,8 +660,98 @@ async def generate_report(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"보고서 발행 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+@router.post("/projects/{project_id}/simulate", response_model=SimulationResponse)
+async def simulate_valuation(
+    project_id: str,
+    request: SimulationRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_accountant_user)
+):
+    """
+    # 7. 가정 수정 시뮬레이션 (What-if)
+
+    DCF 가정을 수정했을 때의 가치 변화와 가정별 영향을 계산합니다.
+
+    ## 권한
+    - 회계사만 가능
+
+    ## 수정 가능 가정
+    - revenue_growth_rate: 매출성장률 (스칼라 또는 연도별 리스트)
+    - ebit_margin: 목표 영업이익률
+    - wacc: 할인율 (직접 지정)
+    - terminal_growth: 영구성장률
+    - 기타 DCF 엔진 가정 (capex_rate, beta 등) → other_impacts
+
+    ## 처리 방식
+    - 프로젝트별 기준 상태를 메모리에 유지 (최초 요청 시 DCF 결과에서 적재)
+    - 기준/전체 수정/가정별 단독 수정을 한 번의 배치 계산으로 처리
+    - 가정별 영향의 합 = 전체 변화 (상호작용분 비례 배분)
+    """
+    try:
+        if request.method != "dcf":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"시뮬레이션은 DCF평가법만 지원합니다. (요청: {request.method})"
+            )
+
+        # 기준 상태 적재 (캐시 미스 시에만 DB 조회)
+        if not simulation_service.has_state(project_id):
+            project = await db.scalar(select(Project).where(Project.project_id == project_id))
+            if not project:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="프로젝트를 찾을 수 없습니다."
+                )
+
+            valuation_result = await db.scalar(
+                select(ValuationResult).where(
+                    ValuationResult.project_id == project_id,
+                    ValuationResult.method == "dcf"
+                ).order_by(ValuationResult.calculation_date.desc().nullslast()).limit(1)
+            )
+            if not valuation_result:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="DCF 평가 결과가 없습니다. 평가 계산을 먼저 진행해주세요."
+                )
+
+            # key_assumptions는 assumptions만 담으므로 저장된 엔진 입력 전체로 적재
+            simulation_service.load_state(project_id, valuation_result.input_data or {})
+
+        result = simulation_service.simulate(project_id, request.modified_assumptions)
+
+        return SimulationResponse(
+            project_id=project_id,
+            method=request.method,
+            simulation_result=SimulationResult(
+                original_value=result["original_value"],
+                simulated_value=result["simulated_value"],
+                change_amount=result["change_amount"],
+                change_percentage=result["change_percentage"]
+            ),
+            impact_breakdown=ImpactBreakdown(
+                **result["impacts"],
+                other_impacts=result["other_impacts"]
+            ),
+            new_assumptions=result["new_assumptions"]
+        )
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"시뮬레이션 중 오류가 발생했습니다: {str(e)}"
+        )
@@ -9,11 +9,12 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
 
-from database import get_db
+from database import get_async_db
 from auth import get_admin_user, User
 from schemas.project import (
     QuoteRequest,
@@ -38,7 +39,7 @@ router = APIRouter(
 async def send_quote(
     project_id: str,
     request: QuoteRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_admin_user)
 ):
     """
@@ -60,7 +61,7 @@ async def send_quote(
     """
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -89,8 +90,8 @@ async def send_quote(
         project.status = "quote_sent"
 
         db.add(quote)
-        db.commit()
-        db.refresh(quote)
+        await db.commit()
+        await db.refresh(quote)
 
         return QuoteResponse(
             quote_id=quote.quote_id,
@@ -105,7 +106,7 @@ async def send_quote(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"견적서 발송 중 오류가 발생했습니다: {str(e)}"
@@ -116,7 +117,7 @@ async def send_quote(
 async def negotiate_quote(
     project_id: str,
     request: NegotiationRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_admin_user)
 ):
     """
@@ -138,7 +139,7 @@ async def negotiate_quote(
     """
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -167,8 +168,8 @@ async def negotiate_quote(
             project.status = "negotiating"
 
         db.add(negotiation)
-        db.commit()
-        db.refresh(negotiation)
+        await db.commit()
+        await db.refresh(negotiation)
 
         return NegotiationResponse(
             negotiation_id=negotiation.negotiation_id,
@@ -181,7 +182,7 @@ async def negotiate_quote(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"협의 처리 중 오류가 발생했습니다: {str(e)}"
@@ -192,7 +193,7 @@ async def negotiate_quote(
 async def approve_project(
     project_id: str,
     request: ApprovalRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_admin_user)
 ):
     """
@@ -214,7 +215,7 @@ async def approve_project(
     """
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -229,7 +230,7 @@ async def approve_project(
             )
 
         # 견적서 확인
-        quote = db.query(Quote).filter(Quote.project_id == project_id).first()
+        quote = await db.scalar(select(Quote).where(Quote.project_id == project_id).limit(1))
         if not quote:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -249,7 +250,7 @@ async def approve_project(
         project.contract_signed = True
         project.contract_date = datetime.utcnow().date()
 
-        db.commit()
+        await db.commit()
 
         return ApprovalResponse(
             project_id=project_id,
@@ -264,7 +265,7 @@ async def approve_project(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"승인 처리 중 오류가 발생했습니다: {str(e)}"
@@ -276,7 +277,7 @@ async def list_all_projects(
     skip: int = 0,
     limit: int = 100,
     status: str = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_admin_user)
 ):
     """
@@ -293,13 +294,13 @@ async def list_all_projects(
     - limit: 한 페이지당 개수
     """
     try:
-        query = db.query(Project)
+        query = select(Project)
 
         if status:
-            query = query.filter(Project.status == status)
+            query = query.where(Project.status == status)
 
-        total = query.count()
-        projects = query.offset(skip).limit(limit).all()
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+        projects = (await db.scalars(query.offset(skip).limit(limit))).all()
 
         return {
             "total": total,
@@ -5,108 +5,27 @@ Calculations Router
 - POST /projects/{project_id}/calculate - 평가 계산 실행
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List
 
 from database import get_db
 from schemas.calculation import CalculationRequest, CalculationResponse
 from models.project import Project
-from models.valuation_result import ValuationResult
+from models.valuation_result import ValuationResult, CalculationStatus
+from app.services.valuation_engine.engine_registry import engine_registry
+from services.result_cache import result_cache
 
 router = APIRouter()
 
 
-async def calculate_dcf(input_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    DCF (Discounted Cash Flow) 평가
-
-    TODO: 실제 DCF 엔진 연동 필요
-    """
-    # TODO: valuation_engine/dcf/dcf_engine.py 연동
-    return {
-        "enterprise_value": 10000000000,
-        "equity_value": 7000000000,
-        "wacc": 0.08,
-        "terminal_growth_rate": 0.02,
-        "free_cash_flows": [500000000, 600000000, 700000000, 800000000, 900000000]
-    }
-
-
-async def calculate_relative(input_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    상대가치평가법 (Relative Valuation)
-
-    TODO: 실제 Relative 엔진 연동 필요
-    """
-    # TODO: valuation_engine/relative/relative_engine.py 연동
-    return {
-        "equity_value": 6500000000,
-        "per_multiple": 15.2,
-        "pbr_multiple": 1.8,
-        "ev_ebitda_multiple": 8.5,
-        "comparable_companies": ["경쟁사A", "경쟁사B", "경쟁사C"]
-    }
-
-
-async def calculate_asset(input_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    자산가치평가법 (Asset-based Valuation)
-
-    TODO: 실제 Asset 엔진 연동 필요
-    """
-    # TODO: valuation_engine/asset/asset_engine.py 연동
-    return {
-        "net_asset_value": 5000000000,
-        "adjusted_book_value": 5500000000,
-        "liquidation_value": 4500000000
-    }
-
-
-async def calculate_capital_market_law(input_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    본질가치평가법
-
-    TODO: 실제 본질가치 엔진 연동 필요
-    """
-    # TODO: valuation_engine/capital_market_law/cml_engine.py 연동
-    return {
-        "fair_value": 6800000000,
-        "adjustment_factor": 1.0,
-        "compliance_check": "pass"
-    }
-
-
-async def calculate_inheritance_tax_law(input_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    상속세법 평가 (Inheritance Tax Law Valuation)
-
-    TODO: 실제 ITL 엔진 연동 필요
-    """
-    # TODO: valuation_engine/inheritance_tax_law/itl_engine.py 연동
-    return {
-        "tax_base_value": 6200000000,
-        "net_asset_value": 5000000000,
-        "earning_value": 7000000000,
-        "weighted_average": 6200000000,
-        "weight_ratio": {"net_asset": 0.4, "earning": 0.6}
-    }
-
-
-# 평가 방법별 계산 함수 매핑
-CALCULATION_METHODS = {
-    "dcf": calculate_dcf,
-    "relative": calculate_relative,
-    "asset": calculate_asset,
-    "capital_market_law": calculate_capital_market_law,
-    "inheritance_tax_law": calculate_inheritance_tax_law
-}
-
-
 @router.post("/projects/{project_id}/calculate", response_model=CalculationResponse)
 async def calculate_valuation(
     project_id: str,
     request: CalculationRequest,
+    force_recompute: bool = Query(False, description="결과 캐시를 무시하고 재계산 (감사용)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -145,6 +64,10 @@ async def calculate_valuation(
 
     ## 필수 입력
     - input_data: 평가에 필요한 데이터 (AI 추출 결과 + 수동 입력)
+
+    ## 결과 캐시
+    - (평가법, 엔진 버전, 입력)이 같으면 이전 결과 재사용
+    - force_recompute=true 이면 캐시를 무시하고 재계산
     """
     try:
         # 프로젝트 존재 확인
@@ -176,15 +99,19 @@ async def calculate_valuation(
         # 각 평가 방법에 대해 계산 수행
         results = []
         for method in project.valuation_methods:
-            if method not in CALCULATION_METHODS:
+            if not engine_registry.supports(method):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"지원하지 않는 평가 방법입니다: {method}"
                 )
 
-            # 계산 수행
-            calculation_func = CALCULATION_METHODS[method]
-            result_data = await calculation_func(request.input_data)
+            # 캐시 조회 → 미적중 시 계산 (엔진은 처음 쓰일 때만 로드, CPU 작업은 스레드풀에서 실행)
+            lookup = result_cache.lookup(method, request.input_data, db=db, force=force_recompute)
+            if lookup.hit:
+                result_data = lookup.result
+            else:
+                result_data = await run_in_threadpool(engine_registry.evaluate, method, request.input_data)
+                result_cache.store(lookup, result_data)
 
             # 기존 결과 확인
             existing_result = db.query(ValuationResult).filter(
@@ -195,23 +122,32 @@ async def calculate_valuation(
             if existing_result:
                 # 기존 결과 업데이트
                 existing_result.result = result_data
-                existing_result.calculation_status = "completed"
+                existing_result.calculation_status = CalculationStatus.COMPLETED
                 existing_result.key_assumptions = request.input_data.get("assumptions", {})
+                existing_result.input_data = request.input_data
+                existing_result.calculation_date = datetime.utcnow()
+                existing_result.input_hash = lookup.key
+                existing_result.engine_version = lookup.engine_version
                 result = existing_result
             else:
                 # 새 결과 생성
                 result = ValuationResult(
                     project_id=project_id,
                     method=method,
-                    calculation_status="completed",
+                    calculation_status=CalculationStatus.COMPLETED,
                     result=result_data,
-                    key_assumptions=request.input_data.get("assumptions", {})
+                    key_assumptions=request.input_data.get("assumptions", {}),
+                    input_data=request.input_data,
+                    input_hash=lookup.key,
+                    engine_version=lookup.engine_version,
+                    calculation_date=datetime.utcnow()
                 )
                 db.add(result)
 
             results.append({
                 "method": method,
-                "result": result_data
+                "result": result_data,
+                "cache": lookup.source
             })
 
         db.commit()
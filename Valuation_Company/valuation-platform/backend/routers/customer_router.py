@@ -9,13 +9,14 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 from pathlib import Path
 import shutil
 
-from database import get_db
+from database import get_async_db
 from auth import get_customer_user, User
 from schemas.project import ProjectCreateRequest, ProjectCreateResponse
 from schemas.document import DocumentUploadResponse
@@ -58,7 +59,7 @@ def generate_project_id(company_code: str, valuation_methods: List[str]) -> str:
 @router.post("/projects", response_model=ProjectCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     request: ProjectCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_customer_user)
 ):
     """
@@ -78,9 +79,11 @@ async def create_project(
     """
     try:
         # 사업자번호 중복 체크
-        existing = db.query(Project).filter(
-            Project.business_number == request.company_info.business_number
-        ).first()
+        existing = await db.scalar(
+            select(Project).where(
+                Project.business_number == request.company_info.business_number
+            ).limit(1)
+        )
 
         if existing:
             raise HTTPException(
@@ -115,8 +118,8 @@ async def create_project(
         )
 
         db.add(project)
-        db.commit()
-        db.refresh(project)
+        await db.commit()
+        await db.refresh(project)
 
         return ProjectCreateResponse(
             project_id=project.project_id,
@@ -130,7 +133,7 @@ async def create_project(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"프로젝트 생성 중 오류가 발생했습니다: {str(e)}"
@@ -143,7 +146,7 @@ async def upload_documents(
     files: List[UploadFile] = File(...),
     document_type: str = Form(...),
     description: Optional[str] = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_customer_user)
 ):
     """
@@ -166,7 +169,7 @@ async def upload_documents(
     """
     try:
         # 프로젝트 존재 및 권한 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -225,10 +228,10 @@ async def upload_documents(
         if project.status != "documents_uploaded":
             project.status = "documents_uploaded"
 
-        db.commit()
+        await db.commit()
 
         for doc in uploaded_documents:
-            db.refresh(doc)
+            await db.refresh(doc)
 
         return DocumentUploadResponse(
             project_id=project_id,
@@ -249,7 +252,7 @@ async def upload_documents(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"문서 업로드 중 오류가 발생했습니다: {str(e)}"
@@ -260,7 +263,7 @@ async def upload_documents(
 async def request_revision(
     project_id: str,
     request: RevisionRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_customer_user)
 ):
     """
@@ -277,7 +280,7 @@ async def request_revision(
     """
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -304,8 +307,8 @@ async def request_revision(
         db.add(revision)
         project.status = "revision_requested"
 
-        db.commit()
-        db.refresh(revision)
+        await db.commit()
+        await db.refresh(revision)
 
         return RevisionResponse(
             project_id=project_id,
@@ -319,7 +322,7 @@ async def request_revision(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"수정 요청 처리 중 오류가 발생했습니다: {str(e)}"
@@ -329,7 +332,7 @@ async def request_revision(
 @router.get("/projects/{project_id}/report/download")
 async def download_report(
     project_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_customer_user)
 ):
     """
@@ -349,7 +352,7 @@ async def download_report(
 
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -357,9 +360,11 @@ async def download_report(
             )
 
         # 보고서 조회
-        report = db.query(Report).filter(
-            Report.project_id == project_id
-        ).order_by(Report.issued_at.desc()).first()
+        report = await db.scalar(
+            select(Report).where(
+                Report.project_id == project_id
+            ).order_by(Report.issued_at.desc()).limit(1)
+        )
 
         if not report:
             raise HTTPException(
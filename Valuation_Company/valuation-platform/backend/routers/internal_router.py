@@ -7,12 +7,14 @@
 3. 통합 평가
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any
 from datetime import datetime
 
-from database import get_db
+from database import get_async_db
 from auth import get_system_user, User
 from schemas.ai_extraction import AIExtractionRequest, AIExtractionResponse
 from schemas.calculation import (
@@ -24,7 +26,10 @@ from schemas.calculation import (
 from models.project import Project
 from models.document import Document
 from models.approval_point import ApprovalPoint
-from models.valuation_result import ValuationResult
+from models.valuation_result import ValuationResult, CalculationStatus
+from services.simulation_service import simulation_service
+from services.result_cache import result_cache
+from app.services.valuation_engine.engine_registry import engine_registry
 
 # 라우터 생성
 router = APIRouter(
@@ -37,7 +42,7 @@ router = APIRouter(
 async def extract_data(
     project_id: str,
     request: AIExtractionRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_system_user)
 ):
     """
@@ -59,7 +64,7 @@ async def extract_data(
     """
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -74,9 +79,9 @@ async def extract_data(
             )
 
         # 업로드된 문서 조회
-        documents = db.query(Document).filter(
-            Document.project_id == project_id
-        ).all()
+        documents = (await db.scalars(
+            select(Document).where(Document.project_id == project_id)
+        )).all()
 
         if not documents:
             raise HTTPException(
@@ -112,7 +117,7 @@ async def extract_data(
         # 프로젝트 상태 업데이트
         project.status = "collecting"
 
-        db.commit()
+        await db.commit()
 
         return AIExtractionResponse(
             project_id=project_id,
@@ -127,7 +132,7 @@ async def extract_data(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"AI 추출 중 오류가 발생했습니다: {str(e)}"
@@ -138,7 +143,8 @@ async def extract_data(
 async def calculate_valuation(
     project_id: str,
     request: CalculationRequest,
-    db: Session = Depends(get_db),
+    force_recompute: bool = Query(False, description="결과 캐시를 무시하고 재계산 (감사용)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_system_user)
 ):
     """
@@ -156,12 +162,16 @@ async def calculate_valuation(
     4. 자산가치평가법 (asset)
     5. 상증세법평가법 (inheritance_tax_law)
 
+    ## 결과 캐시
+    - (평가법, 엔진 버전, 입력)이 같으면 이전 결과 재사용
+    - force_recompute=true 이면 캐시를 무시하고 재계산
+
     ## 상태 변경
     - collecting → evaluating
     """
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -175,25 +185,30 @@ async def calculate_valuation(
                 detail=f"평가 계산은 'collecting' 상태에서만 가능합니다. (현재: {project.status})"
             )
 
-        # TODO: 실제 평가 엔진 호출
-        # 여기서는 더미 결과 반환
-        valuation_result = {
-            "method": request.method,
-            "enterprise_value": 10000000000,
-            "equity_value": 7000000000,
-            "value_per_share": 70000,
-            "key_assumptions": {
-                "wacc": 0.08,
-                "terminal_growth": 0.02
-            }
-        }
+        if not engine_registry.supports(request.method):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"지원하지 않는 평가 방법입니다: {request.method}"
+            )
+
+        # 캐시 조회 → 미적중 시 평가 엔진 실행
+        lookup = await result_cache.alookup(request.method, request.input_data, db=db, force=force_recompute)
+        if lookup.hit:
+            valuation_result = lookup.result
+        else:
+            valuation_result = await run_in_threadpool(engine_registry.evaluate, request.method, request.input_data)
+            result_cache.store(lookup, valuation_result)
 
         # 결과 저장
         result = ValuationResult(
             project_id=project_id,
             method=request.method,
+            calculation_status=CalculationStatus.COMPLETED,
             result=valuation_result,
-            key_assumptions=valuation_result["key_assumptions"],
+            key_assumptions=request.input_data.get("assumptions", {}),
+            input_data=request.input_data,
+            input_hash=lookup.key,
+            engine_version=lookup.engine_version,
             calculation_date=datetime.utcnow()
         )
 
@@ -202,8 +217,11 @@ async def calculate_valuation(
         # 프로젝트 상태 업데이트
         project.status = "evaluating"
 
-        db.commit()
-        db.refresh(result)
+        await db.commit()
+        await db.refresh(result)
+
+        # 시뮬레이션 기준 상태 폐기 (다음 시뮬레이션 시 새 결과로 재적재)
+        simulation_service.invalidate(project_id)
 
         return CalculationResponse(
             project_id=project_id,
@@ -213,23 +231,37 @@ async def calculate_valuation(
             status=project.status,
             calculated_at=result.calculation_date,
             message=f"{request.method} 평가가 완료되었습니다."
+                    + (" (캐시된 결과)" if lookup.hit else "")
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"평가 계산 중 오류가 발생했습니다: {str(e)}"
         )
 
 
+@router.get("/result-cache/stats")
+async def get_result_cache_stats(current_user: User = Depends(get_system_user)):
+    """
+    # 평가 결과 캐시 통계
+
+    캐시 적중/미적중 카운터와 엔진별 콜드 스타트 비용을 반환합니다.
+    """
+    return {
+        "result_cache": result_cache.stats(),
+        "engines": engine_registry.stats()
+    }
+
+
 @router.post("/projects/{project_id}/integrated-valuation", response_model=IntegratedValuationResponse)
 async def integrated_valuation(
     project_id: str,
     request: IntegratedValuationRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_system_user)
 ):
     """
@@ -250,7 +282,7 @@ async def integrated_valuation(
     """
     try:
         # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.project_id == project_id))
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -265,9 +297,9 @@ async def integrated_valuation(
             )
 
         # 평가 결과 조회
-        valuation_results = db.query(ValuationResult).filter(
-            ValuationResult.project_id == project_id
-        ).all()
+        valuation_results = (await db.scalars(
+            select(ValuationResult).where(ValuationResult.project_id == project_id)
+        )).all()
 
         if not valuation_results:
             raise HTTPException(
@@ -328,7 +360,7 @@ async def integrated_valuation(
         # 프로젝트 상태 업데이트
         project.status = "human_approval"
 
-        db.commit()
+        await db.commit()
 
         return IntegratedValuationResponse(
             project_id=project_id,
@@ -344,7 +376,7 @@ async def integrated_valuation(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"통합 평가 중 오류가 발생했습니다: {str(e)}"
@@ -58,10 +58,16 @@ __all__ = [
     "ApprovalPointsResponse",
     "ApprovalDecisionRequest",
     "ApprovalDecisionResponse",
+    "ApprovalPointsListResponse",
+    "BatchApprovalItem",
+    "BatchApprovalRequest",
+    "BatchApprovalResponse",
 
     # Draft
     "DraftRequest",
     "DraftResponse",
+    "DraftGenerateRequest",
+    "DraftGenerateResponse",
     "RevisionRequest",
     "RevisionResponse",
 
@@ -70,4 +76,6 @@ __all__ = [
     "FinalizeResponse",
     "ReportRequest",
     "ReportResponse",
+    "ReportGenerateRequest",
+    "ReportGenerateResponse",
 ]
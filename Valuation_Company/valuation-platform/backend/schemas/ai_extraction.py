@@ -0,0 +1,31 @@
+"""
+AI data extraction schemas
+
+시스템/AI 내부 API(internal_router) 데이터 추출 스키마
+"""
+
+from typing import Literal
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+from .common import ProjectStatusCode
+
+
+# ========================================
+# AI 데이터 추출 (POST /internal/projects/{project_id}/extract)
+# ========================================
+
+class AIExtractionRequest(BaseModel):
+    """AI 데이터 추출 요청"""
+    extraction_method: Literal["gemini", "claude", "ocr"] = Field(default="gemini", description="추출 방식")
+
+
+class AIExtractionResponse(BaseModel):
+    """AI 데이터 추출 응답"""
+    project_id: str
+    extracted_data: dict = Field(..., description="추출된 데이터 (financials, assets, liabilities, market_data)")
+    extraction_method: str = Field(..., description="추출 방식")
+    confidence_score: float = Field(..., ge=0, le=1, description="추출 신뢰도")
+    status: ProjectStatusCode
+    extracted_at: datetime
+    message: str
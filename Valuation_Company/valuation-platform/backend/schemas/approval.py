@@ -103,6 +103,16 @@ class ApprovalPointsResponse(BaseModel):
         }
 
 
+class ApprovalPointsListResponse(BaseModel):
+    """판단 포인트 목록 응답 (회계사 API)"""
+    project_id: str
+    total_points: int = Field(..., description="전체 포인트 수")
+    approved_count: int = Field(..., description="승인 완료 수")
+    rejected_count: int = Field(..., description="거절 수")
+    pending_count: int = Field(..., description="승인 대기 수")
+    approval_points: List[ApprovalPoint] = Field(..., description="판단 포인트 목록")
+
+
 # ========================================
 # 10. 판단 포인트 승인 (POST /projects/{project_id}/approval-points/{point_id})
 # ========================================
@@ -180,6 +190,43 @@ class ApprovalDecisionResponse(BaseModel):
         }
 
 
+# ========================================
+# 판단 포인트 일괄 승인 (POST /projects/{project_id}/approval-points/batch-approve)
+# ========================================
+
+class BatchApprovalItem(BaseModel):
+    """일괄 승인 항목"""
+    point_id: str = Field(..., description="포인트 ID (JP001-JP022)", pattern=r'^JP\d{3}$')
+    decision: Literal["approved", "rejected", "custom"] = Field(..., description="회계사 결정")
+    custom_value: Optional[Union[float, int, str, List[str], dict]] = Field(None, description="수정값 (custom 시 필수)")
+    rationale: Optional[str] = Field(None, description="승인 근거")
+
+
+class BatchApprovalRequest(BaseModel):
+    """판단 포인트 일괄 승인 요청"""
+    decisions: List[BatchApprovalItem] = Field(..., min_length=1, description="포인트별 결정 목록")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "decisions": [
+                    {"point_id": "JP001", "decision": "approved"},
+                    {"point_id": "JP003", "decision": "custom", "custom_value": 0.095,
+                     "rationale": "동종업계 WACC 범위 반영"}
+                ]
+            }
+        }
+
+
+class BatchApprovalResponse(BaseModel):
+    """판단 포인트 일괄 승인 응답"""
+    project_id: str
+    success_count: int = Field(..., description="처리 성공 수")
+    failed_count: int = Field(..., description="처리 실패 수")
+    errors: Optional[List[dict]] = Field(None, description="실패 항목 ({'point_id', 'error'})")
+    message: str
+
+
 # ========================================
 # 22개 판단 포인트 전체 목록
 # ========================================
@@ -0,0 +1,67 @@
+"""
+Internal calculation schemas
+
+시스템/AI 내부 API(internal_router) 평가 계산·통합 평가 스키마
+"""
+
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+from .common import ProjectStatusCode
+
+
+# ========================================
+# 평가 계산 (POST /internal/projects/{project_id}/calculate)
+# ========================================
+
+class CalculationRequest(BaseModel):
+    """평가 계산 요청 (평가법 1개)"""
+    method: str = Field(..., description="평가법 (engine_registry 등록명 또는 별칭)")
+    input_data: Dict[str, Any] = Field(..., description="평가 엔진 입력")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "method": "dcf",
+                "input_data": {
+                    "company_id": "SAMSU-2501191430-CP",
+                    "historical_financials": [],
+                    "assumptions": {},
+                    "wacc_inputs": {},
+                    "adjustments": {}
+                }
+            }
+        }
+
+
+class CalculationResponse(BaseModel):
+    """평가 계산 응답"""
+    project_id: str
+    method: str
+    result: Dict[str, Any] = Field(..., description="평가 엔진 결과")
+    result_id: Optional[str] = Field(None, description="결과 ID")
+    status: ProjectStatusCode
+    calculated_at: Optional[datetime] = None
+    message: str
+
+
+# ========================================
+# 통합 평가 (POST /internal/projects/{project_id}/integrated-valuation)
+# ========================================
+
+class IntegratedValuationRequest(BaseModel):
+    """통합 평가 요청"""
+    weights: Dict[str, float] = Field(default_factory=dict, description="평가법별 가중치 (생략 시 1.0)")
+
+
+class IntegratedValuationResponse(BaseModel):
+    """통합 평가 응답"""
+    project_id: str
+    final_value: float = Field(..., description="가중평균 주주가치")
+    value_range: Dict[str, float] = Field(..., description="가치 범위 {'min', 'max'}")
+    method_results: List[dict] = Field(..., description="평가법별 결과 ({'method', 'value', 'weight'})")
+    judgment_points: List[dict] = Field(..., description="생성된 판단 포인트")
+    status: ProjectStatusCode
+    integrated_at: datetime
+    message: str
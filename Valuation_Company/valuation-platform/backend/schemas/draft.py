@@ -59,6 +59,24 @@ class DraftResponse(BaseModel):
         }
 
 
+class DraftGenerateRequest(BaseModel):
+    """초안 생성 요청 (회계사 API)"""
+    format: Literal["pdf", "docx"] = Field(default="pdf", description="초안 파일 형식")
+
+
+class DraftGenerateResponse(BaseModel):
+    """초안 생성 응답 (회계사 API)"""
+    project_id: str
+    draft_id: str = Field(..., description="초안 ID")
+    draft_version: int = Field(..., description="초안 버전")
+    format: str = Field(..., description="초안 파일 형식")
+    preview_url: str = Field(..., description="초안 미리보기 URL")
+    download_url: str = Field(..., description="초안 다운로드 URL")
+    status: ProjectStatusCode
+    generated_at: Optional[datetime] = None
+    message: str
+
+
 # ========================================
 # 12. 수정 요청 (POST /projects/{project_id}/revisions)
 # ========================================
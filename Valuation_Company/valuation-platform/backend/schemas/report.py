@@ -140,3 +140,20 @@ class ReportResponse(BaseModel):
                 "message": "평가 보고서가 발행되었습니다."
             }
         }
+
+
+class ReportGenerateRequest(BaseModel):
+    """보고서 발행 요청 (회계사 API)"""
+    format: Literal["pdf", "docx"] = Field(default="pdf", description="보고서 파일 형식")
+    digital_signature: bool = Field(default=True, description="전자 서명 포함 여부")
+    password_protected: bool = Field(default=False, description="암호화 여부")
+
+
+class ReportGenerateResponse(BaseModel):
+    """보고서 발행 응답 (회계사 API)"""
+    project_id: str
+    report_id: str = Field(..., description="보고서 ID")
+    report_number: str = Field(..., description="보고서 번호 (VR-YYYY-NNNNN)")
+    download_url: str = Field(..., description="보고서 다운로드 URL")
+    issued_at: Optional[datetime] = None
+    message: str
@@ -0,0 +1,45 @@
+"""
+Customer revision request schemas
+
+고객 수정 요청 API(customer_router) 스키마
+"""
+
+from typing import Optional, List, Literal
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+from .common import ProjectStatusCode
+
+
+# ========================================
+# 수정 요청 (POST /customer/projects/{project_id}/revisions)
+# ========================================
+
+class RevisionRequest(BaseModel):
+    """수정 요청"""
+    revision_type: Literal["assumption_change", "scope_change", "clarification"] = Field(
+        ..., description="수정 유형"
+    )
+    description: str = Field(..., description="수정 요청 내용")
+    specific_sections: Optional[List[str]] = Field(None, description="수정 대상 섹션")
+    urgency: Literal["normal", "urgent"] = Field(default="normal", description="긴급도")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "revision_type": "assumption_change",
+                "description": "WACC를 10.5%로 조정해주세요.",
+                "specific_sections": ["valuation_results"],
+                "urgency": "normal"
+            }
+        }
+
+
+class RevisionResponse(BaseModel):
+    """수정 요청 응답"""
+    project_id: str
+    revision_id: str = Field(..., description="수정 요청 ID")
+    revision_type: str = Field(..., description="수정 유형")
+    status: ProjectStatusCode
+    requested_at: Optional[datetime] = None
+    message: str
@@ -4,31 +4,26 @@
 기존 DCF 엔진을 FastAPI 서비스로 래핑
 """
 
-import sys
-import os
 from typing import Dict, Any, Optional
-from pathlib import Path
 
-# 기존 평가 엔진 경로 추가
-ENGINE_PATH = Path(__file__).parent.parent.parent.parent / "기업가치평가플랫폼" / "valuation_engine"
-if str(ENGINE_PATH) not in sys.path:
-    sys.path.insert(0, str(ENGINE_PATH))
+from app.services.valuation_engine.engine_registry import engine_registry
 
 
 class DCFService:
     """DCF평가법 서비스"""
 
     def __init__(self):
-        """서비스 초기화"""
-        try:
-            # 기존 DCF 엔진 import
-            from dcf.dcf_engine import DCFEngine
-            self.engine = DCFEngine()
-            self.engine_available = True
-        except ImportError as e:
-            print(f"⚠️ DCF 엔진 import 실패: {e}")
-            self.engine = None
-            self.engine_available = False
+        """서비스 초기화 (DCF 엔진은 첫 계산 시 레지스트리에서 로드)"""
+        self.method = 'dcf'
+
+    @property
+    def engine(self):
+        """프로세스 공용 DCF 엔진 (evaluate(inputs) 규약)"""
+        return engine_registry.get(self.method)
+
+    @property
+    def engine_available(self) -> bool:
+        return engine_registry.is_available(self.method)
 
     def validate_inputs(self, input_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         """
@@ -107,7 +102,7 @@ class DCFService:
 
         try:
             # 기존 DCF 엔진 실행
-            result = self.engine.run_valuation(input_data)
+            result = self.engine.evaluate(input_data)
 
             # 결과 포맷 변환 (FastAPI 응답용)
             return {
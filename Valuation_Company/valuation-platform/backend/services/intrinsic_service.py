@@ -4,14 +4,7 @@
 기존 본질가치평가 엔진을 FastAPI 서비스로 래핑
 """
 
-import sys
 from typing import Dict, Any, Optional
-from pathlib import Path
-
-# 기존 평가 엔진 경로 추가
-ENGINE_PATH = Path(__file__).parent.parent.parent.parent / "기업가치평가플랫폼" / "valuation_engine"
-if str(ENGINE_PATH) not in sys.path:
-    sys.path.insert(0, str(ENGINE_PATH))
 
 
 class IntrinsicService:
@@ -19,16 +12,10 @@ class IntrinsicService:
 
     def __init__(self):
         """서비스 초기화"""
-        try:
-            # 기존 본질가치평가 엔진 import (있다면)
-            # from capital_market_law.cml_engine import CMLEngine
-            # self.engine = CMLEngine()
-            self.engine = None
-            self.engine_available = False
-        except ImportError as e:
-            print(f"⚠️ 본질가치평가 엔진 import 실패: {e}")
-            self.engine = None
-            self.engine_available = False
+        # 엔진 결과 → 응답 포맷 매핑 전까지 더미 결과 사용
+        # (엔진은 engine_registry.get('capital_market_law')로 지연 로드)
+        self.engine = None
+        self.engine_available = False
 
     def validate_inputs(self, input_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         """
@@ -108,7 +95,7 @@ class IntrinsicService:
 
         try:
             # 기존 본질가치평가 엔진 실행
-            result = self.engine.run_valuation(input_data)
+            result = self.engine.evaluate(input_data)
 
             # 결과 포맷 변환 (FastAPI 응답용)
             return {
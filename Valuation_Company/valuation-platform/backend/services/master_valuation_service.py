@@ -4,7 +4,10 @@
 5가지 평가법을 통합하여 최종 의견을 도출
 """
 
-from typing import Dict, Any, List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional, Set
 from .dcf_service import DCFService
 from .relative_service import RelativeService
 from .intrinsic_service import IntrinsicService
@@ -12,6 +15,33 @@ from .asset_service import AssetService
 from .tax_service import TaxService
 
 
+# 평가법 코드 → (서비스 속성명, 서비스 클래스)
+METHOD_SERVICES = {
+    'dcf': ('dcf_service', DCFService),
+    'relative': ('relative_service', RelativeService),
+    'capital_market_law': ('intrinsic_service', IntrinsicService),
+    'asset': ('asset_service', AssetService),
+    'inheritance_tax_law': ('tax_service', TaxService)
+}
+
+# 프로세스 워커별 서비스 인스턴스 (워커 프로세스 안에서 1회만 생성)
+_worker_services: Dict[str, Any] = {}
+
+
+def _calculate_in_worker(method: str, method_input: Dict[str, Any]) -> tuple:
+    """
+    프로세스 풀 워커 진입점 (모듈 수준 함수여야 pickle 가능)
+
+    Returns:
+        (평가 결과, 계산 시간(ms))
+    """
+    if method not in _worker_services:
+        _worker_services[method] = METHOD_SERVICES[method][1]()
+    start = time.perf_counter()
+    result = _worker_services[method].calculate(method_input)
+    return result, (time.perf_counter() - start) * 1000
+
+
 class MasterValuationService:
     """
     통합 평가 서비스
@@ -19,6 +49,25 @@ class MasterValuationService:
     5가지 평가법의 결과를 종합하여 최종 기업가치 의견 도출
     """
 
+    # 병렬 모드에서 프로세스 풀로 보낼 평가법 (민감도·몬테카를로 등 CPU 집약)
+    PROCESS_METHODS = {'dcf'}
+
+    # 평가법별 기본 제한 시간 (초)
+    DEFAULT_TIMEOUTS = {
+        'dcf': 30.0,
+        'relative': 10.0,
+        'capital_market_law': 10.0,
+        'asset': 10.0,
+        'inheritance_tax_law': 10.0
+    }
+
+    # 요청 간 공유하는 워커 풀 (최초 병렬 실행 시 생성, 시간 초과 시 교체)
+    _thread_pool: Optional[ThreadPoolExecutor] = None
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _process_futures: Dict[Future, float] = {}      # 현재 프로세스 풀에서 진행 중인 작업 → 제한 시각
+    _retired_process_pools: List[ProcessPoolExecutor] = []
+    _pool_lock = threading.Lock()
+
     def __init__(self):
         """서비스 초기화 - 5가지 평가 엔진 인스턴스 생성"""
         self.dcf_service = DCFService()
@@ -27,11 +76,209 @@ class MasterValuationService:
         self.asset_service = AssetService()
         self.tax_service = TaxService()
 
+    @classmethod
+    def _pools(cls, max_workers: int = 5):
+        """공유 스레드/프로세스 풀"""
+        with cls._pool_lock:
+            if cls._thread_pool is None:
+                cls._thread_pool = ThreadPoolExecutor(max_workers=max_workers,
+                                                      thread_name_prefix="valuation")
+            if cls._process_pool is None:
+                cls._process_pool = ProcessPoolExecutor(max_workers=max_workers)
+            return cls._thread_pool, cls._process_pool
+
+    @classmethod
+    def _submit_process(cls, pool: ProcessPoolExecutor, deadline: float, *args) -> Future:
+        """
+        프로세스 풀 제출 + 진행 중 작업과 제한 시각 추적
+
+        풀 교체 시 다른 요청의 작업을 각자의 제한 시각까지 기다리기 위해 사용
+        (deadline: time.perf_counter() 기준)
+        """
+        future = pool.submit(*args)
+        with cls._pool_lock:
+            if pool is cls._process_pool:
+                futures = cls._process_futures
+                futures[future] = deadline
+                future.add_done_callback(lambda f: futures.pop(f, None))
+        return future
+
+    @classmethod
+    def _retire_pools(cls,
+                      thread_pool: Optional[ThreadPoolExecutor],
+                      process_pool: Optional[ProcessPoolExecutor],
+                      stuck: Set[Future]):
+        """
+        시간 초과 작업이 점유한 풀 교체
+
+        실행 중인 작업은 future.cancel()로 멈출 수 없어 슬롯을 계속 차지하므로,
+        이후 요청은 새 풀을 쓰고 기존 풀은 더 이상 작업을 받지 않는다.
+        - 스레드 풀: 스레드는 강제 종료할 수 없으므로 작업이 끝나는 대로 종료
+        - 프로세스 풀: 다른 요청의 진행 중 작업이 끝나면 (늦어도 그 작업들의 가장 늦은 제한 시각) 워커 프로세스를 종료
+        """
+        with cls._pool_lock:
+            if thread_pool is not None and thread_pool is cls._thread_pool:
+                cls._thread_pool = None
+                thread_pool.shutdown(wait=False)
+            if process_pool is None or process_pool is not cls._process_pool:
+                return
+            others = {f: deadline for f, deadline in cls._process_futures.items() if f not in stuck}
+            cls._process_pool = None
+            cls._process_futures = {}
+            cls._retired_process_pools.append(process_pool)
+
+        # 요청별 timeouts가 기본값보다 길 수 있으므로 실제 진행 중 작업의 제한 시각 기준
+        grace = max(max(others.values()) - time.perf_counter(), 0.0) if others else 0.0
+        threading.Thread(target=cls._reap_process_pool, args=(process_pool, others, grace),
+                         name="valuation-pool-reaper", daemon=True).start()
+
+    @classmethod
+    def _reap_process_pool(cls, pool: ProcessPoolExecutor, others: Dict[Future, float], grace: float):
+        """교체된 프로세스 풀: 다른 작업 완료 대기 후 남은 워커(시간 초과 작업) 종료"""
+        wait(others, timeout=grace)
+        cls._terminate_process_pool(pool)
+
+    @classmethod
+    def _terminate_process_pool(cls, pool: ProcessPoolExecutor):
+        with cls._pool_lock:
+            if pool not in cls._retired_process_pools:
+                return
+            cls._retired_process_pools.remove(pool)
+        for process in list((getattr(pool, '_processes', None) or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    @classmethod
+    def shutdown_pools(cls):
+        """
+        워커 풀 종료 (앱 종료 시 호출)
+
+        대기 중 작업은 취소하고 실행 중 작업은 끝날 때까지 기다린다.
+        wait=False로 두면 인터프리터 종료 중 관리 스레드가 닫힌 파이프에 접근해 OSError가 난다.
+        """
+        for pool in list(cls._retired_process_pools):
+            cls._terminate_process_pool(pool)
+        with cls._pool_lock:
+            pools = (cls._thread_pool, cls._process_pool)
+            cls._thread_pool = None
+            cls._process_pool = None
+            cls._process_futures = {}
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def _calculate(self, method: str, method_input: Dict[str, Any]) -> tuple:
+        """평가법 1개 실행 (요청 스레드 또는 스레드 풀) → (결과, 계산 시간(ms))"""
+        service = getattr(self, METHOD_SERVICES[method][0])
+        start = time.perf_counter()
+        result = service.calculate(method_input)
+        return result, (time.perf_counter() - start) * 1000
+
+    @staticmethod
+    def _failed_result(error: str, **flags) -> Dict[str, Any]:
+        return {'success': False, 'error': error, 'enterprise_value': 0, 'equity_value': 0, **flags}
+
+    def _run_sequential(self, methods: List[str], input_data: Dict[str, Any]):
+        """기존 방식: 요청 스레드에서 순서대로 실행"""
+        results, timings = {}, {}
+        for method in methods:
+            start = time.perf_counter()
+            try:
+                results[method], compute_ms = self._calculate(method, input_data.get(method, {}))
+                status = 'ok' if results[method].get('success') else 'failed'
+            except Exception as e:
+                results[method] = self._failed_result(f"{self._get_method_name(method)} 실행 오류: {str(e)}")
+                compute_ms, status = None, 'error'
+            timings[method] = {
+                'status': status,
+                'mode': 'sequential',
+                'elapsed_ms': round((time.perf_counter() - start) * 1000, 2),
+                'compute_ms': round(compute_ms, 2) if compute_ms is not None else None
+            }
+        return results, timings
+
+    def _run_parallel(self,
+                      methods: List[str],
+                      input_data: Dict[str, Any],
+                      timeouts: Dict[str, float]):
+        """
+        병렬 실행: 평가법별로 워커 풀에 제출하고 끝나는 순서대로 수집
+
+        - 제한 시간을 넘긴 평가법은 실패(timed_out)로 처리하고 나머지를 기다리지 않음
+        - 이미 실행 중인 작업은 중단할 수 없으므로 결과를 버리고 해당 풀을 교체 (_retire_pools)
+        """
+        thread_pool, process_pool = self._pools()
+
+        submitted_at = time.perf_counter()
+        futures = {}
+        for method in methods:
+            method_input = input_data.get(method, {})
+            if method in self.PROCESS_METHODS:
+                future = self._submit_process(process_pool, submitted_at + timeouts[method],
+                                              _calculate_in_worker, method, method_input)
+                mode = 'process'
+            else:
+                future = thread_pool.submit(self._calculate, method, method_input)
+                mode = 'thread'
+            futures[future] = (method, mode, submitted_at + timeouts[method])
+
+        results, timings = {}, {}
+        pending = set(futures)
+
+        while pending:
+            now = time.perf_counter()
+            next_deadline = min(futures[f][2] for f in pending)
+            done, pending = wait(pending, timeout=max(next_deadline - now, 0), return_when=FIRST_COMPLETED)
+
+            now = time.perf_counter()
+            for future in done:
+                method, mode, _ = futures[future]
+                try:
+                    results[method], compute_ms = future.result()
+                    status = 'ok' if results[method].get('success') else 'failed'
+                except Exception as e:
+                    results[method] = self._failed_result(f"{self._get_method_name(method)} 실행 오류: {str(e)}")
+                    compute_ms, status = None, 'error'
+                timings[method] = {
+                    'status': status,
+                    'mode': mode,
+                    'elapsed_ms': round((now - submitted_at) * 1000, 2),
+                    'compute_ms': round(compute_ms, 2) if compute_ms is not None else None
+                }
+
+            # 제한 시간 초과
+            expired = [f for f in pending if futures[f][2] <= now]
+            stuck = {f for f in expired if not f.cancel()}
+            stuck_modes = {futures[f][1] for f in stuck}
+            if stuck:
+                self._retire_pools(thread_pool if 'thread' in stuck_modes else None,
+                                   process_pool if 'process' in stuck_modes else None,
+                                   stuck)
+            for future in expired:
+                method, mode, _ = futures[future]
+                pending.discard(future)
+                results[method] = self._failed_result(
+                    f"{self._get_method_name(method)} 제한 시간 초과 ({timeouts[method]:.1f}초)",
+                    timed_out=True
+                )
+                timings[method] = {
+                    'status': 'timeout',
+                    'mode': mode,
+                    'elapsed_ms': round((now - submitted_at) * 1000, 2),
+                    'compute_ms': None
+                }
+
+        # 요청 순서대로 정렬
+        return {m: results[m] for m in methods}, {m: timings[m] for m in methods}
+
     def run_integrated_valuation(
         self,
         methods: List[str],
         input_data: Dict[str, Any],
-        weights: Dict[str, float] = None
+        weights: Dict[str, float] = None,
+        parallel: bool = False,
+        timeouts: Optional[Dict[str, float]] = None
     ) -> Dict[str, Any]:
         """
         통합 평가 실행
@@ -49,6 +296,11 @@ class MasterValuationService:
                 }
             weights: 각 평가법의 가중치 (선택)
                 {'dcf': 0.4, 'relative': 0.3, ...}
+            parallel: True면 평가법별로 워커 풀에서 동시 실행
+                (DCF는 프로세스 풀, 나머지는 스레드 풀)
+                서비스 호출 전용 옵션 - 현재 이 서비스를 호출하는 API 라우터가 없음
+                (routers/master_valuation.py는 더미 결과를 쓰는 미등록 레퍼런스)
+            timeouts: 병렬 모드 평가법별 제한 시간(초). 생략 시 DEFAULT_TIMEOUTS
 
         Returns:
             Dict: 통합 평가 결과
@@ -57,27 +309,23 @@ class MasterValuationService:
                     'final_value': float,           # 최종 기업가치
                     'value_range': Dict,            # 평가 범위
                     'weighted_average': float,      # 가중평균 가치
-                    'recommendation': str           # 최종 의견
+                    'recommendation': str,          # 최종 의견
+                    'valuation_summary': Dict       # 성공/실패/시간 초과 및 평가법별 소요 시간
                 }
         """
-        results = {}
+        started = time.perf_counter()
+        methods = [method for method in methods if method in METHOD_SERVICES]
 
         # 1. 각 평가법 실행
-        for method in methods:
-            if method == 'dcf':
-                results['dcf'] = self.dcf_service.calculate(input_data.get('dcf', {}))
-            elif method == 'relative':
-                results['relative'] = self.relative_service.calculate(input_data.get('relative', {}))
-            elif method == 'capital_market_law':
-                results['capital_market_law'] = self.intrinsic_service.calculate(input_data.get('capital_market_law', {}))
-            elif method == 'asset':
-                results['asset'] = self.asset_service.calculate(input_data.get('asset', {}))
-            elif method == 'inheritance_tax_law':
-                results['inheritance_tax_law'] = self.tax_service.calculate(input_data.get('inheritance_tax_law', {}))
+        if parallel:
+            timeouts = {**self.DEFAULT_TIMEOUTS, **(timeouts or {})}
+            results, timings = self._run_parallel(methods, input_data, timeouts)
+        else:
+            results, timings = self._run_sequential(methods, input_data)
 
         # 2. 가중치 설정 (없으면 균등 가중)
         if not weights:
-            weights = {method: 1.0 / len(methods) for method in methods}
+            weights = {method: 1.0 / len(methods) for method in methods} if methods else {}
 
         # 3. 가중평균 계산
         weighted_sum = 0
@@ -116,11 +364,16 @@ class MasterValuationService:
                 'equity_value': result.get('equity_value', 0),
                 'weight': weights.get(method, 1.0),
                 'success': result.get('success', False),
+                'status': timings[method]['status'],
+                'error': result.get('error'),
                 'note': result.get('note', '')
             }
             for method, result in results.items()
         ]
 
+        failed_methods = [m for m, t in timings.items() if t['status'] in ('failed', 'error')]
+        timed_out_methods = [m for m, t in timings.items() if t['status'] == 'timeout']
+
         return {
             'method_results': method_results,
             'final_value': final_value,
@@ -130,7 +383,13 @@ class MasterValuationService:
             'valuation_summary': {
                 'total_methods_used': len(methods),
                 'successful_methods': sum(1 for r in results.values() if r.get('success')),
-                'weights': weights
+                'weights': weights,
+                'execution_mode': 'parallel' if parallel else 'sequential',
+                'partial': bool(failed_methods or timed_out_methods),
+                'failed_methods': failed_methods,
+                'timed_out_methods': timed_out_methods,
+                'timings': timings,
+                'total_elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
             }
         }
 
@@ -0,0 +1,272 @@
+"""
+평가 결과 캐시 (Content-addressed)
+
+(평가법, 엔진 버전, 정규화 입력)의 해시를 키로 평가 결과를 재사용
+- 프로세스 내 LRU (메모리)
+- valuation_results 테이블의 input_hash로 워커 간 공유
+- 엔진 소스가 바뀌면 엔진 버전이 바뀌어 이전 키는 자연히 미적중
+- 기본 시장 데이터 저장소가 있으면 그 지문도 키에 포함 (WACC 구성요소 as-of 값 갱신 반영)
+"""
+
+import copy
+import hashlib
+import json
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Any, Optional
+
+from app.services.valuation_engine.engine_registry import engine_registry
+from common.market_data import get_default_store  # engine_registry가 엔진 루트를 sys.path에 추가
+
+
+def normalize_inputs(value: Any) -> Any:
+    """
+    입력을 해시용 정규형으로 변환
+
+    - dict 키 정렬은 json.dumps(sort_keys=True)에 맡김
+    - tuple / numpy 배열 → list, Decimal / numpy 스칼라 → float
+    - 정수값 float → int (1.0과 1을 같은 입력으로 취급), 나머지 float은 유효숫자 12자리
+    - date / datetime → ISO 문자열
+    """
+    if isinstance(value, dict):
+        return {str(k): normalize_inputs(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_inputs(v) for v in value]
+    if hasattr(value, 'tolist'):  # numpy 배열 / 스칼라
+        return normalize_inputs(value.tolist())
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, Decimal)):
+        number = float(value)
+        if not math.isfinite(number):
+            return repr(number)
+        if number.is_integer():
+            return int(number)
+        return float(f"{number:.12g}")
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+@dataclass
+class CacheLookup:
+    """캐시 조회 결과 (미적중이면 result=None, 계산 후 store에 그대로 넘김)"""
+    method: str  # 호출 측 평가법 코드 (DB 저장용)
+    key: str  # 입력 해시
+    engine_version: str
+    result: Optional[Dict[str, Any]] = None
+    source: str = 'miss'  # 'memory' | 'db' | 'miss' | 'forced'
+
+    @property
+    def hit(self) -> bool:
+        return self.result is not None
+
+
+class ValuationResultCache:
+    """평가 결과 캐시 (메모리 LRU + valuation_results 테이블)"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'db_hits': 0, 'misses': 0, 'forced': 0, 'evictions': 0}
+
+    # ==================== 키 ====================
+
+    def key_for(self, method: str, inputs: Dict[str, Any]) -> tuple:
+        """
+        캐시 키 계산
+
+        Returns:
+            (키, 엔진 버전)
+        """
+        engine_version = engine_registry.version(method)
+        market_data = get_default_store()
+        payload = json.dumps(
+            {
+                'method': engine_registry.resolve(method),
+                'engine_version': engine_version,
+                'market_data': market_data.fingerprint if market_data is not None else None,
+                'inputs': normalize_inputs(inputs)
+            },
+            sort_keys=True, ensure_ascii=False, separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest(), engine_version
+
+    # ==================== 조회 / 저장 ====================
+
+    def lookup(self, method: str, inputs: Dict[str, Any], db=None, force: bool = False) -> CacheLookup:
+        """
+        캐시 조회 (메모리 → DB 순)
+
+        Args:
+            method: 평가법 코드
+            inputs: 평가 입력
+            db: SQLAlchemy 세션 (있으면 메모리 미적중 시 valuation_results 조회)
+            force: True면 조회하지 않고 재계산 대상으로 반환 (감사용)
+
+        Returns:
+            CacheLookup
+        """
+        lookup = self._lookup_memory(method, inputs, force)
+        if lookup.source == 'miss' and db is not None:
+            self._apply_db(lookup, self._lookup_db(db, method, lookup.key))
+        return self._finish(lookup)
+
+    async def alookup(self, method: str, inputs: Dict[str, Any], db=None, force: bool = False) -> CacheLookup:
+        """
+        캐시 조회 (비동기 세션용, lookup과 동일한 순서 / 카운터)
+
+        Args:
+            db: SQLAlchemy AsyncSession
+        """
+        lookup = self._lookup_memory(method, inputs, force)
+        if lookup.source == 'miss' and db is not None:
+            self._apply_db(lookup, await self._alookup_db(db, method, lookup.key))
+        return self._finish(lookup)
+
+    def _lookup_memory(self, method: str, inputs: Dict[str, Any], force: bool) -> CacheLookup:
+        key, engine_version = self.key_for(method, inputs)
+        lookup = CacheLookup(method=method, key=key, engine_version=engine_version)
+
+        if force:
+            self.counters['forced'] += 1
+            lookup.source = 'forced'
+            return lookup
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.counters['hits'] += 1
+                lookup.result = copy.deepcopy(cached)
+                lookup.source = 'memory'
+        return lookup
+
+    def _apply_db(self, lookup: CacheLookup, cached: Optional[Dict[str, Any]]):
+        if cached is not None:
+            self._remember(lookup.key, cached)
+            self.counters['db_hits'] += 1
+            lookup.result = copy.deepcopy(cached)
+            lookup.source = 'db'
+
+    def _finish(self, lookup: CacheLookup) -> CacheLookup:
+        if lookup.source == 'miss':
+            self.counters['misses'] += 1
+        return lookup
+
+    @staticmethod
+    def _db_query(method: str, key: str):
+        """
+        같은 엔진의 완료된 결과 조회
+
+        valuation_results.method는 프로젝트 표기('capital_market_law' 등)로 저장되므로
+        요청 코드가 아니라 해석된 엔진의 코드 전체로 찾는다. 저장 가능한 코드가 없으면 None
+        """
+        from sqlalchemy import select
+        from models.valuation_result import ValuationResult, ValuationMethod, CalculationStatus
+
+        stored = {m.value for m in ValuationMethod}
+        codes = [code for code in engine_registry.codes(method) if code in stored]
+        if not codes:
+            return None
+        return select(ValuationResult.result).where(
+            ValuationResult.method.in_(codes),
+            ValuationResult.input_hash == key,
+            ValuationResult.calculation_status == CalculationStatus.COMPLETED
+        ).limit(1)
+
+    def _lookup_db(self, db, method: str, key: str) -> Optional[Dict[str, Any]]:
+        query = self._db_query(method, key)
+        return db.execute(query).scalar() if query is not None else None
+
+    async def _alookup_db(self, db, method: str, key: str) -> Optional[Dict[str, Any]]:
+        query = self._db_query(method, key)
+        return (await db.execute(query)).scalar() if query is not None else None
+
+    def store(self, lookup: CacheLookup, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        계산 결과를 메모리 캐시에 저장
+
+        DB 쪽은 호출 측이 ValuationResult 행에 input_hash / engine_version과
+        calculation_status=COMPLETED를 함께 기록한다 (완료 행만 조회 대상).
+        """
+        self._remember(lookup.key, copy.deepcopy(result))
+        lookup.result = result
+        return result
+
+    def _remember(self, key: str, result: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.counters['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            {
+                'entries': int, 'max_entries': int,
+                'hits': int, 'db_hits': int, 'misses': int, 'forced': int, 'evictions': int,
+                'hit_ratio': float  # (hits + db_hits) / 조회 수 (forced 제외)
+            }
+        """
+        lookups = self.counters['hits'] + self.counters['db_hits'] + self.counters['misses']
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            **self.counters,
+            'hit_ratio': round((self.counters['hits'] + self.counters['db_hits']) / lookups, 4) if lookups else 0.0
+        }
+
+
+# 싱글톤 인스턴스
+result_cache = ValuationResultCache()
+
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 80)
+    print("평가 결과 캐시 테스트")
+    print("=" * 80)
+
+    cache = ValuationResultCache(max_entries=2)
+    inputs = {'asset_value': 50000, 'income_value': 80000.0, 'purpose': '합병'}
+
+    # 같은 입력이면 키 순서 / 1.0 vs 1 / tuple vs list와 무관하게 같은 키
+    key_a, version = cache.key_for('intrinsic', inputs)
+    key_b, _ = cache.key_for('capital_market_law', {'purpose': '합병', 'income_value': 80000,
+                                                     'asset_value': 50000.0})
+    assert key_a == key_b
+    print(f"키: {key_a[:16]}…  엔진 버전: {version}")
+
+    for attempt in range(3):
+        start = time.perf_counter()
+        lookup = cache.lookup('capital_market_law', inputs)
+        if not lookup.hit:
+            cache.store(lookup, engine_registry.evaluate('capital_market_law', inputs))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {attempt + 1}회차: {lookup.source:<7} {elapsed:7.3f} ms  → {lookup.result['cml_value']:,.0f}")
+
+    forced = cache.lookup('capital_market_law', inputs, force=True)
+    assert forced.source == 'forced' and not forced.hit
+
+    # LRU 퇴출
+    for income in (1, 2):
+        cache.store(cache.lookup('intrinsic', {**inputs, 'income_value': income}), {'cml_value': income})
+    assert not cache.lookup('intrinsic', inputs).hit
+
+    print(f"\n통계: {cache.stats()}")
+    print("=" * 80)
@@ -0,0 +1,397 @@
+"""
+평가 시뮬레이션 서비스 (What-if)
+
+프로젝트별 DCF 기준 상태(정규화 재무, 기준 가정, 기준 결과)를 메모리에 유지하고
+수정된 가정을 델타로 적용해 가치 변화와 가정별 영향도를 한 번의 배치 호출로 계산
+"""
+
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from app.services.valuation_engine.engine_registry import engine_registry
+
+
+class DCFSimulationState:
+    """프로젝트별 DCF 기준 상태 (warm state)"""
+
+    def __init__(self, project_id: str, inputs: Dict[str, Any], engine):
+        self.project_id = project_id
+        self.inputs = inputs
+        self.periods = inputs.get('projection_period', 5)
+        self.normalized = engine.engine.normalize_financials(inputs['historical_financials'])
+        # 선택자만 있는 wacc_inputs(업종·종목 등)는 시장 데이터로 한 번만 확정
+        self.wacc_inputs = engine.resolve_wacc_inputs(inputs)
+
+        base = engine.run_valuation({**inputs, 'wacc_inputs': self.wacc_inputs}, normalized=self.normalized)
+        self.base_wacc = float(base['wacc'][0])
+        self.base_equity_value = float(base['equity_value'][0])
+        self.base_value_per_share = float(base['value_per_share'][0])
+        self.loaded_at = time.time()
+
+
+class SimulationService:
+    """
+    DCF 시뮬레이션 서비스
+
+    - 프로젝트별 기준 상태를 LRU로 보관 (max_projects 초과 시 가장 오래 안 쓴 프로젝트 제거)
+    - 요청마다 [기준, 전체 수정, 가정별 단독 수정] 행을 한 번의 배치 평가로 계산
+    """
+
+    # 요청 키 → (입력 구역, 엔진 키, ImpactBreakdown 필드)
+    DRIVERS = {
+        'revenue_growth_rate': ('assumptions', 'revenue_growth', 'revenue_growth_impact'),
+        'ebit_margin': ('assumptions', 'target_operating_margin', 'ebit_margin_impact'),
+        'wacc': ('wacc_inputs', 'wacc', 'wacc_impact'),
+        'terminal_growth': ('assumptions', 'terminal_growth', 'terminal_growth_impact'),
+    }
+
+    # 엔진 키 그대로 수정 가능한 가정
+    ASSUMPTION_KEYS = ('target_operating_margin', 'tax_rate', 'depreciation_rate',
+                       'capex_rate', 'wc_rate', 'terminal_growth', 'revenue_growth')
+    WACC_KEYS = ('risk_free_rate', 'beta', 'market_premium', 'cost_of_debt', 'debt_ratio')
+    # 배치 엔진에 넘길 수치형 WACC 입력 (선택자·관측일 정보 제외)
+    WACC_COLUMNS = WACC_KEYS + ('tax_rate', 'wacc')
+
+    REQUIRED_INPUTS = ('historical_financials', 'assumptions', 'wacc_inputs', 'adjustments')
+
+    # 엔진 금액 단위(백만원) → 응답 단위(원)
+    UNIT = 1_000_000
+
+    def __init__(self, max_projects: int = 256, latency_window: int = 1000):
+        """서비스 초기화 (엔진은 첫 적재 시 생성)"""
+        self._engine = None
+        self.max_projects = max_projects
+        self._states: "OrderedDict[str, DCFSimulationState]" = OrderedDict()
+        self._latencies = deque(maxlen=latency_window)
+        self.counters = {'hits': 0, 'loads': 0, 'evictions': 0}
+
+    @property
+    def engine(self):
+        """배치 DCF 엔진 (엔진 모듈 지연 로딩 유지를 위해 첫 사용 시 생성)"""
+        if self._engine is None:
+            self._engine = engine_registry.instance('dcf_batch')
+        return self._engine
+
+    # ==================== 기준 상태 관리 ====================
+
+    def has_state(self, project_id: str) -> bool:
+        return project_id in self._states
+
+    def load_state(self, project_id: str, inputs: Dict[str, Any]) -> DCFSimulationState:
+        """
+        기준 상태 적재 (DCF 엔진 입력 전체 필요)
+
+        Raises:
+            ValueError: 필수 입력 누락, WACC 구성요소를 시장 데이터로 채울 수 없음
+        """
+        missing = [key for key in self.REQUIRED_INPUTS if key not in (inputs or {})]
+        if missing:
+            raise ValueError(f"시뮬레이션 기준 입력 누락: {', '.join(missing)}")
+
+        try:
+            state = DCFSimulationState(project_id, inputs, self.engine)
+        except LookupError as e:
+            raise ValueError(f"WACC 입력을 확정할 수 없습니다: {e}")
+        self._states[project_id] = state
+        self._states.move_to_end(project_id)
+        self.counters['loads'] += 1
+
+        while len(self._states) > self.max_projects:
+            self._states.popitem(last=False)
+            self.counters['evictions'] += 1
+
+        return state
+
+    def invalidate(self, project_id: Optional[str] = None):
+        """기준 상태 삭제 (평가 재실행·가정 확정 시 호출)"""
+        if project_id is None:
+            self._states.clear()
+        else:
+            self._states.pop(project_id, None)
+
+    # ==================== 시뮬레이션 ====================
+
+    def _resolve(self, name: str):
+        """요청 키 → (입력 구역, 엔진 키, 영향 필드)"""
+        if name in self.DRIVERS:
+            return self.DRIVERS[name]
+        if name in self.ASSUMPTION_KEYS:
+            return 'assumptions', name, None
+        if name in self.WACC_KEYS:
+            return 'wacc_inputs', name, None
+        raise ValueError(f"시뮬레이션할 수 없는 가정입니다: {name}")
+
+    def _growth_path(self, value, periods: int) -> List[float]:
+        """성장률: 스칼라면 전 기간 동일, 리스트면 연도별 경로"""
+        if np.ndim(value) == 0:
+            return [float(value)] * periods
+        if len(value) < periods:
+            raise ValueError(f"성장률 경로는 {periods}개 연도가 필요합니다")
+        return [float(v) for v in value[:periods]]
+
+    def simulate(self, project_id: str, modified_assumptions: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        수정 가정 적용 후 가치 변화 및 가정별 영향 계산
+
+        배치 행 구성 (한 번의 BatchDCFEngine 호출):
+            0      : 기준
+            1      : 모든 수정 반영
+            2..k+1 : 가정 하나씩만 수정 (단독 영향)
+
+        영향도 = 단독 영향 + 상호작용분(전체 변화 - 단독 영향 합)을 |단독 영향| 비례 배분
+        → 가정별 영향의 합 = 전체 변화
+
+        Returns:
+            {
+                'original_value', 'simulated_value', 'change_amount', 'change_percentage',
+                'impacts': {'revenue_growth_impact': ..., ...},
+                'other_impacts': {'capex_rate': ...},
+                'new_assumptions': {...},
+                'elapsed_ms': 0.4
+            }
+
+        Raises:
+            KeyError: 기준 상태 없음 (load_state 먼저 호출)
+            ValueError: 지원하지 않는 가정
+        """
+        start = time.perf_counter()
+
+        state = self._states[project_id]
+        self._states.move_to_end(project_id)
+        self.counters['hits'] += 1
+
+        base_assumptions = state.inputs['assumptions']
+        base_wacc_inputs = state.wacc_inputs
+        periods = state.periods
+
+        # 수정 항목 정리 (입력 구역, 엔진 키, 값)
+        edits = []
+        for name, value in modified_assumptions.items():
+            section, key, impact_field = self._resolve(name)
+            if section == 'wacc_inputs' and key != 'wacc' and 'wacc' in base_wacc_inputs:
+                raise ValueError(f"WACC가 직접 지정된 프로젝트는 {name}을(를) 수정할 수 없습니다 ('wacc'로 수정)")
+            if key == 'revenue_growth':
+                value = self._growth_path(value, periods)
+            edits.append((name, section, key, impact_field, value))
+
+        n_rows = 2 + len(edits)
+
+        # 기준값으로 채운 컬럼 → 행별 수정 반영
+        assumption_columns = {
+            key: np.full(n_rows, float(base_assumptions[key]))
+            for key in self.ASSUMPTION_KEYS
+            if key in base_assumptions and key != 'revenue_growth'
+        }
+        growth = np.tile(np.asarray(base_assumptions['revenue_growth'][:periods], dtype=float), (n_rows, 1))
+        wacc_columns = {
+            key: np.full(n_rows, float(base_wacc_inputs[key]))
+            for key in self.WACC_COLUMNS
+            if base_wacc_inputs.get(key) is not None
+        }
+        if any(key == 'wacc' for _, _, key, _, _ in edits):
+            wacc_columns['wacc'] = np.full(n_rows, state.base_wacc)
+
+        for row, (_, section, key, _, value) in enumerate(edits, start=2):
+            for target_row in (1, row):
+                if key == 'revenue_growth':
+                    growth[target_row] = value
+                elif section == 'assumptions':
+                    assumption_columns.setdefault(
+                        key, np.full(n_rows, float(self.engine.DEFAULT_ASSUMPTIONS.get(key, np.nan)))
+                    )[target_row] = value
+                else:
+                    wacc_columns[key][target_row] = value
+
+        batch = self.engine.run_valuation({
+            **state.inputs,
+            'assumptions': {
+                **assumption_columns,
+                'revenue_growth': growth,
+                'base_year': base_assumptions['base_year']
+            },
+            'wacc_inputs': wacc_columns
+        }, normalized=state.normalized)
+
+        if not batch['valid'].all():
+            raise ValueError("WACC는 영구성장률보다 커야 합니다")
+
+        equity = batch['equity_value'] * self.UNIT
+        original_value = float(equity[0])
+        simulated_value = float(equity[1])
+        change = simulated_value - original_value
+
+        # 가정별 영향 (상호작용분 비례 배분)
+        standalone = equity[2:] - equity[0]
+        residual = change - float(standalone.sum())
+        weight_total = float(np.abs(standalone).sum())
+        if weight_total > 0:
+            attributed = standalone + residual * np.abs(standalone) / weight_total
+        else:
+            attributed = standalone
+
+        impacts = {}
+        other_impacts = {}
+        for (name, _, _, impact_field, _), amount in zip(edits, attributed):
+            if impact_field:
+                impacts[impact_field] = int(round(amount))
+            else:
+                other_impacts[name] = int(round(amount))
+
+        elapsed = time.perf_counter() - start
+        self._latencies.append(elapsed)
+
+        return {
+            'original_value': int(round(original_value)),
+            'simulated_value': int(round(simulated_value)),
+            'change_amount': int(round(change)),
+            'change_percentage': change / original_value if original_value else 0.0,
+            'value_per_share': float(batch['value_per_share'][1]),
+            'impacts': impacts,
+            'other_impacts': other_impacts or None,
+            'new_assumptions': {**modified_assumptions},
+            'elapsed_ms': elapsed * 1e3
+        }
+
+    # ==================== 모니터링 ====================
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 및 지연시간 통계 (최근 latency_window건 기준)"""
+        latencies_ms = np.asarray(self._latencies) * 1e3
+        return {
+            'projects_cached': len(self._states),
+            'max_projects': self.max_projects,
+            **self.counters,
+            'latency_ms': {
+                'count': int(latencies_ms.size),
+                'p50': float(np.percentile(latencies_ms, 50)) if latencies_ms.size else None,
+                'p99': float(np.percentile(latencies_ms, 99)) if latencies_ms.size else None,
+                'max': float(latencies_ms.max()) if latencies_ms.size else None
+            }
+        }
+
+
+# 프로세스 단위 공유 인스턴스
+simulation_service = SimulationService()
+
+
+# 테스트
+if __name__ == "__main__":
+    print("=" * 80)
+    print("DCF Simulation Service - Warm State What-if")
+    print("=" * 80)
+
+    import sys
+    # 공유 인스턴스 생성만으로는 엔진 모듈을 로드하지 않음 (지연 로딩)
+    assert simulation_service._engine is None and 'dcf.batch_dcf_engine' not in sys.modules
+
+    base_inputs = {
+        'company_id': 'TEST001',
+        'company_name': '테스트기업',
+        'valuation_date': '2025-01-01',
+        'historical_financials': [
+            {'year': 2022, 'revenue': 100_000, 'operating_income': 12_000, 'net_income': 8_000,
+             'depreciation': 3_000, 'capex': 4_000, 'working_capital_change': 1_000},
+            {'year': 2023, 'revenue': 115_000, 'operating_income': 15_000, 'net_income': 10_000,
+             'depreciation': 3_500, 'capex': 5_000, 'working_capital_change': 1_500},
+            {'year': 2024, 'revenue': 130_000, 'operating_income': 18_000, 'net_income': 12_000,
+             'depreciation': 4_000, 'capex': 6_000, 'working_capital_change': 1_500}
+        ],
+        'assumptions': {
+            'base_year': 2024,
+            'revenue_growth': [0.12, 0.10, 0.08, 0.06, 0.05],
+            'target_operating_margin': 0.15,
+            'tax_rate': 0.25,
+            'depreciation_rate': 0.03,
+            'capex_rate': 0.05,
+            'wc_rate': 0.10,
+            'terminal_growth': 0.03
+        },
+        'wacc_inputs': {
+            'risk_free_rate': 0.035, 'beta': 1.2, 'market_premium': 0.07,
+            'cost_of_debt': 0.05, 'debt_ratio': 0.30, 'tax_rate': 0.25
+        },
+        'adjustments': {
+            'cash': 10_000, 'total_debt': 30_000,
+            'non_operating_assets': 5_000, 'shares_outstanding': 10_000_000
+        }
+    }
+
+    service = SimulationService(max_projects=2)
+    state = service.load_state('TEST001', base_inputs)
+    print(f"\n기준 WACC: {state.base_wacc:.2%}, 기준 주식가치: {state.base_equity_value:,.0f}백만원")
+
+    modified = {'revenue_growth_rate': 0.07, 'ebit_margin': 0.16, 'wacc': 0.095,
+                'terminal_growth': 0.025, 'capex_rate': 0.055}
+    result = service.simulate('TEST001', modified)
+    print(f"\n시뮬레이션: {result['original_value']:,}원 → {result['simulated_value']:,}원 "
+          f"({result['change_percentage']:+.2%})")
+    for field, amount in {**result['impacts'], **result['other_impacts']}.items():
+        print(f"  {field:<24} {amount:>+22,}원")
+
+    attributed = sum(result['impacts'].values()) + sum(result['other_impacts'].values())
+    assert abs(attributed - result['change_amount']) <= len(modified)
+
+    # 전체 수정 행이 스칼라 엔진 결과와 일치하는지 확인
+    import contextlib
+    import io
+    from dcf.dcf_engine import DCFEngine
+    scalar_inputs = {
+        **base_inputs,
+        'assumptions': {**base_inputs['assumptions'], 'revenue_growth': [0.07] * 5,
+                        'target_operating_margin': 0.16, 'terminal_growth': 0.025, 'capex_rate': 0.055}
+    }
+    engine = DCFEngine()
+    override = {**engine.calculate_wacc_detailed(base_inputs['wacc_inputs']), 'wacc': 0.095}
+    engine.calculate_wacc_detailed = lambda wacc_inputs: override
+    with contextlib.redirect_stdout(io.StringIO()):
+        scalar = engine.run_valuation(scalar_inputs)
+    expected = scalar['valuation_result']['equity_value'] * SimulationService.UNIT
+    assert abs(result['simulated_value'] - expected) <= 1
+    print("\n스칼라 엔진 결과와 일치, 영향 합계 = 전체 변화")
+
+    # 지연시간 (warm state)
+    for _ in range(2000):
+        service.simulate('TEST001', modified)
+    latency = service.stats()['latency_ms']
+    print(f"\n지연시간 ({latency['count']}건): p50 {latency['p50']:.3f} ms, p99 {latency['p99']:.3f} ms")
+
+    # LRU 제거
+    service.load_state('P2', base_inputs)
+    service.load_state('P3', base_inputs)
+    assert not service.has_state('TEST001')
+    print(f"캐시 통계: { {k: v for k, v in service.stats().items() if k != 'latency_ms'} }")
+
+    # 선택자만 있는 wacc_inputs (업종 베타 + 시장 데이터) == 구성요소를 채운 입력
+    from common.market_data import MarketDataStore, set_default_store
+    store = MarketDataStore()
+    store.add_series('ktb_yield', '10Y', ['2024-12-30'], [0.035])
+    store.add_series('credit_spread', 'BBB', ['2024-12-30'], [0.015])
+    store.add_series('mrp', 'KR', ['2024-12-30'], [0.07])
+    store.add_series('beta', '소프트웨어', ['2024-12-31'], [1.2])
+    set_default_store(store)
+    try:
+        selector_inputs = {**base_inputs,
+                           'wacc_inputs': {'industry': '소프트웨어', 'debt_ratio': 0.30, 'tax_rate': 0.25}}
+        service.load_state('SELECTOR', selector_inputs)
+        service.load_state('EXPLICIT', base_inputs)
+        edits = {'beta': 1.35, 'cost_of_debt': 0.055, 'ebit_margin': 0.16}
+        from_selector = service.simulate('SELECTOR', edits)
+        from_explicit = service.simulate('EXPLICIT', edits)
+        assert from_selector['simulated_value'] == from_explicit['simulated_value']
+        print(f"\n선택자 입력 시뮬레이션: {from_selector['simulated_value']:,}원 (구성요소 입력과 동일)")
+    finally:
+        set_default_store(None)
+
+    # WACC 직접 지정 프로젝트의 구성요소 수정은 반영될 수 없으므로 거부
+    service.load_state('DIRECT', {**base_inputs, 'wacc_inputs': {'wacc': 0.10}})
+    try:
+        service.simulate('DIRECT', {'beta': 1.35})
+    except ValueError as e:
+        print(f"직접 WACC + beta 수정 거부: {e}")
+    else:
+        raise AssertionError("직접 지정된 WACC의 구성요소 수정이 허용되었습니다")
+    print(f"직접 WACC 수정: {service.simulate('DIRECT', {'wacc': 0.11})['change_percentage']:+.2%}")
+    print("=" * 80)
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+DCF 엔진 일괄 검증 (평가보고서 대비)
+
+sample_inputs의 모든 케이스를 프로세스 풀에서 DCF 엔진으로 평가하고
+실제 보고서에 기재된 값과 항목별로 비교해 오차표를 만든다.
+엔진 변경 배포 전 회귀 게이트로 사용 (기준 오차표 대비 악화 시 종료 코드 1)
+
+검증 대상은 valuation-platform/backend의 앱 엔진(app/services/valuation_engine/dcf)이고,
+입력 변환은 benchmarks/fixtures.to_dcf_inputs를 그대로 쓴다.
+실행 시간은 참고용으로만 출력하며 회귀 판정에는 쓰지 않는다
+(지연시간 회귀는 backend/benchmarks/engine_benchmark.py가 담당).
+
+사용법:
+    python validate_dcf_reports.py                      # 검증 + 기준 오차표 비교
+    python validate_dcf_reports.py --save-baseline      # 기준 오차표 갱신
+    python validate_dcf_reports.py --workers 8 --report result.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+VALIDATION_DIR = Path(__file__).resolve().parent
+# 배포 대상인 backend 앱 엔진과 벤치마크 픽스처(보고서 입력 → 엔진 입력 변환)를 검증
+BACKEND_DIR = VALIDATION_DIR.parents[2] / "valuation-platform" / "backend"
+sys.path[:0] = [str(BACKEND_DIR), str(BACKEND_DIR / "app" / "services" / "valuation_engine")]
+
+from dcf.dcf_engine import DCFEngine
+from benchmarks.fixtures import to_dcf_inputs
+
+SAMPLE_DIR = VALIDATION_DIR / "sample_inputs"
+BASELINE_PATH = VALIDATION_DIR / "validation_baseline.json"
+
+# 비교 항목: 이름 → (보고서 값 경로, 엔진 결과 경로, 오차 기준 'rel' | 'abs', 허용 오차)
+FIELDS = {
+    'wacc': (('할인율_WACC', 'WACC'), ('wacc', 'wacc'), 'abs', 0.0005),
+    'total_pv_fcf': (('현재가치_계산', '예측기간_FCF_합계'), ('discounted_fcf', 'total_pv_fcf'), 'rel', 0.01),
+    'terminal_value': (('영구성장_가정', '계속가치_Terminal_Value'), ('terminal_value', 'terminal_value'), 'rel', 0.01),
+    'pv_terminal_value': (('현재가치_계산', '계속가치_현재가치'), ('terminal_value', 'pv_terminal_value'), 'rel', 0.01),
+    'enterprise_value': (('현재가치_계산', '기업가치_EV'), ('valuation_result', 'enterprise_value'), 'rel', 0.01),
+    'equity_value': (('주주가치_계산', '주주가치'), ('valuation_result', 'equity_value'), 'rel', 0.01),
+    'value_per_share': (('주주가치_계산', '주당가치_원'), ('valuation_result', 'value_per_share'), 'rel', 0.01),
+}
+# 연도별 항목: 이름 → (보고서 예측 키, 엔진 projections 키)
+YEARLY_FIELDS = {
+    'revenue': ('매출액', 'revenue'),
+    'fcf': ('잉여현금흐름_FCF', 'fcf'),
+}
+YEARLY_TOLERANCE = 0.02
+
+# 기준 오차표 대비 이만큼(비율 오차는 %p, WACC는 절대값) 나빠지면 회귀
+REGRESSION_MARGIN = {'rel': 0.001, 'abs': 0.0001}
+
+
+def _dig(data: dict, path: tuple):
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def _error(kind: str, expected: float, actual: float) -> float:
+    if kind == 'abs':
+        return actual - expected
+    return (actual - expected) / expected if expected else float('inf')
+
+
+# ==================== 워커 ====================
+
+_engine = None
+
+
+def _init_worker():
+    """워커 프로세스별 엔진 1회 생성"""
+    global _engine
+    _engine = DCFEngine()
+
+
+def validate_case(path: str) -> dict:
+    """
+    케이스 1건 검증 (워커에서 실행, JSON 로드부터 워커가 담당)
+
+    Returns:
+        {
+            'case': str, 'elapsed_ms': float, 'error': str | None,
+            'fields': {항목: {'expected', 'actual', 'error', 'kind', 'passed'}}
+        }
+    """
+    global _engine
+    if _engine is None:
+        _init_worker()
+
+    case = Path(path).stem.replace('_dcf_input', '')
+    start = time.perf_counter()
+    try:
+        with open(path, encoding='utf-8') as f:
+            sample = json.load(f)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = _engine.run_valuation(to_dcf_inputs(sample))
+    except Exception as e:
+        return {'case': case, 'elapsed_ms': (time.perf_counter() - start) * 1000,
+                'error': f"{type(e).__name__}: {e}", 'fields': {}}
+
+    fields = {}
+    for name, (report_path, result_path, kind, tolerance) in FIELDS.items():
+        expected = _dig(sample, report_path)
+        actual = _dig(result, result_path)
+        if expected is None or actual is None:
+            continue
+        error = _error(kind, expected, actual)
+        fields[name] = {'expected': expected, 'actual': actual, 'error': error,
+                        'kind': kind, 'passed': abs(error) <= tolerance}
+
+    forecast = sample.get('예측_재무데이터', {})
+    for name, (report_key, projection_key) in YEARLY_FIELDS.items():
+        for i, expected in enumerate(forecast.get(report_key, [])[:len(result['projections'])]):
+            actual = result['projections'][i][projection_key]
+            error = _error('rel', expected, actual)
+            fields[f"{name}_{result['projections'][i]['year']}"] = {
+                'expected': expected, 'actual': actual, 'error': error,
+                'kind': 'rel', 'passed': abs(error) <= YEARLY_TOLERANCE}
+
+    return {'case': case, 'elapsed_ms': (time.perf_counter() - start) * 1000, 'error': None, 'fields': fields}
+
+
+# ==================== 실행 / 집계 ====================
+
+def run_validation(sample_dir: Path = SAMPLE_DIR, workers: int = None) -> dict:
+    """
+    전체 케이스 검증
+
+    Returns:
+        {
+            'cases': [validate_case 결과, ...],
+            'summary': {항목: {'n', 'mean_abs_error', 'max_abs_error', 'worst_case', 'pass_rate', 'kind'}},
+            'runtime': {'total_s', 'cases', 'workers', 'cases_per_s', 'mean_case_ms'}
+        }
+    """
+    paths = sorted(str(p) for p in Path(sample_dir).glob('*_input.json'))
+    workers = workers or min(len(paths), os.cpu_count() or 1) or 1
+
+    start = time.perf_counter()
+    if workers > 1 and len(paths) > 1:
+        # 케이스가 수백 건이면 chunksize로 프로세스 간 통신 횟수를 줄인다
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            cases = list(pool.map(validate_case, paths, chunksize=chunksize))
+    else:
+        cases = [validate_case(p) for p in paths]
+    total = time.perf_counter() - start
+
+    summary = {}
+    for case in cases:
+        for name, field in case['fields'].items():
+            s = summary.setdefault(name, {'n': 0, 'sum_abs': 0.0, 'max_abs_error': 0.0,
+                                          'worst_case': None, 'passed': 0, 'kind': field['kind']})
+            s['n'] += 1
+            s['sum_abs'] += abs(field['error'])
+            s['passed'] += field['passed']
+            if abs(field['error']) >= s['max_abs_error']:
+                s['max_abs_error'] = abs(field['error'])
+                s['worst_case'] = case['case']
+    for s in summary.values():
+        s['mean_abs_error'] = s.pop('sum_abs') / s['n']
+        s['pass_rate'] = s.pop('passed') / s['n']
+
+    return {
+        'cases': cases,
+        'summary': summary,
+        'runtime': {
+            'total_s': round(total, 3),
+            'cases': len(cases),
+            'workers': workers,
+            'cases_per_s': round(len(cases) / total, 1) if total else None,
+            'mean_case_ms': round(sum(c['elapsed_ms'] for c in cases) / len(cases), 2) if cases else None
+        }
+    }
+
+
+def find_regressions(current: dict, baseline: dict) -> list:
+    """
+    기준 오차표 대비 케이스·항목별 오차가 커진 항목
+
+    신규 실패 케이스, 기준에는 있었는데 사라진 케이스·항목도 회귀로 본다 (이후 값은 None).
+
+    Returns:
+        [(케이스, 항목, 기준 오차, 현재 오차), ...]
+    """
+    cases = {c['case']: c for c in current['cases']}
+    regressions = []
+    for before in baseline['cases']:
+        case = cases.get(before['case'])
+        if case is None:
+            regressions.append((before['case'], 'case', before['error'], None))
+            continue
+        if case['error'] and not before['error']:
+            regressions.append((case['case'], 'run', before['error'], case['error']))
+            continue
+        for name, old in before['fields'].items():
+            field = case['fields'].get(name)
+            if field is None:
+                regressions.append((case['case'], name, old['error'], None))
+            elif abs(field['error']) - abs(old['error']) > REGRESSION_MARGIN[field['kind']]:
+                regressions.append((case['case'], name, old['error'], field['error']))
+    return regressions
+
+
+def find_unbaselined(current: dict, baseline: dict) -> list:
+    """
+    기준 오차표에 없는 케이스·항목 (비교 대상이 없어 회귀 판정에서 빠지는 항목)
+
+    Returns:
+        ['케이스', '케이스/항목', ...]
+    """
+    previous = {c['case']: c for c in baseline['cases']}
+    unbaselined = []
+    for case in current['cases']:
+        before = previous.get(case['case'])
+        if before is None:
+            unbaselined.append(case['case'])
+            continue
+        unbaselined.extend(f"{case['case']}/{name}" for name in case['fields'] if name not in before['fields'])
+    return unbaselined
+
+
+def _fmt(error: float, kind: str) -> str:
+    return f"{error * 10000:+.1f}bp" if kind == 'abs' else f"{error:+.2%}"
+
+
+def print_report(report: dict):
+    print("=" * 90)
+    print("DCF 엔진 검증 - 케이스별 오차 (엔진 - 보고서)")
+    print("=" * 90)
+
+    names = list(report['summary'])
+    for case in report['cases']:
+        if case['error']:
+            print(f"\n[{case['case']}] ✗ 실행 실패: {case['error']}")
+            continue
+        print(f"\n[{case['case']}] {case['elapsed_ms']:.1f} ms")
+        for name in names:
+            field = case['fields'].get(name)
+            if field:
+                mark = '✓' if field['passed'] else '✗'
+                print(f"  {mark} {name:<20} 보고서 {field['expected']:>14,.4f}  엔진 {field['actual']:>14,.4f}  "
+                      f"{_fmt(field['error'], field['kind']):>10}")
+
+    print("\n" + "=" * 90)
+    print(f"{'항목':<22} {'케이스':>6} {'평균 |오차|':>12} {'최대 |오차|':>12} {'통과율':>8}  최대 오차 케이스")
+    print("-" * 90)
+    for name, s in report['summary'].items():
+        mean = _fmt(s['mean_abs_error'], s['kind']).lstrip('+')
+        worst = _fmt(s['max_abs_error'], s['kind']).lstrip('+')
+        print(f"{name:<22} {s['n']:>6} {mean:>12} {worst:>12} {s['pass_rate']:>8.0%}  {s['worst_case']}")
+
+    rt = report['runtime']
+    print("-" * 90)
+    print(f"총 {rt['cases']}건 / {rt['workers']}개 프로세스 / {rt['total_s']:.2f}초 "
+          f"({rt['cases_per_s']}건/초, 케이스당 평균 {rt['mean_case_ms']} ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DCF 엔진 일괄 검증 (보고서 대비)")
+    parser.add_argument("--samples", type=Path, default=SAMPLE_DIR, help="sample_inputs 디렉터리")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="기준 오차표 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준 오차표로 저장")
+    parser.add_argument("--report", type=Path, help="전체 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    report = run_validation(args.samples, args.workers)
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n기준 오차표 저장: {args.baseline}")
+        sys.exit(0)
+
+    if not args.baseline.exists():
+        print("\n기준 오차표가 없습니다 (--save-baseline으로 생성)")
+        sys.exit(0)
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = find_regressions(report, baseline)
+    unbaselined = find_unbaselined(report, baseline)
+    previous_runtime = baseline['runtime']
+    print(f"\n실행 시간 (참고용, 회귀 판정 제외): {report['runtime']['total_s']:.2f}초 "
+          f"(기준 {previous_runtime['total_s']:.2f}초, {previous_runtime['cases']}건)")
+
+    if unbaselined:
+        print(f"\n기준 없음 {len(unbaselined)}건 (--save-baseline으로 편입): {', '.join(unbaselined)}")
+
+    if regressions:
+        print(f"\n✗ 회귀 {len(regressions)}건")
+        for case, name, before, after in regressions:
+            print(f"  {case:<20} {name:<20} {before} → {'누락' if after is None else after}")
+        sys.exit(1)
+
+    print("\n✓ 기준 오차표 대비 회귀 없음")